@@ -43,6 +43,7 @@ set(STRATEGA_SOURCE_FILES
         ForwardModel/ActionAssignment.cpp
         ForwardModel/Action.cpp
         ForwardModel/ActionSpace.cpp
+        ForwardModel/ActionSpaceCache.cpp
         ForwardModel/ActionTarget.cpp
         ForwardModel/Condition.cpp
         ForwardModel/Effect.cpp
@@ -69,7 +70,9 @@ set(STRATEGA_SOURCE_FILES
         Representation/GameInfo.cpp
         Representation/GameState.cpp
         Representation/ActionQueue.cpp
+        Representation/PathCache.cpp
         Representation/Player.cpp
+        Representation/SpatialIndex.cpp
         Representation/TechnologyTree.cpp
         Representation/Tile.cpp
         Utils/cparse/catch.cpp
@@ -78,6 +81,7 @@ set(STRATEGA_SOURCE_FILES
         Utils/cparse/packToken.cpp
         Utils/cparse/shunting-yard.cpp
         Utils/cparse/builtin-features.cpp
+        Utils/WorkerPool.cpp
         )
 if(NOT SGA_BUILD_HEADLESS)
    list(APPEND STRATEGA_SOURCE_FILES
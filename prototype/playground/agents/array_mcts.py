@@ -0,0 +1,137 @@
+import random
+from playground.utils.gamestate import GameState
+from playground.utils.tree import TreeNode
+from playground.utils.tree_store import TreeStore, ACTIONS, STOP
+from playground.utils.actions import MASK_ACTIONS, FIRST_ACTION, to_action_id
+from playground.utils.budget import Budget
+
+# MCTS agent on a struct-of-arrays tree with a fixed node cap
+# same search as MCTSAgent, but nodes are indices into a TreeStore instead of TreeNode objects
+class ArrayMCTSAgent:
+    def __init__(self, game_state: GameState, time_limit=0.1, node_cap=100000, at_cap=STOP, max_iterations=None, budget: Budget = None):
+        self.store = TreeStore(game_state, capacity=node_cap, at_capacity=at_cap)
+        self.root = self.store.root
+        self.time_limit = time_limit
+        self.max_iterations = max_iterations
+        self.budget = budget if budget is not None else Budget(time_limit=time_limit, max_iterations=max_iterations)
+        self.iteration_count = 0
+
+    def count_nodes(self) -> int:
+        return len(self.store)
+
+    # run MCTS
+    def run(self, debug=False) -> tuple[list, TreeNode]:
+        budget = self.budget
+        budget.reset()
+        profile = budget.profile
+
+        while not budget.is_over():
+            node = self.select(self.root)
+            if profile:
+                budget.lap("select")
+            if not self.store.is_done(node):
+                # a full store that cannot prune keeps searching the existing tree
+                child = self.expand(node)
+                if child != -1:
+                    node = child
+            if profile:
+                budget.lap("expand")
+            reward = self.simulate(node)
+            if profile:
+                budget.lap("simulate")
+            self.backpropagate(node, reward)
+            if profile:
+                budget.lap("backpropagate")
+            self.iteration_count += 1
+            budget.iterations += 1
+
+        if debug:
+            print(f"Nodes: {len(self.store)}/{self.store.capacity}, pruned: {self.store.pruned_count}, budget: {budget}")
+
+        return self.best_action_sequence()
+
+    # select a node to start with
+    def select(self, node: int) -> int:
+        while not self.store.is_done(node) and self.store.is_fully_expanded(node):
+            node = self.best_child(node)
+        return node
+
+    # same UCT as TreeNode.best_child
+    def best_child(self, node: int, exploration_weight=1.4) -> int:
+        children = self.store.children(node)
+        visits = self.store.visits[children]
+        weights = (self.store.value[children] / visits) + exploration_weight * (2 * (self.store.visits[node]) ** 0.5 / (1 + visits))
+        return children[int(weights.argmax())]
+
+    # returns the new child, or -1 if the store is full
+    def expand(self, node: int) -> int:
+        # the lowest untried bit is the first untried move in the order of get_available_moves
+        move = FIRST_ACTION[self.store.untried_mask(node)]
+        if move == -1:
+            return -1
+        game_state = self.store.game_state(node)
+        # the state is rebuilt from its encoding, start the next turn like get_available_moves would
+        game_state.refresh_turn()
+        self.budget.count_fm_calls("expand")
+        return self.store.add_child(node, move, game_state.apply(move))
+
+    def simulate(self, node: int) -> float:
+        current_state = self.store.game_state(node)
+        depth = 0
+        max_depth = 5  # Limiting the simulation depth to prevent infinite loops
+
+        while not current_state.done and depth < max_depth:
+            action = random.choice(MASK_ACTIONS[current_state.legal_mask()])
+            current_state.player_action(action)
+            depth += 1
+
+        self.budget.count_fm_calls("simulate", depth)
+        return current_state.reward
+
+    def backpropagate(self, node: int, reward: float) -> None:
+        while node != -1:
+            self.store.visits[node] += 1
+            self.store.value[node] += reward
+            node = self.store.parent[node]
+
+    def best_action_sequence(self) -> tuple[list, TreeNode]:
+        node = self.root
+        actions = []
+
+        while self.store.child_count[node] > 0:
+            node = self.best_child(node, exploration_weight=0)
+            actions.append(ACTIONS[self.store.action[node]])
+
+        # detached node for the same return type as MCTSAgent
+        final_node = TreeNode(game_state=self.store.game_state(node), action=actions[-1] if actions else None)
+        final_node.visits = int(self.store.visits[node])
+        final_node.value = float(self.store.value[node])
+        return (actions, final_node)
+
+    # visits and value of the root children by action, like the children of a TreeNode root
+    def root_statistics(self) -> dict:
+        return {ACTIONS[self.store.action[child]]: (int(self.store.visits[child]), float(self.store.value[child]))
+                for child in self.store.children(self.root)}
+
+    # move the root along the executed actions and keep the statistics of that subtree
+    # nodes outside the subtree are recycled by the store, returns whether the tree was reused
+    def advance(self, actions: list, game_state: GameState) -> bool:
+        self.iteration_count = 0
+        node = self.root
+        for action in actions:
+            action_id = to_action_id(action)
+            node = next((child for child in self.store.children(node) if self.store.action[child] == action_id), -1)
+            if node == -1:
+                break
+
+        expected = self.store.game_state(node) if node != -1 else None
+        if expected is not None:
+            expected.refresh_turn()
+        if (expected is None) or (expected.to_tuple() != game_state.to_tuple()):
+            self.store = TreeStore(game_state, capacity=self.store.capacity, at_capacity=self.store.at_capacity)
+            self.root = self.store.root
+            return False
+
+        self.store.reroot(node, game_state)
+        self.root = node
+        return True
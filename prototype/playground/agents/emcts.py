@@ -1,11 +1,18 @@
 import time
+import math
 import random
-from playground.utils.abstract_tree import AbstractTreeNode, GameState, copy
+from collections import deque
+from playground.utils.abstract_tree import AbstractTreeNode, GameState
+from playground.utils.tree import collect_nodes, follow_actions, matches_state
+from playground.utils.rollouts import batch_rollout, parallel_rollout
+from playground.utils.actions import ACTION_NAMES, MASK_ACTIONS, FIRST_ACTION
+from playground.utils.transposition import TranspositionTable
+from playground.utils.budget import Budget
 import numpy as np
 
 # Elastic MCTS agent that uses approximate homomorphism
 class EMCTSAgent:
-    def __init__(self, game_state: GameState, time_limit=0.1, alpha_abs=100, batch_size=20, eta_r=0.5, eta_t=1.42):
+    def __init__(self, game_state: GameState, time_limit=0.1, alpha_abs=100, batch_size=20, eta_r=0.5, eta_t=1.42, rollouts_per_leaf=1, transposition_table_size=0, executor=None, workers=1, max_iterations=None, budget: Budget = None):
         self.root = AbstractTreeNode(game_state)
         self.time_limit = time_limit
         self.alpha_abs = alpha_abs
@@ -13,16 +20,35 @@ class EMCTSAgent:
         self.eta_r = eta_r
         self.eta_t = eta_t
         self.iteration_count = 0
-        self.nodes_to_merge = {}
+        self._reset_index()
+        # time spent in update_abstraction and revert_abstraction during run
+        self.abstraction_time = 0.0
+        # more than one rollout per leaf runs them batched through numpy
+        self.rollouts_per_leaf = rollouts_per_leaf
+        # with an executor the batched rollouts are split over its worker processes
+        self.executor = executor
+        self.workers = workers
+        self.rng = np.random.default_rng(random.getrandbits(32))
+        # optional fixed number of iterations, reproducible unlike the time limit
+        self.max_iterations = max_iterations
+        # the budget replaces the time limit and iterations, see playground.utils.budget
+        self.budget = budget if budget is not None else Budget(time_limit=time_limit, max_iterations=max_iterations)
+        # identical states reached through different move orders share one node
+        self.transpositions = None
+        if transposition_table_size > 0:
+            self.transpositions = TranspositionTable(transposition_table_size)
+            self.transpositions.store(game_state, self.root)
+        # nodes visited in the current iteration, nodes can have several parents with transpositions
+        self.path = []
     
     def count_nodes(self):
         visited = set()
         return self.count_nodes_recursive(self.root, visited)
 
     def count_nodes_recursive(self, node: AbstractTreeNode, visited: set):
-        if node in visited:
+        if id(node) in visited:
             return 0
-        visited.add(node)
+        visited.add(id(node))
 
         count = 1  # Count the current node
         for child in node.children:
@@ -30,138 +56,219 @@ class EMCTSAgent:
         return count
     
     def run(self, debug=False):
-        start_time = time.time()
+        budget = self.budget
+        budget.reset()
+        profile = budget.profile
 
-        while (time.time() - start_time) < self.time_limit:
-            
+        while not budget.is_over():
             if debug:
                 print(f"Iteration count: {self.iteration_count}")
             
             node = self.select(self.root)
+            if profile:
+                budget.lap("select")
             if not node.game_state.done:
                 node = self.expand(node)
+            if profile:
+                budget.lap("expand")
             reward = self.simulate(node)
+            if profile:
+                budget.lap("simulate")
             self.backpropagate(node, reward)
+            if profile:
+                budget.lap("backpropagate")
             self.iteration_count += 1
+            budget.iterations += 1
 
-            if (self.iteration_count > 0) and (self.iteration_count % self.batch_size) == 0:
-                # print(f"going into abstraction: {self.iteration_count} {self.iteration_count % self.batch_size}")
-                # print(f"Before homomorphism, node count: {self.count_nodes()}")
-                self.update_abstraction()
-                # print(f"After homomorphism, node count: {self.count_nodes()}")
-
+            # the abstraction is only used for the first alpha_abs iterations, the ground tree is searched afterwards
+            abstraction_start = time.perf_counter()
             if self.iteration_count > self.alpha_abs:
-                self.revert_abstraction()
-                if debug:
-                    print(f"After reverting abstraction, node count: {self.count_nodes()}")
+                if self.merged_nodes:
+                    self.revert_abstraction()
+                    if debug:
+                        print(f"After reverting abstraction, node count: {self.count_nodes()}")
+            elif (self.iteration_count % self.batch_size) == 0:
+                self.update_abstraction()
+            self.abstraction_time += time.perf_counter() - abstraction_start
+            if profile:
+                budget.lap("abstraction")
 
         #at the end we have to revert the abstraction and return the best actions
+        abstraction_start = time.perf_counter()
         self.revert_abstraction()
+        self.abstraction_time += time.perf_counter() - abstraction_start
+        if profile:
+            budget.lap("abstraction")
+
+        if debug:
+            print(f"Budget: {budget}")
+
         return self.best_action_sequence()
 
     def select(self, node: AbstractTreeNode) -> AbstractTreeNode:
+        self.path = [node]
         while not node.game_state.done and node.is_fully_expanded():
             node = node.best_child()
+            self.path.append(node)
         return node
 
     def expand(self, node: AbstractTreeNode) -> AbstractTreeNode:
-        available_moves = node.game_state.get_available_moves()
-        
-        # This is different thatn in the normal tree node as the actions here are a list
-        # so we need to handle it appropriatly
-        tried_moves = [move for child in node.children for move in child.action]
+        # the lowest untried bit is the first untried move in the order of get_available_moves
+        move = FIRST_ACTION[node.untried_mask()]
+        if move != -1:
+            child = self._add_child(node, ACTION_NAMES[move])
+            self.path.append(child)
+            return child
 
-        for move in available_moves:
-            if move not in tried_moves:
-                node.add_child(move)
-                return node.children[-1]
+    # add a child for the move, reusing the node of an identical state if there is a transposition table
+    def _add_child(self, node: AbstractTreeNode, move) -> AbstractTreeNode:
+        self.budget.count_fm_calls("expand")
+        if self.transpositions is None:
+            node.add_child(move)
+            self._index_node(node.children[-1])
+            return node.children[-1]
+
+        child_state = node.game_state.apply(move)
+        child = self.transpositions.get(child_state)
+        if child is None:
+            child = AbstractTreeNode(game_state=child_state, parent=node, action=move)
+            node.append_child(child, move)
+            self.transpositions.store(child_state, child)
+            self._index_node(child)
+        else:
+            node.link_child(child, move)
+        return child
 
     def simulate(self, node: AbstractTreeNode):
-        current_state = copy.deepcopy(node.game_state)
         depth = 0
         max_depth = 5 
 
+        # leaf-parallel mode: average a batch of rollouts from the same leaf
+        if self.rollouts_per_leaf > 1:
+            if self.executor is not None:
+                rewards = parallel_rollout(self.executor, node.game_state, self.rollouts_per_leaf, self.workers, max_depth=max_depth, rng=self.rng)
+            else:
+                rewards = batch_rollout([node.game_state], repeats=self.rollouts_per_leaf, max_depth=max_depth, rng=self.rng)
+            # every batched rollout is counted with its full depth
+            self.budget.count_fm_calls("simulate", self.rollouts_per_leaf * max_depth)
+            return float(rewards.mean())
+
+        current_state = node.game_state.clone()
+
         while not current_state.done and depth < max_depth:
-            available_moves = current_state.get_available_moves()
-            action = random.choice(available_moves)
+            action = random.choice(MASK_ACTIONS[current_state.legal_mask()])
             current_state.player_action(action)
             depth += 1
 
+        self.budget.count_fm_calls("simulate", depth)
         return current_state.reward
 
     def backpropagate(self, node: AbstractTreeNode, reward: float):
+        # in a DAG the parent pointer is only one of the ways to reach the node, follow the selected path
+        if self.transpositions is not None and self.path and self.path[-1] is node:
+            for path_node in self.path:
+                path_node.visits += 1
+                path_node.value += reward
+            return
+
         while node is not None:
             node.visits += 1
             node.value += reward
             node = node.parent
     
-    def _get_max_depth(self, node: AbstractTreeNode, current_depth=0) -> int:
-        if not node.children:
-            return current_depth
-        return max(self._get_max_depth(child, current_depth + 1) for child in node.children)
+    def _reset_index(self) -> None:
+        # nodes per depth, updated on expansion instead of walking the tree
+        self.nodes_by_depth = [[self.root]]
+        # siblings bucketed by quantized reward and position, similar nodes are always in neighbouring buckets
+        self.buckets = {}
+        # nodes created (or moved under a new parent) since the last abstraction batch
+        self.new_nodes = []
+        # merged nodes in the order they were merged, and the ids of the nodes they absorbed
+        self.merged_nodes = []
+        self.absorbed = set()
+
+    def _index_node(self, node: AbstractTreeNode) -> None:
+        if node.depth == len(self.nodes_by_depth):
+            self.nodes_by_depth.append([])
+        self.nodes_by_depth[node.depth].append(node)
+        self._add_to_bucket(node)
+        self.new_nodes.append(node)
+
+    # nodes can only be similar if their reward and position are within eta_r and eta_t
+    # so with cells of that size they are in the same or a neighbouring bucket
+    def _bucket_key(self, node: AbstractTreeNode) -> tuple:
+        (x, y) = node.game_state.player.position
+        reward = node.game_state.reward
+        return (id(node.parent), self._quantize(reward, self.eta_r), self._quantize(x, self.eta_t), self._quantize(y, self.eta_t))
+
+    def _quantize(self, value, cell_size) -> float:
+        return math.floor(value / cell_size) if cell_size > 0 else value
+
+    def _add_to_bucket(self, node: AbstractTreeNode) -> None:
+        self.buckets.setdefault(self._bucket_key(node), []).append(node)
+
+    def _remove_from_bucket(self, node: AbstractTreeNode) -> None:
+        key = self._bucket_key(node)
+        bucket = self.buckets[key]
+        for i, bucket_node in enumerate(bucket):
+            if bucket_node is node:
+                del bucket[i]
+                break
+        if not bucket:
+            del self.buckets[key]
+
+    def _get_candidates(self, node: AbstractTreeNode) -> list[AbstractTreeNode]:
+        (parent_id, reward, x, y) = self._bucket_key(node)
+        offsets = (-1, 0, 1)
+        candidates = []
+        for d_reward in (offsets if self.eta_r > 0 else (0,)):
+            for d_x in (offsets if self.eta_t > 0 else (0,)):
+                for d_y in (offsets if self.eta_t > 0 else (0,)):
+                    bucket = self.buckets.get((parent_id, reward + d_reward, x + d_x, y + d_y))
+                    if bucket:
+                        candidates.extend(candidate for candidate in bucket if candidate is not node)
+        return candidates
 
     # main method to be called when abstracting
+    # only the nodes created since the last batch are checked, and only against similar siblings
     def update_abstraction(self) -> None:
-        # determine the maximum depth
-        max_depth = self._get_max_depth(self.root)
+        new_nodes = self.new_nodes
+        self.new_nodes = []
 
         # we go from leaves to root
-        for depth in reversed(range(max_depth + 1)):
-            print(f"===== DEPTH {depth} =====")
-            
-            # we get all the nodes at this depth and see if we can group them
-            nodes_at_depth = self._get_nodes_at_depth(depth)
-            # print(f"nodes at depth {depth}: {nodes_at_depth}")
-            for node in nodes_at_depth:
-                # we check all the nodes if we can group them
-                # we remove the node we are checking for to make sure that we only group the nodes that make sense
-                current_node_removed = [check_node for check_node in nodes_at_depth if check_node != node]
-
-                self.nodes_to_merge[node] = []
-
-                for other_node in current_node_removed:
-                    # print(f"{node} and {other_node}")
-                    # print(f"e_r = {self._calculate_reward_error(node, other_node)}")
-                    # print(f"e_t = {self._calculate_transition_error(node, other_node)}")
-                    if (self._is_similar(node, other_node)) and (node.parent == other_node.parent):
-                        # print(f"merging node1: {node} & node2: {other_node}")
-                        self.nodes_to_merge[node].append(other_node)
-            # we now have a dictionary of nodes and nodes that it can merge with
-            # now we group them based on this dictionary
-            self._group_nodes()
-                        
-    def _get_nodes_at_depth(self, depth) -> list[AbstractTreeNode]:
-        node_list = []
-        self._collect_nodes_at_depth(self.root, depth, 0, node_list)
-        return node_list
-
-    def _collect_nodes_at_depth(self, node, target_depth, current_depth, node_list) -> list[AbstractTreeNode]:
-        if current_depth == target_depth:
-            node_list.append(node)
-        elif current_depth < target_depth:
-            for child in node.children:
-                self._collect_nodes_at_depth(child, target_depth, current_depth + 1, node_list)
-
-    def _group_nodes(self) -> None:
-
-        # set of nodes to check if they have already been used
+        new_nodes.sort(key=lambda node: node.depth, reverse=True)
         grouped_nodes = set()
 
-        for node in self.nodes_to_merge:
-            # if this node has been grouped already, we skip it
-            if node in grouped_nodes:
+        for node in new_nodes:
+            if (id(node) in grouped_nodes) or (id(node) in self.absorbed) or node.merged_with:
                 continue
-            
-            for other_node in self.nodes_to_merge[node]:
-                if other_node not in grouped_nodes and (node.parent == other_node.parent):
-                    print(f"{node.parent} {other_node.parent}")
-                    grouped_nodes.add(node)
-                    node.merge_with(other_node)
-                    grouped_nodes.add(other_node)
-                    
-            grouped_nodes.add(node)
-        #reset nodes to merge
-        self.nodes_to_merge = {}
+
+            for other_node in self._get_candidates(node):
+                # a node is only merged once, and only unmerged nodes are absorbed
+                if (id(other_node) in grouped_nodes) or other_node.merged_with:
+                    continue
+                if self._is_similar(node, other_node):
+                    # the older node keeps its place in the tree
+                    self._merge(other_node, node)
+                    grouped_nodes.add(id(node))
+                    grouped_nodes.add(id(other_node))
+                    break
+
+    def _merge(self, node: AbstractTreeNode, other: AbstractTreeNode) -> None:
+        # linked children keep their owner, the others move to the merged node (see merge_with)
+        moved_children = [child for child in node.absorbable_children(other) if id(child) not in other.linked_actions]
+        for child in moved_children:
+            self._remove_from_bucket(child)
+        self._remove_from_bucket(other)
+
+        node.merge_with(other)
+        self.merged_nodes.append(node)
+        self.absorbed.add(id(other))
+
+        # the children now have new siblings to be compared with in the next batch
+        for child in moved_children:
+            self._add_to_bucket(child)
+            self.new_nodes.append(child)
 
     def _is_similar(self, node1: AbstractTreeNode, node2: AbstractTreeNode):
         error_r = self._calculate_reward_error(node1, node2)
@@ -177,19 +284,21 @@ class EMCTSAgent:
         distance = np.sqrt((node1_x - node2_x) ** 2 + (node1_y - node2_y) ** 2)
         return distance
 
+    # undo the merges from last to first so nested merges are restored correctly
     def revert_abstraction(self):
-        # similar to merging, we start at the bottom and unmerge
-        max_depth = self._get_max_depth(self.root)
-
-        for depth in reversed(range(max_depth + 1)):
+        while self.merged_nodes:
+            node = self.merged_nodes.pop()
+            unmerged_node = node.merged_with
+            moved_children = [child for child in node.original_children if id(child) not in node.merged_links]
+            for child in moved_children:
+                self._remove_from_bucket(child)
 
-            #get nodes at each depth
-            nodes_at_depth = self._get_nodes_at_depth(depth)
-            # print(f"nodes at depth {depth}: {nodes_at_depth}")
-            for node in nodes_at_depth:
-                #check the actions to see if the node has been merged
-                node.unmerge()
+            node.unmerge()
+            self.absorbed.discard(id(unmerged_node))
 
+            self._add_to_bucket(unmerged_node)
+            for child in moved_children:
+                self._add_to_bucket(child)
 
     def best_action_sequence(self) -> tuple[list, AbstractTreeNode]:
         node = self.root
@@ -197,17 +306,63 @@ class EMCTSAgent:
         
         while node.children:
             best_child = node.best_child(exploration_weight=0)
-            actions.append(best_child.action[0])
+            actions.append(node.child_action(best_child)[0])
             node = best_child
         
         return (actions, node)
 
-    def _get_all_nodes(self) -> list[AbstractTreeNode]:
-        all_nodes = []
-        self._collect_all_nodes(self.root, all_nodes)
-        return all_nodes
+    # move the root along the executed actions and keep the statistics of that subtree
+    # falls back to a fresh tree when the subtree is missing or the observed state differs
+    # returns whether the tree was reused
+    def advance(self, actions: list, game_state: GameState) -> bool:
+        # merged nodes are split again so the actions lead through the ground tree
+        self.revert_abstraction()
+        # like the iterations, the abstraction time is counted per search
+        self.iteration_count = 0
+        self.abstraction_time = 0.0
+        self.path = []
+        node = follow_actions(self.root, actions)
 
-    def _collect_all_nodes(self, node, all_nodes):
-        all_nodes.append(node)
-        for child in node.children:
-            self._collect_all_nodes(child, all_nodes)
+        if (node is None) or (not matches_state(node, game_state)):
+            self.root = AbstractTreeNode(game_state)
+            reused = False
+        else:
+            # detach the new root so the rest of the tree can be freed
+            node.parent = None
+            node.game_state = game_state
+            self.root = node
+            reused = True
+
+        self._reindex_tree()
+        return reused
+
+    # rebuild the depth index, buckets and transposition table for the tree below the root
+    # every kept node is a candidate for the next abstraction batch again
+    def _reindex_tree(self) -> None:
+        self._reset_index()
+        if self.transpositions is not None:
+            self.transpositions = TranspositionTable(self.transpositions.max_size)
+            self.transpositions.store(self.root.game_state, self.root)
+
+        subtree = {id(node) for node in collect_nodes(self.root)}
+
+        # breadth first so parents are indexed before their children
+        self.root.depth = 0
+        visited = {id(self.root)}
+        queue = deque([self.root])
+        while queue:
+            node = queue.popleft()
+            for child in node.children:
+                if id(child) in visited:
+                    continue
+                visited.add(id(child))
+                # shared nodes whose owner was cut off get a new owner in the subtree
+                if id(child.parent) not in subtree:
+                    child.action = node.child_action(child)
+                    node.linked_actions.pop(id(child), None)
+                    child.parent = node
+                child.depth = node.depth + 1
+                self._index_node(child)
+                if self.transpositions is not None:
+                    self.transpositions.restore(child)
+                queue.append(child)
@@ -1,58 +1,132 @@
-import time
 import random
-from playground.utils.tree import GameState, TreeNode, copy
+from playground.utils.tree import GameState, TreeNode, collect_nodes, follow_actions, matches_state
+from playground.utils.rollouts import batch_rollout, parallel_rollout
+from playground.utils.actions import ACTION_NAMES, MASK_ACTIONS, FIRST_ACTION
+from playground.utils.transposition import TranspositionTable
+from playground.utils.budget import Budget
+import numpy as np
 
 # MCTS agent to run the game
 class MCTSAgent:
-    def __init__(self, game_state: GameState, time_limit=0.1):
+    def __init__(self, game_state: GameState, time_limit=0.1, rollouts_per_leaf=1, transposition_table_size=0, executor=None, workers=1, max_iterations=None, budget: Budget = None):
         self.root = TreeNode(game_state)
         # given a timelimit of 100ms
         self.time_limit = time_limit 
+        # more than one rollout per leaf runs them batched through numpy
+        self.rollouts_per_leaf = rollouts_per_leaf
+        # with an executor the batched rollouts are split over its worker processes
+        self.executor = executor
+        self.workers = workers
+        self.rng = np.random.default_rng(random.getrandbits(32))
+        # optional fixed number of iterations, reproducible unlike the time limit
+        self.max_iterations = max_iterations
+        # the budget replaces the time limit and iterations, see playground.utils.budget
+        self.budget = budget if budget is not None else Budget(time_limit=time_limit, max_iterations=max_iterations)
+        # identical states reached through different move orders share one node
+        self.transpositions = None
+        if transposition_table_size > 0:
+            self.transpositions = TranspositionTable(transposition_table_size)
+            self.transpositions.store(game_state, self.root)
+        # nodes visited in the current iteration, nodes can have several parents with transpositions
+        self.path = []
+        self.iteration_count = 0
+
+    def count_nodes(self) -> int:
+        return len(collect_nodes(self.root))
 
     # run MCTS
     def run(self, debug=False) -> tuple[list, TreeNode]:
-        start_time = time.time()
+        budget = self.budget
+        budget.reset()
+        profile = budget.profile
 
-        while (time.time() - start_time) < self.time_limit:
+        while not budget.is_over():
             node = self.select(self.root)
+            if profile:
+                budget.lap("select")
             if not node.game_state.done:
                 node = self.expand(node)
+            if profile:
+                budget.lap("expand")
             reward = self.simulate(node)
+            if profile:
+                budget.lap("simulate")
             self.backpropagate(node, reward)
+            if profile:
+                budget.lap("backpropagate")
+            self.iteration_count += 1
+            budget.iterations += 1
+
+        if debug:
+            print(f"Budget: {budget}")
 
         return self.best_action_sequence()
 
     # select a node to start with
     def select(self, node: TreeNode) -> TreeNode:
+        self.path = [node]
         while not node.game_state.done and node.is_fully_expanded():
             node = node.best_child()
+            self.path.append(node)
         return node
 
     def expand(self, node: TreeNode) -> TreeNode:
-        available_moves = node.game_state.get_available_moves()
-        # print(f"available moves = {available_moves}")
-        tried_moves = [child.action for child in node.children]
-        # print(f"tried moves = {tried_moves}")
+        # the lowest untried bit is the first untried move in the order of get_available_moves
+        move = FIRST_ACTION[node.untried_mask()]
+        if move != -1:
+            child = self._add_child(node, ACTION_NAMES[move])
+            self.path.append(child)
+            return child
+
+    # add a child for the move, reusing the node of an identical state if there is a transposition table
+    def _add_child(self, node: TreeNode, move) -> TreeNode:
+        self.budget.count_fm_calls("expand")
+        if self.transpositions is None:
+            node.add_child(move)
+            return node.children[-1]
 
-        for move in available_moves:
-            if move not in tried_moves:
-                node.add_child(move)
-                return node.children[-1]
+        child_state = node.game_state.apply(move)
+        child = self.transpositions.get(child_state)
+        if child is None:
+            child = TreeNode(game_state=child_state, parent=node, action=move)
+            node.append_child(child, move)
+            self.transpositions.store(child_state, child)
+        else:
+            node.link_child(child, move)
+        return child
 
     def simulate(self, node: TreeNode) -> float:
-        current_state = copy.deepcopy(node.game_state)
         depth = 0
         max_depth = 5  # Limiting the simulation depth to prevent infinite loops
 
+        # leaf-parallel mode: average a batch of rollouts from the same leaf
+        if self.rollouts_per_leaf > 1:
+            if self.executor is not None:
+                rewards = parallel_rollout(self.executor, node.game_state, self.rollouts_per_leaf, self.workers, max_depth=max_depth, rng=self.rng)
+            else:
+                rewards = batch_rollout([node.game_state], repeats=self.rollouts_per_leaf, max_depth=max_depth, rng=self.rng)
+            # every batched rollout is counted with its full depth
+            self.budget.count_fm_calls("simulate", self.rollouts_per_leaf * max_depth)
+            return float(rewards.mean())
+
+        current_state = node.game_state.clone()
+
         while not current_state.done and depth < max_depth:
-            available_moves = current_state.get_available_moves()
-            action = random.choice(available_moves)
+            action = random.choice(MASK_ACTIONS[current_state.legal_mask()])
             current_state.player_action(action)
             depth += 1
 
+        self.budget.count_fm_calls("simulate", depth)
         return current_state.reward
 
     def backpropagate(self, node: TreeNode, reward: float) -> None:
+        # in a DAG the parent pointer is only one of the ways to reach the node, follow the selected path
+        if self.transpositions is not None and self.path and self.path[-1] is node:
+            for path_node in self.path:
+                path_node.visits += 1
+                path_node.value += reward
+            return
+
         while node is not None:
             node.visits += 1
             node.value += reward
@@ -64,7 +138,47 @@ class MCTSAgent:
         
         while node.children:
             best_child = node.best_child(exploration_weight=0)
-            actions.append(best_child.action)
+            actions.append(node.child_action(best_child))
             node = best_child
         
-        return (actions, node)
\ No newline at end of file
+        return (actions, node)
+
+    # move the root along the executed actions and keep the statistics of that subtree
+    # falls back to a fresh tree when the subtree is missing or the observed state differs
+    # returns whether the tree was reused
+    def advance(self, actions: list, game_state: GameState) -> bool:
+        self.iteration_count = 0
+        self.path = []
+        node = follow_actions(self.root, actions)
+
+        if (node is None) or (not matches_state(node, game_state)):
+            self.root = TreeNode(game_state)
+            if self.transpositions is not None:
+                self.transpositions = TranspositionTable(self.transpositions.max_size)
+                self.transpositions.store(game_state, self.root)
+            return False
+
+        # detach the new root so the rest of the tree can be freed
+        node.parent = None
+        node.game_state = game_state
+        self.root = node
+        if self.transpositions is not None:
+            self._rebuild_transpositions()
+        return True
+
+    # keep only the nodes below the root in the table
+    # shared nodes whose owner was cut off get one of their parents in the subtree as new owner
+    def _rebuild_transpositions(self) -> None:
+        nodes = collect_nodes(self.root)
+        subtree = {id(node) for node in nodes}
+        self.transpositions = TranspositionTable(self.transpositions.max_size)
+        # the root has the observed state, the other nodes keep the key they were found with
+        self.transpositions.store(self.root.game_state, self.root)
+        for node in nodes:
+            if node is not self.root:
+                self.transpositions.restore(node)
+            for child in node.children:
+                if id(child.parent) not in subtree:
+                    child.action = node.child_action(child)
+                    node.linked_actions.pop(id(child), None)
+                    child.parent = node
@@ -0,0 +1,83 @@
+import random
+from concurrent.futures import Executor, ProcessPoolExecutor
+from playground.agents.mcts import MCTSAgent
+from playground.utils.gamestate import GameState
+from playground.utils.tree import TreeNode
+
+# Root parallel MCTS: every worker process builds its own tree from the same gamestate
+# and the statistics of the root children are summed up to pick the action
+class RootParallelAgent:
+    def __init__(self, game_state: GameState, time_limit=0.1, workers=2, agent_class=MCTSAgent, executor: Executor = None, **agent_kwargs):
+        self.game_state = game_state
+        self.time_limit = time_limit
+        self.workers = workers
+        self.agent_class = agent_class
+        self.agent_kwargs = agent_kwargs
+        # the executor can be shared between turns so the worker processes stay alive
+        self.executor = executor
+        # merged root statistics, action -> [visits, value]
+        self.root_stats = {}
+        self.iteration_count = 0
+
+    def run(self, debug=False) -> tuple[list, TreeNode]:
+        executor = self.executor
+        if executor is None:
+            executor = ProcessPoolExecutor(max_workers=self.workers)
+
+        try:
+            seeds = [random.getrandbits(32) for _ in range(self.workers)]
+            futures = [executor.submit(_search_root, self.agent_class, self.game_state, self.time_limit, seed, self.agent_kwargs)
+                       for seed in seeds]
+            results = [future.result() for future in futures]
+        finally:
+            if self.executor is None:
+                executor.shutdown()
+
+        self.root_stats = {}
+        self.iteration_count = 0
+        for (root_stats, iterations, _, _) in results:
+            self.iteration_count += iterations
+            for action, (visits, value) in root_stats.items():
+                stats = self.root_stats.setdefault(action, [0, 0])
+                stats[0] += visits
+                stats[1] += value
+
+        if debug:
+            print(f"Root statistics: {self.root_stats} over {self.iteration_count} iterations")
+
+        if not self.root_stats:
+            return ([], TreeNode(self.game_state))
+
+        # same as best_child(exploration_weight=0) on the merged statistics
+        best_action = max(self.root_stats, key=lambda action: self.root_stats[action][1] / self.root_stats[action][0])
+
+        # continue with the plan of the worker that visited the best root action most
+        plans = [result for result in results if result[2] and result[2][0] == best_action]
+        if not plans:
+            new_game_state = self.game_state.apply(best_action)
+            return ([best_action], TreeNode(game_state=new_game_state, action=best_action))
+        (_, _, actions, final_node) = max(plans, key=lambda result: result[0][best_action][0])
+        return (actions, final_node)
+
+# entry point of the worker processes
+# only the root statistics and the plan are sent back, not the whole tree
+def _search_root(agent_class, game_state: GameState, time_limit: float, seed: int, agent_kwargs: dict):
+    random.seed(seed)
+    agent = agent_class(game_state, time_limit=time_limit, **agent_kwargs)
+    actions, final_node = agent.run()
+
+    # the array tree has no node objects to walk
+    if hasattr(agent, "root_statistics"):
+        root_stats = agent.root_statistics()
+    else:
+        root_stats = {}
+        for child in agent.root.children:
+            action = agent.root.child_action(child)
+            if isinstance(action, list):
+                action = action[0]
+            root_stats[action] = (child.visits, child.value)
+
+    # detach the final node so pickling it does not pull in the tree
+    final_node.parent = None
+    final_node.children = []
+    return (root_stats, agent.iteration_count, actions, final_node)
@@ -0,0 +1,195 @@
+import argparse
+import json
+import platform
+import random
+import subprocess
+import time
+import tracemalloc
+from playground.agents.mcts import MCTSAgent, GameState
+from playground.agents.emcts import EMCTSAgent
+from playground.agents.array_mcts import ArrayMCTSAgent
+from playground.utils.budget import Budget, PHASES
+
+# peak resident memory is only available on unix
+try:
+    import resource
+except ImportError:
+    resource = None
+
+AGENTS = {"mcts": MCTSAgent, "emcts": EMCTSAgent, "mcts_array": ArrayMCTSAgent}
+
+# play one game from a seeded random start and collect the search statistics of every decision
+def run_game(agent_name: str, seed: int, time_limit=None, iterations=None, max_decisions=200, trace_memory=False, agent_kwargs=None, reuse_tree=False,
+             actions_per_decision=None, fm_calls=None, profile=False) -> dict:
+    agent_class = AGENTS[agent_name]
+    agent_kwargs = dict(agent_kwargs or {})
+    # the budget is reset by every search, so one budget serves the whole game
+    budget = Budget(time_limit=time_limit, max_iterations=iterations, max_fm_calls=fm_calls, profile=profile)
+    agent_kwargs["budget"] = budget
+    agent_time_limit = time_limit if time_limit is not None else float("inf")
+
+    random.seed(seed)
+    state = GameState(random_init=True)
+
+    decisions = 0
+    total_iterations = 0
+    total_nodes = 0
+    max_tree_size = 0
+    search_time = 0.0
+    abstraction_time = 0.0
+    peak_traced = 0
+    total_fm_calls = 0
+    time_by_phase = dict.fromkeys(PHASES, 0)
+    fm_calls_by_phase = dict.fromkeys(PHASES, 0)
+    # nodes kept from the previous turn, per decision
+    retained_nodes = []
+
+    if trace_memory:
+        tracemalloc.start()
+
+    agent = None
+    actions = []
+    while not state.done and decisions < max_decisions:
+        if reuse_tree and agent is not None:
+            agent.advance(actions, state)
+            retained_nodes.append(agent.count_nodes() - 1)
+        else:
+            agent = agent_class(state, time_limit=agent_time_limit, **agent_kwargs)
+            retained_nodes.append(0)
+
+        start = time.perf_counter()
+        actions, _ = agent.run()
+        search_time += time.perf_counter() - start
+        # executing only the start of the plan leaves a subtree worth reusing
+        if actions_per_decision is not None:
+            actions = actions[:actions_per_decision]
+
+        tree_size = agent.count_nodes()
+        total_iterations += agent.iteration_count
+        total_nodes += tree_size
+        max_tree_size = max(max_tree_size, tree_size)
+        abstraction_time += getattr(agent, "abstraction_time", 0.0)
+        total_fm_calls += budget.fm_calls
+        for phase in PHASES:
+            time_by_phase[phase] += budget.time_by_phase[phase]
+            fm_calls_by_phase[phase] += budget.fm_calls_by_phase[phase]
+        if trace_memory:
+            peak_traced = max(peak_traced, tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+
+        state = state.simulate_turns(actions)
+        decisions += 1
+
+    if trace_memory:
+        tracemalloc.stop()
+
+    return {
+        "agent": agent_name,
+        "seed": seed,
+        "decisions": decisions,
+        "iterations": total_iterations,
+        "iterations_per_sec": total_iterations / search_time if search_time else 0.0,
+        "nodes": total_nodes,
+        "nodes_per_sec": total_nodes / search_time if search_time else 0.0,
+        "fm_calls": total_fm_calls,
+        "fm_calls_per_sec": total_fm_calls / search_time if search_time else 0.0,
+        "time_by_phase_ns": time_by_phase if profile else None,
+        "fm_calls_by_phase": fm_calls_by_phase,
+        "max_tree_size": max_tree_size,
+        "search_time": search_time,
+        "abstraction_share": abstraction_time / search_time if search_time else 0.0,
+        "peak_traced_mb": peak_traced / 2**20 if trace_memory else None,
+        "retained_nodes": retained_nodes,
+        "won": state.opponent.health <= 0,
+        "turns": state.turn,
+        "final_reward": state.reward,
+    }
+
+# run every agent on every seed and summarise the runs per agent
+def run_benchmark(agents: list, seeds: list, time_limit=None, iterations=None, max_decisions=200, trace_memory=False, agent_kwargs=None, reuse_tree=False,
+                  actions_per_decision=None, fm_calls=None, profile=False) -> dict:
+    runs = []
+    for agent_name in agents:
+        for seed in seeds:
+            runs.append(run_game(agent_name, seed, time_limit=time_limit, iterations=iterations, max_decisions=max_decisions,
+                                 trace_memory=trace_memory, agent_kwargs=agent_kwargs, reuse_tree=reuse_tree,
+                                 actions_per_decision=actions_per_decision, fm_calls=fm_calls, profile=profile))
+
+    summary = {}
+    for agent_name in agents:
+        agent_runs = [run for run in runs if run["agent"] == agent_name]
+        search_time = sum(run["search_time"] for run in agent_runs)
+        summary[agent_name] = {
+            "iterations_per_sec": sum(run["iterations"] for run in agent_runs) / search_time if search_time else 0.0,
+            "nodes_per_sec": sum(run["nodes"] for run in agent_runs) / search_time if search_time else 0.0,
+            "fm_calls_per_sec": sum(run["fm_calls"] for run in agent_runs) / search_time if search_time else 0.0,
+            "fm_call_split": _split([run["fm_calls_by_phase"] for run in agent_runs]),
+            "time_split": _split([run["time_by_phase_ns"] for run in agent_runs]) if profile else None,
+            "win_rate": sum(run["won"] for run in agent_runs) / len(agent_runs),
+            "mean_turns": sum(run["turns"] for run in agent_runs) / len(agent_runs),
+            "mean_final_reward": sum(run["final_reward"] for run in agent_runs) / len(agent_runs),
+            "mean_retained_nodes": sum(sum(run["retained_nodes"]) for run in agent_runs) / max(1, sum(run["decisions"] for run in agent_runs)),
+        }
+
+    return {
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "budget": {"time_limit": time_limit, "iterations": iterations, "fm_calls": fm_calls},
+        "reuse_tree": reuse_tree,
+        "actions_per_decision": actions_per_decision,
+        "seeds": seeds,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024 if resource is not None else None,
+        "summary": summary,
+        "runs": runs,
+    }
+
+# share of every phase summed over the runs
+def _split(by_phase: list) -> dict:
+    totals = {phase: sum(values[phase] for values in by_phase) for phase in PHASES}
+    total = sum(totals.values())
+    return {phase: (value / total if total else 0.0) for phase, value in totals.items()}
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the MCTS and EMCTS agents on seeded random starts.")
+    parser.add_argument("--agents", nargs="+", choices=list(AGENTS), default=list(AGENTS), help="Agents to benchmark.")
+    parser.add_argument("--seeds", nargs="+", type=int, default=list(range(10)), help="Seeds of the random starts.")
+    budget = parser.add_mutually_exclusive_group()
+    budget.add_argument("--time_limit", type=float, default=None, help="Time budget per decision in seconds.")
+    budget.add_argument("--iterations", type=int, default=None, help="Fixed number of iterations per decision (reproducible).")
+    budget.add_argument("--fm_calls", type=int, default=None, help="Fixed number of forward model calls per decision (reproducible).")
+    parser.add_argument("--max_decisions", type=int, default=200, help="Stop a game after this many decisions.")
+    parser.add_argument("--profile", action="store_true", help="Time the select, expand, simulate, backpropagate and abstraction phases.")
+    parser.add_argument("--trace_memory", action="store_true", help="Track the peak Python memory of the search with tracemalloc (slow).")
+    parser.add_argument("--reuse_tree", action="store_true", help="Keep the subtree of the executed actions between decisions.")
+    parser.add_argument("--actions_per_decision", type=int, default=None, help="Execute only this many actions of each plan (default: the whole plan).")
+    parser.add_argument("--output", default=None, help="Write the results as JSON to this file.")
+    args = parser.parse_args()
+
+    iterations = args.iterations
+    if args.time_limit is None and iterations is None and args.fm_calls is None:
+        iterations = 500
+
+    results = run_benchmark(args.agents, args.seeds, time_limit=args.time_limit, iterations=iterations,
+                            max_decisions=args.max_decisions, trace_memory=args.trace_memory, reuse_tree=args.reuse_tree,
+                            actions_per_decision=args.actions_per_decision, fm_calls=args.fm_calls, profile=args.profile)
+
+    for agent_name, summary in results["summary"].items():
+        print(f"{agent_name}: {summary['iterations_per_sec']:.0f} iterations/s, {summary['nodes_per_sec']:.0f} nodes/s, "
+              f"win rate {summary['win_rate']:.2f}, turns {summary['mean_turns']:.1f}, reward {summary['mean_final_reward']:.2f}, "
+              f"retained nodes {summary['mean_retained_nodes']:.0f}, {summary['fm_calls_per_sec']:.0f} forward model calls/s")
+        split = summary["time_split"] if args.profile else summary["fm_call_split"]
+        print(f"    {'time' if args.profile else 'forward model calls'}: " + ", ".join(f"{phase} {share:.2f}" for phase, share in split.items()))
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+        print(f"Results written to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -1,32 +1,94 @@
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from playground.agents.mcts import MCTSAgent, GameState
 from playground.agents.emcts import EMCTSAgent
+from playground.agents.array_mcts import ArrayMCTSAgent
+from playground.agents.parallel import RootParallelAgent
+from playground.utils.budget import Budget
 
 def main():
     parser = argparse.ArgumentParser(description="Run MCTS or EMCTS on the GameState.")
-    parser.add_argument("--agent", choices=["mcts", "emcts"], default="mcts", help="Choose the agent: 'mcts' or 'emcts'.")
+    parser.add_argument("--agent", choices=["mcts", "emcts", "mcts_array"], default="mcts", help="Choose the agent: 'mcts', 'emcts' or 'mcts_array'.")
     parser.add_argument("--random_init", action="store_true", help="Initialize the GameState positions randomly.")
     parser.add_argument("--debug", action="store_true", help="Run with debug")
+    parser.add_argument("--rollouts_per_leaf", type=int, default=None, help="Number of batched rollouts per simulated leaf (default: 1, or --workers with --leaf_parallel).")
+    parser.add_argument("--transposition_table_size", type=int, default=0, help="Share nodes of identical states in a table of this size (0 disables it).")
+    parser.add_argument("--node_cap", type=int, default=100000, help="Maximum number of nodes of the 'mcts_array' tree.")
+    parser.add_argument("--at_cap", choices=["stop", "prune"], default="stop", help="Stop expanding or prune the least visited subtrees when the 'mcts_array' tree is full.")
+    parser.add_argument("--reuse_tree", action="store_true", help="Keep the subtree of the executed actions for the next turn.")
+    parser.add_argument("--actions_per_turn", type=int, default=None, help="Execute only this many actions of each plan (default: the whole plan).")
+    parser.add_argument("--iterations", type=int, default=None, help="Stop each search after this many iterations.")
+    parser.add_argument("--fm_calls", type=int, default=None, help="Stop each search after this many forward model calls.")
+    parser.add_argument("--workers", type=int, default=1, help="Number of worker processes, more than 1 runs a root parallel search.")
+    parser.add_argument("--leaf_parallel", action="store_true", help="Use the workers for the rollouts of each leaf instead of separate trees.")
     args = parser.parse_args()
 
+    # the array tree has its own rollouts and no shared nodes
+    if args.agent == "mcts_array":
+        if args.leaf_parallel:
+            parser.error("--leaf_parallel is not supported by 'mcts_array', use --workers for a root parallel search")
+        if args.rollouts_per_leaf is not None:
+            parser.error("--rollouts_per_leaf is not supported by 'mcts_array'")
+        if args.transposition_table_size != 0:
+            parser.error("--transposition_table_size is not supported by 'mcts_array'")
+
+    # the workers of a leaf parallel search share the rollouts of each leaf, one rollout would keep all but one idle
+    if args.leaf_parallel:
+        if args.workers <= 1:
+            parser.error("--leaf_parallel needs --workers greater than 1")
+        if args.rollouts_per_leaf is None:
+            args.rollouts_per_leaf = args.workers
+        elif args.rollouts_per_leaf <= 1:
+            parser.error("--leaf_parallel needs --rollouts_per_leaf greater than 1")
+    elif args.rollouts_per_leaf is None:
+        args.rollouts_per_leaf = 1
+
     print(f"Running {args.agent} -- random initialization {args.random_init}")
 
     state = GameState(random_init=args.random_init)
     runs = 1
     total_actions = []
 
+    if args.agent == "mcts_array":
+        agent_class = ArrayMCTSAgent
+        agent_kwargs = {"node_cap": args.node_cap, "at_cap": args.at_cap}
+    else:
+        agent_class = MCTSAgent if args.agent == "mcts" else EMCTSAgent
+        agent_kwargs = {"rollouts_per_leaf": args.rollouts_per_leaf, "transposition_table_size": args.transposition_table_size}
+
+    # the agents build an unprofiled budget of their time limit, --debug needs its own to report the time split
+    if (args.iterations is not None) or (args.fm_calls is not None):
+        agent_kwargs["budget"] = Budget(max_iterations=args.iterations, max_fm_calls=args.fm_calls, profile=args.debug)
+    elif args.debug:
+        agent_kwargs["budget"] = Budget(time_limit=0.1, profile=True)
+
+    # the worker processes are kept alive for the whole game
+    executor = ProcessPoolExecutor(max_workers=args.workers) if args.workers > 1 else None
+    if executor is not None and args.leaf_parallel:
+        agent_kwargs.update(executor=executor, workers=args.workers)
+
+    agent = None
     while not state.done:
         print(f"=============== RUN {runs} ===============")
         
-        if args.agent == "mcts":
-            agent = MCTSAgent(game_state=state, time_limit=0.1)
-        elif args.agent == "emcts":
-            agent = EMCTSAgent(game_state=state, time_limit=0.1)
+        if executor is not None and not args.leaf_parallel:
+            agent = RootParallelAgent(game_state=state, time_limit=0.1, workers=args.workers, agent_class=agent_class, executor=executor, **agent_kwargs)
+        elif args.reuse_tree and agent is not None:
+            reused = agent.advance(best_action_sequence, state)
+            print(f"Reused tree: {reused}, retained nodes: {agent.count_nodes()}")
+        else:
+            agent = agent_class(game_state=state, time_limit=0.1, **agent_kwargs)
         
         best_action_sequence, final_node = agent.run()
+        if args.actions_per_turn is not None:
+            best_action_sequence = best_action_sequence[:args.actions_per_turn]
         
         print(f"Best action sequence: {best_action_sequence}")
         print(f"Best final node: {final_node}")
+        if args.debug and getattr(agent, "budget", None) is not None:
+            print(f"Budget: {agent.budget}, time split: {agent.budget.time_split()}")
+        if getattr(agent, "transpositions", None) is not None:
+            print(f"Transpositions: {agent.transpositions}")
 
         total_actions.extend(best_action_sequence)
         
@@ -43,5 +105,8 @@ def main():
     print(f"FINAL SEQUENCE: {total_actions}")
     print(f"BEST FINAL NODE: {final_node}")
 
+    if executor is not None:
+        executor.shutdown()
+
 if __name__ == "__main__":
     main()
@@ -1,5 +1,13 @@
-import copy
 from playground.utils.gamestate import GameState
+from playground.utils.actions import ACTION_BITS, MASK_ACTIONS, actions_mask
+
+# remove a node from a list by identity, nodes compare equal when their values are
+def remove_node(nodes: list, node) -> None:
+    for i, list_node in enumerate(nodes):
+        if list_node is node:
+            del nodes[i]
+            return
+    raise ValueError(f"{node} is not in the list")
 
 class AbstractTreeNode:
     def __init__(self, game_state: GameState, parent=None, action=None) -> None:
@@ -7,10 +15,20 @@ class AbstractTreeNode:
         self.parent: AbstractTreeNode = parent 
         self.children: list[AbstractTreeNode] = []
         self.action = [action] if action is not None else []
+        self.depth = parent.depth + 1 if parent is not None else 0
         self.visits = 0
         self.value = 0
         self.original_children: list[AbstractTreeNode] = []
+        # ids of the original children that were linked by the merge, the others were moved to this node
+        self.merged_links = set()
         self.merged_with: AbstractTreeNode = None
+        # actions towards children that are owned by another parent (see link_child)
+        self.linked_actions = {}
+        # key of the node in the transposition table, see TranspositionTable.restore
+        self.transposition_key = None
+        # bitmasks of the legal actions (computed on first use) and of the actions that already have a child
+        self.legal_mask = None
+        self.tried_mask = 0
     
     def __repr__(self) -> str:
         if self.merge_with:
@@ -26,28 +44,56 @@ class AbstractTreeNode:
         # Compute a hash based on unique properties of the node
         return hash((self.game_state, self.parent, tuple(self.action)))
 
+    # legal actions that no child has been reached with yet, see playground.utils.actions
+    def untried_mask(self) -> int:
+        if self.legal_mask is None:
+            self.legal_mask = self.game_state.legal_mask()
+        return self.legal_mask & ~self.tried_mask
+
     # check if there are any available moves
     def is_fully_expanded(self) -> bool:
+        untried_mask = self.untried_mask()
         # check before abstraction i.e. there are as many children as there are available moves
-        if len(self.children) == len(self.game_state.get_available_moves()):
+        if len(self.children) == len(MASK_ACTIONS[self.legal_mask]):
             return True
         
         #check if all available moves have been used in the children
-        all_actions = self.game_state.get_available_moves()
-        tried_actions = []
-        for child in self.children:
-            tried_actions.extend(child.action)
-        
-        return all(move in tried_actions for move in all_actions)
+        return untried_mask == 0
 
     # add new node based on an action
     def add_child(self, action) -> None:
-        # need to make a deepcopy of the game state to not mess with the current one we have
-        new_game_state = copy.deepcopy(self.game_state)
-        new_game_state.player_action(action)
+        # apply works on a clone of the game state to not mess with the current one we have
+        new_game_state = self.game_state.apply(action)
         new_node = AbstractTreeNode(game_state=new_game_state, parent=self, action=action)
-        self.children.append(new_node)
+        self.append_child(new_node, action)
+
+    # add a node that is owned by this node as child
+    def append_child(self, node, action) -> None:
+        self.tried_mask |= ACTION_BITS[action]
+        self.children.append(node)
     
+    # link an existing node as child, used by transposition tables and turns the tree into a DAG
+    # a node that is already a child keeps its edge, so unmerge does not drop the link of a merged child twice
+    def link_child(self, node, action) -> None:
+        if any(child is node for child in self.children):
+            self.tried_mask |= ACTION_BITS[action]
+            return
+        self.linked_actions[id(node)] = action
+        self.append_child(node, action)
+
+    # the actions that lead from this node to the child
+    def child_action(self, child) -> list:
+        action = self.linked_actions.get(id(child))
+        if action is None:
+            return child.action
+        return [action]
+
+    # the children of other that a merge adds to this node
+    # with transpositions both nodes can reach the same child, which this node keeps as it is
+    def absorbable_children(self, other) -> list:
+        own_children = {id(child) for child in self.children}
+        return [child for child in other.children if id(child) not in own_children]
+
     # merge nodes that are similar
     # we average their cumulative rewards and visits
     def merge_with(self, other):
@@ -56,11 +102,18 @@ class AbstractTreeNode:
         if not self.merged_with:
 
             #if the other node has children we save them
-            if other.children:
-                for child in other.children:
-                    self.original_children.append(child)
+            for child in self.absorbable_children(other):
+                self.original_children.append(child)
+                # linked children keep their owner, only the action towards them moves
+                if id(child) in other.linked_actions:
+                    self.linked_actions[id(child)] = other.linked_actions[id(child)]
+                    self.merged_links.add(id(child))
+                else:
                     child.parent = self
-                    self.children.append(child)
+                self.children.append(child)
+
+            # the actions towards the absorbed children count as tried
+            self.tried_mask |= other.tried_mask
 
             #show that this node is merged
             self.merged_with = other
@@ -74,7 +127,7 @@ class AbstractTreeNode:
             self.visits = round((self.visits + other.visits) / 2)
             self.value = (self.value + other.value) / 2
 
-            self.parent.children.remove(other)
+            remove_node(self.parent.children, other)
         
     
     # method to unmerge the changes and to revert back to the original tree
@@ -83,10 +136,17 @@ class AbstractTreeNode:
 
             #get original node that was merged and add children to it
             unmerged_node = self.merged_with
+            # only the children added by the merge are given back, with the links it created
             for child in self.original_children:
-                child.parent = unmerged_node
-                self.children.remove(child)
+                if id(child) in self.merged_links:
+                    self.linked_actions.pop(id(child))
+                else:
+                    child.parent = unmerged_node
+                remove_node(self.children, child)
             
+            # only the actions towards the remaining children stay tried
+            self.tried_mask = actions_mask(action for child in self.children for action in self.child_action(child))
+
             #update values
             unmerged_node.value = self.value
             unmerged_node.visits = self.visits
@@ -98,6 +158,7 @@ class AbstractTreeNode:
             # clear merge
             self.merged_with = None
             self.original_children = []
+            self.merged_links = set()
 
     # print the tree
     def pretty_print(self, prefix="", is_last=True):
@@ -0,0 +1,34 @@
+# integer encoding of the player actions
+# ids are in the order of GameState.get_available_moves, so the lowest untried bit is the next move to expand
+UP, DOWN, LEFT, RIGHT, ATTACK = range(5)
+ACTION_NAMES = ("up", "down", "left", "right", "attack")
+ACTION_IDS = {name: action_id for action_id, name in enumerate(ACTION_NAMES)}
+
+# legal moves as bitmasks, bit i is set when action id i is legal
+MOVE_MASK = (1 << UP) | (1 << DOWN) | (1 << LEFT) | (1 << RIGHT)
+ATTACK_BIT = 1 << ATTACK
+ALL_ACTIONS_MASK = MOVE_MASK | ATTACK_BIT
+
+# names and ids both map to the id and the bit, strings are only accepted at the boundary
+_ACTION_LOOKUP = {**ACTION_IDS, **{action_id: action_id for action_id in range(len(ACTION_NAMES))}}
+ACTION_BITS = {action: 1 << action_id for action, action_id in _ACTION_LOOKUP.items()}
+
+# precomputed per mask: the legal ids in order, their names, and the first (lowest) id or -1
+MASK_ACTIONS = tuple(tuple(action_id for action_id in range(len(ACTION_NAMES)) if mask & (1 << action_id)) for mask in range(ALL_ACTIONS_MASK + 1))
+MASK_NAMES = tuple(tuple(ACTION_NAMES[action_id] for action_id in actions) for actions in MASK_ACTIONS)
+FIRST_ACTION = tuple(actions[0] if actions else -1 for actions in MASK_ACTIONS)
+
+# id of an action given by name or id, None for unknown actions
+def to_action_id(action):
+    return _ACTION_LOOKUP.get(action)
+
+# name of an action given by name or id
+def to_action_name(action) -> str:
+    return ACTION_NAMES[_ACTION_LOOKUP[action]]
+
+# bitmask of a list of actions given by name or id
+def actions_mask(actions) -> int:
+    mask = 0
+    for action in actions:
+        mask |= ACTION_BITS[action]
+    return mask
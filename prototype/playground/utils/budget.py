@@ -0,0 +1,101 @@
+import time
+
+# phases of a search iteration, the budgets report how the spent budget splits between them
+PHASES = ("select", "expand", "simulate", "backpropagate", "abstraction")
+
+# search budget of one decision, like the budget types of the native agents (see Stratega/Agent/AgentParameters.h)
+# every limit that is set can end the search, the clock is only read every check_every iterations
+class Budget:
+    def __init__(self, time_limit=None, max_iterations=None, max_fm_calls=None, check_every=16, profile=False) -> None:
+        self.time_limit = time_limit
+        self.max_iterations = max_iterations
+        self.max_fm_calls = max_fm_calls
+        self.check_every = max(1, check_every)
+        # time every phase with perf_counter_ns, costs one clock read per phase
+        self.profile = profile
+        self.time_limit_ns = None if (time_limit is None) or (time_limit == float("inf")) else int(time_limit * 1e9)
+        self.reset()
+
+    def __repr__(self) -> str:
+        return (f"{type(self).__name__}(time_limit={self.time_limit}, max_iterations={self.max_iterations}, max_fm_calls={self.max_fm_calls}, "
+                f"iterations={self.iterations}, fm_calls={self.fm_calls}, elapsed={self.elapsed():.4f}s)")
+
+    # start the budget of a new decision
+    def reset(self) -> None:
+        self.iterations = 0
+        self.fm_calls = 0
+        self.time_over = False
+        self.next_check = 0
+        self.fm_calls_by_phase = dict.fromkeys(PHASES, 0)
+        self.time_by_phase = dict.fromkeys(PHASES, 0)
+        self.start_ns = time.perf_counter_ns()
+        self.lap_ns = self.start_ns
+
+    # between two checks the hot loop only compares the iteration count
+    def is_over(self) -> bool:
+        if self.iterations < self.next_check:
+            return False
+        return self._check()
+
+    def _check(self) -> bool:
+        if (self.max_iterations is not None) and (self.iterations >= self.max_iterations):
+            return True
+        # iterations that select a terminal state make no calls, so they are bounded by the same number
+        if (self.max_fm_calls is not None) and ((self.fm_calls >= self.max_fm_calls) or (self.iterations >= self.max_fm_calls)):
+            return True
+        if self.time_limit_ns is not None:
+            self.time_over = (time.perf_counter_ns() - self.start_ns) >= self.time_limit_ns
+            if self.time_over:
+                return True
+
+        # the calls of an iteration are not known in advance, so a call budget is checked every iteration
+        if self.max_fm_calls is not None:
+            self.next_check = self.iterations + 1
+        elif self.time_limit_ns is not None:
+            self.next_check = self.iterations + self.check_every
+        else:
+            self.next_check = float("inf")
+        if self.max_iterations is not None:
+            self.next_check = min(self.next_check, self.max_iterations)
+        return False
+
+    # forward model calls (GameState.player_action) made in a phase
+    def count_fm_calls(self, phase: str, calls=1) -> None:
+        self.fm_calls += calls
+        self.fm_calls_by_phase[phase] += calls
+
+    # add the time since the previous lap to the phase, only called when profiling
+    def lap(self, phase: str) -> None:
+        now = time.perf_counter_ns()
+        self.time_by_phase[phase] += now - self.lap_ns
+        self.lap_ns = now
+
+    def elapsed(self) -> float:
+        return (time.perf_counter_ns() - self.start_ns) / 1e9
+
+    # share of each phase in the profiled time
+    def time_split(self) -> dict:
+        return _shares(self.time_by_phase)
+
+    # share of each phase in the forward model calls
+    def fm_call_split(self) -> dict:
+        return _shares(self.fm_calls_by_phase)
+
+# fixed number of iterations, reproducible
+class IterationBudget(Budget):
+    def __init__(self, max_iterations: int, **kwargs) -> None:
+        super().__init__(max_iterations=max_iterations, **kwargs)
+
+# fixed number of forward model calls, compares agents that spend different work per iteration
+class ForwardModelBudget(Budget):
+    def __init__(self, max_fm_calls: int, **kwargs) -> None:
+        super().__init__(max_fm_calls=max_fm_calls, **kwargs)
+
+# wall clock limit in seconds, measured with perf_counter_ns every check_every iterations
+class TimeBudget(Budget):
+    def __init__(self, time_limit: float, check_every=16, **kwargs) -> None:
+        super().__init__(time_limit=time_limit, check_every=check_every, **kwargs)
+
+def _shares(values: dict) -> dict:
+    total = sum(values.values())
+    return {phase: (value / total if total else 0.0) for phase, value in values.items()}
@@ -2,6 +2,9 @@ ATTACK_DAMAGE = 10
 MOVEMENT_LIMIT = 2
 
 class Player():
+    # fixed attribute layout keeps players small and cheap to clone
+    __slots__ = ("name", "position", "health", "movement_points", "max_movement")
+
     def __init__(self, name:str, start_position: tuple, health: int, movement_points=MOVEMENT_LIMIT):
         self.name = name
         self.position = list(start_position)
@@ -12,6 +15,16 @@ class Player():
     def __repr__(self) -> str:
         return f"{self.name}: Pos={tuple(self.position)}, HP={self.health}, MP={self.movement_points}"
     
+    # copy of the player without going through copy.deepcopy
+    def clone(self) -> "Player":
+        player = Player.__new__(Player)
+        player.name = self.name
+        player.position = [self.position[0], self.position[1]]
+        player.health = self.health
+        player.movement_points = self.movement_points
+        player.max_movement = self.max_movement
+        return player
+    
     def moveUp(self):
         if self.movement_points > 0:
             self.position[1] += 1
@@ -38,4 +51,4 @@ class Player():
     
     # refresh movement points at the end of a turn
     def reset(self):
-        self.movement_points = self.max_movement
\ No newline at end of file
+        self.movement_points = self.max_movement
@@ -1,11 +1,17 @@
 from playground.utils.character import Player, ATTACK_DAMAGE, MOVEMENT_LIMIT
 from playground.utils.rewards import calculate_reward
-import copy
+from playground.utils.actions import ATTACK, MOVE_MASK, ATTACK_BIT, MASK_NAMES, to_action_id
 import random
 
 MAX_TURNS = 100
 
+# movement of the player per action id, attack is handled separately as it needs the opponent
+PLAYER_MOVES = (Player.moveUp, Player.moveDown, Player.moveLeft, Player.moveRight)
+
 class GameState():
+    # fixed attribute layout, subclasses (e.g. test mocks) still get a __dict__
+    __slots__ = ("done", "turn", "map_size", "player", "opponent", "reward")
+
     def __init__(self, map_size=20, random_init=False):
         self.done = False
         self.turn = 0
@@ -33,6 +39,45 @@ class GameState():
     def __hash__(self) -> int:
         return hash((self.player.position[0], self.player.position[1], self.opponent.health, self.player.movement_points, self.turn, self.reward))
     
+    # copy of the gamestate that replaces copy.deepcopy in the tree and rollouts
+    def clone(self) -> "GameState":
+        new_state = object.__new__(type(self))
+        for name in GameState.__slots__:
+            if hasattr(self, name):
+                value = getattr(self, name)
+                if isinstance(value, Player):
+                    value = value.clone()
+                setattr(new_state, name, value)
+        # subclasses without slots keep their extra attributes
+        if hasattr(self, "__dict__"):
+            new_state.__dict__.update(self.__dict__)
+        return new_state
+
+    # immutable step: return the state after the action and leave this one untouched
+    def apply(self, action) -> "GameState":
+        new_state = self.clone()
+        new_state.player_action(action)
+        return new_state
+
+    # fixed-width encoding (player x, y, hp, mp, opponent x, y, hp, turn, done)
+    def to_tuple(self) -> tuple:
+        return (self.player.position[0], self.player.position[1], self.player.health, self.player.movement_points,
+                self.opponent.position[0], self.opponent.position[1], self.opponent.health, self.turn, self.done)
+
+    # rebuild a gamestate from the encoding returned by to_tuple
+    @classmethod
+    def from_tuple(cls, values: tuple, map_size=20) -> "GameState":
+        (player_x, player_y, player_hp, player_mp, opp_x, opp_y, opp_hp, turn, done) = values
+        new_state = object.__new__(cls)
+        new_state.done = done
+        new_state.turn = turn
+        new_state.map_size = map_size
+        new_state.player = Player(name="Player", start_position=(player_x, player_y), health=player_hp)
+        new_state.player.movement_points = player_mp
+        new_state.opponent = Player(name="Opp", start_position=(opp_x, opp_y), health=opp_hp, movement_points=0)
+        new_state.reward = calculate_reward(new_state)
+        return new_state
+    
     # check if the game is done if either player is dead or max turns have been reached
     def check_done(self) -> None:
         if (self.player.health <= 0) or (self.opponent.health <= 0) or (self.turn >= MAX_TURNS):
@@ -51,33 +96,24 @@ class GameState():
     # return all possible moves that a player can make
     # if we are iterating in the tree and we want to check for the next turn, we will need to make sure that we update the turns and movement points here
     def get_available_moves(self) -> list:
-        moves = []
-        if not self.done:
-            if self.player.movement_points > 0:
-                moves.extend(["up", "down", "left", "right"])
-                if self.can_attack():
-                    moves.append("attack")
-                return moves
-            # no movement points left
-            else:
-                self.turn += 1
-                self.player.reset()
-                return self.get_available_moves()
+        return list(MASK_NAMES[self.legal_mask()])
 
+    # bitmask of the legal action ids (see playground.utils.actions), starts the next turn like get_available_moves
+    def legal_mask(self) -> int:
+        if self.done:
+            return 0
+        # no movement points left
+        self.refresh_turn()
+        return (MOVE_MASK | ATTACK_BIT) if self.can_attack() else MOVE_MASK
 
     # run actions for the player only as the opponent will do nothing
+    # the action is an id from playground.utils.actions or its name
     def player_action(self, command) -> None:
-        match command:
-            case "up":
-                self.player.moveUp()
-            case "down":
-                self.player.moveDown()
-            case "left":
-                self.player.moveLeft()
-            case "right":
-                self.player.moveRight()
-            case "attack":
-                self.player.attack(self.opponent)
+        action = to_action_id(command)
+        if action == ATTACK:
+            self.player.attack(self.opponent)
+        elif action is not None:
+            PLAYER_MOVES[action](self.player)
         
         self.check_done()
 
@@ -85,14 +121,18 @@ class GameState():
     
     # forward model that advances the game by n actions
     def simulate_turns(self, actions: list):
-        game_state_copy = copy.deepcopy(self)
+        game_state_copy = self.clone()
         for action in actions:
             game_state_copy.player_action(action)
-            if game_state_copy.player.movement_points == 0:
-                game_state_copy.turn += 1
-                game_state_copy.player.reset()
+            game_state_copy.refresh_turn()
         return game_state_copy
 
+    # start the next turn once the player ran out of movement points
+    def refresh_turn(self) -> None:
+        if self.player.movement_points == 0:
+            self.turn += 1
+            self.player.reset()
+
     def print_map(self):
         grid = [["." for _ in range(self.map_size)] for _ in range(self.map_size)]
         
@@ -27,3 +27,15 @@ def calculate_reward(game_state) -> float:
     reward = opponent_health_penalty - player_health_penalty - turn_penalty + victory_bonus + proximity_reward
     
     return reward
+
+
+# same heuristic as calculate_reward on numpy arrays, one entry per gamestate
+def calculate_reward_batch(player_x, player_y, player_hp, opp_x, opp_y, opp_hp, turn):
+    opponent_health_penalty = 20 - opp_hp
+    player_health_penalty = 100 - player_hp
+    distance_to_opponent = ((player_x - opp_x) ** 2 + (player_y - opp_y) ** 2) ** 0.5
+    max_distance = ((12 - 0) ** 2 + (12 - 0) ** 2) ** 0.5
+    proximity_reward = (max_distance - distance_to_opponent) / max_distance * 10
+    turn_penalty = turn / 100
+    victory_bonus = (opp_hp <= 0) * 100
+    return opponent_health_penalty - player_health_penalty - turn_penalty + victory_bonus + proximity_reward
@@ -0,0 +1,62 @@
+import numpy as np
+from playground.utils.character import ATTACK_DAMAGE
+from playground.utils.gamestate import GameState, MAX_TURNS
+from playground.utils.rewards import calculate_reward_batch
+from playground.utils.actions import UP, DOWN, LEFT, RIGHT, ATTACK
+
+# run random rollouts for many gamestates at once
+# every row advances in lock-step and mirrors GameState.get_available_moves / player_action
+# states are repeated `repeats` times, the result holds one reward per rollout in the same order
+def batch_rollout(states: list[GameState], repeats=1, max_depth=5, rng: np.random.Generator = None) -> np.ndarray:
+    if rng is None:
+        rng = np.random.default_rng()
+
+    encoded = np.array([state.to_tuple() for state in states], dtype=np.int64)
+    encoded = np.repeat(encoded, repeats, axis=0)
+    (player_x, player_y, player_hp, player_mp, opp_x, opp_y, opp_hp, turn, done) = (encoded[:, i].copy() for i in range(9))
+    done = done.astype(bool)
+    max_mp = np.repeat(np.array([state.player.max_movement for state in states], dtype=np.int64), repeats)
+    rewards = np.repeat(np.array([state.reward for state in states], dtype=np.float64), repeats)
+
+    for _ in range(max_depth):
+        active = ~done
+        if not active.any():
+            break
+
+        # no movement points left: next turn (see GameState.get_available_moves)
+        refresh = active & (player_mp <= 0)
+        turn[refresh] += 1
+        player_mp[refresh] = max_mp[refresh]
+
+        # uniform choice over the 4 moves, plus attack when next to the opponent
+        can_attack = ((player_x - opp_x) ** 2 + (player_y - opp_y) ** 2) <= 2
+        move_count = 4 + can_attack
+        action = (rng.random(len(done)) * move_count).astype(np.int64)
+
+        player_y += active & (action == UP)
+        player_y -= active & (action == DOWN)
+        player_x -= active & (action == LEFT)
+        player_x += active & (action == RIGHT)
+        opp_hp -= ATTACK_DAMAGE * (active & (action == ATTACK))
+        player_mp -= active
+
+        done |= active & ((player_hp <= 0) | (opp_hp <= 0) | (turn >= MAX_TURNS))
+        rewards = np.where(active, calculate_reward_batch(player_x, player_y, player_hp, opp_x, opp_y, opp_hp, turn), rewards)
+
+    return rewards
+
+
+# leaf parallelism: split the rollouts of one leaf over the worker processes of an executor
+def parallel_rollout(executor, game_state: GameState, repeats: int, workers: int, max_depth=5, rng: np.random.Generator = None) -> np.ndarray:
+    if rng is None:
+        rng = np.random.default_rng()
+
+    chunk_sizes = [len(chunk) for chunk in np.array_split(np.arange(repeats), workers) if len(chunk) > 0]
+    seeds = rng.integers(2**32, size=len(chunk_sizes))
+    futures = [executor.submit(_seeded_rollout, game_state, chunk_size, max_depth, int(seed))
+               for chunk_size, seed in zip(chunk_sizes, seeds)]
+    return np.concatenate([future.result() for future in futures])
+
+# entry point of the worker processes, generators are created in the worker from the seed
+def _seeded_rollout(game_state: GameState, repeats: int, max_depth: int, seed: int) -> np.ndarray:
+    return batch_rollout([game_state], repeats=repeats, max_depth=max_depth, rng=np.random.default_rng(seed))
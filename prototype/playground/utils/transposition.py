@@ -0,0 +1,54 @@
+from collections import OrderedDict
+from playground.utils.gamestate import GameState
+
+# bounded table from gamestates to tree nodes, the least recently used entry is dropped when full
+# keys are the fixed-width encoding of the state as gamestates are updated in place by get_available_moves
+class TranspositionTable:
+    def __init__(self, max_size=100000) -> None:
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, game_state: GameState):
+        key = game_state.to_tuple()
+        node = self.entries.get(key)
+        if node is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return node
+
+    # the key is kept on the node, see restore
+    def store(self, game_state: GameState, node) -> None:
+        key = game_state.to_tuple()
+        node.transposition_key = key
+        self._insert(key, node)
+
+    # store a node again under the key it was stored with
+    # its game state may have been refreshed in place since, which changes the encoding but not the lookups that lead to it
+    def restore(self, node) -> None:
+        if node.transposition_key is None:
+            self.store(node.game_state, node)
+        else:
+            self._insert(node.transposition_key, node)
+
+    def _insert(self, key, node) -> None:
+        self.entries[key] = node
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def occupancy(self) -> float:
+        return len(self.entries) / self.max_size
+
+    def __repr__(self) -> str:
+        return f"TranspositionTable(size={len(self)}/{self.max_size}, hit rate={self.hit_rate():.2f})"
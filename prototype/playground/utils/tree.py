@@ -1,5 +1,5 @@
-import copy
 from playground.utils.gamestate import GameState
+from playground.utils.actions import ACTION_BITS
 
 class TreeNode:
     def __init__(self, game_state: GameState, parent=None, action=None) -> None:
@@ -9,21 +9,47 @@ class TreeNode:
         self.action = action
         self.visits = 0
         self.value = 0
+        # actions towards children that are owned by another parent (see link_child)
+        self.linked_actions = {}
+        # key of the node in the transposition table, see TranspositionTable.restore
+        self.transposition_key = None
+        # bitmasks of the legal actions (computed on first use) and of the actions that already have a child
+        self.legal_mask = None
+        self.tried_mask = 0
     
     def __repr__(self) -> str:
         return f"{self.action} -> {self.game_state})"
 
+    # legal actions without a child yet, see playground.utils.actions
+    def untried_mask(self) -> int:
+        if self.legal_mask is None:
+            self.legal_mask = self.game_state.legal_mask()
+        return self.legal_mask & ~self.tried_mask
+
     # check if there are any available moves
     def is_fully_expanded(self) -> bool:
-        return len(self.children) == len(self.game_state.get_available_moves())
+        return self.untried_mask() == 0
 
     # add new node based on an action
     def add_child(self, action) -> None:
-        # need to make a deepcopy of the game state to not mess with the current one we have
-        new_game_state = copy.deepcopy(self.game_state)
-        new_game_state.player_action(action)
+        # apply works on a clone of the game state to not mess with the current one we have
+        new_game_state = self.game_state.apply(action)
         new_node = TreeNode(game_state=new_game_state, parent=self, action=action)
-        self.children.append(new_node)
+        self.append_child(new_node, action)
+
+    # add a node that is owned by this node as child
+    def append_child(self, node, action) -> None:
+        self.tried_mask |= ACTION_BITS[action]
+        self.children.append(node)
+
+    # link an existing node as child, used by transposition tables and turns the tree into a DAG
+    def link_child(self, node, action) -> None:
+        self.linked_actions[id(node)] = action
+        self.append_child(node, action)
+
+    # the action that leads from this node to the child
+    def child_action(self, child):
+        return self.linked_actions.get(id(child), child.action)
 
     # print the tree
     def pretty_print(self, prefix="", is_last=True):
@@ -63,3 +89,37 @@ def expand_tree(node: TreeNode, depth=0):
     for move in available_moves:
         node.add_child(move)
         expand_tree(node.children[-1], depth - 1)
+
+
+# follow the actions down from a node, returns None if one of them has not been expanded
+# works for TreeNode and AbstractTreeNode (whose child actions are lists)
+def follow_actions(node, actions: list):
+    for action in actions:
+        for child in node.children:
+            child_action = node.child_action(child)
+            if (child_action == action) or (isinstance(child_action, list) and action in child_action):
+                node = child
+                break
+        else:
+            return None
+    return node
+
+# check that the observed state is the one the tree predicted for the node
+def matches_state(node, game_state: GameState) -> bool:
+    expected = node.game_state.clone()
+    expected.refresh_turn()
+    return expected.to_tuple() == game_state.to_tuple()
+
+# all distinct nodes below a node, each shared node only once
+def collect_nodes(root) -> list:
+    nodes = []
+    visited = set()
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if id(node) in visited:
+            continue
+        visited.add(id(node))
+        nodes.append(node)
+        stack.extend(node.children)
+    return nodes
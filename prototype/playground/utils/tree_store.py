@@ -0,0 +1,198 @@
+import numpy as np
+from playground.utils.gamestate import GameState
+from playground.utils.actions import ACTION_NAMES, ACTION_BITS, MOVE_MASK, ATTACK_BIT, ALL_ACTIONS_MASK, to_action_id
+
+# moves in the order of GameState.get_available_moves, nodes store the index into this tuple
+ACTIONS = ACTION_NAMES
+
+# what to do when the store is full
+STOP = "stop"
+PRUNE = "prune"
+
+# Struct-of-arrays tree: every node is an index into preallocated numpy arrays
+# children are linked through first_child / next_sibling and states are kept as their to_tuple encoding
+class TreeStore:
+    def __init__(self, game_state: GameState, capacity=100000, at_capacity=STOP, prune_fraction=0.1) -> None:
+        self.capacity = capacity
+        self.at_capacity = at_capacity
+        self.prune_fraction = prune_fraction
+        self.map_size = game_state.map_size
+
+        self.visits = np.zeros(capacity, dtype=np.int64)
+        self.value = np.zeros(capacity, dtype=np.float64)
+        self.reward = np.zeros(capacity, dtype=np.float64)
+        self.parent = np.full(capacity, -1, dtype=np.int32)
+        self.first_child = np.full(capacity, -1, dtype=np.int32)
+        self.next_sibling = np.full(capacity, -1, dtype=np.int32)
+        self.child_count = np.zeros(capacity, dtype=np.int8)
+        # bitmasks of the legal actions and of the actions that already have a child, see playground.utils.actions
+        self.legal_mask = np.zeros(capacity, dtype=np.uint8)
+        self.tried_mask = np.zeros(capacity, dtype=np.uint8)
+        self.action = np.full(capacity, -1, dtype=np.int8)
+        self.states = np.zeros((capacity, 9), dtype=np.int32)
+        self.used = np.zeros(capacity, dtype=bool)
+
+        # never used indices start at size, pruned indices are recycled from the free list
+        self.size = 0
+        self.free = []
+        self.node_count = 0
+        self.pruned_count = 0
+
+        self.root = self._allocate()
+        self._set_state(self.root, game_state)
+
+    def __len__(self) -> int:
+        return self.node_count
+
+    def _allocate(self) -> int:
+        if self.free:
+            index = self.free.pop()
+        elif self.size < self.capacity:
+            index = self.size
+            self.size += 1
+        else:
+            return -1
+        self.used[index] = True
+        self.node_count += 1
+        return index
+
+    def _set_state(self, index: int, game_state: GameState) -> None:
+        self.states[index] = game_state.to_tuple()
+        self.reward[index] = game_state.reward
+        # the four moves, plus attack when next to the opponent (see GameState.legal_mask)
+        self.legal_mask[index] = (MOVE_MASK | ATTACK_BIT) if game_state.can_attack() else MOVE_MASK
+
+    # rebuild the gamestate of a node on demand
+    def game_state(self, index: int) -> GameState:
+        game_state = GameState.from_tuple(tuple(int(value) for value in self.states[index]), map_size=self.map_size)
+        game_state.reward = float(self.reward[index])
+        return game_state
+
+    def is_done(self, index: int) -> bool:
+        return bool(self.states[index, 8])
+
+    def is_fully_expanded(self, index: int) -> bool:
+        return self.tried_mask[index] == self.legal_mask[index]
+
+    # legal actions of the node without a child yet
+    def untried_mask(self, index: int) -> int:
+        return int(self.legal_mask[index] & ~self.tried_mask[index])
+
+    def children(self, index: int) -> list[int]:
+        children = []
+        child = self.first_child[index]
+        while child != -1:
+            children.append(int(child))
+            child = self.next_sibling[child]
+        return children
+
+    # add a child reached with the action (id or name), returns -1 if the store is full and nothing can be pruned
+    def add_child(self, index: int, action, game_state: GameState) -> int:
+        child = self._allocate()
+        if child == -1 and self.at_capacity == PRUNE:
+            self.prune(protected=index)
+            child = self._allocate()
+        if child == -1:
+            return -1
+
+        self.visits[child] = 0
+        self.value[child] = 0.0
+        self.parent[child] = index
+        self.first_child[child] = -1
+        self.child_count[child] = 0
+        self.tried_mask[child] = 0
+        self.action[child] = to_action_id(action)
+        self._set_state(child, game_state)
+
+        self.next_sibling[child] = self.first_child[index]
+        self.first_child[index] = child
+        self.child_count[index] += 1
+        self.tried_mask[index] |= ACTION_BITS[action]
+        return child
+
+    def ancestors(self, index: int) -> list[int]:
+        path = []
+        while index != -1:
+            path.append(index)
+            index = int(self.parent[index])
+        return path
+
+    # free the least visited subtrees until prune_fraction of the capacity is available
+    # the protected node and its ancestors are kept, so no freed subtree contains the protected node
+    def prune(self, protected: int) -> int:
+        keep = set(self.ancestors(protected))
+        target = max(1, int(self.capacity * self.prune_fraction))
+        freed = 0
+
+        candidates = np.flatnonzero(self.used)
+        for index in candidates[np.argsort(self.visits[candidates], kind="stable")]:
+            if freed >= target:
+                break
+            index = int(index)
+            if (not self.used[index]) or (index in keep):
+                continue
+            self._unlink(index)
+            freed += self._free_subtree(index)
+
+        self.pruned_count += freed
+        return freed
+
+    def _unlink(self, index: int) -> None:
+        parent = int(self.parent[index])
+        previous = -1
+        child = int(self.first_child[parent])
+        while child != index:
+            previous = child
+            child = int(self.next_sibling[child])
+        if previous == -1:
+            self.first_child[parent] = self.next_sibling[index]
+        else:
+            self.next_sibling[previous] = self.next_sibling[index]
+        self.child_count[parent] -= 1
+        # the action can be expanded again
+        self.tried_mask[parent] &= ALL_ACTIONS_MASK ^ ACTION_BITS[int(self.action[index])]
+
+    def _free_subtree(self, index: int) -> int:
+        freed = 0
+        stack = [index]
+        while stack:
+            node = stack.pop()
+            stack.extend(self.children(node))
+            self.used[node] = False
+            self.parent[node] = -1
+            self.free.append(node)
+            freed += 1
+        self.node_count -= freed
+        return freed
+
+    def subtree(self, index: int) -> list[int]:
+        nodes = []
+        stack = [index]
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            stack.extend(self.children(node))
+        return nodes
+
+    # make the node the new root and recycle every node outside of its subtree
+    def reroot(self, index: int, game_state: GameState) -> int:
+        keep = np.zeros(self.capacity, dtype=bool)
+        keep[self.subtree(index)] = True
+        dropped = np.flatnonzero(self.used & ~keep)
+
+        self.used[dropped] = False
+        self.parent[dropped] = -1
+        self.free.extend(int(node) for node in dropped)
+        self.node_count -= len(dropped)
+
+        self.parent[index] = -1
+        self.next_sibling[index] = -1
+        self._set_state(index, game_state)
+        self.root = index
+        return len(dropped)
+
+    # bytes used by the preallocated arrays
+    def nbytes(self) -> int:
+        return sum(array.nbytes for array in (self.visits, self.value, self.reward, self.parent, self.first_child,
+                                              self.next_sibling, self.child_count, self.legal_mask, self.tried_mask, self.action,
+                                              self.states, self.used))
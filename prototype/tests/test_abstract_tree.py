@@ -3,6 +3,7 @@ from playground.utils.gamestate import GameState
 from playground.utils.abstract_tree import AbstractTreeNode, expand_tree
 from playground.utils.character import Player
 import copy
+from playground.utils.actions import actions_mask
 
 # Mock GameState class for testing
 class MockGameState(GameState):
@@ -15,6 +16,9 @@ class MockGameState(GameState):
     def get_available_moves(self):
         return self.moves
 
+    def legal_mask(self):
+        return actions_mask(self.moves)
+
     def player_action(self, action):
         # Simulate basic action logic
         if action == 'up':
@@ -99,6 +103,8 @@ def test_merge_with():
     #merge child1 and child2
     root.children[0].merge_with(root.children[1])
 
+    # the action of the absorbed child counts as tried
+    assert root.children[0].tried_mask == actions_mask(["down"])
     assert root.children[0].visits == 10  # Average of visits
     assert root.children[0].value == 10  # Average of values
     assert len(root.children[0].children) == 1  # Children from node2 should be added
@@ -139,6 +145,7 @@ def test_unmerge():
 
     # Unmerge nodes
     root.children[0].unmerge()
+    assert root.children[0].tried_mask == 0
 
     #make sure root has two children
     assert len(root.children) == 2
@@ -0,0 +1,22 @@
+from playground.utils.actions import (UP, DOWN, LEFT, RIGHT, ATTACK, ACTION_NAMES, MOVE_MASK, ATTACK_BIT,
+                                      MASK_ACTIONS, MASK_NAMES, FIRST_ACTION, to_action_id, to_action_name, actions_mask)
+
+# Test names and ids map to each other
+def test_action_ids():
+    assert ACTION_NAMES[UP] == "up"
+    assert ACTION_NAMES[ATTACK] == "attack"
+    for action_id, name in enumerate(ACTION_NAMES):
+        assert to_action_id(name) == action_id
+        assert to_action_id(action_id) == action_id
+        assert to_action_name(action_id) == name
+    assert to_action_id("jump") is None
+
+# Test the precomputed tables of a mask
+def test_mask_tables():
+    assert actions_mask(["up", "down", "left", "right"]) == MOVE_MASK
+    assert actions_mask([ATTACK]) == ATTACK_BIT
+    assert MASK_ACTIONS[MOVE_MASK | ATTACK_BIT] == (UP, DOWN, LEFT, RIGHT, ATTACK)
+    assert MASK_NAMES[MOVE_MASK] == ("up", "down", "left", "right")
+    assert FIRST_ACTION[actions_mask(["left", "attack"])] == LEFT
+    assert FIRST_ACTION[0] == -1
+    assert MASK_ACTIONS[0] == ()
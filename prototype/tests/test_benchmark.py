@@ -0,0 +1,40 @@
+import pytest
+from playground.benchmark import run_game, run_benchmark
+from playground.utils.tree import collect_nodes
+from playground.agents.mcts import MCTSAgent, GameState
+
+# Test the node count of a searched tree
+def test_collect_nodes():
+    agent = MCTSAgent(GameState(map_size=20, random_init=False), max_iterations=25)
+    agent.run()
+
+    # every iteration expands one node under the root
+    assert len(collect_nodes(agent.root)) == 26
+
+# Test iteration budgets give reproducible games
+@pytest.mark.parametrize("agent_name", ["mcts", "emcts"])
+def test_run_game_reproducible(agent_name):
+    first = run_game(agent_name, seed=3, iterations=100)
+    second = run_game(agent_name, seed=3, iterations=100)
+
+    for key in ["decisions", "iterations", "nodes", "max_tree_size", "won", "turns", "final_reward"]:
+        assert first[key] == second[key]
+    assert first["iterations"] == 100 * first["decisions"]
+
+# Test the summary over agents and seeds
+def test_run_benchmark():
+    results = run_benchmark(["mcts", "emcts"], seeds=[0, 1], iterations=50, trace_memory=True)
+
+    assert len(results["runs"]) == 4
+    assert set(results["summary"]) == {"mcts", "emcts"}
+    assert results["budget"] == {"time_limit": None, "iterations": 50, "fm_calls": None}
+    for run in results["runs"]:
+        assert run["peak_traced_mb"] > 0
+        assert 0 <= run["abstraction_share"] <= 1
+
+# Test the abstraction time of a reused tree is only counted for the decision it was spent in
+def test_abstraction_share_with_reuse():
+    run = run_game("emcts", seed=0, iterations=200, max_decisions=20, reuse_tree=True, actions_per_decision=1, agent_kwargs={"batch_size": 20})
+
+    assert run["abstraction_share"] > 0
+    assert run["abstraction_share"] <= 1
@@ -0,0 +1,73 @@
+import random
+import time
+import pytest
+from playground.utils.gamestate import GameState
+from playground.utils.budget import Budget, IterationBudget, ForwardModelBudget, TimeBudget, PHASES
+from playground.agents.mcts import MCTSAgent
+from playground.agents.emcts import EMCTSAgent
+from playground.agents.array_mcts import ArrayMCTSAgent
+
+# Test the iteration budget stops after exactly that many iterations, every search starts a new budget
+def test_iteration_budget():
+    budget = IterationBudget(30)
+    agent = MCTSAgent(GameState(map_size=20, random_init=False), budget=budget)
+
+    agent.run()
+    assert budget.iterations == 30
+    agent.run()
+    assert budget.iterations == 30
+    assert agent.iteration_count == 60
+
+@pytest.mark.parametrize("agent_class", [MCTSAgent, EMCTSAgent, ArrayMCTSAgent])
+# Test the forward model budget counts the calls of expansion and rollouts
+def test_forward_model_budget(agent_class):
+    random.seed(0)
+    budget = ForwardModelBudget(500)
+    agent = agent_class(GameState(map_size=20, random_init=False), budget=budget)
+
+    actions, _ = agent.run()
+    assert len(actions) > 0
+    # the last iteration can overshoot by one rollout
+    assert 500 <= budget.fm_calls <= 500 + 6
+    assert budget.fm_calls_by_phase["expand"] == budget.iterations
+    assert sum(budget.fm_calls_by_phase.values()) == budget.fm_calls
+    assert sum(budget.fm_call_split().values()) == pytest.approx(1.0)
+
+# Test the forward model budget ends when only terminal states are left to select
+def test_forward_model_budget_terminal_state():
+    game_state = GameState(map_size=20, random_init=False)
+    game_state.done = True
+    budget = ForwardModelBudget(100)
+    agent = MCTSAgent(game_state, budget=budget)
+
+    agent.run()
+    assert budget.fm_calls == 0
+    assert budget.iterations == 100
+
+# Test the time budget only reads the clock every check_every iterations
+def test_time_budget_check_every():
+    budget = TimeBudget(0.05, check_every=8)
+    assert not budget.is_over()
+    time.sleep(0.06)
+
+    over = []
+    for iteration in range(1, 9):
+        budget.iterations = iteration
+        over.append(budget.is_over())
+    assert over == [False] * 7 + [True]
+
+    budget = TimeBudget(0.0)
+    agent = MCTSAgent(GameState(map_size=20, random_init=False), budget=budget)
+    agent.run()
+    assert budget.iterations == 0
+
+# Test profiling splits the time between the phases
+def test_profile():
+    budget = Budget(max_iterations=200, profile=True)
+    agent = EMCTSAgent(GameState(map_size=20, random_init=False), alpha_abs=100, batch_size=10, budget=budget)
+
+    agent.run()
+    assert set(budget.time_split()) == set(PHASES)
+    assert sum(budget.time_split().values()) == pytest.approx(1.0)
+    for phase in PHASES:
+        assert budget.time_by_phase[phase] > 0
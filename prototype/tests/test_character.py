@@ -26,4 +26,13 @@ def test_moveLeft():
 def test_moveRight():
     player = Player("test", (0,0), 100)
     player.moveRight()
-    assert(player.position == [1, 0])
\ No newline at end of file
+    assert(player.position == [1, 0])
+
+def test_clone():
+    player = Player("test", (0,0), 100)
+    clone = player.clone()
+    clone.moveUp()
+    assert(player.position == [0, 0])
+    assert(player.movement_points == 2)
+    assert(clone.position == [0, 1])
+    assert(clone.movement_points == 1)
@@ -0,0 +1,76 @@
+import pytest
+import random
+from playground.utils.gamestate import GameState
+from playground.utils.abstract_tree import AbstractTreeNode
+from playground.agents.emcts import EMCTSAgent
+
+def expanded_agent(iterations=40, **kwargs):
+    random.seed(0)
+    agent = EMCTSAgent(GameState(map_size=20, random_init=False), **kwargs)
+    for _ in range(iterations):
+        node = agent.select(agent.root)
+        if not node.game_state.done:
+            node = agent.expand(node)
+        agent.backpropagate(node, agent.simulate(node))
+    return agent
+
+# Test nodes are indexed by depth on expansion
+def test_nodes_by_depth():
+    agent = expanded_agent()
+
+    assert agent.nodes_by_depth[0] == [agent.root]
+    for depth, nodes in enumerate(agent.nodes_by_depth):
+        for node in nodes:
+            assert node.depth == depth
+    assert sum(len(nodes) for nodes in agent.nodes_by_depth) == agent.count_nodes()
+    assert len(agent.new_nodes) == agent.count_nodes() - 1
+
+# Test only similar siblings are merged
+def test_update_abstraction_merges_similar_siblings():
+    agent = expanded_agent()
+    agent.update_abstraction()
+
+    assert agent.merged_nodes
+    for node in agent.merged_nodes:
+        assert node.depth == node.merged_with.depth
+        assert agent._is_similar(node, node.merged_with)
+        assert not any(child is node.merged_with for child in node.merged_with.parent.children)
+
+# Test candidates match a pairwise search over the siblings
+def test_candidates_match_pairwise():
+    agent = expanded_agent()
+
+    for nodes in agent.nodes_by_depth[1:]:
+        for node in nodes:
+            candidates = agent._get_candidates(node)
+            for sibling in node.parent.children:
+                if sibling is not node and agent._is_similar(node, sibling):
+                    assert any(candidate is sibling for candidate in candidates)
+
+# Test reverting restores the ground tree
+def test_revert_abstraction():
+    agent = expanded_agent()
+    node_count = agent.count_nodes()
+
+    agent.update_abstraction()
+    assert agent.count_nodes() < node_count
+
+    agent.revert_abstraction()
+    assert agent.count_nodes() == node_count
+    assert not agent.merged_nodes
+    assert not agent.absorbed
+    for nodes in agent.nodes_by_depth[1:]:
+        for node in nodes:
+            assert any(child is node for child in node.parent.children)
+
+# Test full searches with small batches, with and without transpositions
+@pytest.mark.parametrize("transposition_table_size", [0, 1000])
+def test_run(transposition_table_size):
+    for seed in range(5):
+        random.seed(seed)
+        agent = EMCTSAgent(GameState(map_size=20, random_init=True), time_limit=0.02, batch_size=5,
+                           transposition_table_size=transposition_table_size)
+        actions, final_node = agent.run()
+
+        assert len(actions) > 0
+        assert isinstance(final_node, AbstractTreeNode)
@@ -2,6 +2,7 @@ import pytest
 from playground.utils.character import Player, ATTACK_DAMAGE, MOVEMENT_LIMIT
 from playground.utils.rewards import calculate_reward
 from playground.utils.gamestate import GameState, MAX_TURNS
+from playground.utils.actions import UP, MOVE_MASK, ATTACK_BIT, MASK_NAMES
 import random
 
 # Test GameState initialization with and without random positions
@@ -85,6 +86,20 @@ def test_player_actions():
     game_state.player_action("right")
     assert game_state.player.position == [0, 0]
 
+# Test the legal mask matches the available moves and actions can be given by id
+def test_legal_mask_and_action_ids():
+    game_state = GameState(map_size=20, random_init=False)
+    assert game_state.legal_mask() == MOVE_MASK
+    assert list(MASK_NAMES[game_state.legal_mask()]) == game_state.get_available_moves()
+
+    game_state.player_action(UP)
+    assert game_state == GameState(map_size=20, random_init=False).apply("up")
+
+    game_state.player.position = [11, 12]
+    assert game_state.legal_mask() == MOVE_MASK | ATTACK_BIT
+    game_state.done = True
+    assert game_state.legal_mask() == 0
+
 # Test player attack and check done state
 def test_player_attack():
     game_state = GameState(map_size=20, random_init=False)
@@ -151,3 +166,33 @@ def test_check_done():
     game_state.turn = MAX_TURNS
     game_state.check_done()
     assert game_state.done
+
+# Test clone gives an independent copy
+def test_clone():
+    game_state = GameState(map_size=20, random_init=False)
+    clone = game_state.clone()
+
+    assert clone == game_state
+    assert clone.player is not game_state.player
+
+    clone.player_action("up")
+    assert game_state.player.position == [0, 0]
+    assert clone.player.position == [0, 1]
+
+# Test apply leaves the original state untouched
+def test_apply():
+    game_state = GameState(map_size=20, random_init=False)
+    new_game_state = game_state.apply("right")
+
+    assert game_state.player.position == [0, 0]
+    assert new_game_state.player.position == [1, 0]
+    assert new_game_state.player.movement_points == MOVEMENT_LIMIT - 1
+    assert new_game_state.reward == calculate_reward(new_game_state)
+
+# Test the fixed-width encoding round trip
+def test_to_tuple():
+    game_state = GameState(map_size=20, random_init=False)
+    game_state.player_action("up")
+
+    assert game_state.to_tuple() == (0, 1, 100, 1, 12, 12, 20, 0, False)
+    assert GameState.from_tuple(game_state.to_tuple()) == game_state
@@ -1,6 +1,7 @@
 import pytest
 from playground.utils.tree import GameState, TreeNode
 from playground.agents.mcts import MCTSAgent
+from playground.utils.actions import UP, actions_mask
 
 # Mock GameState and TreeNode to avoid full game simulation
 class MockGameState(GameState):
@@ -12,9 +13,12 @@ class MockGameState(GameState):
     def get_available_moves(self):
         return self.moves
 
+    def legal_mask(self):
+        return actions_mask(self.moves)
+
     def player_action(self, action):
-        # Randomly complete the game for testing
-        if action == 'up':
+        # Randomly complete the game for testing, rollouts use the action ids
+        if action in ('up', UP):
             self.done = True
             self.reward = 1.0
 
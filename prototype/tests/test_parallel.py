@@ -0,0 +1,52 @@
+import pytest
+import random
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from playground.utils.gamestate import GameState
+from playground.utils.rollouts import parallel_rollout
+from playground.agents.mcts import MCTSAgent
+from playground.agents.emcts import EMCTSAgent
+from playground.agents.array_mcts import ArrayMCTSAgent
+from playground.agents.parallel import RootParallelAgent
+
+@pytest.fixture(scope="module")
+def executor():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        yield executor
+
+# Test the rollouts of a leaf are split over the workers
+def test_parallel_rollout(executor):
+    game_state = GameState(map_size=20, random_init=False)
+    rewards = parallel_rollout(executor, game_state, repeats=11, workers=2, rng=np.random.default_rng(0))
+
+    assert rewards.shape == (11,)
+
+    # the same seed gives the same rollouts
+    again = parallel_rollout(executor, game_state, repeats=11, workers=2, rng=np.random.default_rng(0))
+    assert np.array_equal(rewards, again)
+
+# Test root parallel search merges the root statistics of all workers
+@pytest.mark.parametrize("agent_class", [MCTSAgent, EMCTSAgent, ArrayMCTSAgent])
+def test_root_parallel_run(executor, agent_class):
+    random.seed(0)
+    game_state = GameState(map_size=20, random_init=False)
+    agent = RootParallelAgent(game_state, time_limit=0.05, workers=2, agent_class=agent_class, executor=executor)
+
+    actions, final_node = agent.run()
+
+    assert len(actions) > 0
+    assert actions[0] in game_state.get_available_moves()
+    assert final_node.parent is None
+    assert agent.iteration_count > 0
+    best_action = max(agent.root_stats, key=lambda action: agent.root_stats[action][1] / agent.root_stats[action][0])
+    assert actions[0] == best_action
+
+# Test leaf parallel search through the agent
+def test_leaf_parallel_run(executor):
+    game_state = GameState(map_size=20, random_init=False)
+    agent = MCTSAgent(game_state, time_limit=0.05, rollouts_per_leaf=4, executor=executor, workers=2)
+
+    actions, _ = agent.run()
+
+    assert len(actions) > 0
+    assert agent.iteration_count > 0
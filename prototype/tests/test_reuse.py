@@ -0,0 +1,103 @@
+import random
+import pytest
+from playground.utils.gamestate import GameState
+from playground.utils.tree_store import TreeStore
+from playground.utils.tree import collect_nodes
+from playground.agents.mcts import MCTSAgent
+from playground.agents.emcts import EMCTSAgent
+from playground.agents.array_mcts import ArrayMCTSAgent
+from playground.benchmark import run_game
+
+# Test rerooting frees every node outside of the new root's subtree
+def test_tree_store_reroot():
+    game_state = GameState(map_size=20, random_init=False)
+    store = TreeStore(game_state, capacity=10)
+
+    up = store.add_child(store.root, "up", game_state.apply("up"))
+    down = store.add_child(store.root, "down", game_state.apply("down"))
+    up_up = store.add_child(up, "up", game_state.apply("up").apply("up"))
+    down_up = store.add_child(down, "up", game_state.apply("down").apply("up"))
+
+    assert store.reroot(up, game_state.apply("up")) == 3
+    assert store.root == up
+    assert len(store) == 2
+    assert store.parent[up] == -1
+    assert store.children(up) == [up_up]
+    # the freed indices are used again
+    assert store.add_child(up_up, "down", game_state) in (0, down, down_up)
+
+@pytest.mark.parametrize("agent_class, agent_kwargs", [
+    (MCTSAgent, {}),
+    (MCTSAgent, {"transposition_table_size": 1000}),
+    (EMCTSAgent, {"alpha_abs": 10, "batch_size": 10}),
+    (EMCTSAgent, {"alpha_abs": 10, "batch_size": 10, "transposition_table_size": 1000}),
+    (ArrayMCTSAgent, {}),
+])
+# Test the agents keep the statistics of the executed actions' subtree
+def test_advance_keeps_subtree(agent_class, agent_kwargs):
+    random.seed(0)
+    game_state = GameState(map_size=20, random_init=False)
+    agent = agent_class(game_state, time_limit=float("inf"), max_iterations=300, **agent_kwargs)
+    actions, _ = agent.run()
+    actions = actions[:1]
+    new_state = game_state.simulate_turns(actions)
+
+    assert agent.advance(actions, new_state)
+    assert agent.iteration_count == 0
+    assert 1 < agent.count_nodes() < 300
+
+    # the search continues from the kept tree
+    next_actions, _ = agent.run()
+    assert len(next_actions) > 0
+    assert agent.count_nodes() > 1
+
+# Test the agents fall back to a fresh tree when the state does not match the tree
+@pytest.mark.parametrize("agent_class", [MCTSAgent, EMCTSAgent, ArrayMCTSAgent])
+def test_advance_mismatch(agent_class):
+    random.seed(0)
+    game_state = GameState(map_size=20, random_init=False)
+    agent = agent_class(game_state, time_limit=float("inf"), max_iterations=100)
+    actions, _ = agent.run()
+
+    other_state = GameState(map_size=20, random_init=True)
+    assert not agent.advance(actions[:1], other_state)
+    assert agent.count_nodes() == 1
+
+# Test the EMCTS index only contains nodes of the kept subtree after advancing
+def test_emcts_advance_reindexes():
+    random.seed(1)
+    game_state = GameState(map_size=20, random_init=False)
+    agent = EMCTSAgent(game_state, time_limit=float("inf"), max_iterations=300, alpha_abs=10, batch_size=10)
+    actions, _ = agent.run()
+    agent.advance(actions[:1], game_state.simulate_turns(actions[:1]))
+
+    subtree = {id(node) for node in collect_nodes(agent.root)}
+    indexed = [node for nodes in agent.nodes_by_depth[1:] for node in nodes]
+    assert agent.nodes_by_depth[0] == [agent.root]
+    assert len(indexed) == len(subtree) - 1
+    assert all(id(node) in subtree for node in indexed)
+    assert all(node.depth == node.parent.depth + 1 for node in indexed)
+
+# Test the EMCTS index and transposition table only hold the kept subtree of a DAG, keyed by the new parents
+def test_emcts_advance_reindexes_transpositions():
+    random.seed(0)
+    game_state = GameState(map_size=20, random_init=False)
+    agent = EMCTSAgent(game_state, time_limit=float("inf"), max_iterations=300, alpha_abs=200, batch_size=10, transposition_table_size=1000)
+    for _ in range(5):
+        actions, _ = agent.run()
+        game_state = game_state.simulate_turns(actions[:1])
+        agent.advance(actions[:1], game_state)
+
+        subtree = collect_nodes(agent.root)
+        bucketed = [node for bucket in agent.buckets.values() for node in bucket]
+        assert len(bucketed) == len(subtree) - 1
+        assert all(node in agent.buckets[agent._bucket_key(node)] for node in bucketed)
+        assert all(id(node.parent) in {id(parent) for parent in subtree} for node in bucketed)
+        assert len(agent.transpositions) == len(subtree)
+
+# Test whole games reusing the tree of an agent with abstraction and a transposition table
+@pytest.mark.parametrize("seed", range(3))
+def test_emcts_reuse_with_transpositions(seed):
+    result = run_game("emcts", seed, iterations=200, max_decisions=30, reuse_tree=True, actions_per_decision=1,
+                      agent_kwargs={"transposition_table_size": 1000})
+    assert result["decisions"] > 0
@@ -0,0 +1,68 @@
+import pytest
+import numpy as np
+from playground.utils.gamestate import GameState
+from playground.utils.rewards import calculate_reward
+from playground.utils.rollouts import batch_rollout
+
+def next_to_opponent():
+    game_state = GameState(map_size=20, random_init=False)
+    game_state.player.position = [11, 12]
+    game_state.reward = calculate_reward(game_state)
+    return game_state
+
+# Test no steps keeps the current rewards
+def test_batch_rollout_zero_depth():
+    states = [GameState(map_size=20, random_init=False), next_to_opponent()]
+    rewards = batch_rollout(states, repeats=3, max_depth=0)
+
+    assert rewards.shape == (6,)
+    assert np.allclose(rewards[:3], states[0].reward)
+    assert np.allclose(rewards[3:], states[1].reward)
+
+# Test a single step matches the rewards of all possible actions
+def test_batch_rollout_single_step():
+    game_state = next_to_opponent()
+    expected = {round(game_state.apply(move).reward, 6) for move in game_state.get_available_moves()}
+
+    rewards = batch_rollout([game_state], repeats=500, max_depth=1, rng=np.random.default_rng(0))
+    assert {round(reward, 6) for reward in rewards} == expected
+
+# Test rollouts refresh movement points and advance turns
+def test_batch_rollout_turns():
+    game_state = GameState(map_size=20, random_init=False)
+    game_state.player.movement_points = 0
+
+    # get_available_moves starts the next turn on a copy
+    next_turn = game_state.clone()
+    moves = next_turn.get_available_moves()
+    expected = {round(next_turn.apply(move).reward, 6) for move in moves}
+
+    rewards = batch_rollout([game_state], repeats=200, max_depth=1, rng=np.random.default_rng(0))
+    assert {round(reward, 6) for reward in rewards} == expected
+
+# Test finished games are not advanced
+def test_batch_rollout_done():
+    game_state = next_to_opponent()
+    game_state.done = True
+    rewards = batch_rollout([game_state], repeats=10, max_depth=5)
+
+    assert np.allclose(rewards, game_state.reward)
+
+# Test the batched engine against the scalar rollout on average
+def test_batch_rollout_matches_scalar():
+    game_state = next_to_opponent()
+    rng = np.random.default_rng(1)
+    batched = batch_rollout([game_state], repeats=4000, max_depth=5, rng=rng).mean()
+
+    import random
+    random.seed(1)
+    scalar = []
+    for _ in range(4000):
+        current_state = game_state.clone()
+        for _ in range(5):
+            if current_state.done:
+                break
+            current_state.player_action(random.choice(current_state.get_available_moves()))
+        scalar.append(current_state.reward)
+
+    assert batched == pytest.approx(np.mean(scalar), abs=2.0)
@@ -0,0 +1,146 @@
+import pytest
+import random
+from playground.utils.gamestate import GameState
+from playground.utils.transposition import TranspositionTable
+from playground.utils.tree import TreeNode, collect_nodes, matches_state
+from playground.utils.budget import Budget
+from playground.agents.mcts import MCTSAgent
+from playground.agents.emcts import EMCTSAgent
+
+# Test lookups and hit counters
+def test_table_get_and_store():
+    table = TranspositionTable(max_size=10)
+    game_state = GameState(map_size=20, random_init=False)
+
+    node = TreeNode(game_state)
+
+    assert table.get(game_state) is None
+    table.store(game_state, node)
+    assert table.get(game_state.clone()) is node
+
+    assert table.hits == 1
+    assert table.misses == 1
+    assert table.hit_rate() == 0.5
+    assert table.occupancy() == 0.1
+
+# Test the least recently used entry is dropped
+def test_table_lru_replacement():
+    table = TranspositionTable(max_size=2)
+    game_state = GameState(map_size=20, random_init=False)
+    up = game_state.apply("up")
+    right = game_state.apply("right")
+
+    root_node, up_node, right_node = TreeNode(game_state), TreeNode(up), TreeNode(right)
+
+    table.store(game_state, root_node)
+    table.store(up, up_node)
+    table.get(game_state)
+    table.store(right, right_node)
+
+    assert len(table) == 2
+    assert table.get(up) is None
+    assert table.get(game_state) is root_node
+    assert table.get(right) is right_node
+
+# Test different move orders share one node
+@pytest.mark.parametrize("agent_class", [MCTSAgent, EMCTSAgent])
+def test_agent_shares_transpositions(agent_class):
+    game_state = GameState(map_size=20, random_init=False)
+    agent = agent_class(game_state, transposition_table_size=100)
+
+    up = agent._add_child(agent.root, "up")
+    right = agent._add_child(agent.root, "right")
+    up_right = agent._add_child(up, "right")
+    right_up = agent._add_child(right, "up")
+
+    assert up_right is right_up
+    assert up_right.parent is up
+    assert right.child_action(right_up) in ("up", ["up"])
+    assert agent.transpositions.hits == 1
+
+# Test backpropagation follows the selected path through shared nodes
+def test_agent_backpropagates_selected_path():
+    game_state = GameState(map_size=20, random_init=False)
+    agent = MCTSAgent(game_state, transposition_table_size=100)
+
+    up = agent._add_child(agent.root, "up")
+    right = agent._add_child(agent.root, "right")
+    agent._add_child(up, "right")
+    shared = agent._add_child(right, "up")
+
+    agent.path = [agent.root, right, shared]
+    agent.backpropagate(shared, 1.0)
+
+    assert right.visits == 1
+    assert up.visits == 0
+    assert shared.visits == 1
+
+# Test a search with transpositions still returns a valid plan
+@pytest.mark.parametrize("agent_class, kwargs", [(MCTSAgent, {}), (EMCTSAgent, {"batch_size": 10**9})])
+def test_agent_run_with_transpositions(agent_class, kwargs):
+    game_state = GameState(map_size=20, random_init=False)
+    agent = agent_class(game_state, time_limit=0.05, transposition_table_size=1000, **kwargs)
+
+    actions, final_node = agent.run()
+
+    assert len(actions) > 0
+    assert game_state.simulate_turns(actions) is not None
+    assert agent.transpositions.hits > 0
+
+# Test the table still finds the nodes after a reroot when their states were refreshed in place
+@pytest.mark.parametrize("agent_class", [MCTSAgent, EMCTSAgent])
+def test_advance_keeps_the_keys_of_refreshed_states(agent_class):
+    game_state = GameState(map_size=20, random_init=False)
+    agent = agent_class(game_state, transposition_table_size=100)
+
+    up = agent._add_child(agent.root, "up")
+    node = up
+    # use up the movement points so legal_mask starts the next turn in place
+    for _ in range(game_state.player.movement_points):
+        node = agent._add_child(node, "right")
+    key = node.game_state.to_tuple()
+    node.game_state.legal_mask()
+    assert node.game_state.to_tuple() != key
+
+    assert agent.advance(["up"], up.game_state.clone())
+
+    lookup = up.game_state.clone()
+    for _ in range(game_state.player.movement_points):
+        lookup = lookup.apply("right")
+    assert agent.transpositions.get(lookup) is node
+
+# Test merging a node that reaches the same transposed child keeps the links and owners of both nodes
+def test_merge_keeps_shared_children():
+    game_state = GameState(map_size=20, random_init=False)
+    agent = EMCTSAgent(game_state, transposition_table_size=100)
+
+    up = agent._add_child(agent.root, "up")
+    right = agent._add_child(agent.root, "right")
+    shared = agent._add_child(up, "right")
+    assert agent._add_child(right, "up") is shared
+
+    right.merge_with(up)
+    assert sum(child is shared for child in right.children) == 1
+    right.unmerge()
+
+    assert shared.parent is up
+    assert up.child_action(shared) == ["right"]
+    assert right.child_action(shared) == ["up"]
+    assert [child for child in right.children] == [shared]
+
+# Test every edge of a search with abstraction and transpositions leads to its child once the abstraction is reverted
+@pytest.mark.parametrize("seed", range(5))
+def test_emcts_abstraction_with_transpositions(seed):
+    random.seed(seed)
+    game_state = GameState(map_size=20, random_init=False)
+    agent = EMCTSAgent(game_state, transposition_table_size=10000, alpha_abs=400, batch_size=10, budget=Budget(max_iterations=500))
+
+    actions, final_node = agent.run()
+
+    assert agent.merged_nodes == []
+    for node in collect_nodes(agent.root):
+        for child in node.children:
+            reached = node.game_state.apply(node.child_action(child)[0])
+            reached.refresh_turn()
+            assert matches_state(child, reached)
+    assert matches_state(final_node, game_state.simulate_turns(actions))
@@ -2,6 +2,7 @@ import pytest
 from playground.utils.tree import TreeNode, expand_tree
 from playground.utils.gamestate import GameState
 from playground.utils.character import Player
+from playground.utils.actions import actions_mask
 
 # Mock GameState class for testing
 class MockGameState(GameState):
@@ -16,6 +17,9 @@ class MockGameState(GameState):
     def get_available_moves(self):
         return self.moves
 
+    def legal_mask(self):
+        return actions_mask(self.moves)
+
     def player_action(self, action):
         # Simulate a basic action
         if action == 'up':
@@ -0,0 +1,66 @@
+import pytest
+from playground.utils.gamestate import GameState
+from playground.utils.tree_store import TreeStore, ACTIONS, STOP, PRUNE
+from playground.utils.actions import ACTION_BITS
+from playground.agents.array_mcts import ArrayMCTSAgent
+
+# Test adding children and rebuilding their gamestates
+def test_add_child():
+    game_state = GameState(map_size=20, random_init=False)
+    store = TreeStore(game_state, capacity=10)
+
+    up = store.add_child(store.root, "up", game_state.apply("up"))
+    right = store.add_child(store.root, "right", game_state.apply("right"))
+
+    assert len(store) == 3
+    assert sorted(store.children(store.root)) == sorted([up, right])
+    assert store.parent[up] == store.root
+    assert ACTIONS[store.action[right]] == "right"
+    assert store.game_state(up) == game_state.apply("up")
+    assert store.game_state(store.root) == game_state
+
+# Test a full store stops expanding
+def test_capacity_stop():
+    game_state = GameState(map_size=20, random_init=False)
+    store = TreeStore(game_state, capacity=2, at_capacity=STOP)
+
+    assert store.add_child(store.root, "up", game_state.apply("up")) != -1
+    assert store.add_child(store.root, "down", game_state.apply("down")) == -1
+    assert len(store) == 2
+
+# Test a full store prunes the least visited subtree and recycles its nodes
+def test_capacity_prune():
+    game_state = GameState(map_size=20, random_init=False)
+    store = TreeStore(game_state, capacity=4, at_capacity=PRUNE, prune_fraction=0.25)
+
+    up = store.add_child(store.root, "up", game_state.apply("up"))
+    down = store.add_child(store.root, "down", game_state.apply("down"))
+    up_up = store.add_child(up, "up", game_state.apply("up").apply("up"))
+    store.visits[up] = 5
+    store.visits[up_up] = 3
+    store.visits[down] = 1
+
+    left = store.add_child(up_up, "left", game_state.apply("up").apply("up").apply("left"))
+
+    assert left == down  # the index of the pruned node is recycled
+    assert store.children(store.root) == [up]
+    # the pruned action can be expanded again
+    assert store.untried_mask(store.root) & ACTION_BITS["down"]
+    assert not store.untried_mask(store.root) & ACTION_BITS["up"]
+    assert store.pruned_count == 1
+    assert len(store) == 4
+
+# Test the agent never grows the tree over the cap
+@pytest.mark.parametrize("at_cap", [STOP, PRUNE])
+def test_agent_node_cap(at_cap):
+    game_state = GameState(map_size=20, random_init=False)
+    agent = ArrayMCTSAgent(game_state, time_limit=float("inf"), node_cap=50, at_cap=at_cap, max_iterations=500)
+
+    actions, final_node = agent.run()
+
+    assert agent.iteration_count == 500
+    assert agent.count_nodes() <= 50
+    assert len(actions) > 0
+    assert final_node.game_state.player.position == game_state.simulate_turns(actions).player.position
+    if at_cap == PRUNE:
+        assert agent.store.pruned_count > 0
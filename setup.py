@@ -134,6 +134,7 @@ setup(
     long_description_content_type="text/markdown",
     ext_modules=[CMakeExtension('stratega')],
     cmdclass=dict(build_ext=CMakeBuild),
+    install_requires=['numpy'],
     url="",
     project_urls={
         "Github": "https://github.com/GAIGResearch/Stratega",
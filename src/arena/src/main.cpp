@@ -14,10 +14,13 @@ int main(int argc, char** argv)
 	auto numberOfGames = parser.getCmdOption<unsigned int>("-gamesNumber", 1);
 	auto playerCount = parser.getCmdOption<int>("-playerCount", 2);
 	auto logPath = parser.getCmdOption<std::string>("-logPath", "./sgaLog.yaml");
+	// yaml or jsonl, jsonl logs are written while the games run and can be converted with FileLogger::convertJsonLinesToYaml
+	auto logFormat = parser.getCmdOption<std::string>("-logFormat", "yaml");
 	//Currently obsolete but configPath shouldn't have a default value. So we keep it until then
 	auto configPath = parser.getCmdOption< std::string >("-configPath", "../resources/gameConfigurations/TBS/KillTheKing.yaml");
 	//Optional
 	auto mapsPath = parser.getCmdOption<std::string>("-mapsPath", "");
+	auto workers = parser.getCmdOption<int>("-workers", 1);
 
 	if (configPath.empty())
 	{
@@ -25,16 +28,23 @@ int main(int argc, char** argv)
 		return 0;
 	}
 
+	if (logFormat != "yaml" && logFormat != "jsonl")
+	{
+		std::cout << "The argument -logFormat has to be yaml or jsonl" << std::endl;
+		return 0;
+	}
+
 	// Read Config
 	auto gameConfig = SGA::loadConfigFromYAML(configPath);
 
 	// Run games
-	SGA::setDefaultLogger(std::make_unique<SGA::FileLogger>(logPath));
+	const auto format = logFormat == "jsonl" ? SGA::FileLogger::Format::JsonLines : SGA::FileLogger::Format::Yaml;
+	SGA::setDefaultLogger(std::make_unique<SGA::FileLogger>(logPath, format));
 	Arena arena(*gameConfig);
 	if (mapsPath.empty())
 	{
 		//Run single map defined in the game config
-		arena.runGames(playerCount, seed, numberOfGames);
+		arena.runGames(playerCount, seed, numberOfGames, 1, workers);
 	}
 	else
 	{
@@ -42,7 +52,7 @@ int main(int argc, char** argv)
 		gameConfig->levelDefinitions = SGA::loadLevelsFromYAML(mapsPath, *gameConfig);
 		//Run combinations per map
 		const int mapNumber = static_cast<int>(gameConfig->levelDefinitions.size());
-		arena.runGames(playerCount, seed, numberOfGames, mapNumber);
+		arena.runGames(playerCount, seed, numberOfGames, mapNumber, workers);
 	}
 
 	return 0;
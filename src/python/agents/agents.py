@@ -8,6 +8,7 @@ import copy
 import time
 from contextlib import contextmanager
 import fnmatch
+import numpy as np
 #------------------------------ Agents ----------------------------------------
 class DoNothingPythonAgent(stratega.Agent):
     def init(self, state, forward_model, timer):
@@ -35,27 +36,22 @@ class RandomPythonAgent(stratega.Agent):
 
 def evaluate_state(state, player_id):
     score=0.0
-    opponent_entites=state.get_non_player_entities(player_id, stratega.EntityCategory.Null)
-    player_entites=state.get_player_entities(player_id, stratega.EntityCategory.Null)
+    if state.is_game_over():
+        score=1000 if state.get_winner_id() == player_id else -1000
 
-    if state.is_game_over() and state.get_winner_id() == player_id:
-       score=1000
-    elif state.is_game_over() and state.get_winner_id() != player_id:
-        score=-1000
+    # columns 0-4 of the entity table are id, owner, type, x, y
+    entities=state.get_entity_table()
+    positions=entities[:, 3:5]
+    is_player=entities[:, 1] == player_id
+    player_positions=positions[is_player]
+    opponent_positions=positions[~is_player]
 
-    sum_of_average_distances = 0
-    if not player_entites:
-        for p in player_entites:
-            sum_of_distances=0
-            for o in opponent_entites:
-                sum_of_distances+= abs(p.position.x-o.position.x)+ abs(p.position.y-o.position.y)
+    # mean manhattan distance of the player's entities to the opponent entities, closer is better
+    if len(player_positions) and len(opponent_positions):
+        distances=np.abs(player_positions[:, None, :]-opponent_positions[None, :, :]).sum(axis=2)
+        score-=distances.mean()
 
-            sum_of_average_distances=sum_of_distances/len(opponent_entites)
-
-    if not player_entites:
-        score += sum_of_average_distances/len(player_entites)
-
-    return -score
+    return score
 
 
 class OSLAPythonAgent(stratega.Agent):
@@ -72,10 +68,9 @@ class OSLAPythonAgent(stratega.Agent):
         best_heuristic_value=-float("inf")
         best_action_index=0
 
-        for index, action in enumerate(actions):
-            gs_copy = copy.deepcopy(state)
-            forward_model.advance_gamestate(gs_copy, action)
-
+        # copies and steps every action in C++ in one call
+        next_states = forward_model.advance_many(state, actions)
+        for index, gs_copy in enumerate(next_states):
             value=evaluate_state(gs_copy, self.get_player_id())
 
             if value > best_heuristic_value:
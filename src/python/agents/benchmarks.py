@@ -0,0 +1,256 @@
+import argparse
+import copy
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import stratega
+
+# Benchmarks of the native optimisations, one subcommand each:
+#   python benchmarks.py copy|action-cache|path-cache|collision|agent-thread|thread-scaling [options]
+# Run them from the repository root, the default configs are relative to it.
+
+TBS_CONFIGS = ["resources/gameConfigurations/TBS/Original/KillTheKing.yaml",
+               "resources/gameConfigurations/TBS/Original/ProtectTheBase.yaml"]
+RTS_CONFIG = "resources/gameConfigurations/RTS/Original/BasicRTS.yaml"
+
+#------------------------------ Helpers ---------------------------------------
+def load(path):
+    """Returns the config at path, a new state of it and its forward model."""
+    config = stratega.load_config(path)
+    return config, config.generate_gamestate(), config.forward_model
+
+def timed(function):
+    """Calls function and returns its result and the seconds it took."""
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+def walkable_cells(state):
+    cells = []
+    for y in range(state.get_board_height()):
+        for x in range(state.get_board_width()):
+            if state.get_tile_at(x, y).is_walkable():
+                cells.append((x, y))
+    return cells
+
+def random_step(state, forward_model, rng):
+    actions = forward_model.generate_actions(state, state.get_current_tbs_player())
+    forward_model.advance_gamestate(state, actions[rng.randrange(actions.count())])
+
+def rollout(state, forward_model, depth, rng):
+    """Plays up to depth random steps on a copy of state and returns the number of steps."""
+    state = copy.copy(state)
+    steps = 0
+    while steps < depth and not state.is_game_over():
+        random_step(state, forward_model, rng)
+        steps += 1
+    return steps
+
+#------------------------------ Game state copies -----------------------------
+# Measures how fast game states are forked, with and without playing a step on the fork.
+# Copies share the board and the technology state until they modify them, so a fork costs about the entities and players.
+
+def copy_benchmark(args):
+    for path in args.configs:
+        _, state, forward_model = load(path)
+        _, seconds = timed(lambda: [copy.copy(state) for _ in range(args.count)])
+        line = f"{path}: {args.count / seconds:.0f} copies/s"
+        # RTS states advance by ticks, there is no turn player to fork a step for
+        if state.get_game_type() == stratega.GameType.TBS:
+            rng = random.Random(args.seed)
+            forks = args.count // 4
+            _, seconds = timed(lambda: [rollout(state, forward_model, 1, rng) for _ in range(forks)])
+            line += f", {forks / seconds:.0f} fork+step/s"
+        print(line)
+
+#------------------------------ Action cache ----------------------------------
+# Measures random rollouts with and without the action cache of the forward model.
+# The cache reuses the actions of the entities that the last steps did not affect, and gives the same actions in the same order.
+
+def steps_per_second(state, forward_model, count, depth, seed):
+    rng = random.Random(seed)
+    def play():
+        steps = 0
+        while steps < count:
+            steps += rollout(state, forward_model, depth, rng)
+        return steps
+    steps, seconds = timed(play)
+    return steps / seconds
+
+def action_cache_benchmark(args):
+    for path in args.configs:
+        _, state, forward_model = load(path)
+        forward_model.set_action_cache_enabled(False)
+        plain = steps_per_second(state, forward_model, args.count, args.depth, args.seed)
+        forward_model.set_action_cache_enabled(True)
+        cached = steps_per_second(state, forward_model, args.count, args.depth, args.seed)
+        print(f"{path}: {plain:.0f} steps/s, {cached:.0f} steps/s with the action cache ({cached / plain:.2f}x)")
+
+#------------------------------ Path cache ------------------------------------
+# Measures path queries of the RTS forward model with and without the path cache and the flow fields.
+# The queries go from the entities and random cells to a few goals, like units that are sent to the same bases.
+
+def path_queries(state, count, goals, seed):
+    rng = random.Random(seed)
+    cells = walkable_cells(state)
+    starts = [entity.get_position() for entity in state.get_entities()]
+    starts += [stratega.Vector2f(x + rng.random(), y + rng.random()) for x, y in rng.sample(cells, min(len(cells), 100))]
+    targets = [stratega.Vector2f(x + 0.5, y + 0.5) for x, y in rng.sample(cells, min(len(cells), goals))]
+    return [(rng.choice(starts), rng.choice(targets)) for _ in range(count)]
+
+def queries_per_second(path, queries, cache_size, flow_field_threshold):
+    # A new state builds a new navmesh, which starts with an empty cache
+    _, state, forward_model = load(path)
+    forward_model.set_path_cache_size(cache_size)
+    forward_model.set_flow_field_threshold(flow_field_threshold)
+    _, seconds = timed(lambda: [forward_model.find_path(state, start, end) for start, end in queries])
+    return len(queries) / seconds
+
+def path_cache_benchmark(args):
+    for path in args.configs:
+        _, state, _ = load(path)
+        queries = path_queries(state, args.count, args.goals, args.seed)
+        plain = queries_per_second(path, queries, 0, 0)
+        cached = queries_per_second(path, queries, args.cache_size, 0)
+        flow_fields = queries_per_second(path, queries, args.cache_size, args.flow_field_threshold)
+        print(f"{path}: {plain:.0f} queries/s, {cached:.0f} queries/s with the path cache ({cached / plain:.2f}x), "
+              f"{flow_fields:.0f} queries/s with flow fields ({flow_fields / plain:.2f}x)")
+
+#------------------------------ Entity collisions -----------------------------
+# Measures the entity collisions of the RTS forward model with many units spread over the walkable cells of the board.
+# Each unit is only tested against the units in its neighbouring cells, so the time per tick grows with the number of units
+# and the units close to each other, instead of with every pair of units.
+
+def spawn_units(config, state, count, seed):
+    rng = random.Random(seed)
+    move_id = next(action_type.id for action_type in config.action_types.values() if action_type.name == "Move")
+    unit_types = [entity_type for entity_type in config.entity_types.values() if entity_type.can_execute_action(move_id)]
+    cells = walkable_cells(state)
+    for i in range(count):
+        x, y = rng.choice(cells)
+        config.forward_model.spawn_entity(state, rng.choice(unit_types), i % config.num_players, stratega.Vector2f(x + rng.random(), y + rng.random()))
+
+def collision_benchmark(args):
+    config, _, forward_model = load(args.config)
+    previous = None
+    for count in args.counts:
+        state = config.generate_gamestate()
+        spawn_units(config, state, count, args.seed)
+        _, seconds = timed(lambda: [forward_model.resolve_entity_collisions(state) for _ in range(args.ticks)])
+        rate = args.ticks / seconds
+        scaling = f", {previous / rate:.2f}x the time of the previous count" if previous else ""
+        print(f"{count} units: {rate:.0f} ticks/s{scaling}")
+        previous = rate
+
+#------------------------------ Agent thread ----------------------------------
+# Measures the scheduling overhead of the game runner between two decisions of an agent.
+# The agent sleeps through its time budget, so the gap between the end of a decision and the start of the next one
+# is the time the runner spends collecting the actions, advancing the state and handing the new state to the agent thread.
+# The budget is the BudgetTimeMs of the config, 40 ms unless the config sets it.
+
+class SleepingAgent(stratega.Agent):
+    def __init__(self):
+        stratega.Agent.__init__(self, "SleepingAgent")
+        self.starts = []
+        self.ends = []
+
+    def init(self, state, forward_model, timer):
+        pass
+
+    def compute_action(self, state, forward_model, timer):
+        self.starts.append(time.perf_counter())
+        # Sleeping releases the GIL, the other agents run while this one waits
+        time.sleep(max(timer.remaining_time_milliseconds() - 1, 0) / 1000)
+        self.ends.append(time.perf_counter())
+        return stratega.ActionAssignment()
+
+def report(name, values):
+    values = np.array(values) * 1000
+    print(f"{name}: mean {values.mean():.3f} ms, p50 {np.percentile(values, 50):.3f} ms, "
+          f"p99 {np.percentile(values, 99):.3f} ms, max {values.max():.3f} ms")
+
+def agent_thread_benchmark(args):
+    config, state, _ = load(args.config)
+    runner = stratega.create_runner(config)
+    agents = [SleepingAgent() for _ in range(state.get_num_players())]
+    runner.run(agents, args.seed)
+
+    gaps = []
+    decisions = []
+    for agent in agents:
+        gaps.extend(start - end for start, end in zip(agent.starts[1:], agent.ends))
+        decisions.extend(end - start for start, end in zip(agent.starts, agent.ends))
+
+    print(f"{len(decisions)} decisions")
+    report("decision", decisions)
+    report("overhead between decisions", gaps)
+
+#------------------------------ Thread scaling --------------------------------
+# Measures how random rollouts scale over Python threads.
+# The forward model calls release the GIL, so threads overlap the simulation and only the Python glue is serialised.
+# Every task works on its own copy of the state, see the thread-safety notes of GameState and ForwardModel.
+
+def thread_scaling_benchmark(args):
+    _, state, forward_model = load(args.config)
+    baseline = None
+    for threads in args.threads:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            _, seconds = timed(lambda: list(executor.map(
+                lambda seed: rollout(state, forward_model, args.depth, random.Random(seed)), range(args.rollouts))))
+        rate = args.rollouts / seconds
+        baseline = baseline or rate
+        print(f"{threads} threads: {rate:.1f} rollouts/s, speedup {rate / baseline:.2f}")
+
+#------------------------------ Command line ----------------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks of the Stratega forward models, game states and runners.")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    copies = subparsers.add_parser("copy", help="Game state copies per second on the example configs.")
+    copies.add_argument("--configs", nargs="+", default=TBS_CONFIGS + [RTS_CONFIG])
+    copies.add_argument("--count", type=int, default=20000)
+    copies.add_argument("--seed", type=int, default=0)
+    copies.set_defaults(run=copy_benchmark)
+
+    action_cache = subparsers.add_parser("action-cache", help="Rollout steps per second with and without the action cache on the example configs.")
+    action_cache.add_argument("--configs", nargs="+", default=TBS_CONFIGS + ["resources/gameConfigurations/TBS/Original/CityCapturing.yaml"])
+    action_cache.add_argument("--count", type=int, default=20000)
+    action_cache.add_argument("--depth", type=int, default=50)
+    action_cache.add_argument("--seed", type=int, default=0)
+    action_cache.set_defaults(run=action_cache_benchmark)
+
+    path_cache = subparsers.add_parser("path-cache", help="Path queries per second with and without the path cache on the RTS configs.")
+    path_cache.add_argument("--configs", nargs="+", default=[RTS_CONFIG, "resources/gameConfigurations/RTS/Original/Settlers.yaml"])
+    path_cache.add_argument("--count", type=int, default=20000)
+    path_cache.add_argument("--goals", type=int, default=4)
+    path_cache.add_argument("--cache-size", type=int, default=1024)
+    path_cache.add_argument("--flow-field-threshold", type=int, default=8)
+    path_cache.add_argument("--seed", type=int, default=0)
+    path_cache.set_defaults(run=path_cache_benchmark)
+
+    collision = subparsers.add_parser("collision", help="Entity collision ticks per second for growing numbers of units on an RTS config.")
+    collision.add_argument("--config", default=RTS_CONFIG)
+    collision.add_argument("--counts", type=int, nargs="+", default=[50, 100, 200, 400, 800])
+    collision.add_argument("--ticks", type=int, default=100)
+    collision.add_argument("--seed", type=int, default=0)
+    collision.set_defaults(run=collision_benchmark)
+
+    agent_thread = subparsers.add_parser("agent-thread", help="Scheduling overhead and tail latency of the agent decisions of an RTS game.")
+    agent_thread.add_argument("--config", default=RTS_CONFIG)
+    agent_thread.add_argument("--seed", type=int, default=0)
+    agent_thread.set_defaults(run=agent_thread_benchmark)
+
+    thread_scaling = subparsers.add_parser("thread-scaling", help="Rollouts per second over Python threads.")
+    thread_scaling.add_argument("--config", default=TBS_CONFIGS[0])
+    thread_scaling.add_argument("--threads", nargs="+", type=int, default=[1, 2, 4, 8])
+    thread_scaling.add_argument("--rollouts", type=int, default=200)
+    thread_scaling.add_argument("--depth", type=int, default=50)
+    thread_scaling.set_defaults(run=thread_scaling_benchmark)
+
+    args = parser.parse_args()
+    args.run(args)
+
+if __name__ == "__main__":
+    main()
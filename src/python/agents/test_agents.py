@@ -0,0 +1,23 @@
+import os
+
+import pytest
+
+stratega = pytest.importorskip("stratega")
+from agents import evaluate_state
+
+KILL_THE_KING = os.path.join(os.path.dirname(__file__), "..", "..", "..", "resources", "gameConfigurations", "TBS", "Original", "KillTheKing.yaml")
+
+# Test a win scores higher than an open game and an open game higher than a loss, the OSLA agent maximises the score
+def test_evaluate_state_sign():
+    config = stratega.load_config(KILL_THE_KING)
+    state = config.generate_gamestate()
+    open_score = evaluate_state(state, 0)
+
+    state.set_game_over(True)
+    state.set_winner_id(0)
+    win_score = evaluate_state(state, 0)
+    loss_score = evaluate_state(state, 1)
+
+    assert win_score > open_score > loss_score
+    assert win_score > 0
+    assert loss_score < -1000
@@ -226,9 +226,11 @@ namespace stratega
 			}
 
 			std::cout << "Run GUI" << std::endl;
-			py::gil_scoped_release release;
-			a.play(newAgents.begin(), newAgents.end(), resolution);
-			py::gil_scoped_acquire acquire;
+			// Python agents take the GIL back in their trampoline while the game runs
+			{
+				py::gil_scoped_release release;
+				a.play(newAgents.begin(), newAgents.end(), resolution);
+			}
 		}
 			)
 			.def("play",
@@ -267,9 +269,11 @@ namespace stratega
 			}
 
 			std::cout << "Run GUI" << std::endl;
-			py::gil_scoped_release release;
-			a.play(newAgents.begin(), newAgents.end(), resolution);
-			py::gil_scoped_acquire acquire;
+			// Python agents take the GIL back in their trampoline while the game runs
+			{
+				py::gil_scoped_release release;
+				a.play(newAgents.begin(), newAgents.end(), resolution);
+			}
 		}
 			)
 			.def("run",
@@ -307,9 +311,11 @@ namespace stratega
 				}
 			}
 			std::cout << "Run arena" << std::endl;
-			py::gil_scoped_release release;
-			a.run(newAgents.begin(), newAgents.end());
-			py::gil_scoped_acquire acquire;
+			// Python agents take the GIL back in their trampoline while the game runs
+			{
+				py::gil_scoped_release release;
+				a.run(newAgents.begin(), newAgents.end());
+			}
 		}
 			)
 			.def("run",
@@ -333,14 +339,16 @@ namespace stratega
 				}
 			}
 			std::cout << "Run arena" << std::endl;
-			py::gil_scoped_release release;
-			a.run(newAgents.begin(), newAgents.end());
-			py::gil_scoped_acquire acquire;
+			// Python agents take the GIL back in their trampoline while the game runs
+			{
+				py::gil_scoped_release release;
+				a.run(newAgents.begin(), newAgents.end());
+			}
 		}
 			)
 			.def("reset", py::overload_cast<int>(&SGA::GameRunner::reset), py::arg("levelID"), "Resets the game to an initial state.")
 			.def("reset", py::overload_cast<>(&SGA::GameRunner::reset), "Resets the game to an initial state with a specific map.")
-			.def("step", &SGA::GameRunner::step, py::arg("actions"), "Advances the game by one timestep. When the game has ended, you are responsible for calling GameRunner::reset() to reset the environments state.")
+			.def("step", &SGA::GameRunner::step, py::arg("actions"), py::call_guard<py::gil_scoped_release>(), "Advances the game by one timestep. When the game has ended, you are responsible for calling GameRunner::reset() to reset the environments state.")
 			.def("render", &SGA::GameRunner::render, "Renders a visual representation of the game. May create a new window when called for the first time.")
 			.def("get_gamestate", &SGA::GameRunner::getGameState, "Returns a reference to the current state of the game.")
 			;
@@ -349,13 +357,14 @@ namespace stratega
 		py::class_<SGA::Agent, PyAgent, std::shared_ptr<SGA::Agent>/* <--- trampoline*/>(m, "Agent", "Abstract class from which all agents should inherit.")
 			.def(py::init<std::string>(), py::arg("name") = "PythonAgent")
 			//.def_readwrite("agent_name",&SGA::Agent::agentName)
-			.def("computeAction", &SGA::Agent::computeAction, "Function for deciding the next action to execute. Must be overriden for an agent to work. Returns an ActionAssignment")
+			.def("computeAction", &SGA::Agent::computeAction, py::call_guard<py::gil_scoped_release>(), "Function for deciding the next action to execute. Must be overriden for an agent to work. Returns an ActionAssignment")
 			.def("init", &SGA::Agent::init, "Function for initializing the agent. Override this function to receive a call just before starts.")
 			.def("get_player_id", &SGA::Agent::getPlayerID);
 
 		// ---- Arena ----
 		py::class_<Arena>(m, "Arena","The Arena provides an easy way to test the performance between different Agents in different environments.")
-			.def("run_games", py::overload_cast<int, int, int, int>(&Arena::runGames))
+			.def("run_games", py::overload_cast<int, int, int, int, int>(&Arena::runGames), py::arg("playerCount"), py::arg("seed"), py::arg("gamesNumber"), py::arg("mapNumber") = 1, py::arg("workers") = 1, py::call_guard<py::gil_scoped_release>(),
+				"Runs every agent assignment of the config agents on gamesNumber seeds of each map. With workers > 1 the battles run on that many threads and the log matches a sequential run.")
 			.def("run_games",
 				[](Arena& a, int playerCount, int seed, int gamesNumber, int mapNumber, py::list agents)
 		{
@@ -378,9 +387,11 @@ namespace stratega
 				}
 			}
 
-			py::gil_scoped_release release;
-			a.runGames(playerCount, seed, gamesNumber, mapNumber, newAgents);
-			py::gil_scoped_acquire acquire;
+			// Python agents take the GIL back in their trampoline while the game runs
+			{
+				py::gil_scoped_release release;
+				a.runGames(playerCount, seed, gamesNumber, mapNumber, newAgents);
+			}
 		}
 			)
 			;
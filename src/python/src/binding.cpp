@@ -91,6 +91,7 @@ PYBIND11_MODULE(stratega, m)
 			Arena
 
 			GameObserver
+			StateHeuristic
 			MinimizeDistanceHeuristic
 			ActionAssignment
 			
@@ -63,9 +63,14 @@ std::vector<std::shared_ptr<SGA::Agent>> generateAgents(const SGA::GameConfig* g
 	return newAgents;
 }
 
-void setDefaultLogger(std::string logPath)
+void setDefaultLogger(std::string logPath, std::string format)
 {
-	SGA::setDefaultLogger(std::make_unique<SGA::FileLogger>(logPath));
+	if (format == "yaml")
+		SGA::setDefaultLogger(std::make_unique<SGA::FileLogger>(logPath, SGA::FileLogger::Format::Yaml));
+	else if (format == "jsonl")
+		SGA::setDefaultLogger(std::make_unique<SGA::FileLogger>(logPath, SGA::FileLogger::Format::JsonLines));
+	else
+		throw std::invalid_argument("Unknown log format " + format + ", expected yaml or jsonl");
 }
 
 Arena createArena(const SGA::GameConfig* gameConfig)
@@ -82,7 +87,8 @@ namespace stratega
 		m.def("create_runner", &createRunner, "Create game runner", py::arg("gameConfig"));
 		m.def("create_arena", &createArena, "Create game aren", py::arg("gameConfig"));
 		m.def("generate_agents", &generateAgents, "Generate agents", py::arg("gameConfig"));
-		m.def("set_default_logger", &setDefaultLogger, "Set default logger", py::arg("logPath"));
+		m.def("set_default_logger", &setDefaultLogger, "Set default logger, the format is yaml or jsonl", py::arg("logPath"), py::arg("format") = "yaml");
+		m.def("convert_log_to_yaml", &SGA::FileLogger::convertJsonLinesToYaml, "Writes a jsonl log in the layout of the yaml logs", py::arg("jsonLinesPath"), py::arg("yamlPath"));
 		m.def("load_levels_from_yaml", &SGA::loadLevelsFromYAML, "Load Levels definitions  from YAML", py::arg("fileMapsPath"), py::arg("config"));
 	}	
 }
\ No newline at end of file
@@ -120,7 +120,6 @@ namespace stratega
 			.def("x", &SGA::Entity::x, "Returns y position of this entity.")
 			.def("y", &SGA::Entity::y, "Returns y position of this entity.")
 			.def("get_position", &SGA::Entity::getPosition, "Returns y position of this entity.")
-			.def("set_position", &SGA::Entity::setPosition, py::arg("v"), "Sets the position of this entity in the board. Does not modify the board.")
 			.def("get_path", &SGA::Entity::getPath, "Returns the path that this entity is following (RTS games only) ")
 			.def("inc_path_index", &SGA::Entity::incPathIndex, "Increments the current index of the path that this entity is following (RTS games only) ")
 			.def("set_path", &SGA::Entity::setPath, "Sets the path this entity is following (RTS games only) ")
@@ -75,6 +75,25 @@ namespace stratega
 
 			.def("get_on_tick_effects", &SGA::ForwardModel::getOnTickEffects, "Returns all effects that are exxecuted on every tick of the game.")
 			.def("get_on_entity_spawn_effects", &SGA::ForwardModel::getOnEntitySpawnEffects, "Returns all effects that are exxecuted every time an entity is spawned in the game.")
+
+			.def("set_action_cache_enabled", &SGA::ForwardModel::setActionCacheEnabled, py::arg("enabled"), "Enables or disables the incremental action generation. When enabled, generate_actions only generates again the actions of the entities affected by the changes since the previous call of the same thread with this forward model. The returned actions are the same. Disabled by default.")
+			.def("is_action_cache_enabled", &SGA::ForwardModel::isActionCacheEnabled, "Returns true if the actions of the entities are reused between calls to generate_actions.")
+
+			.def("advance_many", &SGA::ForwardModel::advanceGameStates, py::arg("state"), py::arg("actions"), py::arg("numThreads") = 1, py::call_guard<py::gil_scoped_release>(), "Returns one copy of the state per action, each advanced with its action. Copies and steps run in C++ without the GIL, optionally on several threads.")
+			.def("evaluate_many",
+				[](const SGA::ForwardModel& fm, const std::vector<SGA::GameState*>& states, SGA::StateHeuristic& heuristic, int playerID, int numThreads)
+		{
+			std::vector<double> values(states.size());
+			{
+				py::gil_scoped_release release;
+				SGA::parallelFor(states.size(), numThreads, [&](size_t i)
+				{
+					values[i] = heuristic.evaluateGameState(fm, *states[i], playerID);
+				});
+			}
+			return values;
+		}
+				, py::arg("states"), py::arg("heuristic"), py::arg("playerID"), py::arg("numThreads") = 1, "Evaluates every state with the heuristic for the player without copying the states. Runs in C++ without the GIL, optionally on several threads.")
 			;
 
 
@@ -83,32 +102,36 @@ namespace stratega
 
 			.def("get_game_type", &SGA::TBSForwardModel::getGameType)
 
-			.def("generate_actions", py::overload_cast<const SGA::GameState&, int>(&SGA::ForwardModel::generateActions, py::const_), " Generates actions in the given gamestate by the received player and fills the action vector passed by parameter.")
-			.def("generate_actions", py::overload_cast<const SGA::GameState&, int, std::vector<SGA::Action>&>(&SGA::ForwardModel::generateActions, py::const_), "Returns a list of available actions in the given gamestate by the received player")
+			.def("generate_actions", py::overload_cast<const SGA::GameState&, int>(&SGA::ForwardModel::generateActions, py::const_), py::call_guard<py::gil_scoped_release>(), " Generates actions in the given gamestate by the received player and fills the action vector passed by parameter.")
+			.def("generate_actions", py::overload_cast<const SGA::GameState&, int, std::vector<SGA::Action>&>(&SGA::ForwardModel::generateActions, py::const_), py::call_guard<py::gil_scoped_release>(), "Returns a list of available actions in the given gamestate by the received player")
 
-			.def("advance_gamestate", py::overload_cast<SGA::GameState&, const SGA::Action&>(&SGA::TBSForwardModel::advanceGameState, py::const_), "Executes an action in a given SGA::GameState before updating the entities of the gamestate that should be removed and checking if the game is over.")
-			.def("advance_gamestate", py::overload_cast<SGA::GameState&, const SGA::ActionAssignment&>(&SGA::TBSForwardModel::advanceGameState, py::const_), "Executes a list of actions.")
+			.def("advance_gamestate", py::overload_cast<SGA::GameState&, const SGA::Action&>(&SGA::TBSForwardModel::advanceGameState, py::const_), py::call_guard<py::gil_scoped_release>(), "Executes an action in a given SGA::GameState before updating the entities of the gamestate that should be removed and checking if the game is over.")
+			.def("advance_gamestate", py::overload_cast<SGA::GameState&, const SGA::ActionAssignment&>(&SGA::TBSForwardModel::advanceGameState, py::const_), py::call_guard<py::gil_scoped_release>(), "Executes a list of actions.")
 
-			.def("end_turn", &SGA::TBSForwardModel::endTurn, py::arg("state"), "End the turn of the current player and if all the player has played it ends the current game turn.")
-			.def("check_game_is_finished", &SGA::TBSForwardModel::checkGameIsFinished, py::arg("state"), " Checks if the game is finished by current limit or because a player has won.")
+			.def("end_turn", &SGA::TBSForwardModel::endTurn, py::arg("state"), py::call_guard<py::gil_scoped_release>(), "End the turn of the current player and if all the player has played it ends the current game turn.")
+			.def("check_game_is_finished", &SGA::TBSForwardModel::checkGameIsFinished, py::arg("state"), py::call_guard<py::gil_scoped_release>(), " Checks if the game is finished by current limit or because a player has won.")
 			;
 
 		py::class_<SGA::RTSForwardModel, SGA::ForwardModel>(m, "RTSForwardModel", "Is the default SGA::ForwardModel for RTS games, it contains specific methods.")
 			.def(py::init<>())
 			.def("get_game_type", &SGA::RTSForwardModel::getGameType)
 
-			.def("generate_actions", py::overload_cast<const SGA::GameState&, int>(&SGA::ForwardModel::generateActions, py::const_), " Generates actions in the given gamestate by the received player and fills the action vector passed by parameter.")
-			.def("generate_actions", py::overload_cast<const SGA::GameState&, int, std::vector<SGA::Action>&>(&SGA::ForwardModel::generateActions, py::const_), "Returns a list of available actions in the given gamestate by the received player")
+			.def("generate_actions", py::overload_cast<const SGA::GameState&, int>(&SGA::ForwardModel::generateActions, py::const_), py::call_guard<py::gil_scoped_release>(), " Generates actions in the given gamestate by the received player and fills the action vector passed by parameter.")
+			.def("generate_actions", py::overload_cast<const SGA::GameState&, int, std::vector<SGA::Action>&>(&SGA::ForwardModel::generateActions, py::const_), py::call_guard<py::gil_scoped_release>(), "Returns a list of available actions in the given gamestate by the received player")
 
-			.def("advance_gamestate", py::overload_cast<SGA::GameState&, const SGA::Action&>(&SGA::RTSForwardModel::advanceGameState, py::const_), "Moves all the entities and resolves collisions before and after executing an action in a given Gamestate")
-			.def("advance_gamestate", py::overload_cast<SGA::GameState&, const SGA::ActionAssignment&>(&SGA::RTSForwardModel::advanceGameState, py::const_), "Moves all the entities and resolves collisions before and after executing an action in a given Gamestate")
+			.def("advance_gamestate", py::overload_cast<SGA::GameState&, const SGA::Action&>(&SGA::RTSForwardModel::advanceGameState, py::const_), py::call_guard<py::gil_scoped_release>(), "Moves all the entities and resolves collisions before and after executing an action in a given Gamestate")
+			.def("advance_gamestate", py::overload_cast<SGA::GameState&, const SGA::ActionAssignment&>(&SGA::RTSForwardModel::advanceGameState, py::const_), py::call_guard<py::gil_scoped_release>(), "Moves all the entities and resolves collisions before and after executing an action in a given Gamestate")
 
-			.def("move_entities", &SGA::RTSForwardModel::moveEntities, py::arg("state"), "Moves all the entities that have a current path and they did not reach their destination. If the entity has a path it moves the entity through all the path points one after theother until reaching the last one.")
-			.def("resolve_entity_collisions", &SGA::RTSForwardModel::resolveEntityCollisions, py::arg("state"), "Resolves collisions between entities in a basic way computing the penetration depth and pushing them way in the opposite direction.")
-			.def("resolve_environment_collisions", &SGA::RTSForwardModel::resolveEnvironmentCollisions, py::arg("state"), "Resolves collisions between entities and the tiles that are not walkable in a basic way computing the penetration depth and pushing them way in the opposite direction.")
+			.def("move_entities", &SGA::RTSForwardModel::moveEntities, py::arg("state"), py::call_guard<py::gil_scoped_release>(), "Moves all the entities that have a current path and they did not reach their destination. If the entity has a path it moves the entity through all the path points one after theother until reaching the last one.")
+			.def("resolve_entity_collisions", &SGA::RTSForwardModel::resolveEntityCollisions, py::arg("state"), py::call_guard<py::gil_scoped_release>(), "Resolves collisions between entities in a basic way computing the penetration depth and pushing them way in the opposite direction.")
+			.def("resolve_environment_collisions", &SGA::RTSForwardModel::resolveEnvironmentCollisions, py::arg("state"), py::call_guard<py::gil_scoped_release>(), "Resolves collisions between entities and the tiles that are not walkable in a basic way computing the penetration depth and pushing them way in the opposite direction.")
 
-			.def("find_path", &SGA::RTSForwardModel::findPath, py::arg("state"), py::arg("startPos"), py::arg("endPos"), "Returns a Path inside the Navmesh between the start and end positons.")
-			.def("check_game_is_finished", &SGA::RTSForwardModel::checkGameIsFinished, py::arg("state"), "Checks if the game is finished by current limit or because a player has won.")
+			.def("find_path", &SGA::RTSForwardModel::findPath, py::arg("state"), py::arg("startPos"), py::arg("endPos"), py::call_guard<py::gil_scoped_release>(), "Returns a Path inside the Navmesh between the start and end positons.")
+			.def("set_path_cache_size", &SGA::RTSForwardModel::setPathCacheSize, py::arg("size"), "Sets the number of path corridors that find_path remembers for each navmesh, the least recently used ones are evicted. Corridors are reused between the same cells of the board. 0 disables the cache, which is the default.")
+			.def("get_path_cache_size", &SGA::RTSForwardModel::getPathCacheSize, "Returns the number of path corridors that find_path remembers for each navmesh.")
+			.def("set_flow_field_threshold", &SGA::RTSForwardModel::setFlowFieldThreshold, py::arg("threshold"), "Sets the number of path queries to a goal cell after which a flow field towards it is built and shared by the next queries. 0 disables flow fields, which is the default.")
+			.def("get_flow_field_threshold", &SGA::RTSForwardModel::getFlowFieldThreshold, "Returns the number of path queries to a goal cell after which a flow field towards it is built.")
+			.def("check_game_is_finished", &SGA::RTSForwardModel::checkGameIsFinished, py::arg("state"), py::call_guard<py::gil_scoped_release>(), "Checks if the game is finished by current limit or because a player has won.")
 			;
 
 		// ---- Path ----
@@ -2,6 +2,133 @@
 
 namespace stratega
 {
+	namespace
+	{
+		// Arrays handed to Python are read-only, the state is only modified through the forward model
+		template<typename T>
+		py::array_t<T> readOnly(py::array_t<T> array)
+		{
+			array.attr("setflags")(py::arg("write") = false);
+			return array;
+		}
+
+		// Number of columns before the parameters in the entity table
+		constexpr py::ssize_t ENTITY_TABLE_FIXED_COLUMNS = 5;
+
+		// Tile type id of every board position, indexed [y, x]
+		py::array_t<int> tileTypeGrid(const SGA::GameState& state)
+		{
+			const auto width = static_cast<py::ssize_t>(state.getBoardWidth());
+			const auto height = static_cast<py::ssize_t>(state.getBoardHeight());
+			py::array_t<int> grid({ height, width });
+			auto values = grid.mutable_unchecked<2>();
+			for (py::ssize_t y = 0; y < height; y++)
+			{
+				for (py::ssize_t x = 0; x < width; x++)
+				{
+					values(y, x) = state.getTileAtConst(SGA::Vector2i(static_cast<int>(x), static_cast<int>(y))).getTileTypeID();
+				}
+			}
+			return readOnly(grid);
+		}
+
+		// Column names of the entity table: id, owner, type, x, y and every parameter by its global ID
+		std::vector<std::string> entityTableColumns(const SGA::GameState& state)
+		{
+			std::vector<std::string> columns = { "id", "owner", "type", "x", "y" };
+			const auto& lookup = state.getGameInfo()->getParameterIDLookup();
+			columns.resize(static_cast<size_t>(ENTITY_TABLE_FIXED_COLUMNS) + lookup.size());
+			for (const auto& [name, id] : lookup)
+			{
+				columns[static_cast<size_t>(ENTITY_TABLE_FIXED_COLUMNS + id)] = name;
+			}
+			return columns;
+		}
+
+		// One row per entity (of a player, or all entities if playerID is -1) filled in a single pass.
+		// Parameters are stored per entity type by index, so they are placed in the column of their global ID.
+		// Parameters the entity type does not have are NaN.
+		py::array_t<double> entityTable(const SGA::GameState& state, int playerID)
+		{
+			const auto& entities = state.getEntities();
+			const auto columns = ENTITY_TABLE_FIXED_COLUMNS + static_cast<py::ssize_t>(state.getGameInfo()->getParameterIDLookup().size());
+			py::ssize_t rows = 0;
+			for (const auto& entity : entities)
+			{
+				if (playerID == -1 || entity.getOwnerID() == playerID)
+					rows++;
+			}
+
+			py::array_t<double> table({ rows, columns });
+			auto values = table.mutable_unchecked<2>();
+			py::ssize_t row = 0;
+			for (const auto& entity : entities)
+			{
+				if (playerID != -1 && entity.getOwnerID() != playerID)
+					continue;
+
+				values(row, 0) = entity.getID();
+				values(row, 1) = entity.getOwnerID();
+				values(row, 2) = entity.getEntityTypeID();
+				values(row, 3) = entity.x();
+				values(row, 4) = entity.y();
+				for (py::ssize_t column = ENTITY_TABLE_FIXED_COLUMNS; column < columns; column++)
+				{
+					values(row, column) = std::numeric_limits<double>::quiet_NaN();
+				}
+
+				const auto& parameterValues = entity.getParamValues();
+				for (const auto& [id, parameter] : entity.getEntityType().getParameters())
+				{
+					auto it = parameterValues.find(parameter.getIndex());
+					if (it != parameterValues.end())
+						values(row, ENTITY_TABLE_FIXED_COLUMNS + id) = it->second;
+				}
+				row++;
+			}
+			return readOnly(table);
+		}
+
+		// Column names of the player parameter table: id and every player parameter by its index
+		std::vector<std::string> playerTableColumns(const SGA::GameState& state)
+		{
+			const auto& parameterTypes = state.getGameInfo()->getPlayerParameterTypes();
+			std::vector<std::string> columns(1 + parameterTypes.size());
+			columns[0] = "id";
+			for (const auto& [id, parameter] : parameterTypes)
+			{
+				columns[static_cast<size_t>(1 + parameter.getIndex())] = parameter.getName();
+			}
+			return columns;
+		}
+
+		// One row per player with its id and parameters, missing parameters are NaN
+		py::array_t<double> playerTable(const SGA::GameState& state)
+		{
+			const auto& players = state.getPlayers();
+			const auto rows = static_cast<py::ssize_t>(players.size());
+			const auto columns = 1 + static_cast<py::ssize_t>(state.getGameInfo()->getPlayerParameterTypes().size());
+
+			py::array_t<double> table({ rows, columns });
+			auto values = table.mutable_unchecked<2>();
+			for (py::ssize_t row = 0; row < rows; row++)
+			{
+				const auto& player = players[static_cast<size_t>(row)];
+				values(row, 0) = player.getID();
+				for (py::ssize_t column = 1; column < columns; column++)
+				{
+					values(row, column) = std::numeric_limits<double>::quiet_NaN();
+				}
+				for (const auto& [index, value] : player.getParameters())
+				{
+					if (index >= 0 && 1 + index < columns)
+						values(row, 1 + index) = value;
+				}
+			}
+			return readOnly(table);
+		}
+	}
+
 	void gamestate(py::module_& m)
 	{
 		// ---- GameState ----
@@ -20,7 +147,7 @@ namespace stratega
 		}))
 			.def("__copy__", [](const SGA::GameState& self) {
 			return SGA::GameState(self);
-		})
+		}, py::call_guard<py::gil_scoped_release>())
 			.def("__deepcopy__", [](const SGA::GameState& self, py::dict) {
 			return SGA::GameState(self);
 		})
@@ -49,6 +176,7 @@ namespace stratega
 
 			.def("get_tile_at", py::overload_cast<int, int>(&SGA::GameState::getTileAtConst, py::const_), "Returns the tile at the position indicated in the parameter. Can throw an exception if out of bounds.")
 			.def("get_tile_at", py::overload_cast<const SGA::Vector2i&>(&SGA::GameState::getTileAtConst, py::const_), "Returns the tile at the position (x,y) indicated in the parameter. Can throw an exception if out of bounds.")
+			.def("get_tile_type_grid", &tileTypeGrid, "Returns a read-only numpy array of shape (height, width) with the tile type ID of every position, indexed [y, x].")
 
 			////Entities
 			.def("get_entity", py::overload_cast<int>(&SGA::GameState::getEntity), py::return_value_policy::reference, "Get entity")
@@ -61,6 +189,7 @@ namespace stratega
 			.def("get_entity_const", &SGA::GameState::getEntityConst, py::arg("entityID"), py::return_value_policy::reference, "Returns an entity at board position 'pos'. It'll return a nullptr if no entities at this position. ")
 			.def("add_entity", py::overload_cast<const SGA::EntityType&, int, const SGA::Vector2f&>(&SGA::GameState::addEntity), "Adds a new entity of a given type to the game, in a given position, belonging to a specific player. ")
 			.def("add_entity", py::overload_cast<SGA::Entity, int, const SGA::Vector2f&>(&SGA::GameState::addEntity), "Adds a new entity, in a given position, belonging to a specific player. ")
+			.def("move_entity", &SGA::GameState::moveEntity, py::arg("entity"), py::arg("position"), "Moves an entity of this state to a new position and keeps the position queries (get_entity_at, get_entities_around...) up to date. Entities can only be moved through their state.")
 
 			.def("get_player_entities", &SGA::GameState::getPlayerEntities, py::arg("playerID"), py::arg("entityCategory") = SGA::EntityCategory::Null, "Gets the list of entities of the specified player.")
 			.def("get_non_player_entities", &SGA::GameState::getNonPlayerEntities, py::arg("playerID"), py::arg("entityCategory") = SGA::EntityCategory::Null, "Gets the list of entities of the specified player.")
@@ -70,6 +199,8 @@ namespace stratega
 			return state.getEntities();
 		}
 			)
+			.def("get_entity_table", &entityTable, py::arg("playerID") = -1, "Returns a read-only numpy array with one row per entity of the player (all entities if playerID is -1). Columns are given by get_entity_table_columns, missing parameters are NaN.")
+			.def("get_entity_table_columns", &entityTableColumns, "Returns the column names of get_entity_table: id, owner, type, x, y and the parameters by their global ID.")
 			////Player
 			.def("get_player",
 				[](SGA::GameState& state, int id)
@@ -94,6 +225,17 @@ namespace stratega
 			.def("get_player_parameter_names", &SGA::GameState::hasPlayerParameter, py::arg("playerID"), "Returns a list will all the parameter names of the player of which ID is given")
 			.def("get_player_parameters", &SGA::GameState::getPlayerParameters, py::arg("playerID"), "Gets a map with all pairs <parameter,value>")
 			.def("get_player_score", &SGA::GameState::getPlayerScore, py::arg("playerID"), "Returns the score of the player whose ID is passed.")
+			.def("get_player_table", &playerTable, "Returns a read-only numpy array with one row per player: its ID and parameters. Columns are given by get_player_table_columns, missing parameters are NaN.")
+			.def("get_player_table_columns", &playerTableColumns, "Returns the column names of get_player_table: id and the player parameters by their index.")
+			.def("get_parameters_view",
+				[](py::object self)
+		{
+			const auto& parameters = self.cast<const SGA::GameState&>().getParameters();
+			// Shares the storage of the state parameters and keeps the state alive, valid until the parameters are resized
+			py::array_t<double> view({ static_cast<py::ssize_t>(parameters.size()) }, { static_cast<py::ssize_t>(sizeof(double)) }, parameters.data(), self);
+			return readOnly(view);
+		}
+				, "Returns a read-only numpy view (no copy) of the state parameters, indexed by parameter index.")
 
 			.def("apply_fog_of_war", &SGA::GameState::applyFogOfWar, py::arg("playerID"), "Removes entities and hide tiles that are not visible from the point of view of the given player.")
 			.def("get_fog_of_war_tile_id", &SGA::GameState::getFogOfWarTileId, "Returns the ID of the tile that represents the fog of war.")
@@ -6,6 +6,7 @@
 #include <pybind11/functional.h>
 #include <pybind11/chrono.h>
 #include <pybind11/iostream.h>
+#include <pybind11/numpy.h>
 
 #include <Stratega/Logging/FileLogger.h>
 #include <Stratega/Representation/Vector2.h>
@@ -21,6 +22,7 @@
 #include <Stratega/Agent/AgentFactory.h>
 #include <Stratega/Game/AgentThread.h>
 #include <Stratega/Agent/Heuristic/MinimizeDistanceHeuristic.h>
+#include <Stratega/Utils/ParallelFor.h>
 #include <Stratega/Arena/Arena.h>
 #include <Stratega/Representation/Buff.h>
 #include <Stratega/Representation/BuffType.h>
@@ -5,10 +5,14 @@ namespace stratega
 	void heuristic(py::module_& m)
 	{
 		// ---- Heuristic ----
-		py::class_<SGA::MinimizeDistanceHeuristic>(m, "MinimizeDistanceHeuristic", "Heuristic that focus in minimizing the distance with the enemy.")
+		py::class_<SGA::StateHeuristic>(m, "StateHeuristic", "Base class of the heuristics that evaluate a game state for a player.")
+			.def("get_name", &SGA::StateHeuristic::getName)
+			.def("evaluate_gamestate", &SGA::StateHeuristic::evaluateGameState, py::arg("forwardModel"), py::arg("gameState"), py::arg("playerID"), py::call_guard<py::gil_scoped_release>());
+
+		py::class_<SGA::MinimizeDistanceHeuristic, SGA::StateHeuristic>(m, "MinimizeDistanceHeuristic", "Heuristic that focus in minimizing the distance with the enemy.")
 			.def(py::init<>())
 			.def("get_name", &SGA::MinimizeDistanceHeuristic::getName)
-			.def("evaluate_gamestate", &SGA::MinimizeDistanceHeuristic::evaluateGameState, py::arg("forwardModel"), py::arg("gameState"), py::arg("playerID"));
+			.def("evaluate_gamestate", &SGA::MinimizeDistanceHeuristic::evaluateGameState, py::arg("forwardModel"), py::arg("gameState"), py::arg("playerID"), py::call_guard<py::gil_scoped_release>());
 
 	}	
 }
\ No newline at end of file
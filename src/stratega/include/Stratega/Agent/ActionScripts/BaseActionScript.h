@@ -2,6 +2,7 @@
 #include <Stratega/Representation/GameState.h>
 #include <Stratega/ForwardModel/Action.h>
 #include <Stratega/ForwardModel/ActionSpace.h>
+#include <boost/random.hpp>
 #include <map>
 
 namespace SGA {
@@ -47,6 +48,16 @@ namespace SGA {
 
 		virtual Action getAction(const GameState& gameState, std::vector<Action>& actionSpace, int playerID) const = 0;
 		virtual Action getActionForUnit(const GameState& gameState, std::vector<Action>& actionSpace, int playerID, int unitID) const = 0;
+
+		/// <summary>
+		/// Returns the action of the player like getAction, drawing the random choices of the script from randomGenerator.
+		/// Agents that roll states on several threads use it to stay deterministic, scripts without random choices keep this default.
+		/// </summary>
+		virtual Action getActionWithGenerator(const GameState& gameState, std::vector<Action>& actionSpace, int playerID, boost::mt19937& /*randomGenerator*/) const
+		{
+			return getAction(gameState, actionSpace, playerID);
+		}
+
 		virtual std::string toString() const = 0;
 
 		friend std::ostream& operator<<(std::ostream& os, const BaseActionScript& dt)
@@ -11,6 +11,7 @@ namespace SGA {
 
 		Action getAction(const GameState& gameState, std::vector<Action>& actionSpace, int playerID) const override;
 		Action getActionForUnit(const GameState& gameState, std::vector<Action>& actionSpace, int playerID, int unitID) const override;
+		Action getActionWithGenerator(const GameState& gameState, std::vector<Action>& actionSpace, int playerID, boost::mt19937& randomGenerator) const override;
 		std::string toString() const override { return "RandomActionScript"; };
 	};
 }
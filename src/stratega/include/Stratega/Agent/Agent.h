@@ -149,8 +149,9 @@ namespace SGA
 	/// <param name="fm">Forward model to roll the state forward and quering available actions.</param>
 	/// <param name="agParams">Parameters of the agent who's calling this method.</param>
 	/// <param name="oppID">ID of the opponent who will roll the state forward with an action.</param>
+	/// <param name="randomGenerator">If set, the random choices of the opponent model are drawn from it instead of the shared rand() state.</param>
 	/// <returns>True if one action was executed.</returns>
-	inline bool rollOppAction(GameState& gs, const ForwardModel& fm, const AgentParameters& agParams, int oppID)
+	inline bool rollOppAction(GameState& gs, const ForwardModel& fm, const AgentParameters& agParams, int oppID, boost::mt19937* randomGenerator = nullptr)
 	{
 		//An opponent is to play in this state.
 		std::shared_ptr<BaseActionScript> oppModel = agParams.getOpponentModel();
@@ -158,7 +159,7 @@ namespace SGA
 		{
 			//If an opponent model is defined, apply it.
 			auto actions = fm.generateActions(gs, oppID);
-			fm.advanceGameState(gs, oppModel->getAction(gs, actions, oppID));
+			fm.advanceGameState(gs, randomGenerator ? oppModel->getActionWithGenerator(gs, actions, oppID, *randomGenerator) : oppModel->getAction(gs, actions, oppID));
 			return true;
 		}
 		else
@@ -178,15 +179,16 @@ namespace SGA
 	/// <param name="gs">Game state to roll forward</param>
 	/// <param name="fm">Forward model to roll the state forward and quering available actions.</param>
 	/// <param name="agParams">Parameters of the agent who's calling this method.</param>
+	/// <param name="randomGenerator">If set, the random choices of the opponent model are drawn from it instead of the shared rand() state.</param>
 	/// <returns>The number of actions executed by this function.</returns>
-	inline int rollOppOnly(GameState& gs, const ForwardModel& fm, const AgentParameters& agParams)
+	inline int rollOppOnly(GameState& gs, const ForwardModel& fm, const AgentParameters& agParams, boost::mt19937* randomGenerator = nullptr)
 	{
 		int actionsExecuted = 0;
 		std::vector<int> canPlay = gs.whoCanPlay();
 		for (int id : canPlay)
 		{
 			//Try to execute an action for this player if it's an opponent opponent
-			if (id != agParams.PLAYER_ID && rollOppAction(gs, fm, agParams, id))  actionsExecuted++;
+			if (id != agParams.PLAYER_ID && rollOppAction(gs, fm, agParams, id, randomGenerator))  actionsExecuted++;
 		}
 		return actionsExecuted;
 	}
@@ -199,8 +201,9 @@ namespace SGA
 	/// <param name="fm">Forward model to roll the state forward and quering available actions.</param>
 	/// <param name="act">Action to execute for the player with id equals to agParams.PLAYER_ID</param>
 	/// <param name="agParams">Parameters of the agent who's calling this method.</param>
+	/// <param name="randomGenerator">If set, the random choices of the opponent model are drawn from it instead of the shared rand() state.</param>
 	/// <returns>The number of actions executed by this function.</returns>
-	inline int roll(GameState& gs, const ForwardModel& fm, const Action& act, int playerID, const AgentParameters& agParams)
+	inline int roll(GameState& gs, const ForwardModel& fm, const Action& act, int playerID, const AgentParameters& agParams, boost::mt19937* randomGenerator = nullptr)
 	{
 		int actionsExecuted = 0;
 		std::vector<int> whoCanPlay = gs.whoCanPlay();
@@ -216,7 +219,7 @@ namespace SGA
 			//An opponent is to play in this state, execute:
 			else if (agParams.PLAYER_ID != id)
 			{
-				rollOppAction(gs, fm, agParams, id);
+				rollOppAction(gs, fm, agParams, id, randomGenerator);
 				actionsExecuted++;
 			}
 		}
@@ -1,5 +1,6 @@
 #pragma once
 #include <Stratega/ForwardModel/ForwardModel.h>
+#include <Stratega/Utils/ParallelFor.h>
 
 namespace SGA
 {
@@ -10,6 +11,20 @@ namespace SGA
 
 		virtual double evaluateGameState(const ForwardModel& /*forwardModel*/, GameState& /*gameState*/, const int /*playerID*/) { return 0; };
 		virtual std::string getName() const { return "Undefined heuristic name"; }
+
+		/// <summary>
+		/// Evaluates every state for the player. With more than one thread, evaluateGameState is called concurrently on different states,
+		/// so heuristics that keep state between calls must only be used with numThreads = 1.
+		/// </summary>
+		std::vector<double> evaluateGameStates(const ForwardModel& forwardModel, std::vector<GameState>& gameStates, const int playerID, int numThreads = 1)
+		{
+			std::vector<double> values(gameStates.size());
+			parallelFor(gameStates.size(), numThreads, [&](size_t i)
+			{
+				values[i] = evaluateGameState(forwardModel, gameStates[i], playerID);
+			});
+			return values;
+		}
 	};
 
 
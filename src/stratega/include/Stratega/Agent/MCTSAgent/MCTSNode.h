@@ -13,6 +13,10 @@ namespace SGA {
 	protected:
 		int nVisits = 0;			//number of visits to this node.
 		double bounds[2] = { 0, 1 };	//Reward bounds in this node.
+		bool hasGameState = true;		//False once the state of this node was dropped, see MCTSParameters::storeNodeStates.
+		bool isReplayable = false;		//If the state of this node is the state of its parent after its action, without moves of other players.
+		bool isTerminal = false;		//If the game is over in the state of this node.
+		bool ownerCanPlay = false;		//If the owner of the tree can play in the state of this node.
 
 
 	public:
@@ -71,7 +75,42 @@ namespace SGA {
 
 
 		//Applies an action "action" to a game state "gameState", using "forwardModel". It updates "params" for budget concerns.
-		void applyActionToGameState(ForwardModel& forwardModel, GameState& targetGameState, Action& action, MCTSParameters& params, int playerID) const;
+		//Returns true if only "action" was applied and this agent can play again or the game is over, so applying it again leads to the same state.
+		bool applyActionToGameState(ForwardModel& forwardModel, GameState& targetGameState, Action& action, MCTSParameters& params, int playerID) const;
+
+		/// <summary>
+		/// Returns a copy of the state of this node. If the state was dropped, it is computed again from the closest ancestor that keeps its state.
+		/// </summary>
+		GameState copyGameState(ForwardModel& forwardModel, MCTSParameters& params) const;
+
+		/// <summary>
+		/// Releases the state of this node, see MCTSParameters::storeNodeStates.
+		/// </summary>
+		void dropGameState();
+
+		/// <summary>
+		/// Number of visits to this node.
+		/// </summary>
+		int getVisitCount() const { return nVisits; }
+
+		/// <summary>
+		/// Returns the subtree of the child reached with the action at actionIndex as a new tree, if the state of the child matches the observed state.
+		/// Returns nullptr if the child was not expanded or its state differs, for example because of the moves of the opponents.
+		/// </summary>
+		/// <param name="root">Root of the tree searched in the previous decision. The rest of the tree is released.</param>
+		/// <param name="actionIndex">Index of the action executed after the previous decision.</param>
+		/// <param name="observedState">State received in the current decision.</param>
+		static std::unique_ptr<MCTSNode> reRoot(std::unique_ptr<MCTSNode> root, int actionIndex, const GameState& observedState, ForwardModel& forwardModel, MCTSParameters& params);
+
+		/// <summary>
+		/// Returns true if both states have the same tick, current player, players and entities with the same parameters, positions and buffs.
+		/// </summary>
+		static bool isSameState(const GameState& predicted, const GameState& observed);
+
+		/// <summary>
+		/// Returns true if both action spaces have the same actions with the same targets in the same order.
+		/// </summary>
+		static bool isSameActionSpace(const std::vector<Action>& predicted, const std::vector<Action>& observed);
 
 	public:
 		// Root Node Constructor
@@ -18,7 +18,8 @@ namespace SGA {
         double K = sqrt(2);                     //Balance constant for tree policy (UCT)
         int rolloutLength = 3;                  //Lenght of the complete playout.
         bool rolloutsEnabled = true;            //If the simulation/rollout phase should be executed or not.
-        bool continuePreviousSearch = true;     //Indicates if tree should be kept between two consecutive decision making steps.
+        bool continuePreviousSearch = true;     //Indicates if tree should be kept between two consecutive decision making steps. It is reused only if the observed state matches the predicted one.
+        bool storeNodeStates = true;            //If false, nodes that are not the root drop their state when the other players did not move in between, and compute it again from the action path when needed.
 
         boost::random::uniform_real_distribution<double> doubleDistribution_ = boost::random::uniform_real_distribution<double>(0, 1);  //Uniform distribution of real numbers in [0,1]
         double epsilon = 1e-2;                  //Small number to avoid /0
@@ -49,6 +50,7 @@ namespace YAML
             rhs.rolloutLength= node["RolloutLength"].as<int>(rhs.rolloutLength);
             rhs.rolloutsEnabled = node["EnableRollouts"].as<bool>(rhs.rolloutsEnabled);
             rhs.continuePreviousSearch = node["ContPreviousSearch"].as<bool>(rhs.continuePreviousSearch);
+            rhs.storeNodeStates = node["StoreNodeStates"].as<bool>(rhs.storeNodeStates);
             return true;
         }
     };
@@ -4,6 +4,8 @@
 #include <Stratega/Agent/Heuristic/StateHeuristic.h>
 #include <Stratega/Representation/GameState.h>
 #include <Stratega/ForwardModel/ForwardModel.h>
+#include <Stratega/Utils/WorkerPool.h>
+#include <functional>
 
 #include <Stratega/Agent/RHEAAgent/RHEAGenome.h>
 #include <Stratega/Agent/RHEAAgent/RHEAParameters.h>
@@ -16,6 +18,7 @@ namespace SGA
 	private:
 		std::vector<RHEAGenome> pop_;						//Population of individuals for RHEA
 		RHEAParameters params_;									//Configuration of RHEA
+		std::unique_ptr<WorkerPool> workerPool_;				//Threads evaluating the new individuals, created by init with params_.numThreads
 
 	public:
 		RHEAAgent(const std::string& name, RHEAParameters&& params) :
@@ -61,14 +64,16 @@ namespace SGA
 		std::vector<RHEAGenome> nextGeneration(const ForwardModel& forwardModel, GameState& gameState, boost::mt19937& randomGenerator);
 		
 		/// <summary>
-		/// Creates a new individual for the next generation
+		/// Creates count individuals with createIndividual, spread over the worker pool, and adds them to the budget counters.
+		/// Each individual gets its own random generator, seeded in order from randomGenerator, and counts its own forward model calls,
+		/// so the individuals do not depend on the number of threads or on the thread that created them.
 		/// </summary>
-		RHEAGenome getNextGenerationIndividual(const ForwardModel& forwardModel, GameState& gameState, boost::mt19937& randomGenerator);
+		std::vector<RHEAGenome> createIndividuals(size_t count, boost::mt19937& randomGenerator, const std::function<RHEAGenome(size_t, boost::mt19937&, int&)>& createIndividual);
 
 		/// <summary>
-		/// Returns a selection of individuals for crossover.
+		/// Returns the indices of two individuals of the population for crossover, each the best of a tournament of params_.tournamentSize random individuals.
 		/// </summary>
-		std::vector<RHEAGenome> tournamentSelection();
+		std::vector<size_t> tournamentSelection(boost::mt19937& randomGenerator) const;
 	};
 	
 }
\ No newline at end of file
@@ -18,8 +18,9 @@ namespace SGA {
 
 	public:
 
-		//Creates a random individual
-		RHEAGenome(const ForwardModel& forwardModel, GameState gameState, RHEAParameters& params);
+		//Creates a random individual. Random choices are drawn from randomGenerator and the forward model calls are added to forwardModelCalls,
+		//so individuals can be created on several threads while params is only read.
+		RHEAGenome(const ForwardModel& forwardModel, GameState gameState, const RHEAParameters& params, boost::mt19937& randomGenerator, int& forwardModelCalls);
 
 		//Creates a copy of an existing individual
 		RHEAGenome(const RHEAGenome& other) = default;
@@ -28,27 +29,30 @@ namespace SGA {
 		std::vector<Action>& getActions() { return actions; };
 
 		//Mutates the current individual.
-		void mutate(const ForwardModel& forwardModel, GameState gameState, RHEAParameters& params, boost::mt19937& randomGenerator);
+		void mutate(const ForwardModel& forwardModel, GameState gameState, const RHEAParameters& params, boost::mt19937& randomGenerator, int& forwardModelCalls);
 
 		//Getter and setter for the fitness of this individual.
 		double getValue() const { return value; };
 		void setValue(double newValue) { this->value = newValue; };
 
 		//Shifts this individual to the left, eliminating the first action and padding from the right with a new valid random action.
-		void shift(const ForwardModel& forwardModel, GameState gameState, RHEAParameters& params);
+		void shift(const ForwardModel& forwardModel, GameState gameState, const RHEAParameters& params, boost::mt19937& randomGenerator, int& forwardModelCalls);
 
 		//Prints contents of this individual.
 		void toString() const;
 
 		//Crosses two individuals (parent1 and parent2) and returns a new one.
-		static RHEAGenome crossover(const ForwardModel& forwardModel, GameState gameState, RHEAParameters& params, boost::mt19937& randomGenerator, RHEAGenome& parent1, RHEAGenome& parent2);
+		static RHEAGenome crossover(const ForwardModel& forwardModel, GameState gameState, const RHEAParameters& params, boost::mt19937& randomGenerator, int& forwardModelCalls, const RHEAGenome& parent1, const RHEAGenome& parent2);
 
 	private:
 
 		//Creates a new individual with a sequence of actions and a fitness already calculated.
 		RHEAGenome(std::vector<Action>& actions, double value);
 
-		//Applies an action "action" to a game state "gameState", using "forwardModel". It updates "params" for budget concerns.
-		static void applyActionToGameState(const ForwardModel& forwardModel, GameState& gameState, const Action& action, RHEAParameters& params);
+		//Applies an action "action" to a game state "gameState", using "forwardModel". It adds the forward model calls to "forwardModelCalls" for budget concerns.
+		static void applyActionToGameState(const ForwardModel& forwardModel, GameState& gameState, const Action& action, const RHEAParameters& params, boost::mt19937& randomGenerator, int& forwardModelCalls);
+
+		//Returns a random action of the action space.
+		static const Action& randomAction(const std::vector<Action>& actionSpace, boost::mt19937& randomGenerator);
 	};
 }
@@ -20,6 +20,7 @@ namespace SGA {
 		bool elitism = true;				// if true, always transfer the best individual to the next generation
 		bool continuePreviousSearch = true;	// initialize new population with shifted best individual of the previous iteration
 		size_t mutateBestN = 9;				// include Mutate_best additional copies of the shifted best individual in the next population
+		int numThreads = 1;					// number of threads evaluating the new individuals of a generation, the heuristic must be safe to call concurrently
 
 		double epsilon = 1e-2;				// the amount of noise for randomly modifying an individuals value
 		boost::random::uniform_real_distribution<double> doubleDistribution_ = boost::random::uniform_real_distribution<double>(0, 1);  //Uniform distribution of real numbers in [0,1]
@@ -51,6 +52,7 @@ namespace YAML
 			rhs.elitism = node["Elitism"].as<bool>(rhs.elitism);
 			rhs.continuePreviousSearch = node["ContPreviousSearch"].as<bool>(rhs.continuePreviousSearch);
 			rhs.mutateBestN = node["MutateBestN"].as<size_t>(rhs.mutateBestN);
+			rhs.numThreads = node["NumThreads"].as<int>(rhs.numThreads);
 			return true;
 		}
 	};
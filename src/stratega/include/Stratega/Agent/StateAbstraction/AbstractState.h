@@ -1,16 +1,37 @@
 #pragma once
 #include <Stratega/Representation/GameState.h>
+#include <algorithm>
+#include <functional>
 #include <vector>
 #include <string>
 
 
 namespace SGA
 {
-
+	/// <summary>
+	/// Description of a state by named lists of values.
+	/// The values of all attributes are packed in one vector in the order the attributes were added, and the hash is updated as they are added,
+	/// so states can be compared and used as keys of hash maps without looking up every attribute by name.
+	/// States are only equal if their attributes were added in the same order, like the states created by the same <see cref="SGA::StateFactory"/>.
+	/// </summary>
 	class AbstractState
 	{
 	private:
-		std::unordered_map<std::string, std::vector<double>> stateDescription;
+		struct Attribute
+		{
+			std::string name;
+			size_t offset;
+			size_t length;
+		};
+
+		std::vector<Attribute> attributes;
+		std::vector<double> values;
+		size_t hash = 0;
+
+		void combineHash(size_t value)
+		{
+			hash ^= value + 0x9e3779b9 + (hash << 6) + (hash >> 2);
+		}
 
 	public:
 		AbstractState()
@@ -18,11 +39,30 @@ namespace SGA
 
 		}
 
-		void addAttribute(std::string parameter, std::vector<double>& values)
+		void addAttribute(std::string parameter, std::vector<double>& newValues)
 		{
-			stateDescription[parameter] = std::move(values);
+			combineHash(std::hash<std::string>()(parameter));
+			combineHash(newValues.size());
+			for (const auto& value : newValues)
+			{
+				// 0.0 and -0.0 are equal and must have the same hash
+				combineHash(std::hash<double>()(value == 0 ? 0.0 : value));
+			}
+
+			attributes.push_back({ std::move(parameter), values.size(), newValues.size() });
+			values.insert(values.end(), newValues.begin(), newValues.end());
 		}
 
+		/// <summary>
+		/// Hash of the attributes, computed as they are added.
+		/// </summary>
+		size_t getHash() const { return hash; }
+
+		/// <summary>
+		/// Values of all attributes in the order they were added.
+		/// </summary>
+		const std::vector<double>& getValues() const { return values; }
+
 		/// <summary>
 		/// Comparator to be used for sorting a list of abstract states.
 		/// A state is considered to be smaller in case the length of its state description is shorter
@@ -32,64 +72,39 @@ namespace SGA
 		/// <param name="state2"></param>
 		/// <returns>true in case state 1 is smaller than state 2</returns>
 		bool compareAbstractStates(const AbstractState& state1, const AbstractState& state2) {
-			if (state1.stateDescription.size() < state2.stateDescription.size())
-				return true;
-			if (state1.stateDescription.size() > state2.stateDescription.size())
-				return false;
-
-			/*
-			 *for (int x = 0; x < state1.stateDescription.size(); x++) {
-				if (state1.stateDescription[x] == state2.stateDescription[x])
-					continue;
-				return state1.stateDescription[x] < state2.stateDescription[x];
-			}*/
+			if (state1.values.size() != state2.values.size())
+				return state1.values.size() < state2.values.size();
 
-			return true;
+			return std::lexicographical_compare(state1.values.begin(), state1.values.end(), state2.values.begin(), state2.values.end());
 		}
 
-		bool operator==(const AbstractState& dt)
+		bool operator==(const AbstractState& dt) const
 		{
-			if (stateDescription.size() == dt.stateDescription.size())
-			{
-				for (auto entry : stateDescription) {
-					std::string test = entry.first;
-
-					const auto got = dt.stateDescription.find(entry.first);
-
-					if (got == dt.stateDescription.end())
-					{
-					//if (dt.stateDescription.contains(entry.first)) {	// check if the same keys are contained
-						if (entry.second.size() != dt.stateDescription.at(entry.first).size()) {	// check if the length per key match
-							return false;
-						}
-					}
-					else
-					{
-						return false;
-					}
-				}
+			if (hash != dt.hash || values != dt.values || attributes.size() != dt.attributes.size())
+				return false;
 
-				for (const auto& entry : stateDescription) {
-					auto compareTo = dt.stateDescription.at(entry.first);
-					for (size_t i = 0; i < entry.second.size(); i++) {
-						if (entry.second[i] != compareTo[i])
-							return false;
-					}
-				}
-				return true;
+			for (size_t i = 0; i < attributes.size(); i++)
+			{
+				if (attributes[i].length != dt.attributes[i].length || attributes[i].name != dt.attributes[i].name)
+					return false;
 			}
-			return false;
+			return true;
+		}
+
+		bool operator!=(const AbstractState& dt) const
+		{
+			return !(*this == dt);
 		}
 
 
 		friend std::ostream& operator<<(std::ostream& os, const AbstractState& dt)
 		{
-			for (auto entry : dt.stateDescription)
+			for (const auto& attribute : dt.attributes)
 			{
-				os << entry.first << ": ";
-				for (auto val : entry.second)
+				os << attribute.name << ": ";
+				for (size_t i = 0; i < attribute.length; i++)
 				{
-					os << val << "; ";
+					os << dt.values[attribute.offset + i] << "; ";
 				}
 				os << std::endl;
 			}
@@ -98,4 +113,16 @@ namespace SGA
 		}
 
 	};
-}
\ No newline at end of file
+}
+
+namespace std
+{
+	template<>
+	struct hash<SGA::AbstractState>
+	{
+		size_t operator()(const SGA::AbstractState& state) const
+		{
+			return state.getHash();
+		}
+	};
+}
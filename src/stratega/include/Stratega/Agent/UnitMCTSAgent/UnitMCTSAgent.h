@@ -2,6 +2,7 @@
 #include <Stratega/Agent/Agent.h>
 #include <Stratega/Agent/Heuristic/AbstractHeuristic.h>
 #include <Stratega/Agent/UnitMCTSAgent/UnitMCTSNode.h>
+#include <unordered_map>
 
 #include "UnitMCTSParameters.h"
 
@@ -25,6 +26,7 @@ namespace SGA {
             for(int i = 0; i < 100; i++) {
                 absNodes.push_back(std::vector< std::vector< UnitMCTSNode* > >());
             }
+            absNodeBySignature = std::vector< std::unordered_map< AbstractState, int > >(100);
 
             absNodeToStatistics = std::map< int, std::vector< double > >();
 
@@ -39,6 +41,7 @@ namespace SGA {
             for(int i = 0; i < 100; i++) {
                 absNodes.push_back(std::vector< std::vector< UnitMCTSNode* > >());
             }
+            absNodeBySignature = std::vector< std::unordered_map< AbstractState, int > >(100);
 
             absNodeToStatistics = std::map< int, std::vector< double > >();
             treeNodetoAbsNode = std::map< int, int >();
@@ -51,6 +54,7 @@ namespace SGA {
             for(int i = 0; i < 100; i++) {
                 absNodes.push_back(std::vector< std::vector< UnitMCTSNode* > >());
             }
+            absNodeBySignature = std::vector< std::unordered_map< AbstractState, int > >(100);
 
             absNodeToStatistics = std::map< int, std::vector< double > >();
             treeNodetoAbsNode = std::map< int, int >();
@@ -69,6 +73,9 @@ namespace SGA {
 
         std::vector< std::vector< std::vector< UnitMCTSNode* > > >
             absNodes;  // first dimension: depth, second dimension: absnode Index, second
+        std::vector< std::unordered_map< AbstractState, int > >
+            absNodeBySignature;  // first dimension: depth, maps the signature of the nodes in an absnode
+                                 // to its index, used with HASH_ABSTRACTION
         std::map< int, std::vector< double > >
             absNodeToStatistics;  // 1st, 2nd, and 3rd dimension of absNodes as key, pair of <value,
                                 // visitCount> as value
@@ -78,6 +85,11 @@ namespace SGA {
         bool newRound = true;
 
         private:
+        // create a new absnode at the depth that contains the node
+        void addAbsNode(int depth, UnitMCTSNode* node);
+        // add the node to an existing absnode at the depth
+        void addToAbsNode(int depth, int absNodeIndex, UnitMCTSNode* node);
+
         //bool initialized = false;
         std::unique_ptr< UnitMCTSNode > rootNode = nullptr;
         int previousActionIndex = -1;
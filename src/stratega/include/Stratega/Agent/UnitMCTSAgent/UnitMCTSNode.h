@@ -1,6 +1,7 @@
 #pragma once
 #include <Stratega/Agent/UnitMCTSAgent/UnitMCTSParameters.h>
 #include <Stratega/Agent/TreeSearchAgents/TreeNode.h>
+#include <Stratega/Agent/StateAbstraction/AbstractState.h>
 
 namespace SGA {
 
@@ -70,6 +71,10 @@ namespace SGA {
 
           void eliminateAbstraction();
 
+          // Describes the node by its actions, their rewards divided in intervals of length rewardThreshold and the next states of its children.
+          // Nodes with the same signature pass isTwoNodeApproxmateHomomorphism with rewardThreshold and any transition threshold.
+          AbstractState getAbstractSignature(double rewardThreshold) const;
+
           // Root Node Constructor
           UnitMCTSNode(ForwardModel& forwardModel, GameState gameState, std::vector<int> unitIndex_, int unitThisStep_, int playerID, int nodeID_);
 
@@ -23,6 +23,9 @@ namespace SGA {
         // double T_THRESHOLD = 0.3;
         double R_THRESHOLD = 0.1;
         double T_THRESHOLD = 0.3;
+        // group nodes by their quantized signature with a hash map lookup instead of comparing them
+        // to every node of each group, only nodes with the same actions and next states are grouped
+        bool HASH_ABSTRACTION = true;
 
         bool CONTINUE_PREVIOUS_SEARCH = true;
         double REMAINING_FM_CALLS = -1;
@@ -67,6 +70,7 @@ namespace YAML {
             rhs.REMAINING_FM_CALLS = rhs.maxFMCalls;
             rhs.DO_STATE_ABSTRACTION = node["DO_STATE_ABSTRACTION"].as< bool >(rhs.DO_STATE_ABSTRACTION);
             rhs.R_THRESHOLD = node["R_THRESHOLD"].as< double >(rhs.R_THRESHOLD);
+            rhs.HASH_ABSTRACTION = node["HASH_ABSTRACTION"].as< bool >(rhs.HASH_ABSTRACTION);
             rhs.CONTINUE_PREVIOUS_SEARCH = node["CONTINUE_PREVIOUS_SEARCH"].as< bool >(
                 rhs.CONTINUE_PREVIOUS_SEARCH);
             rhs.absBatch = node["ABS_BATCH"].as< int >(rhs.absBatch);
@@ -4,6 +4,8 @@
 #include <Stratega/Game/GameObserver.h>
 #include <Stratega/Game/GameRunner.h>
 
+#include <mutex>
+
 class Arena : public SGA::GameObserver
 {
 public:
@@ -13,7 +15,12 @@ public:
 	}
 	Arena(const SGA::GameConfig& config);
 
-	virtual void runGames(int playerCount, int seed, int gamesNumber, int mapNumber=1);
+	/// <summary>
+	/// Runs every agent assignment on gamesNumber seeds of every map.
+	/// With more than one worker the battles run in parallel. Each worker reuses one runner and logs every battle to its own logger,
+	/// which is merged as soon as the battle and all earlier ones finished, so the log matches a sequential run and is flushed game by game.
+	/// </summary>
+	virtual void runGames(int playerCount, int seed, int gamesNumber, int mapNumber=1, int workers=1);
 	virtual void runGames(int playerCount, int seed, int gamesNumber, int mapNumber, std::vector<std::shared_ptr<SGA::Agent>> agents);
 	virtual void runGame(const std::vector<int>& agentAssignment, boost::mt19937 rngEngine);
 	virtual void runGame(const std::vector<int>& agentAssignment, boost::mt19937 rngEngine, std::vector<std::shared_ptr<SGA::Agent>> agents);
@@ -22,7 +29,12 @@ public:
 	virtual void onGameFinished(const SGA::GameState& finalState, const SGA::ForwardModel& forwardModel) override;
 	
 private:
+	void runGamesParallel(int playerCount, int seed, int gamesNumber, int mapNumber, int workers);
+	void runBattle(SGA::GameRunner& gameRunner, int mapID, int battleID, const std::vector<int>& agentAssignment, boost::mt19937 rngEngine);
+
 	const SGA::GameConfig* config;
+	//Creating runners and agents reads the shared config, parallel battles do it one at a time
+	std::mutex setupMutex;
 	std::unique_ptr<SGA::GameRunner> runner;
 	//Number of battle in the same game combination with exchanged players
 	int gameBattleCount;
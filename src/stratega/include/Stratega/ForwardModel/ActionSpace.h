@@ -16,6 +16,11 @@ namespace SGA
 		
 		std::vector<Action> generateActions(const GameState& gameState, int player) const;
 		std::vector<Action> generateQueueActions(const GameState& gameState, int player) const;
+		void generateEntityActions(const GameState& gameState, const Entity& sourceEntity, int playerID, std::vector<Action>& bucket) const;
+		void generateEntityActions(const GameState& gameState, const Entity& sourceEntity, const ActionInfo& actionInfo, int playerID, std::vector<Action>& bucket) const;
+		bool generateAbortActions(const Entity& sourceEntity, const ActionType& actionType, int playerID, std::vector<Action>& bucket) const;
+		bool isReady(const GameState& gameState, const Entity& sourceEntity, const ActionInfo& actionInfo) const;
+		void generatePlayerActions(const GameState& gameState, const Player& player, std::vector<Action>& bucket) const;
 		std::vector<Action> generateUnitActions(const GameState& gameState, Entity& e, int playerID, bool generateEnd = true) const;
 		std::vector<std::vector<ActionTarget>> generateTargets(const GameState& state, const Entity& entity, const ActionType& action) const;
 		std::vector<std::vector<ActionTarget>> generateTargets(const GameState& state, const Player& player, const ActionType& action) const;
@@ -45,6 +50,9 @@ namespace SGA
 		virtual void generateActions(const GameState& state, const Entity& sourceEntity, const ActionType& actionType, const std::vector<std::vector<ActionTarget>>& targets, std::vector<Action>& actionBucket) const;
 		virtual void generateActions(const GameState& state, const Player& sourcePlayer, const ActionType& actionType, const std::vector<std::vector<ActionTarget>>& targets, std::vector<Action>& actionBucket) const;
 
+		Action createAction(const Entity& sourceEntity, const ActionType& actionType, const std::vector<ActionTarget>& targets) const;
+		bool isFullfiled(const GameState& state, const Action& action) const;
+
 		virtual Action generateSelfAction(const Entity& sourceEntity, const ActionType& actionType) const;
 		virtual Action generateSelfAction(const Player& sourceEntity, const ActionType& actionType) const;	
 
@@ -0,0 +1,211 @@
+#pragma once
+#include <Stratega/ForwardModel/ActionSpace.h>
+#include <memory>
+#include <mutex>
+#include <thread>
+#include <unordered_map>
+#include <unordered_set>
+#include <vector>
+
+namespace SGA
+{
+	class Condition;
+
+	/// <summary>
+	/// Remembers the actions generated for each entity and action type and updates them in the next calls with the changes of the state.
+	/// Returns the same actions in the same order as <see cref="SGA::ActionSpace::generateActions()"/>.
+	/// Every call compares the state with the previous one. The actions of an entity are generated again if the entity changed,
+	/// or if entities were added, removed or moved within the range where the entity samples entity targets.
+	/// Otherwise only the conditions of the targets that changed, or that stand where entities moved, are checked again.
+	/// Everything is generated again if the tick, the players, the state parameters, the board or the researched technologies changed.
+	/// Player actions and the end turn action are always generated, and action spaces that extend ActionSpace are not cached.
+	/// A cache must not be used by several threads at once, see <see cref="SGA::ActionSpaceCaches"/>.
+	/// </summary>
+	class ActionSpaceCache
+	{
+	public:
+		/// <summary>
+		/// Returns the actions of the player, generating only the entity actions that the changes since the previous call can affect.
+		/// </summary>
+		/// <param name="actionSpace">Action space used to generate the actions, the cache is cleared when it changes.</param>
+		/// <param name="state">Game state for which actions are generated.</param>
+		/// <param name="playerID">ID of the player to generate available actions for.</param>
+		/// <returns>The same list as actionSpace.generateActions(state, playerID).</returns>
+		std::vector<Action> generateActions(const std::shared_ptr<ActionSpace>& actionSpace, const GameState& state, int playerID);
+
+		/// <summary>
+		/// Forgets all generated actions and the parts of the previous state.
+		/// </summary>
+		void clear();
+
+		/// <summary>
+		/// Number of times the actions of an entity and action type were reused from a previous call, checking again the targets that changed.
+		/// </summary>
+		size_t getHits() const { return hits; }
+
+		/// <summary>
+		/// Number of times the actions of an entity and action type had to be generated.
+		/// </summary>
+		size_t getMisses() const { return misses; }
+
+	private:
+		/// <summary>
+		/// Range of action types without sampled entity targets.
+		/// </summary>
+		static constexpr int NO_RANGE = -1;
+
+		/// <summary>
+		/// What the actions of an action type depend on besides their source entity and the global state.
+		/// </summary>
+		struct Dependencies
+		{
+			/// <summary>
+			/// True if the preconditions or the sampling methods can read any entity, the actions are then generated again whenever an entity changed.
+			/// </summary>
+			bool dependsOnAllEntities = false;
+
+			/// <summary>
+			/// True if the target conditions can read any entity, they are then checked again for every target whenever an entity changed.
+			/// </summary>
+			bool conditionsDependOnAllEntities = false;
+
+			/// <summary>
+			/// Distance from the source within which sampled entity targets are looked for, or NO_RANGE.
+			/// </summary>
+			int entityTargetRange = NO_RANGE;
+
+			/// <summary>
+			/// True if every entity is sampled as entity target, so the targets change when entities are added or removed.
+			/// </summary>
+			bool targetsAllEntities = false;
+		};
+
+		/// <summary>
+		/// Parts of the state of the previous call that the next call compares with.
+		/// Holding the shared board and technologies keeps them alive, so they can be compared by address.
+		/// </summary>
+		struct PreviousState
+		{
+			explicit PreviousState(const GameState& state)
+				: board(state.getSharedBoard()),
+				researchedTechnologies(state.getSharedResearchedTechnologies())
+			{
+			}
+
+			std::shared_ptr<GameInfo> gameInfo;
+			GameType gameType = GameType::TBS;
+			int currentTick = 0;
+			std::vector<double> parameters;
+			CopyOnWrite<Grid2D<Tile>> board;
+			CopyOnWrite<std::unordered_map<int, std::vector<int>>> researchedTechnologies;
+			std::vector<Player> players;
+			std::vector<Entity> entities;
+		};
+
+		struct CachedActions
+		{
+			bool isValid = false;
+
+			/// <summary>
+			/// Actions for every sampled combination of targets, with the result of their target conditions.
+			/// </summary>
+			std::vector<Action> candidates;
+			std::vector<bool> isFullfiled;
+
+			/// <summary>
+			/// Available actions, the fullfiled candidates or the abort and self actions.
+			/// </summary>
+			std::vector<Action> actions;
+		};
+
+		/// <summary>
+		/// Returns true if the tick, players, parameters, board and technologies of the state are the ones of the previous state.
+		/// </summary>
+		bool hasSameGlobalState(const GameState& state) const;
+
+		/// <summary>
+		/// Removes the actions of the entities that changed compared to the previous state and collects the changed entities and the positions
+		/// where entities moved. Returns false if the entities changed their order, so the cached actions can list their targets in a different order.
+		/// </summary>
+		bool collectChanges(const GameState& state);
+
+		/// <summary>
+		/// Keeps the parts of the state that the next call compares with.
+		/// </summary>
+		void storePreviousState(const GameState& state);
+
+		/// <summary>
+		/// Updates the cached actions of an entity and action type with the collected changes.
+		/// </summary>
+		void update(const GameState& state, const Entity& entity, const ActionType& actionType, CachedActions& cachedActions);
+		void generateEntityActions(const GameState& state, const Entity& entity, const ActionInfo& actionInfo, int playerID, CachedActions& cachedActions) const;
+
+		/// <summary>
+		/// Returns true if the conditions of the candidate can give a different result since the collected changes.
+		/// </summary>
+		bool isAffected(const GameState& state, const Action& candidate) const;
+
+		/// <summary>
+		/// Returns true if entities moved to or from the tile of the position, or were added or removed there.
+		/// </summary>
+		bool isNearMovedPosition(const Vector2f& position, double range) const;
+
+		const Dependencies& getDependencies(const ActionType& actionType);
+
+		static bool isLocalCondition(const Condition& condition);
+		static bool isSameEntity(const Entity& entity, const Entity& other);
+
+		std::shared_ptr<ActionSpace> actionSpace;
+
+		/// <summary>
+		/// Parts of the state of the previous call, null before the first call.
+		/// </summary>
+		std::unique_ptr<PreviousState> previousState;
+
+		/// <summary>
+		/// Actions of each entity, with one list per attached action.
+		/// </summary>
+		std::unordered_map<int, std::vector<CachedActions>> entityActions;
+		std::unordered_map<const ActionType*, Dependencies> dependencies;
+
+		/// <summary>
+		/// IDs of the entities that changed since the previous call, including the removed ones.
+		/// </summary>
+		std::unordered_set<int> changedEntities;
+
+		/// <summary>
+		/// Positions of the entities that moved, changed their type, were added or removed since the previous call.
+		/// </summary>
+		std::vector<Vector2f> movedPositions;
+		bool entitiesAddedOrRemoved = false;
+
+		size_t hits = 0;
+		size_t misses = 0;
+	};
+
+	/// <summary>
+	/// Action space caches of a forward model, one for each thread that generates actions with it.
+	/// Copies of a forward model start without caches, so clones used by other threads do not share them.
+	/// </summary>
+	class ActionSpaceCaches
+	{
+	public:
+		ActionSpaceCaches() = default;
+		ActionSpaceCaches(const ActionSpaceCaches&) {}
+		ActionSpaceCaches& operator=(const ActionSpaceCaches&) { return *this; }
+
+		/// <summary>
+		/// Returns the cache of the calling thread, creating it on the first call of the thread.
+		/// </summary>
+		ActionSpaceCache& getThreadCache();
+
+		/// <summary>
+		/// Removes the caches of all threads. Must not be called while another thread generates actions with them.
+		/// </summary>
+		void clear();
+
+	private:
+		std::mutex mutex;
+		std::unordered_map<std::thread::id, std::unique_ptr<ActionSpaceCache>> caches;
+	};
+}
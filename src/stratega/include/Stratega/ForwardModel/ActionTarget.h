@@ -139,7 +139,7 @@ namespace SGA
 		//Check if action target is valid in the received gamestate
 		bool isValid(const GameState& state) const;		
 
-		bool operator!=(const ActionTarget& other)
+		bool operator!=(const ActionTarget& other) const
 		{
 			if (targetType == other.targetType)
 			{
@@ -8,6 +8,11 @@
 #include <Stratega/Representation/BuffType.h>
 #include <boost/variant.hpp>
 #include <regex>
+namespace cparse
+{
+	class calculator;
+}
+
 namespace SGA
 {
 	//struct ExpressionStruct
@@ -20,17 +25,26 @@ namespace SGA
 		std::unordered_map<std::string, std::shared_ptr<FunctionParameter>> variable;
 		std::string expression;
 
+		// Expression parsed once by compile(), with its variables renamed to the names of compiledVariables.
+		// Empty if the expression has variables that are only known as text, it is then interpreted.
+		std::shared_ptr<const cparse::calculator> compiledExpression;
+		std::vector<std::pair<std::string, std::shared_ptr<FunctionParameter>>> compiledVariables;
+
 		void addParameter(FunctionParameter parameter, std::string newVariable);
 
 		void setExpression(std::string string);
 
-		std::string getExpression(const GameState& state, const std::vector<ActionTarget>& actionTargets);
+		// Parses the expression into reverse polish notation, so evaluating it only reads its variables
+		void compile();
 
-		std::unordered_map<ParameterID, std::string> getExpressionCost(const GameState& state, const std::vector<ActionTarget>& actionTargets);
+		// Evaluates the compiled expression, or interprets it if it could not be compiled
+		double evaluate(const GameState& state, const std::vector<ActionTarget>& actionTargets) const;
+
+		// Replaces the variables in the text of the expression by their values and parses the result
+		double interpret(const GameState& state, const std::vector<ActionTarget>& actionTargets) const;
 
-		~ExpressionStruct()
-		{
-			expression.~basic_string();
-		}
+		std::string getExpression(const GameState& state, const std::vector<ActionTarget>& actionTargets) const;
+
+		std::unordered_map<ParameterID, std::string> getExpressionCost(const GameState& state, const std::vector<ActionTarget>& actionTargets);
 	};	
 }
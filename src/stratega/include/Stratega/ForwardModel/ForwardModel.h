@@ -2,6 +2,7 @@
 #include <boost/random.hpp>
 #include <Stratega/Representation/GameState.h>
 #include <Stratega/ForwardModel/ActionSpace.h>
+#include <Stratega/ForwardModel/ActionSpaceCache.h>
 #include <Stratega/ForwardModel/ActionAssignment.h>
 
 #include "Condition.h"
@@ -50,6 +51,7 @@ namespace SGA
 	/// and after it updates the action info before executing the action.
 	/// The forward models can be extended by implementing forward model abstractions, can be useful for reducing the games
 	/// complexity and ease the training and decision-making process of AI agents. 
+	/// The const methods do not modify the forward model, so one forward model can advance different game states from several threads at the same time.
 	/// </summary>
 	class ForwardModel
 	{
@@ -73,6 +75,16 @@ namespace SGA
 		/// <param name="state">Game state to advance. The actual object is modified by this call.</param>
 		/// <param name="action">ActionAssignment to execute in the game state.</param>
 		virtual void advanceGameState(GameState& state, const ActionAssignment& action) const = 0;
+
+		/// <summary>
+		/// Advances one copy of the game state per action, as used by one-step lookahead agents.
+		/// The copies are independent, so they can be advanced by several threads.
+		/// </summary>
+		/// <param name="state">State to copy, it is not modified.</param>
+		/// <param name="actions">Actions to execute, one per copy.</param>
+		/// <param name="numThreads">Maximum number of threads used to copy and advance the states.</param>
+		/// <returns>The advanced states, in the order of the actions.</returns>
+		std::vector<GameState> advanceGameStates(const GameState& state, const std::vector<Action>& actions, int numThreads = 1) const;
 		
 		/// <summary>
 		/// Returns a list of available actions in the given gamestate by the received player
@@ -132,6 +144,25 @@ namespace SGA
 		/// <param name="position">Position where the entity will be spawned.</param>
 		void spawnEntity(GameState& state, const EntityType& entityType, int playerID, const Vector2f& position) const;
 
+		/// <summary>
+		/// Enables or disables the incremental action generation. When enabled, <see cref="SGA::ForwardModel::generateActions()"/> keeps
+		/// the actions of every entity in a <see cref="SGA::ActionSpaceCache"/> and only generates them again for the entities affected
+		/// by the changes since the previous call of the same thread with this forward model. The returned actions are the same. Disabled by default.
+		/// Disabling the cache frees the caches of all threads, so it must not be called while another thread generates actions.
+		/// </summary>
+		/// <param name="enabled">True to reuse the actions of unaffected entities.</param>
+		void setActionCacheEnabled(bool enabled)
+		{
+			actionCacheEnabled = enabled;
+			if (!enabled)
+				actionCaches.clear();
+		}
+
+		/// <summary>
+		/// Returns true if the actions of the entities are reused between calls, see <see cref="SGA::ForwardModel::setActionCacheEnabled()"/>.
+		/// </summary>
+		bool isActionCacheEnabled() const { return actionCacheEnabled; }
+
 		/// <summary>
 		/// Returns the action space of this forward model
 		/// </summary>
@@ -374,6 +405,16 @@ namespace SGA
 		/// </summary>
 		std::shared_ptr<ActionSpace> actionSpace;
 
+		/// <summary>
+		/// If true, the actions of the entities are reused between calls to generateActions.
+		/// </summary>
+		bool actionCacheEnabled = false;
+
+		/// <summary>
+		/// Caches of the threads that generated actions with this forward model while the action cache was enabled.
+		/// </summary>
+		mutable ActionSpaceCaches actionCaches;
+
 		/// <summary>
 		/// Executes the action in the given game state. This is used by subclasses of this forward model to
 		/// actually execute an action in the game.
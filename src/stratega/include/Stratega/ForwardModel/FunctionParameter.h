@@ -139,6 +139,8 @@ namespace SGA
 		Type getType() const;
 		const ActionTarget& getActionTarget(const std::vector<ActionTarget>& actionTargets) const;
 		double getConstant(const GameState& state, const std::vector<ActionTarget>& actionTargets) const;
+		// Same as getConstant, but expressions are interpreted from their text instead of evaluated from their compiled form
+		double interpretConstant(const GameState& state, const std::vector<ActionTarget>& actionTargets) const;
 		const Parameter& getParameter(GameState& state, const std::vector<ActionTarget>& actionTargets) const;
 		double getParameterValue(const GameState& state, const std::vector<ActionTarget>& actionTargets) const;
 		double getParameterValue(GameState& state, const std::vector<ActionTarget>& actionTargets) const;
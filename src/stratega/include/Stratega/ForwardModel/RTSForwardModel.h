@@ -24,11 +24,16 @@ namespace  SGA
 
 		double deltaTime;
 
+		size_t pathCacheSize;
+		int flowFieldThreshold;
+
 	public:
 		
 		
 		RTSForwardModel()
-			: deltaTime(1. / 60.)
+			: deltaTime(1. / 60.),
+			pathCacheSize(0),
+			flowFieldThreshold(0)
 		{
 		}
 		
@@ -77,6 +82,21 @@ namespace  SGA
 		/// </summary>
 		Path findPath(const GameState& state, Vector2f startPos, Vector2f endPos) const;
 
+		/// <summary>
+		/// Sets the number of path corridors that <see cref="SGA::RTSForwardModel::findPath()"/> remembers for each navmesh, the least recently used ones are evicted.
+		/// Corridors are reused for queries between the same cells and polygons of the navmesh, so units standing apart in the same cell can take the corridor found for another one.
+		/// 0 disables the cache, which is the default.
+		/// </summary>
+		void setPathCacheSize(size_t size) { pathCacheSize = size; }
+		size_t getPathCacheSize() const { return pathCacheSize; }
+
+		/// <summary>
+		/// Sets the number of path queries to a goal cell after which a flow field towards it is built, so the next queries to it follow the field instead of searching the navmesh.
+		/// Flow fields follow the centers of the polygons and can give other corridors than the search. 0 disables flow fields, which is the default.
+		/// </summary>
+		void setFlowFieldThreshold(int threshold) { flowFieldThreshold = threshold; }
+		int getFlowFieldThreshold() const { return flowFieldThreshold; }
+
 		/// <summary>
 		/// Checks if the game is finished by current limit or because a player has won.
 		/// </summary>
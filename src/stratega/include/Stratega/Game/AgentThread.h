@@ -1,5 +1,8 @@
 #pragma once
 #include <Stratega/Agent/Agent.h>
+#include <atomic>
+#include <condition_variable>
+#include <mutex>
 #include <thread>
 #include <Stratega/Configuration/GameConfig.h>
 #ifdef __linux__ 
@@ -26,12 +29,17 @@ namespace SGA
 
 	/// <summary>
 	/// A reusable thread for running a given agent.
+	/// The thread is started by the first <see cref="AgentThread::startComputing()"/> and waits for the next decision between them,
+	/// so game runners do not create a thread for every decision. It is stopped when the AgentThread is destroyed.
 	/// </summary>
 	class AgentThread final
 	{
 	public:
 		AgentThread();
 		~AgentThread();
+		AgentThread(const AgentThread&) = delete;
+		AgentThread& operator=(const AgentThread&) = delete;
+
 		/// <summary>
 		/// Executes the agent in an separate thread, to obtain the results use <see cref="AgentThread::join()">.
 		/// </summary>
@@ -41,7 +49,7 @@ namespace SGA
 		void startComputing(Agent& agent, const GameState& state, const ForwardModel& forwardModel, const GameConfig& gameConfig, long timeBudgetMs);
 
 		/// <summary>
-		/// Join the agent thread and returns the results obtained by executing the agent.
+		/// Waits until the agent finished computing and returns the results obtained by executing the agent.
 		/// </summary>
 		/// <returns>The results obtained by executing the agent.</returns>
 		AgentResults join();
@@ -62,15 +70,25 @@ namespace SGA
 			return joined;
 		}
 	private:
-		void runAgentThread(long timeBudgetMs);
+		void runAgentThread();
 		
 		Agent* agent;
 		const GameState* state;
 		const ForwardModel* forwardModel;
 		const GameConfig* gameConfig;
+		long timeBudgetMs;
 		std::thread thread;
+
+		/// <summary>
+		/// Guards the decision handed to the thread and its results.
+		/// </summary>
+		std::mutex mutex;
+		std::condition_variable decisionStarted;
+		std::condition_variable decisionFinished;
+		bool hasDecision;
+		bool stopping;
 		
-		bool computing;
+		std::atomic<bool> computing;
 		bool joined;
 		AgentResults resultCache;
 	};
@@ -1,6 +1,7 @@
 #pragma once
 #include <fstream>
 #include <unordered_map>
+#include <vector>
 #include <yaml-cpp/yaml.h>
 #include <yaml-cpp/emitter.h>
 #include <yaml-cpp/node/node.h>
@@ -10,14 +11,57 @@ namespace SGA
 	class FileLogger
 	{
 	public:
-		explicit FileLogger(const std::string& filePath);
+		/// <summary>
+		/// Layout of the log file.
+		/// Yaml keeps the logged values in a tree and writes it on every flush.
+		/// JsonLines buffers the values by their full key and appends them as one JSON object per line,
+		/// {"flush":0,"values":{"Game 0/Map":"0","Game 0/Battle0/ActionCount":[12,9]}}, where arrays are appended to the logged sequences.
+		/// It writes a line on every flush and whenever the buffered values reach the maximum, so long runs keep a bounded amount of memory.
+		/// Lines of the same flush share its number, see <see cref="SGA::FileLogger::convertJsonLinesToYaml()"/>.
+		/// </summary>
+		enum class Format
+		{
+			Yaml,
+			JsonLines
+		};
+
+		explicit FileLogger(const std::string& filePath, Format newFormat = Format::Yaml);
+		/// <summary>
+		/// Creates a logger that keeps the logged values in memory without writing a file, see <see cref="SGA::FileLogger::getLoggedValues()"/>.
+		/// </summary>
+		FileLogger();
 		~FileLogger();
 
 		void flush();
 
+		Format getFormat() const { return format; }
+
+		/// <summary>
+		/// Sets the number of values a JsonLines logger buffers before it writes them without waiting for a flush.
+		/// </summary>
+		void setMaxBufferedValues(size_t count) { maxBufferedValues = count; }
+		size_t getMaxBufferedValues() const { return maxBufferedValues; }
+
+		/// <summary>
+		/// Returns the values logged since the last flush. Always empty for JsonLines loggers, which do not keep a tree.
+		/// </summary>
+		const YAML::Node& getLoggedValues() const { return loggedScalars; }
+
+		/// <summary>
+		/// Adds values logged by another logger. Maps are merged key by key, other values replace the existing ones.
+		/// JsonLines loggers append merged sequences to the ones logged with the same key.
+		/// </summary>
+		void merge(const YAML::Node& values);
+
 		template<typename T>
 		void logValue(const std::string& key, const T& value)
 		{
+			if (format == Format::JsonLines)
+			{
+				bufferValue(key, YAML::Node(value), true);
+				return;
+			}
+
 			YAML::Node node = getNodeFromKey(key, loggedScalars, 0, YAML::NodeType::Sequence);
 			node.push_back(value);
 		}
@@ -25,14 +69,52 @@ namespace SGA
 		template<typename T>
 		void logSingleValue(const std::string& key, const T& value)
 		{
+			if (format == Format::JsonLines)
+			{
+				bufferValue(key, YAML::Node(value), false);
+				return;
+			}
+
 			YAML::Node node = getNodeFromKey(key, loggedScalars, 0, YAML::NodeType::Scalar);
 			node = value;
 		}
 
+		/// <summary>
+		/// Writes a log of the JsonLines format in the layout of the Yaml format, as if the values had been logged by a Yaml logger.
+		/// Only the values of one flush are kept in memory at once.
+		/// </summary>
+		static void convertJsonLinesToYaml(const std::string& jsonLinesPath, const std::string& yamlPath);
+
 	private:
+		/// <summary>
+		/// Values of a key logged since the last line, the logged sequence or a sequence holding the last single value.
+		/// </summary>
+		struct BufferedValue
+		{
+			std::string key;
+			bool isSequence;
+			YAML::Node value;
+		};
+
 		std::ofstream outputStream;
+		Format format;
 		YAML::Node loggedScalars;
 
+		std::vector<BufferedValue> bufferedValues;
+		std::unordered_map<std::string, size_t> bufferedKeys;
+		size_t bufferedValueCount = 0;
+		size_t maxBufferedValues = 10000;
+		size_t flushCount = 0;
+
+		void bufferValue(const std::string& key, const YAML::Node& value, bool isSequence);
+		void bufferNode(const std::string& key, const YAML::Node& values);
+		void writeBufferedValues();
+
+		static void writeJson(std::ostream& stream, const YAML::Node& node);
+		static void writeJsonString(std::ostream& stream, const std::string& string);
+
+		static void mergeNodes(YAML::Node target, const YAML::Node& source);
+
 		// For Developers: This would be easier to read if it was written iteratively.
 		// Problem is that YAML::Node is a reference type, and that makes it much harder to write it iteratively, since we can't use a single variable to represent our current node.
 		static YAML::Node getNodeFromKey(const std::string& key, YAML::Node curNode, size_t keyPos, YAML::NodeType::value leafType)
@@ -7,24 +7,30 @@
 namespace SGA
 {
 	extern std::unique_ptr<SGA::FileLogger> defaultLogger;
-	extern std::vector<SGA::LoggingScope*> loggingScopes;
+	// Scopes and the logger redirection are per thread, so games running in parallel do not mix their keys
+	extern thread_local std::vector<SGA::LoggingScope*> loggingScopes;
+	extern thread_local SGA::FileLogger* threadLogger;
 	extern std::mutex loggingMutex;
 
 	SGA::FileLogger& getDefaultLogger();
 	void setDefaultLogger(std::unique_ptr<SGA::FileLogger> logger);
+	/// <summary>
+	/// Returns the logger of the calling thread, which is the default logger unless a <see cref="SGA::ThreadLoggerScope"/> redirects it.
+	/// </summary>
+	SGA::FileLogger& getThreadLogger();
 	std::string getLoggingScopeKey(const std::string& lastKey);
 	
 	template<typename T>
 	void logSingleValue(const std::string& key, const T& value)
 	{
 		std::lock_guard<std::mutex> logGuard(loggingMutex);
-		getDefaultLogger().logSingleValue(getLoggingScopeKey(key), value);
+		getThreadLogger().logSingleValue(getLoggingScopeKey(key), value);
 	}
 
 	template<typename T>
 	void logValue(const std::string& key, const T& value)
 	{
 		std::lock_guard<std::mutex> logGuard(loggingMutex);
-		getDefaultLogger().logValue(getLoggingScopeKey(key), value);
+		getThreadLogger().logValue(getLoggingScopeKey(key), value);
 	}
 }
@@ -17,4 +17,23 @@ namespace SGA
 	private:
 		std::string scopeName;
 	};
+
+	class FileLogger;
+
+	/// <summary>
+	/// Redirects the logs of the calling thread to the given logger while the scope exists.
+	/// </summary>
+	class ThreadLoggerScope
+	{
+	public:
+		explicit ThreadLoggerScope(FileLogger& logger);
+		ThreadLoggerScope(const ThreadLoggerScope&) = delete;
+		ThreadLoggerScope(ThreadLoggerScope&&) = delete;
+		ThreadLoggerScope& operator=(ThreadLoggerScope other) = delete;
+		ThreadLoggerScope& operator=(ThreadLoggerScope&& other) = delete;
+		~ThreadLoggerScope();
+
+	private:
+		FileLogger* previousLogger;
+	};
 }
@@ -7,6 +7,7 @@
 #include <Stratega/Representation/Path.h>
 #include <Stratega/Representation/Buff.h>
 #include <Stratega/ForwardModel/Action.h>
+#include <Stratega/Utils/CopyOnWrite.h>
 
 namespace SGA
 {
@@ -20,6 +21,8 @@ namespace SGA
 	/// </summary>
 	struct Entity
 	{
+		// Moves entities through setPosition, so the spatial index of the state sees every move
+		friend class GameState;
 
 	private:
 
@@ -75,13 +78,15 @@ namespace SGA
 
 		/// <summary>
 		/// Values for the max parameters value of this entity. Indexed by ID. Use getMaxParameter(...) functions to access these.
+		/// Only changed by buffs, so copies of the entity share them until then.
 		/// </summary>
-		std::unordered_map<int, double> maxParameters;
+		CopyOnWrite<std::unordered_map<int, double>> maxParameters;
 
 		/// <summary>
 		/// Values for the min parameters value of this entity. Indexed by ID. Use getMinParameter(...) functions to access these.
+		/// Shared by the copies of the entity.
 		/// </summary>
-		std::unordered_map<int, double> minParameters;
+		CopyOnWrite<std::unordered_map<int, double>> minParameters;
 		
 		/// <summary>
 		/// Entity type
@@ -92,8 +97,9 @@ namespace SGA
 
 		/// <summary>
 		/// Path that this entity is following (RTS)
+		/// Large and only changed when a new waypoint is reached, so copies of the entity share it until then.
 		/// <summary>
-		Path path;
+		CopyOnWrite<Path> path;
 
 		/// <summary>
 		/// Movement speed for this entity (RTS)
@@ -112,6 +118,18 @@ namespace SGA
 		//Slots occupied
 		std::vector<std::pair<Entity, std::vector<int>>> slots;
 
+		static double findParameter(const std::unordered_map<int, double>& values, int paramIdx)
+		{
+			auto it = values.find(paramIdx);
+			return it == values.end() ? 0 : it->second;
+		}
+
+		/// <summary>
+		/// Sets the position of this entity in the board. Does not modify the board.
+		/// Entities of a state are moved with <see cref="SGA::GameState::moveEntity()"/>.
+		/// </summary>
+		void setPosition(Vector2f v) { position = v; }
+
 	public:
 
 		/// <summary>
@@ -190,7 +208,7 @@ namespace SGA
 		/// Checks if this entity should be removed by the game engine.
 		/// <summary>
 		/// <returns>True if this entity is marked to be removed.</returns>
-		bool flagged() { return remove; }
+		bool flagged() const { return remove; }
 
 
 		/// <summary>
@@ -250,13 +268,13 @@ namespace SGA
 		/// Gets a specific max parameters value, by index 
 		/// <summary>
 		/// <returns>The max parameter value.</returns>
-		double getMaxParameterAt(int paramIdx) { return maxParameters[paramIdx]; }
+		double getMaxParameterAt(int paramIdx) const { return findParameter(*maxParameters, paramIdx); }
 		
 		/// <summary>
 		/// Gets a specific min parameters value, by index 
 		/// <summary>
 		/// <returns>The min parameter value.</returns>
-		double getMinParameterAt(int paramIdx) { return minParameters[paramIdx]; }
+		double getMinParameterAt(int paramIdx) const { return findParameter(*minParameters, paramIdx); }
 
 		/// <summary>
 		/// Gets the list of continuous actions attached to this entity. Modifiable.
@@ -328,26 +346,20 @@ namespace SGA
 		/// </summary>
 		const Vector2f& getPosition() const { return position; }
 
-		/// <summary>
-		/// Sets the position of this entity in the board. Does not modify the board.
-		/// </summary>
-		void setPosition(Vector2f v) { position = v; }
-
-
 		/// <summary>
 		/// Returns the path that this entity is following (RTS games only) 
 		/// </summary>
-		const Path& getPath() const { return path; }
+		const Path& getPath() const { return *path; }
 
 		/// <summary>
 		/// Increments the current index of the path that this entity is following (RTS games only) 
 		/// </summary>
-		void incPathIndex() { path.currentPathIndex++; }
+		void incPathIndex() { path.getMutable().currentPathIndex++; }
 
 		/// <summary>
 		/// Sets the path this entity is following (RTS games only) 
 		/// </summary>
-		void setPath(Path p) { path = p; }
+		void setPath(Path p) { path = std::move(p); }
 
 		/// <summary>
 		/// Add buff to the player
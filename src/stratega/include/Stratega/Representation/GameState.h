@@ -9,6 +9,8 @@
 #include <Stratega/Representation/TileType.h>
 #include <Stratega/Representation/GameInfo.h>
 #include <Stratega/Representation/ActionQueue.h>
+#include <Stratega/Representation/SpatialIndex.h>
+#include <Stratega/Utils/CopyOnWrite.h>
 #include <memory>
 namespace SGA
 {
@@ -21,6 +23,8 @@ namespace SGA
 	/// <summary>
 	/// Contains the game data without any logic, offering access to the current board, a list of player and their units.
 	/// If the agent want access to the definition of entity types, actions or game config yaml  it should access to <see cref="SGA::GameInfo"/>
+	/// Copies share the read-only <see cref="SGA::GameInfo"/> and the RTS navigation. The board and the researched technologies are shared until a copy modifies them, everything else is owned by the copy.
+	/// Different copies can be read and advanced by different threads at the same time, a single copy must not be used by several threads at once.
 	/// </summary>
 	struct GameState
 	{
@@ -91,7 +95,7 @@ namespace SGA
 		/// </summary>
 		/// <param name="position">The position of the tile map</param>
 		/// <returns>A boolean indicating if the tile in the given position is walkable</returns>
-		bool isWalkable(const Vector2i& position);
+		bool isWalkable(const Vector2i& position) const;
 
 		bool isOccupied(const Vector2i& position) const;
 		bool isOccupied(const Vector2i& position, int gridLevel) const;
@@ -114,13 +118,13 @@ namespace SGA
 		/// Returns the width of the board.
 		/// </summary>
 		/// <returns>The width of the board.</returns>
-		int getBoardWidth() const { return static_cast<int>(board.getWidth()); }
+		int getBoardWidth() const { return static_cast<int>(board->getWidth()); }
 
 		/// <summary>
 		/// Returns the height of the board.
 		/// </summary>
 		/// <returns>The height of the board.</returns>
-		int getBoardHeight() const { return static_cast<int>(board.getHeight()); }
+		int getBoardHeight() const { return static_cast<int>(board->getHeight()); }
 
 		/// <summary>
 		/// Returns the tile at the position indicated in the parameter. Can throw an exception if out of bounds.
@@ -139,6 +143,7 @@ namespace SGA
 
 		/// <summary>
 		/// Returns the tile at the position indicated in the parameter. Can throw an exception if out of bounds.
+		/// Gives this state its own copy of the board if it is shared with other copies, use <see cref="SGA::GameState::getTileAtConst()"/> to only read it.
 		/// </summary>
 		/// <param name="pos">Position of the tile to retrieve</param>
 		/// <returns>The tile at 'pos'</returns>
@@ -159,6 +164,26 @@ namespace SGA
 		/// <param name="boardWidth">Width of the board to initialize.</param>
 		void initBoard(int boardWidth, std::vector<Tile>& tiles);
 
+		/// <summary>
+		/// Returns true if this state still shares its board with the other state, so neither of them modified a tile since they were copied.
+		/// </summary>
+		bool sharesBoardWith(const GameState& other) const { return &board.get() == &other.board.get(); }
+
+		/// <summary>
+		/// Returns true if this state still shares the researched technologies with the other state, so neither of them researched a technology since they were copied.
+		/// </summary>
+		bool sharesResearchedTechnologiesWith(const GameState& other) const { return &researchedTechnologies.get() == &other.researchedTechnologies.get(); }
+
+		/// <summary>
+		/// Returns the board shared between the copies of this state. A copy of it keeps the board alive, so it can be compared with the board of a later state.
+		/// </summary>
+		const CopyOnWrite<Grid2D<Tile>>& getSharedBoard() const { return board; }
+
+		/// <summary>
+		/// Returns the researched technologies shared between the copies of this state, see <see cref="SGA::GameState::getSharedBoard()"/>.
+		/// </summary>
+		const CopyOnWrite<std::unordered_map<int, std::vector<int>>>& getSharedResearchedTechnologies() const { return researchedTechnologies; }
+
 
 		/***** GAME ENTITIES FUNCTIONS *****/
 
@@ -185,6 +210,12 @@ namespace SGA
 		std::vector<const Entity*> getEntitiesAroundConst(Vector2f pos, int gridLevel, float maxDistance = 0.0) const;
 		std::vector<const Entity*> getEntitiesAtConst(Vector2f pos, int gridLevel) const;
 
+		/// <summary>
+		/// Returns the indices in the entity list of the entities that can be within maxDistance of the position, in ascending order.
+		/// Entities further away can be included, callers check the exact distance.
+		/// </summary>
+		std::vector<size_t> getEntityIndicesAround(const Vector2f& pos, double maxDistance) const;
+
 		/// <summary>
 		/// Returns an entity by its ID. It'll return nullptr if no entity exists associated to the given ID.
 		/// It searchs also the objects from the entities
@@ -238,8 +269,23 @@ namespace SGA
 		/// <returns>Returns the unique ID of the entity created.</returns>
 		int addEntity(Entity entity, int playerID, const Vector2f& position);
 
+		/// <summary>
+		/// Moves an entity of this state to a new position, keeping the spatial index of the position queries up to date.
+		/// Entities can only be moved through their state, or the position queries would miss them.
+		/// </summary>
+		/// <param name="entity">Entity of this state to move.</param>
+		/// <param name="position">New position of the entity.</param>
+		void moveEntity(Entity& entity, const Vector2f& position);
+
+		/// <summary>
+		/// Removes the entities flagged for removal and invalidates the spatial index of the position queries.
+		/// </summary>
+		void removeFlaggedEntities();
+
 		/// <summary>
 		/// Gets the list of all entities.
+		/// Entities are added, moved and removed through this state, see <see cref="SGA::GameState::moveEntity()"/>, so the spatial index of the position queries stays valid.
+		/// The position of the returned entities cannot be changed directly.
 		/// </summary>
 		/// <returns>A vector with all entities in the game.</returns>
 		std::vector<Entity>& getEntities() { return entities; };
@@ -680,19 +726,32 @@ namespace SGA
 
 		/// <summary>
 		/// Board: a 2 dimensional grid of tiles. This does not contain information about entities on those tiles.		
+		/// Shared with the copies of this state until one of them modifies a tile.
 		/// </summary>
-		Grid2D<Tile> board;
+		CopyOnWrite<Grid2D<Tile>> board;
 
 		/// <summary>
 		/// Map that indicates if a technology is researched by a player. Key is the player ID and maps to a vector of technology IDs.
+		/// Shared with the copies of this state until one of them researches a technology.
 		/// </summary>
-		std::unordered_map<int, std::vector<int>> researchedTechnologies;
+		CopyOnWrite<std::unordered_map<int, std::vector<int>>> researchedTechnologies;
 
 		/// <summary>
 		/// List of entities in this game	
 		/// </summary>
 		std::vector<Entity> entities;
 
+		/// <summary>
+		/// Buckets the entities by position for the position queries. Built on the first query, updated when entities are added or moved and invalidated when they are removed.
+		/// Copies of the state share the buckets until one of them adds or moves an entity.
+		/// </summary>
+		mutable SpatialIndex spatialIndex;
+
+		/// <summary>
+		/// Returns the spatial index, building it if it is not valid.
+		/// </summary>
+		const SpatialIndex& getSpatialIndex() const;
+
 
 		/// <summary>
 		/// List of players in this game	
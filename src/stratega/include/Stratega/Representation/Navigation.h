@@ -1,9 +1,11 @@
 #pragma once
 #include <Stratega/Representation/BuildContext.h>
+#include <Stratega/Representation/PathCache.h>
 #include "DetourCommon.h"
 #include "Recast.h"
 #include "DetourNavMesh.h"
 #include "DetourDebugDraw.h"
+#include <mutex>
 
 /// These are just sample areas
 enum SamplePolyAreas
@@ -138,6 +140,14 @@ namespace SGA
 
 		dtNavMesh* m_navMesh;
 		dtNavMeshQuery* m_navQuery;
+		/// <summary>
+		/// Copies of a game state share their navigation, the query keeps search state and is only used while holding this mutex.
+		/// </summary>
+		std::mutex m_navQueryMutex;
+		/// <summary>
+		/// Corridors found by the path queries of this navmesh, only used while holding m_navQueryMutex.
+		/// </summary>
+		PathCache m_pathCache;
 
 		NavigationConfig config;
 		void cleanup()
@@ -154,6 +164,7 @@ namespace SGA
 			m_dmesh = 0;
 			dtFreeNavMesh(m_navMesh);
 			m_navMesh = 0;
+			m_pathCache.clear();
 		}
 
 		//Detour Stuff
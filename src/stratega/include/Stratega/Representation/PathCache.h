@@ -0,0 +1,111 @@
+#pragma once
+#include <Stratega/Representation/Vector2.h>
+#include "DetourNavMesh.h"
+
+#include <deque>
+#include <list>
+#include <unordered_map>
+#include <vector>
+
+namespace SGA
+{
+	class Navigation;
+
+	/// <summary>
+	/// Remembers the polygon corridors found by the path queries of a <see cref="SGA::Navigation"/>.
+	/// Corridors are stored by the board cells of the start and goal positions and the least recently used ones are evicted.
+	/// Goal cells that are queried often get a flow field, the next polygon towards the goal from every polygon of the navmesh,
+	/// so all the units heading to them share one search.
+	/// A rebuilt navmesh is a new Navigation with an empty cache, the cache is not thread safe and is used while holding the navigation query mutex.
+	/// </summary>
+	class PathCache
+	{
+	public:
+		/// <summary>
+		/// Returns the polygons from startRef to endRef, searched with the navigation query only if no cached corridor or flow field connects them.
+		/// The corridor ends in the polygon closest to endRef if the goal can not be reached.
+		/// </summary>
+		/// <param name="navigation">Navigation whose navmesh and query are used.</param>
+		/// <param name="startPos">Start position in the navmesh, the x and z coordinates are the board position.</param>
+		/// <param name="endPos">End position in the navmesh.</param>
+		/// <param name="capacity">Maximum number of cached corridors, 0 disables the cache.</param>
+		/// <param name="flowFieldThreshold">Number of queries to a goal cell after which its flow field is built, 0 disables flow fields.</param>
+		std::vector<dtPolyRef> findCorridor(Navigation& navigation, dtPolyRef startRef, dtPolyRef endRef, const float* startPos, const float* endPos, size_t capacity, int flowFieldThreshold);
+
+		/// <summary>
+		/// Forgets all corridors and flow fields.
+		/// </summary>
+		void clear();
+
+		/// <summary>
+		/// Number of queries answered by a cached corridor or a flow field.
+		/// </summary>
+		size_t getHits() const { return hits; }
+
+		/// <summary>
+		/// Number of queries that searched the navmesh.
+		/// </summary>
+		size_t getMisses() const { return misses; }
+
+		/// <summary>
+		/// Maximum number of flow fields, the oldest one is removed to build a new one.
+		/// </summary>
+		static constexpr size_t MAX_FLOW_FIELDS = 16;
+
+	private:
+		struct CellPair
+		{
+			Vector2i start;
+			Vector2i goal;
+
+			bool operator==(const CellPair& other) const
+			{
+				return start.x == other.start.x && start.y == other.start.y && goal.x == other.goal.x && goal.y == other.goal.y;
+			}
+		};
+
+		struct CellPairHash
+		{
+			size_t operator()(const CellPair& key) const;
+		};
+
+		struct CachedCorridor
+		{
+			CellPair key;
+			dtPolyRef startRef;
+			dtPolyRef endRef;
+			std::vector<dtPolyRef> polys;
+		};
+
+		/// <summary>
+		/// Next polygon towards the goal from every polygon that reaches it.
+		/// </summary>
+		struct FlowField
+		{
+			dtPolyRef goalRef;
+			std::unordered_map<dtPolyRef, dtPolyRef> next;
+		};
+
+		static Vector2i cellOf(const float* pos);
+		static std::vector<dtPolyRef> searchCorridor(Navigation& navigation, dtPolyRef startRef, dtPolyRef endRef, const float* startPos, const float* endPos);
+		static FlowField buildFlowField(const Navigation& navigation, dtPolyRef goalRef);
+
+		bool followFlowField(dtPolyRef startRef, dtPolyRef endRef, std::vector<dtPolyRef>& corridor) const;
+		void insert(const CellPair& key, dtPolyRef startRef, dtPolyRef endRef, std::vector<dtPolyRef> polys, size_t capacity);
+
+		/// <summary>
+		/// Cached corridors, the most recently used first.
+		/// </summary>
+		std::list<CachedCorridor> corridors;
+		std::unordered_map<CellPair, std::list<CachedCorridor>::iterator, CellPairHash> corridorByCells;
+
+		/// <summary>
+		/// Number of queries to each goal cell without a flow field.
+		/// </summary>
+		std::unordered_map<Vector2i, int> goalQueries;
+		std::deque<FlowField> flowFields;
+
+		size_t hits = 0;
+		size_t misses = 0;
+	};
+}
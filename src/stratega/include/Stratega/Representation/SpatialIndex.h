@@ -0,0 +1,87 @@
+#pragma once
+#include <Stratega/Representation/Vector2.h>
+#include <Stratega/Utils/CopyOnWrite.h>
+
+#include <vector>
+
+namespace SGA
+{
+	class Entity;
+
+	/// <summary>
+	/// Uniform grid over the board that buckets the entities of a <see cref="SGA::GameState"/> by the cell of their position.
+	/// Cells are the integer part of the position, as used by the position queries of the game state, entities outside of the board share one extra bucket.
+	/// Buckets store indices into the entity list of the state, queries return candidates in ascending index order so results keep the order of a linear scan.
+	/// Every bucket is a linked list through flat arrays, so entities move in constant time and copying the buckets copies a few arrays.
+	/// Copies of the index share the buckets until one of them adds or moves an entity, see <see cref="SGA::CopyOnWrite"/>.
+	/// </summary>
+	class SpatialIndex
+	{
+	public:
+		/// <summary>
+		/// Returns true if the buckets match the given number of entities and no change invalidated them.
+		/// </summary>
+		bool isValid(size_t entityCount) const { return valid && entityCount == buckets->cellOfEntity.size(); }
+
+		/// <summary>
+		/// Returns true if this index still shares its buckets with the other index, so neither of them changed since they were copied.
+		/// </summary>
+		bool sharesBucketsWith(const SpatialIndex& other) const { return buckets.sharesWith(other.buckets); }
+		void invalidate() { valid = false; }
+
+		/// <summary>
+		/// Buckets all entities for a board of the given size.
+		/// </summary>
+		void build(const std::vector<Entity>& entities, int boardWidth, int boardHeight);
+
+		/// <summary>
+		/// Adds the entity appended at entityIndex. Only keeps the index valid if it was valid for the previous entities.
+		/// </summary>
+		void add(size_t entityIndex, const Vector2f& position);
+
+		/// <summary>
+		/// Moves the entity at entityIndex to the bucket of its new position.
+		/// </summary>
+		void move(size_t entityIndex, const Vector2f& position);
+
+		/// <summary>
+		/// Indices of the entities in the cell of the position.
+		/// </summary>
+		std::vector<size_t> candidatesAt(const Vector2f& pos) const;
+
+		/// <summary>
+		/// Indices of the entities in the cells that intersect the square of half size maxDistance around the position.
+		/// </summary>
+		std::vector<size_t> candidatesAround(const Vector2f& pos, double maxDistance) const;
+
+	private:
+		/// <summary>
+		/// End of a bucket and empty buckets.
+		/// </summary>
+		static constexpr int NONE = -1;
+
+		struct Buckets
+		{
+			int width = 0;
+			int height = 0;
+			// First entity of every cell, followed by the first entity outside of the board
+			std::vector<int> firstOfCell;
+			// Next and previous entity in the bucket of every entity
+			std::vector<int> next;
+			std::vector<int> previous;
+			// Cell of every entity, width * height if it is outside of the board
+			std::vector<int> cellOfEntity;
+
+			int outsideCell() const { return width * height; }
+			void link(size_t entityIndex, int cell);
+			void unlink(size_t entityIndex);
+			void appendCell(int cell, std::vector<size_t>& candidates) const;
+		};
+
+		int cellOf(const Vector2f& pos) const;
+		void collect(int minX, int minY, int maxX, int maxY, std::vector<size_t>& candidates) const;
+
+		bool valid = false;
+		CopyOnWrite<Buckets> buckets;
+	};
+}
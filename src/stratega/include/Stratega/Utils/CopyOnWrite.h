@@ -0,0 +1,71 @@
+#pragma once
+#include <atomic>
+#include <memory>
+
+namespace SGA
+{
+	/// <summary>
+	/// Value that is shared between copies until one of them modifies it.
+	/// Copying only copies a pointer, <see cref="SGA::CopyOnWrite::getMutable()"/> gives the owner a private copy first if the value is still shared.
+	/// Default constructed values share one instance per type, so unused members cost no allocation.
+	/// Different copies can be used by different threads, a single copy must not be used by several threads at once.
+	/// </summary>
+	template<typename Type>
+	class CopyOnWrite
+	{
+	public:
+		CopyOnWrite()
+			: data(defaultValue())
+		{
+		}
+
+		CopyOnWrite(Type value)
+			: data(std::make_shared<Type>(std::move(value)))
+		{
+		}
+
+		/// <summary>
+		/// Returns the value for reading, never copies it.
+		/// </summary>
+		const Type& get() const { return *data; }
+		const Type& operator*() const { return *data; }
+		const Type* operator->() const { return data.get(); }
+
+		/// <summary>
+		/// Returns the value for writing, copies it first if another copy still shares it.
+		/// References returned by previous calls to get() are not updated by the copy.
+		/// </summary>
+		Type& getMutable()
+		{
+			if (data.use_count() > 1)
+			{
+				data = std::make_shared<Type>(*data);
+			}
+			else
+			{
+				// The last copy that shared the value may have been released by another thread, see its reads before writing
+				std::atomic_thread_fence(std::memory_order_acquire);
+			}
+			return *data;
+		}
+
+		/// <summary>
+		/// Returns true if other copies share the value.
+		/// </summary>
+		bool isShared() const { return data.use_count() > 1; }
+
+		/// <summary>
+		/// Returns true if this copy shares its value with the other copy, so neither of them modified it since they were copied.
+		/// </summary>
+		bool sharesWith(const CopyOnWrite& other) const { return data == other.data; }
+
+	private:
+		static const std::shared_ptr<Type>& defaultValue()
+		{
+			static const std::shared_ptr<Type> value = std::make_shared<Type>();
+			return value;
+		}
+
+		std::shared_ptr<Type> data;
+	};
+}
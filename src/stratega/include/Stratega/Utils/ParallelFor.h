@@ -0,0 +1,69 @@
+#pragma once
+#include <algorithm>
+#include <atomic>
+#include <cstddef>
+#include <exception>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+namespace SGA
+{
+	/// <summary>
+	/// Calls body(i) for every i in [0, count), spread over up to numThreads threads.
+	/// The calling thread takes part in the work and indices are handed out one at a time, so uneven work stays balanced.
+	/// With numThreads <= 1 the loop runs on the calling thread without creating any thread.
+	/// </summary>
+	/// <param name="count">Number of iterations.</param>
+	/// <param name="numThreads">Maximum number of threads, including the calling thread.</param>
+	/// <param name="body">Function called with the index of each iteration. If it throws, the first exception is rethrown once all threads finished.</param>
+	template<typename Function>
+	void parallelFor(size_t count, int numThreads, Function&& body)
+	{
+		const auto threadCount = std::min(count, static_cast<size_t>(std::max(numThreads, 1)));
+		if (threadCount <= 1)
+		{
+			for (size_t i = 0; i < count; i++)
+			{
+				body(i);
+			}
+			return;
+		}
+
+		std::atomic<size_t> next(0);
+		std::exception_ptr error;
+		std::mutex errorMutex;
+		auto work = [&]()
+		{
+			for (auto i = next++; i < count; i = next++)
+			{
+				try
+				{
+					body(i);
+				}
+				catch (...)
+				{
+					std::lock_guard<std::mutex> lock(errorMutex);
+					if (!error)
+						error = std::current_exception();
+					next = count;
+				}
+			}
+		};
+
+		std::vector<std::thread> workers;
+		workers.reserve(threadCount - 1);
+		for (size_t i = 1; i < threadCount; i++)
+		{
+			workers.emplace_back(work);
+		}
+		work();
+		for (auto& worker : workers)
+		{
+			worker.join();
+		}
+
+		if (error)
+			std::rethrow_exception(error);
+	}
+}
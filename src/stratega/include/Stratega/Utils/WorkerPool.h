@@ -0,0 +1,63 @@
+#pragma once
+#include <condition_variable>
+#include <cstddef>
+#include <exception>
+#include <functional>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+namespace SGA
+{
+	/// <summary>
+	/// A fixed set of threads that run the iterations of <see cref="WorkerPool::parallelFor()"/>.
+	/// Unlike <see cref="SGA::parallelFor()"/> the threads are started once and wait for the next loop between calls,
+	/// so code that runs many short parallel loops, like the generations of an evolutionary agent, does not pay for creating threads every time.
+	/// The pool is not thread safe, only one loop can run at a time.
+	/// </summary>
+	class WorkerPool final
+	{
+	public:
+		/// <summary>
+		/// Creates a pool that uses numThreads threads, including the thread calling <see cref="WorkerPool::parallelFor()"/>.
+		/// With numThreads <= 1 no thread is created and the loops run on the calling thread.
+		/// </summary>
+		explicit WorkerPool(int numThreads);
+		~WorkerPool();
+		WorkerPool(const WorkerPool&) = delete;
+		WorkerPool& operator=(const WorkerPool&) = delete;
+
+		/// <summary>
+		/// Calls body(i) for every i in [0, count) and returns once all iterations finished.
+		/// Indices are handed out one at a time, so the thread running an iteration changes between calls.
+		/// </summary>
+		/// <param name="count">Number of iterations.</param>
+		/// <param name="body">Function called with the index of each iteration. If it throws, the first exception is rethrown once all threads finished.</param>
+		void parallelFor(size_t count, const std::function<void(size_t)>& body);
+
+		/// <summary>
+		/// Number of threads used by the loops, including the calling thread.
+		/// </summary>
+		int getNumThreads() const { return static_cast<int>(workers.size()) + 1; }
+
+	private:
+		void runWorker();
+		void work();
+
+		std::vector<std::thread> workers;
+
+		/// <summary>
+		/// Guards the loop handed to the workers.
+		/// </summary>
+		std::mutex mutex;
+		std::condition_variable loopStarted;
+		std::condition_variable loopFinished;
+		const std::function<void(size_t)>* body = nullptr;
+		size_t count = 0;
+		size_t next = 0;
+		size_t loopIndex = 0;
+		size_t busyWorkers = 0;
+		bool stopping = false;
+		std::exception_ptr error;
+	};
+}
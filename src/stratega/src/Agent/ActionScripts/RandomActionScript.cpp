@@ -11,6 +11,17 @@ namespace SGA
 			return Action::createEndAction(playerID);	
 	}
 	
+	Action RandomActionScript::getActionWithGenerator(const GameState& /*gameState*/, std::vector<Action>& actionSpace, int playerID, boost::mt19937& randomGenerator) const
+	{
+		if (actionSpace.size() > 0)
+		{
+			boost::random::uniform_int_distribution<size_t> actionDistribution(0, actionSpace.size() - 1);
+			return actionSpace[actionDistribution(randomGenerator)];
+		}
+		else
+			return Action::createEndAction(playerID);
+	}
+
 	Action RandomActionScript::getActionForUnit(const GameState& /*gameState*/, std::vector<Action>& actionSpace, int playerID, int /*unitID*/) const
 	{
 		//std::vector<Action> suitableActions;
@@ -6,6 +6,7 @@ namespace SGA
 	MCTSNode::MCTSNode(ForwardModel& forwardModel, GameState newGameState, int newOwnerID) :
 		ITreeNode<SGA::MCTSNode>(forwardModel, std::move(newGameState), newOwnerID)
 	{
+		initializeNode();
 	}
 
 	MCTSNode::MCTSNode(ForwardModel& forwardModel, GameState newGameState, MCTSNode* newParent, const int newChildIndex, int newOwnerID) :
@@ -29,6 +30,10 @@ namespace SGA
 		else {
 			nodeDepth = 0;
 		}
+
+		// kept for the tree policy, which also visits nodes that dropped their state
+		isTerminal = gameState.isGameOver();
+		ownerCanPlay = gameState.canPlay(ownerID);
 	}
 
 	/// <summary>
@@ -53,6 +58,9 @@ namespace SGA
 			double delta = selected->rollOut(forwardModel, params, randomGenerator);
 
 			backUp(selected, delta);
+			// the state of the new node can be computed again from its parent
+			if (!params.storeNodeStates && selected->parentNode != nullptr && selected->isReplayable)
+				selected->dropGameState();
 			params.currentIterations++;
 			if (n_repeat_selection >= 20) // repeated selection
 				return;
@@ -71,7 +79,7 @@ namespace SGA
 	{
 		MCTSNode* cur = this;
 
-		while (!cur->gameState.isGameOver() && cur->nodeDepth < params.rolloutLength)
+		while (!cur->isTerminal && cur->nodeDepth < params.rolloutLength)
 		{
 			//If not fully expanded, add a new child
 			if (!cur->isFullyExpanded()) {
@@ -88,20 +96,21 @@ namespace SGA
 	MCTSNode* MCTSNode::expand(ForwardModel& forwardModel, MCTSParameters& params, boost::mt19937& /*randomGenerator*/)
 	{
 		// roll the state
-		//todo remove unnecessary copy of gameState
-		auto gsCopy(gameState);
+		auto gsCopy = copyGameState(forwardModel, params);
 		auto action = actionSpace.at(children.size());
-		applyActionToGameState(forwardModel, gsCopy, action, params, playerID);
+		const bool replayable = applyActionToGameState(forwardModel, gsCopy, action, params, playerID);
 
 		// generate child node and add it to the tree
-		children.push_back(std::unique_ptr<MCTSNode>(new MCTSNode(forwardModel, std::move(gsCopy), this, childIndex, this->ownerID)));
-		return children[static_cast<size_t>(childIndex)].get();
+		const auto newChildIndex = static_cast<int>(children.size());
+		children.push_back(std::unique_ptr<MCTSNode>(new MCTSNode(forwardModel, std::move(gsCopy), this, newChildIndex, this->ownerID)));
+		children.back()->isReplayable = replayable;
+		return children.back().get();
 	}
 
 	MCTSNode* MCTSNode::uct(MCTSParameters& params, boost::mt19937& randomGenerator)
 	{
 		//Find out if this node corresponds to a state where I can move.
-		bool amIMoving = gameState.canPlay(params.PLAYER_ID);
+		bool amIMoving = ownerCanPlay;
 		std::vector<double> childValues(children.size(), 0);
 
 		for (size_t i = 0; i < children.size(); ++i)
@@ -171,7 +180,7 @@ namespace SGA
 		if (params.rolloutsEnabled) {
 
 			//Create a copy and mark our depth on the tree.
-			auto gsCopy(gameState);
+			auto gsCopy = copyGameState(forwardModel, params);
 			int thisDepth = nodeDepth;
 
 			//If we must keep rolling.
@@ -194,7 +203,11 @@ namespace SGA
 			return params.heuristic->evaluateGameState(forwardModel, gsCopy, params.PLAYER_ID);
 		}
 
-		return params.heuristic->evaluateGameState(forwardModel, gameState, params.PLAYER_ID);
+		if (hasGameState)
+			return params.heuristic->evaluateGameState(forwardModel, gameState, params.PLAYER_ID);
+
+		auto gsCopy = copyGameState(forwardModel, params);
+		return params.heuristic->evaluateGameState(forwardModel, gsCopy, params.PLAYER_ID);
 	}
 
 	bool MCTSNode::rolloutFinished(GameState& rollerState, int depth, MCTSParameters& params)
@@ -206,17 +219,129 @@ namespace SGA
 		return rollerState.isGameOver();
 	}
 
-	void MCTSNode::applyActionToGameState(ForwardModel& forwardModel, GameState& targetGameState, Action& action, MCTSParameters& params, int /*playerID*/) const
+	bool MCTSNode::applyActionToGameState(ForwardModel& forwardModel, GameState& targetGameState, Action& action, MCTSParameters& params, int /*playerID*/) const
 	{
 		//Roll the game state with our action.
-		params.currentFMCalls += SGA::roll(targetGameState, forwardModel, action, playerID, params);
+		const int actionsExecuted = SGA::roll(targetGameState, forwardModel, action, playerID, params);
+		params.currentFMCalls += actionsExecuted;
+		bool onlyThisAction = actionsExecuted == 1;
 
 		//Continue rolling the state until the game is over, we run out of budget or this agent can play again. 
 		while (!targetGameState.canPlay(params.PLAYER_ID) && !params.isBudgetOver() && !targetGameState.isGameOver())
 		{
 			//Roll actions for the opponent(s).
 			params.currentFMCalls += SGA::rollOppOnly(targetGameState, forwardModel, params);
+			onlyThisAction = false;
 		}
+
+		// If the budget stopped the loop before the opponents moved, replaying the action with budget left would roll them
+		const bool opponentsFinished = targetGameState.canPlay(params.PLAYER_ID) || targetGameState.isGameOver();
+		return onlyThisAction && opponentsFinished;
+	}
+
+	GameState MCTSNode::copyGameState(ForwardModel& forwardModel, MCTSParameters& params) const
+	{
+		if (hasGameState)
+			return gameState;
+
+		// Only replayable nodes drop their state, so the parent's action leads to the same state again
+		auto state = parentNode->copyGameState(forwardModel, params);
+		auto action = parentNode->actionSpace.at(static_cast<size_t>(childIndex));
+		parentNode->applyActionToGameState(forwardModel, state, action, params, parentNode->playerID);
+		return state;
+	}
+
+	void MCTSNode::dropGameState()
+	{
+		gameState = GameState();
+		hasGameState = false;
+	}
+
+	std::unique_ptr<MCTSNode> MCTSNode::reRoot(std::unique_ptr<MCTSNode> root, int actionIndex, const GameState& observedState, ForwardModel& forwardModel, MCTSParameters& params)
+	{
+		if (root == nullptr || actionIndex < 0 || static_cast<size_t>(actionIndex) >= root->children.size())
+			return nullptr;
+
+		auto& child = root->children[static_cast<size_t>(actionIndex)];
+		if (!isSameState(child->copyGameState(forwardModel, params), observedState))
+			return nullptr;
+
+		auto newRoot = std::move(child);
+		newRoot->parentNode = nullptr;	// release parent
+		newRoot->gameState = observedState;
+		newRoot->hasGameState = true;
+		newRoot->isReplayable = false;
+
+		// the children are stored in the order of the action space, it has to be the same in the observed state
+		const auto previousActionSpace = newRoot->actionSpace;
+		newRoot->computeActionSpace(forwardModel);
+		if (!isSameActionSpace(previousActionSpace, newRoot->actionSpace))
+			return nullptr;
+
+		newRoot->initializeNode();
+		newRoot->setDepth(0);
+		return newRoot;
+	}
+
+	bool MCTSNode::isSameState(const GameState& predicted, const GameState& observed)
+	{
+		if (predicted.getCurrentTick() != observed.getCurrentTick()
+			|| predicted.getCurrentTBSPlayer() != observed.getCurrentTBSPlayer()
+			|| predicted.isGameOver() != observed.isGameOver()
+			|| predicted.getWinnerID() != observed.getWinnerID()
+			|| predicted.getEntities().size() != observed.getEntities().size()
+			|| predicted.getPlayers().size() != observed.getPlayers().size())
+			return false;
+
+		for (size_t i = 0; i < predicted.getPlayers().size(); i++)
+		{
+			const auto& predictedPlayer = predicted.getPlayers()[i];
+			const auto& observedPlayer = observed.getPlayers()[i];
+			if (predictedPlayer.getID() != observedPlayer.getID()
+				|| predictedPlayer.canPlay() != observedPlayer.canPlay()
+				|| predictedPlayer.getParameters() != observedPlayer.getParameters())
+				return false;
+		}
+
+		for (size_t i = 0; i < predicted.getEntities().size(); i++)
+		{
+			const auto& predictedEntity = predicted.getEntities()[i];
+			const auto& observedEntity = observed.getEntities()[i];
+			if (predictedEntity.getID() != observedEntity.getID()
+				|| predictedEntity.getOwnerID() != observedEntity.getOwnerID()
+				|| predictedEntity.getEntityTypeID() != observedEntity.getEntityTypeID()
+				|| !(predictedEntity.getPosition() == observedEntity.getPosition())
+				|| predictedEntity.getParamValues() != observedEntity.getParamValues()
+				|| predictedEntity.getBuffs().size() != observedEntity.getBuffs().size())
+				return false;
+		}
+
+		return true;
+	}
+
+	bool MCTSNode::isSameActionSpace(const std::vector<Action>& predicted, const std::vector<Action>& observed)
+	{
+		if (predicted.size() != observed.size())
+			return false;
+
+		for (size_t i = 0; i < predicted.size(); i++)
+		{
+			const auto& predictedAction = predicted[i];
+			const auto& observedAction = observed[i];
+			if (predictedAction.getActionFlag() != observedAction.getActionFlag()
+				|| predictedAction.getActionTypeID() != observedAction.getActionTypeID()
+				|| predictedAction.getOwnerID() != observedAction.getOwnerID()
+				|| predictedAction.getTargets().size() != observedAction.getTargets().size())
+				return false;
+
+			for (size_t j = 0; j < predictedAction.getTargets().size(); j++)
+			{
+				if (predictedAction.getTargets()[j] != observedAction.getTargets()[j])
+					return false;
+			}
+		}
+
+		return true;
 	}
 
 	//Backpropagation in MCTS. Update number of visits, accummulated reward value and node reward bounds.
@@ -11,6 +11,8 @@ namespace SGA {
 		std::cout << "\tK: " << K << "\n";
 		std::cout << "\tRollout length: " << rolloutLength << "\n";
 		std::cout << "\tRollouts enabled: " << (rolloutsEnabled ? "True" : "False") << "\n";
+		std::cout << "\tContinue previous search: " << (continuePreviousSearch ? "True" : "False") << "\n";
+		std::cout << "\tStore node states: " << (storeNodeStates ? "True" : "False") << "\n";
 		std::cout << "\tEpsilon = " << epsilon << "\n";
 	}
 }
\ No newline at end of file
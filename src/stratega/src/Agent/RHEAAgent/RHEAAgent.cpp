@@ -13,6 +13,7 @@ namespace SGA
         if (params_.budgetType == Budget::UNDEFINED)
             params_.budgetType = Budget::TIME;
         params_.opponentModel = std::make_shared<RandomActionScript>();
+        workerPool_ = std::make_unique<WorkerPool>(params_.numThreads);
     }
 
     ActionAssignment RHEAAgent::computeAction(GameState state, const ForwardModel& forwardModel, Timer timer)
@@ -49,43 +50,73 @@ namespace SGA
         }
     }
 
-    void RHEAAgent::initializePopulation(const ForwardModel& forwardModel, GameState& gameState, boost::mt19937&)
+    void RHEAAgent::initializePopulation(const ForwardModel& forwardModel, GameState& gameState, boost::mt19937& randomGenerator)
     {
         // create params_.popSize new random individuals
-        pop_.clear();
-        for (size_t i = 0; i < params_.popSize; i++) {
-            pop_.emplace_back(RHEAGenome(forwardModel, gameState, params_));
-        }
-        params_.currentIterations += static_cast<int>(params_.popSize);
+        pop_ = createIndividuals(params_.popSize, randomGenerator, [&](size_t, boost::mt19937& individualGenerator, int& forwardModelCalls)
+        {
+            return RHEAGenome(forwardModel, gameState, params_, individualGenerator, forwardModelCalls);
+        });
     }
 
 
     std::vector<RHEAGenome> RHEAAgent::shiftPopulation(const ForwardModel& forwardModel, GameState& gameState, boost::mt19937& randomGenerator)
     {
-        std::vector<RHEAGenome> newPop;
-
         // we shift the first individual, which is the only one that is likely to be feasible
-        pop_[0].shift(forwardModel, gameState, params_);
-        newPop.emplace_back(pop_[0]);
+        std::vector<RHEAGenome> newPop = createIndividuals(1, randomGenerator, [&](size_t, boost::mt19937& individualGenerator, int& forwardModelCalls)
+        {
+            RHEAGenome shifted(pop_[0]);
+            shifted.shift(forwardModel, gameState, params_, individualGenerator, forwardModelCalls);
+            return shifted;
+        });
 
         // from 1 to (1+params._MUTATE_BEST), mutate the best individual
-        for (size_t i = 1; i <= params_.mutateBestN && i < params_.popSize; ++i)
+        // from 1+params.mutateBestN to params_.popSize, generate at random
+        const RHEAGenome& best = newPop[0];
+        auto others = createIndividuals(params_.popSize - 1, randomGenerator, [&](size_t i, boost::mt19937& individualGenerator, int& forwardModelCalls)
         {
-            RHEAGenome mutGen(pop_[0]);
-            mutGen.mutate(forwardModel, gameState, params_, randomGenerator);
-            newPop.emplace_back(mutGen);
-        }
+            if (i < params_.mutateBestN)
+            {
+                RHEAGenome mutGen(best);
+                mutGen.mutate(forwardModel, gameState, params_, individualGenerator, forwardModelCalls);
+                return mutGen;
+            }
+            return RHEAGenome(forwardModel, gameState, params_, individualGenerator, forwardModelCalls);
+        });
+        newPop.insert(newPop.end(), others.begin(), others.end());
 
-        // from 1+params.mutateBestN to params_.popSize, generate at random
-        for (size_t i = 1 + params_.mutateBestN; i < params_.popSize; ++i) {
-            newPop.emplace_back(RHEAGenome(forwardModel, gameState, params_));
+        return newPop;
+    }
+
+    std::vector<RHEAGenome> RHEAAgent::createIndividuals(size_t count, boost::mt19937& randomGenerator, const std::function<RHEAGenome(size_t, boost::mt19937&, int&)>& createIndividual)
+    {
+        std::vector<boost::mt19937::result_type> seeds(count);
+        for (auto& seed : seeds)
+        {
+            seed = randomGenerator();
         }
 
+        // params_ is only read while the individuals are created, the budget counters are updated once all of them finished
+        std::vector<std::unique_ptr<RHEAGenome>> individuals(count);
+        std::vector<int> forwardModelCalls(count, 0);
+        workerPool_->parallelFor(count, [&](size_t i)
+        {
+            boost::mt19937 individualGenerator(seeds[i]);
+            individuals[i] = std::make_unique<RHEAGenome>(createIndividual(i, individualGenerator, forwardModelCalls[i]));
+        });
+
+        std::vector<RHEAGenome> newIndividuals;
+        newIndividuals.reserve(count);
+        for (size_t i = 0; i < count; i++)
+        {
+            params_.currentFMCalls += forwardModelCalls[i];
+            newIndividuals.emplace_back(*individuals[i]);
+        }
 
         //In RHEA, we count iterations as individual evaluations.
-        params_.currentIterations += static_cast<int>(params_.popSize);
+        params_.currentIterations += static_cast<int>(count);
 
-        return newPop;
+        return newIndividuals;
     }
 
 
@@ -113,53 +144,50 @@ namespace SGA
             newPop.emplace_back(pop_[0]);
         }
 
-        // add further individuals until the generation is full
-        while (newPop.size() < params_.popSize) {
-            newPop.emplace_back(getNextGenerationIndividual(forwardModel, gameState, randomGenerator));
-        }
-
-        return newPop;
-    }
-
-    RHEAGenome RHEAAgent::getNextGenerationIndividual(const ForwardModel& forwardModel, GameState& gameState, boost::mt19937& randomGenerator)
-    {
-        params_.currentIterations++;
+        // add further individuals until the generation is full, the parents are selected before the individuals are evaluated in parallel
+        const size_t count = params_.popSize - newPop.size();
+        std::vector<std::vector<size_t>> parents;
         if (params_.popSize > 1)
         {
-            std::vector<RHEAGenome> parents = tournamentSelection();
-            return RHEAGenome::crossover(forwardModel, gameState, params_, randomGenerator, parents[0], parents[1]);
+            for (size_t i = 0; i < count; i++)
+            {
+                parents.emplace_back(tournamentSelection(randomGenerator));
+            }
         }
-        else {
+
+        auto children = createIndividuals(count, randomGenerator, [&](size_t i, boost::mt19937& individualGenerator, int& forwardModelCalls)
+        {
+            if (params_.popSize > 1)
+            {
+                return RHEAGenome::crossover(forwardModel, gameState, params_, individualGenerator, forwardModelCalls, pop_[parents[i][0]], pop_[parents[i][1]]);
+            }
+
             RHEAGenome gMut(pop_[0]);
-            gMut.mutate(forwardModel, gameState, params_, randomGenerator);
+            gMut.mutate(forwardModel, gameState, params_, individualGenerator, forwardModelCalls);
             return (gMut.getValue() >= pop_[0].getValue()) ? gMut : pop_[0];
-        }
+        });
+        newPop.insert(newPop.end(), children.begin(), children.end());
+
+        return newPop;
     }
 
-    std::vector<RHEAGenome> RHEAAgent::tournamentSelection()
+    std::vector<size_t> RHEAAgent::tournamentSelection(boost::mt19937& randomGenerator) const
     {
-        std::vector<RHEAGenome> tournament;
-       // // sample subset, sort by fitness, select best individual
-       // // parent 1
-       ///* std::sample(pop_.begin(), pop_.end(), std::back_inserter(tournament),
-       //     params_.tournamentSize, boost::mt19937{ std::random_device{}() });*/
-       // /*auto parent1 = pop_;
-       // std::shuffle(parent1.begin(), parent1.end(), boost::mt19937{ std::random_device{}() });*/
-
-       // sort(tournament.begin(), tournament.end(), sortByFitness);
-       // RHEAGenome& parent1 = tournament[0];
-
-
-       // // parent 2
-       ///* tournament.clear();
-       // std::sample(pop_.begin(), pop_.end(), std::back_inserter(tournament),
-       //     params_.tournamentSize, boost::mt19937{ std::random_device{}() });
-
-       // std::sort(tournament.begin(), tournament.end(), sortByFitness);
-       // RHEAGenome& parent2 = tournament[0];
-
-       // return std::vector<RHEAGenome>{parent1, parent2};*/
-        return tournament;
+        boost::random::uniform_int_distribution<size_t> individualDistribution(0, pop_.size() - 1);
+        std::vector<size_t> parents;
+        for (int parent = 0; parent < 2; parent++)
+        {
+            // sample a subset of the population and select its best individual
+            size_t best = individualDistribution(randomGenerator);
+            for (int i = 1; i < params_.tournamentSize; i++)
+            {
+                const size_t candidate = individualDistribution(randomGenerator);
+                if (pop_[candidate].getValue() > pop_[best].getValue())
+                    best = candidate;
+            }
+            parents.emplace_back(best);
+        }
+        return parents;
     }
 
 }
@@ -6,7 +6,7 @@ namespace SGA {
     /// <summary>
     /// Creates and evaluates a genome
     /// </summary>
-    RHEAGenome::RHEAGenome(const ForwardModel& forwardModel, GameState gameState, RHEAParameters& params)
+    RHEAGenome::RHEAGenome(const ForwardModel& forwardModel, GameState gameState, const RHEAParameters& params, boost::mt19937& randomGenerator, int& forwardModelCalls)
     {
         //Actions available in this state, always starting with our player.
         auto actionSpace = forwardModel.generateActions(gameState, params.PLAYER_ID);
@@ -14,8 +14,8 @@ namespace SGA {
         size_t length = 0;
         while (!gameState.isGameOver() && actionSpace.size() > 0 && length < params.individualLength) {
             // Until the end of the sequence: choose and apply a random action to the state with the forward model.
-            auto action = actionSpace.at(static_cast<size_t>(rand() % static_cast<int>(actionSpace.size())));
-            applyActionToGameState(forwardModel, gameState, action, params);
+            auto action = randomAction(actionSpace, randomGenerator);
+            applyActionToGameState(forwardModel, gameState, action, params, randomGenerator, forwardModelCalls);
             //new state will have new available actions.
             actionSpace = forwardModel.generateActions(gameState, params.PLAYER_ID);
             actions.emplace_back(action);
@@ -31,21 +31,28 @@ namespace SGA {
 
 
 
-    void RHEAGenome::applyActionToGameState(const ForwardModel& forwardModel, GameState& gameState, const Action& action, RHEAParameters& params)
+    void RHEAGenome::applyActionToGameState(const ForwardModel& forwardModel, GameState& gameState, const Action& action, const RHEAParameters& params, boost::mt19937& randomGenerator, int& forwardModelCalls)
     {
         //Roll the game state with our action.
-        params.currentFMCalls += SGA::roll(gameState, forwardModel, action, params.PLAYER_ID, params);
+        forwardModelCalls += SGA::roll(gameState, forwardModel, action, params.PLAYER_ID, params, &randomGenerator);
 
-        //Continue rolling the state until the game is over, we run out of budget or this agent can play again. 
+        //Continue rolling the state until the game is over, we run out of budget or this agent can play again.
+        //The budget counters of params are only updated between the evaluations, so this does not depend on the other individuals.
         while (!gameState.canPlay(params.PLAYER_ID) && !params.isBudgetOver() && !gameState.isGameOver())
         {
             //Roll actions for the opponent(s).
-            params.currentFMCalls += SGA::rollOppOnly(gameState, forwardModel, params);
+            forwardModelCalls += SGA::rollOppOnly(gameState, forwardModel, params, &randomGenerator);
         }
     }
 
+    const Action& RHEAGenome::randomAction(const std::vector<Action>& actionSpace, boost::mt19937& randomGenerator)
+    {
+        boost::random::uniform_int_distribution<size_t> actionDistribution(0, actionSpace.size() - 1);
+        return actionSpace.at(actionDistribution(randomGenerator));
+    }
+
 
-    void RHEAGenome::mutate(const ForwardModel& forwardModel, GameState gameState, RHEAParameters& params, boost::mt19937& randomGenerator)
+    void RHEAGenome::mutate(const ForwardModel& forwardModel, GameState gameState, const RHEAParameters& params, boost::mt19937& randomGenerator, int& forwardModelCalls)
     {
         //Retrieve the action space for this state.
         auto actionSpace = forwardModel.generateActions(gameState, params.PLAYER_ID);
@@ -60,8 +67,8 @@ namespace SGA {
             // replace with random portfolio in case of mutate or no portfolio available
             if (mutate || (actIdx < actions.size()))
             {
-                auto action = actionSpace.at(static_cast<size_t>(rand() % static_cast<int>(actionSpace.size())));
-                applyActionToGameState(forwardModel, gameState, action, params);
+                auto action = randomAction(actionSpace, randomGenerator);
+                applyActionToGameState(forwardModel, gameState, action, params, randomGenerator, forwardModelCalls);
                 actionSpace = forwardModel.generateActions(gameState, params.PLAYER_ID);
                 if (actIdx < static_cast<unsigned long long>(actions.size()))
                 {
@@ -77,9 +84,9 @@ namespace SGA {
                 // use previous action or sample a new random one in case the individual is too short
                 if (actIdx >= static_cast<unsigned long long>(actions.size()))
                 {
-                    actions.emplace_back(actionSpace.at(static_cast<size_t>(rand() % static_cast<int>(actionSpace.size()))));
+                    actions.emplace_back(randomAction(actionSpace, randomGenerator));
                 }
-                applyActionToGameState(forwardModel, gameState, actions[static_cast<size_t>(actIdx)], params);
+                applyActionToGameState(forwardModel, gameState, actions[static_cast<size_t>(actIdx)], params, randomGenerator, forwardModelCalls);
                 actionSpace = forwardModel.generateActions(gameState, params.PLAYER_ID);
             }
 
@@ -91,7 +98,7 @@ namespace SGA {
     }
 
 
-    RHEAGenome RHEAGenome::crossover(const ForwardModel& forwardModel, GameState gameState, RHEAParameters& params, boost::mt19937& randomGenerator, RHEAGenome& parent1, RHEAGenome& parent2)
+    RHEAGenome RHEAGenome::crossover(const ForwardModel& forwardModel, GameState gameState, const RHEAParameters& params, boost::mt19937& randomGenerator, int& forwardModelCalls, const RHEAGenome& parent1, const RHEAGenome& parent2)
     {
         // create a new individual and its own gameState copy
         auto actionSpace = forwardModel.generateActions(gameState, params.PLAYER_ID);
@@ -111,32 +118,33 @@ namespace SGA {
             // mutation = randomly select a new action for gameStateCopy
             if (mutate)
             {
-                auto action = actionSpace.at(static_cast<size_t>(rand() % static_cast<int>(actionSpace.size())));
-                applyActionToGameState(forwardModel, gameState, action, params);
+                auto action = randomAction(actionSpace, randomGenerator);
+                applyActionToGameState(forwardModel, gameState, action, params, randomGenerator, forwardModelCalls);
                 actionSpace = forwardModel.generateActions(gameState, params.PLAYER_ID);
                 actions.emplace_back(action);
             }
             else
             {
                 const bool useParent1First = doubleDistribution_(randomGenerator) < 0.5;
-                RHEAGenome& from = useParent1First ? parent1 : parent2;
+                // the parents are shared with the other individuals of the generation and only read
+                const RHEAGenome* from = useParent1First ? &parent1 : &parent2;
                 bool validAction = true;
                 // check the first parent and choose portfolio if available
-                if (actIdx < from.actions.size())
+                if (actIdx < from->actions.size())
                 {
-                    validAction = from.actions[actIdx].validate(gameState);
+                    validAction = from->actions[actIdx].validate(gameState);
                     if(validAction) 
-                        actions.emplace_back(from.actions[actIdx]);
+                        actions.emplace_back(from->actions[actIdx]);
                 }
                 else
                 {
                     // check the second parent and choose portfolio if available
-                    from = useParent1First ? parent2 : parent1;
-                    if (actIdx < from.actions.size())
+                    from = useParent1First ? &parent2 : &parent1;
+                    if (actIdx < from->actions.size())
                     {
-                        validAction = from.actions[actIdx].validate(gameState);
+                        validAction = from->actions[actIdx].validate(gameState);
                         if (validAction)
-                            actions.emplace_back(from.actions[actIdx]);
+                            actions.emplace_back(from->actions[actIdx]);
                     }
                     else validAction = false;
                 }
@@ -144,11 +152,11 @@ namespace SGA {
                 if (!validAction)
                 {
                     // use a random action by default
-                    actions.emplace_back(actionSpace.at(static_cast<size_t>(rand() % static_cast<int>(actionSpace.size()))));
+                    actions.emplace_back(randomAction(actionSpace, randomGenerator));
                 }
 
                 //Apply the chosen action to the game state and generate the new set of possible actions for the next step.
-                applyActionToGameState(forwardModel, gameState, actions[actIdx], params);
+                applyActionToGameState(forwardModel, gameState, actions[actIdx], params, randomGenerator, forwardModelCalls);
                 actionSpace = forwardModel.generateActions(gameState, params.PLAYER_ID);
             }
             actIdx++;
@@ -159,7 +167,7 @@ namespace SGA {
         return RHEAGenome(actions, value);
     }
 
-    void RHEAGenome::shift(const ForwardModel& forwardModel, GameState gameState, RHEAParameters& params)
+    void RHEAGenome::shift(const ForwardModel& forwardModel, GameState gameState, const RHEAParameters& params, boost::mt19937& randomGenerator, int& forwardModelCalls)
     {
         // reuse previous solution
         std::rotate(actions.begin(), actions.begin() + 1, actions.end());
@@ -179,10 +187,10 @@ namespace SGA {
 
             if (i == actions.size() - 1 || !actions[i].validate(gameState))
             {
-                actions[i] = actionSpace.at(static_cast<size_t>(rand() % static_cast<int>(actionSpace.size())));
+                actions[i] = randomAction(actionSpace, randomGenerator);
             }
 
-            applyActionToGameState(forwardModel, gameState, actions[i], params);
+            applyActionToGameState(forwardModel, gameState, actions[i], params, randomGenerator, forwardModelCalls);
             actionSpace = forwardModel.generateActions(gameState, params.PLAYER_ID);
         }
 
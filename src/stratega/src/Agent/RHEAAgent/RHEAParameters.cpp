@@ -15,6 +15,7 @@ namespace SGA {
 		std::cout << "\tElitism: " << elitism << std::endl;
 		std::cout << "\tContinue search: " << (continuePreviousSearch ? "True" : "False") << std::endl;
 		std::cout << "\tMutate best individual count: " << mutateBestN << std::endl;
+		std::cout << "\tThreads: " << numThreads << std::endl;
 		std::cout << "\tEpsilon: " << epsilon << std::endl;
 	}
 }
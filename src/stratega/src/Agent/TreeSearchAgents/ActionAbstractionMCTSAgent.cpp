@@ -10,7 +10,6 @@ namespace SGA
 
         // if there is just one action and we don't spent the time on continuing our search
         // we just instantly return it
-        // todo update condition to an and in case we can compare gameStates, since we currently cannot reuse the tree after an endTurnAction
         if (actionSpace.size() == 1)
         {
             rootNode = nullptr;
@@ -22,13 +21,15 @@ namespace SGA
             const auto processedForwardModel = parameters_.preprocessForwardModel(forwardModel);
             if (parameters_.continuePreviousSearch && previousActionIndex != -1)
             {
-                // in case of deterministic games we know which move has been done by us
-                // reuse the tree from the previous iteration
-                rootNode = std::move(rootNode->children.at(static_cast<size_t>(previousActionIndex)));
-                rootNode->parentNode = nullptr;	// release parent
-                rootNode->setDepth(0);
+                // reuse the subtree of the action we executed if it predicted the state we observe now
+                rootNode = MCTSNode::reRoot(std::move(rootNode), previousActionIndex, state, *processedForwardModel, parameters_);
             }
             else
+            {
+                rootNode = nullptr;
+            }
+
+            if (rootNode == nullptr)
             {
                 // start a new tree
                 rootNode = std::make_unique<MCTSNode>(*processedForwardModel, state, getPlayerID());
@@ -43,7 +44,7 @@ namespace SGA
             auto bestAction = rootNode->getActionSpace(forwardModel, getPlayerID()).at(static_cast<size_t>(bestActionIndex));
 
             // return best action
-            previousActionIndex = (bestAction.getActionFlag() == ActionFlag::EndTickAction) ? -1 : bestActionIndex;
+            previousActionIndex = bestActionIndex;
             return ActionAssignment::fromSingleAction(bestAction);
         }
     }
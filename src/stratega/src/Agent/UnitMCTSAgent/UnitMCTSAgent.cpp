@@ -156,7 +156,6 @@ namespace SGA {
 
           // [Homomorphism] do batches
           int tmp_batch_used = 0;
-          int tmp_index = 1000;
           if(! parameters_.DO_STATE_ABSTRACTION) {
              rootNode->searchMCTS(
                 *processedForwardModel,
@@ -198,15 +197,21 @@ namespace SGA {
                 for(auto node1 : deep_layer) {  // each initial node
                    if(node1->isAbstracted)
                       continue;  // can be adjusted
+
+                   if(parameters_.HASH_ABSTRACTION) {  // nodes with the same signature share an absnode
+                      auto signature = node1->getAbstractSignature(parameters_.R_THRESHOLD);
+                      auto absNode = absNodeBySignature[i].find(signature);
+                      if(absNode != absNodeBySignature[i].end()) {
+                         addToAbsNode(i, absNode->second, node1);
+                      } else {
+                         absNodeBySignature[i].emplace(std::move(signature), static_cast<int>(absNodes[i].size()));
+                         addAbsNode(i, node1);
+                      }
+                      continue;
+                   }
+
                    if(static_cast<int>(absNodes[i].size()) == 0) {  // this depth has no node cluster
-                      absNodes[i].push_back(std::vector< UnitMCTSNode* >{node1});
-
-                      // absNodeToStatistics, absNodeHASH -> absNode.value, absNode.visitingCount
-                      absNodeToStatistics.insert(std::pair< int, std::vector< double > >(
-                         i * tmp_index + static_cast<int>(absNodes[i].size()) - 1,
-                         std::vector< double >{node1->value, float(node1->nVisits)}));
-                      node1->isAbstracted = true;
-                      node1->absNodeID = i * 1000 + static_cast<int>(absNodes[i].size()) - 1;
+                      addAbsNode(i, node1);
                       continue;
                    }
 
@@ -226,24 +231,13 @@ namespace SGA {
                          }
                       }
                       if(match) {
-                         node1->isAbstracted = true;
-                         node1->absNodeID = i * tmp_index + j;
-                         absNodes[i][j].push_back(node1);  // add into existing group
-                         treeNodetoAbsNode.insert(std::pair< int, int >(node1->nodeID, i * 1000 + j));
-
+                         addToAbsNode(i, j, node1);  // add into existing group
                          foundExistGroup = true;
                       }
                    }
                    if(! foundExistGroup) {
-                      absNodes[i].push_back(std::vector< UnitMCTSNode* >{node1});
-                      absNodeToStatistics.insert(std::pair< int, std::vector< double > >(
-                         i * tmp_index + static_cast<int>(absNodes[i].size()) - 1,
-                         std::vector< double >{node1->value, float(node1->nVisits)}));
-                      // absNodeToStatistics[i * 1000 + absNodes[i].size() - 1] = std::vector<double>{
-                      // node1->value, double(node1->nVisits) };
-                      node1->isAbstracted = true;
-                      node1->absNodeID = i * 1000 + static_cast<int>(absNodes[i].size()) - 1;
-                      // std::cout << " create absNode, ID: " << i * tmp_index + absNodes[i].size() - 1
+                      addAbsNode(i, node1);
+                      // std::cout << " create absNode, ID: " << i * 1000 + absNodes[i].size() - 1
                       // << std::endl;
                    }
                    node1->isAbstracted = true;
@@ -358,6 +352,26 @@ namespace SGA {
        }
     }
 
+    void UnitMCTSAgent::addAbsNode(int depth, UnitMCTSNode* node)
+    {
+       absNodes[depth].push_back(std::vector< UnitMCTSNode* >{node});
+
+       // absNodeToStatistics, absNodeHASH -> absNode.value, absNode.visitingCount
+       const int absNodeID = depth * 1000 + static_cast<int>(absNodes[depth].size()) - 1;
+       absNodeToStatistics.insert(std::pair< int, std::vector< double > >(
+          absNodeID, std::vector< double >{node->value, float(node->nVisits)}));
+       node->isAbstracted = true;
+       node->absNodeID = absNodeID;
+    }
+
+    void UnitMCTSAgent::addToAbsNode(int depth, int absNodeIndex, UnitMCTSNode* node)
+    {
+       node->isAbstracted = true;
+       node->absNodeID = depth * 1000 + absNodeIndex;
+       absNodes[depth][absNodeIndex].push_back(node);
+       treeNodetoAbsNode.insert(std::pair< int, int >(node->nodeID, depth * 1000 + absNodeIndex));
+    }
+
     // actual reward, what if using the approximate Q? combination of heuristic score [stage1]
     bool UnitMCTSAgent::isTwoNodeApproxmateHomomorphism(const ForwardModel& forwardModel, UnitMCTSNode* node1, UnitMCTSNode* node2, double reward_threshold, double transition_threshold)
     {
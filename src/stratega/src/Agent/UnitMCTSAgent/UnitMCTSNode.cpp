@@ -1,4 +1,5 @@
 #include <Stratega/Agent/UnitMCTSAgent/UnitMCTSNode.h>
+#include <cmath>
 #include <utility>
 
 namespace SGA
@@ -148,6 +149,30 @@ namespace SGA
 		}
 	}
 
+	AbstractState UnitMCTSNode::getAbstractSignature(double rewardThreshold) const
+	{
+		// Rewards in the same interval of length rewardThreshold differ by less than the threshold
+		std::vector<double> actions;
+		std::vector<double> rewards;
+		for (const auto& entry : actionToReward)
+		{
+			actions.emplace_back(entry.first);
+			rewards.emplace_back(rewardThreshold > 0 ? std::floor(entry.second / rewardThreshold) : entry.second);
+		}
+
+		std::vector<double> nextStates;
+		for (const auto& entry : stateCounter)
+		{
+			nextStates.emplace_back(entry.first);
+		}
+
+		AbstractState signature;
+		signature.addAttribute("Actions", actions);
+		signature.addAttribute("Rewards", rewards);
+		signature.addAttribute("NextStates", nextStates);
+		return signature;
+	}
+
 
 	int UnitMCTSNode::getVisitCount(std::map<int, std::vector<double> >* absNodeToStatistics) {
 		if (isAbstracted) {
@@ -4,14 +4,25 @@
 
 #include <Stratega/Arena/Arena.h>
 #include <Stratega/Arena/utils.h>
+#include <Stratega/Utils/ParallelFor.h>
+
+#include <algorithm>
+#include <atomic>
+#include <memory>
 
 Arena::Arena(const SGA::GameConfig& newConfig)
 	: config(&newConfig), runner(createGameRunner(newConfig)), gameBattleCount(0)
 {
 }
 
-void Arena::runGames(int playerCount, int seed, int gamesNumber, int mapNumber)
+void Arena::runGames(int playerCount, int seed, int gamesNumber, int mapNumber, int workers)
 {
+	if (workers > 1)
+	{
+		runGamesParallel(playerCount, seed, gamesNumber, mapNumber, workers);
+		return;
+	}
+
 	currentMapID = 0;
 	currentSeed = seed;
 
@@ -76,14 +87,133 @@ void Arena::runGames(int playerCount, int seed, int gamesNumber, int mapNumber,
 }
 
 void Arena::runGame(const std::vector<int>& agentAssignment, boost::mt19937 rngEngine)
+{
+	runBattle(*runner, currentMapID, gameBattleCount++, agentAssignment, rngEngine);
+}
+
+void Arena::runGamesParallel(int playerCount, int seed, int gamesNumber, int mapNumber, int workers)
+{
+	struct Battle
+	{
+		int gameID;
+		int battleID;
+		std::vector<int> agentAssignment;
+	};
+
+	try
+	{
+		// Same games and assignments as the sequential loop, in the same order
+		std::vector<Battle> battles;
+		for (int i = 0; i < gamesNumber * mapNumber; ++i)
+		{
+			int battleID = 0;
+			CallbackFn callback = [&](const std::vector<int>& c) { battles.push_back({ i, battleID++, c }); };
+			generateCombinations(config->agentParams.size(), static_cast<size_t>(playerCount), callback);
+		}
+
+		// Battles are merged into the default log in the sequential order, as soon as they and all earlier battles finished,
+		// so a finished battle does not keep its log until the whole run is over
+		std::vector<size_t> gameEnds(static_cast<size_t>(gamesNumber * mapNumber), 0);
+		for (const auto& battle : battles)
+		{
+			gameEnds[static_cast<size_t>(battle.gameID)]++;
+		}
+		for (size_t i = 1; i < gameEnds.size(); i++)
+		{
+			gameEnds[i] += gameEnds[i - 1];
+		}
+
+		std::vector<std::unique_ptr<SGA::FileLogger>> battleLogs(battles.size());
+		std::vector<bool> finishedBattles(battles.size(), false);
+		std::mutex mergeMutex;
+		size_t nextGame = 0;
+		size_t nextBattle = 0;
+		bool gameHeaderLogged = false;
+		auto mergeFinishedBattles = [&]()
+		{
+			while (nextGame < gameEnds.size())
+			{
+				if (!gameHeaderLogged)
+				{
+					SGA::LoggingScope scope("Game " + std::to_string(nextGame));
+					SGA::logSingleValue("Map", std::to_string(static_cast<int>(nextGame) / gamesNumber));
+					SGA::logSingleValue("Seed", std::to_string(seed + static_cast<int>(nextGame)));
+					gameHeaderLogged = true;
+				}
+				for (; nextBattle < gameEnds[nextGame] && finishedBattles[nextBattle]; nextBattle++)
+				{
+					{
+						std::lock_guard<std::mutex> logGuard(SGA::loggingMutex);
+						SGA::getDefaultLogger().merge(battleLogs[nextBattle]->getLoggedValues());
+					}
+					battleLogs[nextBattle].reset();
+				}
+				if (nextBattle < gameEnds[nextGame])
+					return;
+
+				SGA::getDefaultLogger().flush();
+				nextGame++;
+				gameHeaderLogged = false;
+			}
+		};
+
+		// Every battle depends only on its seed, map and assignment, so it can run on any worker.
+		// Each worker creates one runner and resets it for every battle it takes, like the sequential run does
+		std::atomic<size_t> nextToRun(0);
+		const auto workerCount = std::min(battles.size(), static_cast<size_t>(workers));
+		SGA::parallelFor(workerCount, workers, [&](size_t /*worker*/)
+		{
+			std::unique_ptr<SGA::GameRunner> workerRunner;
+			{
+				std::lock_guard<std::mutex> setupGuard(setupMutex);
+				workerRunner = SGA::createGameRunner(*config);
+			}
+
+			for (auto i = nextToRun++; i < battles.size(); i = nextToRun++)
+			{
+				const auto& battle = battles[i];
+				battleLogs[i] = std::make_unique<SGA::FileLogger>();
+				try
+				{
+					{
+						SGA::ThreadLoggerScope loggerScope(*battleLogs[i]);
+						SGA::LoggingScope scope("Game " + std::to_string(battle.gameID));
+						boost::mt19937 rngEngine(static_cast<unsigned>(seed + battle.gameID));
+						runBattle(*workerRunner, battle.gameID / gamesNumber, battle.battleID, battle.agentAssignment, rngEngine);
+					}
+
+					std::lock_guard<std::mutex> mergeGuard(mergeMutex);
+					finishedBattles[i] = true;
+					mergeFinishedBattles();
+				}
+				catch (...)
+				{
+					// Stop handing out battles, the other workers finish the ones they are running
+					nextToRun = battles.size();
+					throw;
+				}
+			}
+		});
+	}
+	catch (const std::exception& ex)
+	{
+		std::cout << "Arena error: " << ex.what() << std::endl;
+	}
+}
+
+void Arena::runBattle(SGA::GameRunner& gameRunner, int mapID, int battleID, const std::vector<int>& agentAssignment, boost::mt19937 rngEngine)
 {
 	// Initialize new Game
 	std::cout << "Initializing new game" << std::endl;
-	runner->reset(currentMapID);
+	gameRunner.reset(mapID);
 
 	// Assign agents
 	boost::random::uniform_int_distribution<unsigned int> distribution(0, std::numeric_limits<unsigned int>::max());
-	auto allAgents = config->generateAgents();
+	std::vector<std::unique_ptr<SGA::Agent>> allAgents;
+	{
+		std::lock_guard<std::mutex> setupGuard(setupMutex);
+		allAgents = config->generateAgents();
+	}
 	std::vector<std::shared_ptr<SGA::Agent>> agents(agentAssignment.size());
 
 	boost::random::uniform_int_distribution<unsigned int> seedDist(0, boost::mt19937::max());
@@ -105,7 +235,7 @@ void Arena::runGame(const std::vector<int>& agentAssignment, boost::mt19937 rngE
 	}
 
 	// Initialize logging
-    SGA::LoggingScope battleScope("Battle" + std::to_string(gameBattleCount++));
+    SGA::LoggingScope battleScope("Battle" + std::to_string(battleID));
 
 	for(size_t i = 0; i < agentAssignment.size(); i++)
 	{
@@ -115,7 +245,7 @@ void Arena::runGame(const std::vector<int>& agentAssignment, boost::mt19937 rngE
 	// Run the game
 	try
 	{
-		runner->run(agents.begin(), agents.end(), this);
+		gameRunner.run(agents.begin(), agents.end(), this);
 	}
 	catch (const std::exception& ex)
 	{
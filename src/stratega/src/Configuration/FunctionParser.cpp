@@ -295,7 +295,8 @@ namespace SGA
 					mathExpress += nextChar;						
 			}
 		}
-		temp.setExpression(mathExpress);		
+		temp.setExpression(mathExpress);
+		temp.compile();
 		return FunctionParameter::createExpression(/*ss.str()*/temp);
 	}
 
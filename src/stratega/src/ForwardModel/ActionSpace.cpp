@@ -11,53 +11,85 @@ namespace SGA
 			if (sourceEntity.getOwnerID() != playerID)
 				continue;
 
-			for (const auto& actionInfo : sourceEntity.getAttachedActions())
-			{
-				const auto& actionType = gameState.getGameInfo()->getActionType(actionInfo.actionTypeID);
+			generateEntityActions(gameState, sourceEntity, playerID, bucket);
+		}
 
-				bool generateContinuousAction = true;
-				//Check if action is continuos
-				if (actionType.isContinuous())
-				{
-					//Check if entity is already executing it
-					for (const auto& action : sourceEntity.getContinuousActions())
-					{
-						if (action.getActionTypeID() == actionType.getID())
-						{
-							//This entity cant execute the action
-							generateContinuousAction = false;
+		//Generate player actions
+		generatePlayerActions(gameState, *gameState.getPlayer(playerID), bucket);
 
-							//Give the posibility to abort it
-							bucket.emplace_back(Action::createAbortEntityAction(playerID, sourceEntity.getID(), action.getContinuousActionID()));
-						}
-					}
-				}
+		//Generate EndTurnAction
+		if (gameState.getGameType() == GameType::TBS)
+		{
+			bucket.emplace_back(Action::createEndAction(playerID));
+		}
 
-				if (!generateContinuousAction)
-					continue;
+		return bucket;
+	}
+
+	void ActionSpace::generateEntityActions(const GameState& gameState, const Entity& sourceEntity, int playerID, std::vector<Action>& bucket) const
+	{
+		for (const auto& actionInfo : sourceEntity.getAttachedActions())
+		{
+			generateEntityActions(gameState, sourceEntity, actionInfo, playerID, bucket);
+		}
+	}
+
+	void ActionSpace::generateEntityActions(const GameState& gameState, const Entity& sourceEntity, const ActionInfo& actionInfo, int playerID, std::vector<Action>& bucket) const
+	{
+		const auto& actionType = gameState.getGameInfo()->getActionType(actionInfo.actionTypeID);
 
-				// Check if this action can be executed		
-				if (gameState.getCurrentTick() - actionInfo.lastExecutedTick < actionType.getCooldown())
-					continue;
-				if (!gameState.canExecuteAction(sourceEntity, actionType))
-					continue;
+		//Check if entity is already executing it
+		if (generateAbortActions(sourceEntity, actionType, playerID, bucket))
+			return;
 
-				// Generate all actions
-				if (actionType.getTargets().size() == 0/*TargetType::None*/)
-				{
-					// Self-actions do not have a target, only a source
-					bucket.emplace_back(generateSelfAction(sourceEntity, actionType));
-				}
-				else
+		// Check if this action can be executed		
+		if (!isReady(gameState, sourceEntity, actionInfo))
+			return;
+
+		// Generate all actions
+		if (actionType.getTargets().size() == 0/*TargetType::None*/)
+		{
+			// Self-actions do not have a target, only a source
+			bucket.emplace_back(generateSelfAction(sourceEntity, actionType));
+		}
+		else
+		{
+			auto targets = generateTargets(gameState, sourceEntity, actionType);
+			generateActions(gameState, sourceEntity, actionType, targets, bucket);
+		}
+	}
+
+	bool ActionSpace::generateAbortActions(const Entity& sourceEntity, const ActionType& actionType, int playerID, std::vector<Action>& bucket) const
+	{
+		bool isExecuting = false;
+		//Check if action is continuos
+		if (actionType.isContinuous())
+		{
+			for (const auto& action : sourceEntity.getContinuousActions())
+			{
+				if (action.getActionTypeID() == actionType.getID())
 				{
-					auto targets = generateTargets(gameState, sourceEntity, actionType);
-					generateActions(gameState, sourceEntity, actionType, targets, bucket);
+					//This entity cant execute the action
+					isExecuting = true;
+
+					//Give the posibility to abort it
+					bucket.emplace_back(Action::createAbortEntityAction(playerID, sourceEntity.getID(), action.getContinuousActionID()));
 				}
 			}
 		}
+		return isExecuting;
+	}
 
-		//Generate player actions
-		auto& player = *gameState.getPlayer(playerID);
+	bool ActionSpace::isReady(const GameState& gameState, const Entity& sourceEntity, const ActionInfo& actionInfo) const
+	{
+		const auto& actionType = gameState.getGameInfo()->getActionType(actionInfo.actionTypeID);
+		if (gameState.getCurrentTick() - actionInfo.lastExecutedTick < actionType.getCooldown())
+			return false;
+		return gameState.canExecuteAction(sourceEntity, actionType);
+	}
+
+	void ActionSpace::generatePlayerActions(const GameState& gameState, const Player& player, std::vector<Action>& bucket) const
+	{
 		for (const auto& actionInfo : player.getAttachedActions())
 		{
 			const auto& actionType = gameState.getGameInfo()->getActionType(actionInfo.actionTypeID);
@@ -101,14 +133,6 @@ namespace SGA
 				generateActions(gameState, player, actionType, targets, bucket);
 			}
 		}
-
-		//Generate EndTurnAction
-		if (gameState.getGameType() == GameType::TBS)
-		{
-			bucket.emplace_back(Action::createEndAction(playerID));
-		}
-
-		return bucket;
 	}
 
 	std::vector<Action> ActionSpace::generateQueueActions(const GameState& gameState, int playerID) const
@@ -304,34 +328,43 @@ namespace SGA
 	{
 		for (auto& targetsProduct : productActionTargets(targets))
 		{
-			Action action(&actionType);
-			action.setOwnerID(sourceEntity.getOwnerID());
-			action.getTargets().emplace_back(ActionTarget::createEntityActionTarget(sourceEntity.getID()));
-
-			for (auto& target : targetsProduct)
+			auto action = createAction(sourceEntity, actionType, targetsProduct);
+			if (isFullfiled(state, action))
 			{
-				action.getTargets().emplace_back(target);
+				actionBucket.emplace_back(action);
 			}
+		}
+	}
 
-			if (actionType.isContinuous())
-				action.setActionFlag(ActionFlag::ContinuousAction);
+	Action ActionSpace::createAction(const Entity& sourceEntity, const ActionType& actionType, const std::vector<ActionTarget>& targets) const
+	{
+		Action action(&actionType);
+		action.setOwnerID(sourceEntity.getOwnerID());
+		action.getTargets().emplace_back(ActionTarget::createEntityActionTarget(sourceEntity.getID()));
 
-			bool isValidAction = true;
-			for (auto& actionTargetType : actionType.getTargets())
-				for (const auto& condition : actionTargetType.second)
-				{
-					if (!condition->isFullfiled(state, action.getTargets()))
-					{
-						isValidAction = false;
-						break;
-					}
-				}
+		for (auto& target : targets)
+		{
+			action.getTargets().emplace_back(target);
+		}
 
-			if (isValidAction)
+		if (actionType.isContinuous())
+			action.setActionFlag(ActionFlag::ContinuousAction);
+
+		return action;
+	}
+
+	bool ActionSpace::isFullfiled(const GameState& state, const Action& action) const
+	{
+		for (auto& actionTargetType : action.getActionType().getTargets())
+			for (const auto& condition : actionTargetType.second)
 			{
-				actionBucket.emplace_back(action);
+				if (!condition->isFullfiled(state, action.getTargets()))
+				{
+					return false;
+				}
 			}
-		}
+
+		return true;
 	}
 
 	void ActionSpace::generateActions(const GameState& state, const Player& sourcePlayer, const ActionType& actionType, const std::vector<std::vector<ActionTarget>>& targets, std::vector<Action>& actionBucket) const
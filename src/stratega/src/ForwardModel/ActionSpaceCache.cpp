@@ -0,0 +1,437 @@
+#include <Stratega/ForwardModel/ActionSpaceCache.h>
+#include <Stratega/ForwardModel/Condition.h>
+#include <algorithm>
+#include <cmath>
+#include <typeindex>
+#include <unordered_set>
+#pragma warning(disable: 5045)
+namespace SGA
+{
+	namespace
+	{
+		// Entities are matched to tiles by truncating their position, so an off-grid position can share a tile with positions up to two tiles away
+		constexpr double OFF_GRID_MARGIN = 2.0;
+
+		bool isOnGrid(const Vector2f& position)
+		{
+			return position.x == std::floor(position.x) && position.y == std::floor(position.y);
+		}
+
+		bool isSameBuffs(const std::vector<Buff>& buffs, const std::vector<Buff>& other)
+		{
+			return std::equal(buffs.begin(), buffs.end(), other.begin(), other.end(), [](const Buff& a, const Buff& b)
+			{
+				return &a.getType() == &b.getType() && a.getElapsedTicks() == b.getElapsedTicks() && a.getDurationTicks() == b.getDurationTicks();
+			});
+		}
+
+		bool isSamePlayer(const Player& player, const Player& other)
+		{
+			return player.getID() == other.getID()
+				&& player.canPlay() == other.canPlay()
+				&& player.getParameters() == other.getParameters()
+				&& isSameBuffs(player.getBuffs(), other.getBuffs());
+		}
+	}
+
+	std::vector<Action> ActionSpaceCache::generateActions(const std::shared_ptr<ActionSpace>& newActionSpace, const GameState& state, int playerID)
+	{
+		// Overridden generation could depend on anything
+		if (typeid(*newActionSpace) != typeid(ActionSpace))
+			return newActionSpace->generateActions(state, playerID);
+
+		if (newActionSpace != actionSpace || !previousState || !hasSameGlobalState(state))
+		{
+			clear();
+			actionSpace = newActionSpace;
+		}
+		else if (!collectChanges(state))
+		{
+			entityActions.clear();
+		}
+
+		const bool entitiesChanged = !changedEntities.empty() || !movedPositions.empty();
+		std::vector<Action> bucket;
+		for (const auto& entity : state.getEntities())
+		{
+			const auto& attachedActions = entity.getAttachedActions();
+
+			// Actions of the other players are kept up to date for their next call
+			auto it = entityActions.find(entity.getID());
+			if (it != entityActions.end() && entitiesChanged)
+			{
+				for (size_t i = 0; i < attachedActions.size(); i++)
+				{
+					update(state, entity, state.getGameInfo()->getActionType(attachedActions[i].actionTypeID), it->second[i]);
+				}
+			}
+
+			if (entity.getOwnerID() != playerID)
+				continue;
+
+			if (it == entityActions.end())
+			{
+				it = entityActions.emplace(entity.getID(), std::vector<CachedActions>(attachedActions.size())).first;
+			}
+
+			for (size_t i = 0; i < attachedActions.size(); i++)
+			{
+				auto& cachedActions = it->second[i];
+				if (cachedActions.isValid)
+				{
+					hits++;
+				}
+				else
+				{
+					misses++;
+					generateEntityActions(state, entity, attachedActions[i], playerID, cachedActions);
+				}
+				bucket.insert(bucket.end(), cachedActions.actions.begin(), cachedActions.actions.end());
+			}
+		}
+
+		actionSpace->generatePlayerActions(state, *state.getPlayer(playerID), bucket);
+		if (state.getGameType() == GameType::TBS)
+		{
+			bucket.emplace_back(Action::createEndAction(playerID));
+		}
+
+		storePreviousState(state);
+		return bucket;
+	}
+
+	void ActionSpaceCache::storePreviousState(const GameState& state)
+	{
+		if (!previousState)
+			previousState = std::make_unique<PreviousState>(state);
+
+		// Assigning reuses the storage of the previous call
+		auto& previous = *previousState;
+		previous.gameInfo = state.getGameInfo();
+		previous.gameType = state.getGameType();
+		previous.currentTick = state.getCurrentTick();
+		previous.parameters = state.getParameters();
+		previous.board = state.getSharedBoard();
+		previous.researchedTechnologies = state.getSharedResearchedTechnologies();
+		previous.players = state.getPlayers();
+		previous.entities = state.getEntities();
+	}
+
+	void ActionSpaceCache::clear()
+	{
+		actionSpace.reset();
+		previousState.reset();
+		entityActions.clear();
+		dependencies.clear();
+		changedEntities.clear();
+		movedPositions.clear();
+		entitiesAddedOrRemoved = false;
+	}
+
+	bool ActionSpaceCache::hasSameGlobalState(const GameState& state) const
+	{
+		const auto& previous = *previousState;
+		if (state.getGameInfo() != previous.gameInfo
+			|| state.getGameType() != previous.gameType
+			|| state.getCurrentTick() != previous.currentTick
+			|| state.getParameters() != previous.parameters
+			|| !state.getSharedBoard().sharesWith(previous.board)
+			|| !state.getSharedResearchedTechnologies().sharesWith(previous.researchedTechnologies))
+		{
+			return false;
+		}
+
+		return std::equal(state.getPlayers().begin(), state.getPlayers().end(), previous.players.begin(), previous.players.end(), isSamePlayer);
+	}
+
+	bool ActionSpaceCache::collectChanges(const GameState& state)
+	{
+		changedEntities.clear();
+		movedPositions.clear();
+		entitiesAddedOrRemoved = false;
+		const auto& previousEntities = previousState->entities;
+
+		std::unordered_map<int, size_t> previousIndices;
+		previousIndices.reserve(previousEntities.size());
+		for (size_t i = 0; i < previousEntities.size(); i++)
+		{
+			previousIndices.emplace(previousEntities[i].getID(), i);
+		}
+
+		std::vector<bool> found(previousEntities.size(), false);
+		size_t nextIndex = 0;
+		bool keepsOrder = true;
+		for (const auto& entity : state.getEntities())
+		{
+			auto it = previousIndices.find(entity.getID());
+			if (it == previousIndices.end())
+			{
+				entitiesAddedOrRemoved = true;
+				movedPositions.emplace_back(entity.getPosition());
+				continue;
+			}
+
+			const auto& previous = previousEntities[it->second];
+			found[it->second] = true;
+			keepsOrder = keepsOrder && it->second >= nextIndex;
+			nextIndex = it->second + 1;
+			if (!isSameEntity(entity, previous))
+			{
+				changedEntities.emplace(entity.getID());
+				// The grid of the entity type decides which occupancy conditions see the entity
+				if (previous.getPosition() != entity.getPosition() || &previous.getEntityType() != &entity.getEntityType())
+				{
+					movedPositions.emplace_back(previous.getPosition());
+					movedPositions.emplace_back(entity.getPosition());
+				}
+				entityActions.erase(entity.getID());
+			}
+		}
+
+		for (size_t i = 0; i < previousEntities.size(); i++)
+		{
+			if (!found[i])
+			{
+				entitiesAddedOrRemoved = true;
+				changedEntities.emplace(previousEntities[i].getID());
+				movedPositions.emplace_back(previousEntities[i].getPosition());
+				entityActions.erase(previousEntities[i].getID());
+			}
+		}
+
+		return keepsOrder;
+	}
+
+	void ActionSpaceCache::update(const GameState& state, const Entity& entity, const ActionType& actionType, CachedActions& cachedActions)
+	{
+		if (!cachedActions.isValid)
+			return;
+
+		// Preconditions can read the entities on the tile of the source
+		const auto& actionDependencies = getDependencies(actionType);
+		if (actionDependencies.dependsOnAllEntities
+			|| (actionDependencies.targetsAllEntities && entitiesAddedOrRemoved)
+			|| isNearMovedPosition(entity.getPosition(), std::max(actionDependencies.entityTargetRange, 0)))
+		{
+			cachedActions.isValid = false;
+			return;
+		}
+
+		bool changed = false;
+		for (size_t i = 0; i < cachedActions.candidates.size(); i++)
+		{
+			const auto& candidate = cachedActions.candidates[i];
+			if (actionDependencies.conditionsDependOnAllEntities || isAffected(state, candidate))
+			{
+				const bool isFullfiled = actionSpace->isFullfiled(state, candidate);
+				changed = changed || isFullfiled != cachedActions.isFullfiled[i];
+				cachedActions.isFullfiled[i] = isFullfiled;
+			}
+		}
+
+		if (changed)
+		{
+			cachedActions.actions.clear();
+			for (size_t i = 0; i < cachedActions.candidates.size(); i++)
+			{
+				if (cachedActions.isFullfiled[i])
+					cachedActions.actions.emplace_back(cachedActions.candidates[i]);
+			}
+		}
+	}
+
+	void ActionSpaceCache::generateEntityActions(const GameState& state, const Entity& entity, const ActionInfo& actionInfo, int playerID, CachedActions& cachedActions) const
+	{
+		// Same steps as ActionSpace::generateEntityActions, keeping the candidates that are not fullfiled
+		cachedActions.isValid = true;
+		cachedActions.candidates.clear();
+		cachedActions.isFullfiled.clear();
+		cachedActions.actions.clear();
+
+		const auto& actionType = state.getGameInfo()->getActionType(actionInfo.actionTypeID);
+		if (actionSpace->generateAbortActions(entity, actionType, playerID, cachedActions.actions))
+			return;
+		if (!actionSpace->isReady(state, entity, actionInfo))
+			return;
+
+		if (actionType.getTargets().empty())
+		{
+			cachedActions.actions.emplace_back(actionSpace->generateSelfAction(entity, actionType));
+			return;
+		}
+
+		for (const auto& targetsProduct : actionSpace->productActionTargets(actionSpace->generateTargets(state, entity, actionType)))
+		{
+			auto action = actionSpace->createAction(entity, actionType, targetsProduct);
+			const bool isFullfiled = actionSpace->isFullfiled(state, action);
+			if (isFullfiled)
+				cachedActions.actions.emplace_back(action);
+			cachedActions.candidates.emplace_back(std::move(action));
+			cachedActions.isFullfiled.emplace_back(isFullfiled);
+		}
+	}
+
+	bool ActionSpaceCache::isAffected(const GameState& state, const Action& candidate) const
+	{
+		// Local conditions read the targets and the entities standing on the tiles of the targets
+		for (const auto& target : candidate.getTargets())
+		{
+			switch (target.getType())
+			{
+			case ActionTarget::EntityReference:
+				if (changedEntities.find(target.getEntityID()) != changedEntities.end())
+					return true;
+				if (isNearMovedPosition(state.getEntityConst(target.getEntityID())->getPosition(), 0))
+					return true;
+				break;
+			case ActionTarget::Position:
+			case ActionTarget::TileReference:
+				if (isNearMovedPosition(target.getPosition(), 0))
+					return true;
+				break;
+			default:
+				break;
+			}
+		}
+		return false;
+	}
+
+	bool ActionSpaceCache::isNearMovedPosition(const Vector2f& position, double range) const
+	{
+		const bool onGrid = isOnGrid(position);
+		return std::any_of(movedPositions.begin(), movedPositions.end(), [&](const Vector2f& moved)
+		{
+			if (onGrid && isOnGrid(moved))
+				return moved.chebyshevDistance(position) <= range;
+			return moved.chebyshevDistance(position) < range + OFF_GRID_MARGIN;
+		});
+	}
+
+	const ActionSpaceCache::Dependencies& ActionSpaceCache::getDependencies(const ActionType& actionType)
+	{
+		auto it = dependencies.find(&actionType);
+		if (it != dependencies.end())
+			return it->second;
+
+		Dependencies actionDependencies;
+		for (const auto& precondition : actionType.getPreconditions())
+		{
+			if (!isLocalCondition(*precondition))
+				actionDependencies.dependsOnAllEntities = true;
+		}
+
+		for (const auto& target : actionType.getTargets())
+		{
+			for (const auto& condition : target.second)
+			{
+				if (!isLocalCondition(*condition))
+					actionDependencies.conditionsDependOnAllEntities = true;
+			}
+
+			const auto type = target.first.getType();
+			if (type != TargetType::Entity && type != TargetType::Position && type != TargetType::Tile)
+				continue;
+
+			// Positions and tiles are sampled from the board, entities are sampled where they stand
+			const auto* samplingMethod = target.first.getSamplingMethod().get();
+			const auto* neighbours = dynamic_cast<const Neighbours*>(samplingMethod);
+			const auto* dijkstra = dynamic_cast<const Dijkstra*>(samplingMethod);
+			if (!neighbours && !dijkstra)
+			{
+				actionDependencies.dependsOnAllEntities = true;
+			}
+			else if (type == TargetType::Entity)
+			{
+				if (neighbours && neighbours->shapeType == Neighbours::ShapeType::AllPositions)
+					actionDependencies.targetsAllEntities = true;
+				else
+					actionDependencies.entityTargetRange = std::max(actionDependencies.entityTargetRange, neighbours ? neighbours->shapeSize : dijkstra->searchSize);
+			}
+		}
+
+		return dependencies.emplace(&actionType, actionDependencies).first->second;
+	}
+
+	bool ActionSpaceCache::isLocalCondition(const Condition& condition)
+	{
+		// Conditions that only read the targets, the entities standing on target positions, the players, the tiles and the global state.
+		// HasEntity, HasNoEntity, HasNoEntities and unknown conditions can read any entity.
+		static const std::unordered_set<std::type_index> localConditions = {
+			typeid(ResourceLowerEqual), typeid(ResourceGreaterEqual), typeid(HasElapsedTime), typeid(IsNeutral), typeid(IsNotNeutral),
+			typeid(HasInventoryFull), typeid(HasNotInventoryFull), typeid(SamePlayer), typeid(IsPlayerID), typeid(DifferentPlayer),
+			typeid(InRange), typeid(OutRange), typeid(IsWalkable), typeid(IsOccupied), typeid(IsOccupiedGrid), typeid(IsNotOccupied),
+			typeid(IsNotOccupiedGrid), typeid(IsTile), typeid(IsPlayerEntity), typeid(IsTickMultipleOf), typeid(IsTick), typeid(IsNotTick),
+			typeid(IsResearched), typeid(CanResearch), typeid(HasNoBuff), typeid(HasBuff), typeid(CanSpawnCondition), typeid(CanAfford),
+			typeid(CanEquipObject)
+		};
+		return localConditions.find(typeid(condition)) != localConditions.end();
+	}
+
+	bool ActionSpaceCache::isSameEntity(const Entity& entity, const Entity& other)
+	{
+		if (entity.getID() != other.getID()
+			|| &entity.getEntityType() != &other.getEntityType()
+			|| entity.getOwnerID() != other.getOwnerID()
+			|| entity.getPosition() != other.getPosition()
+			|| entity.flagged() != other.flagged()
+			|| entity.getParamValues() != other.getParamValues()
+			|| !isSameBuffs(entity.getBuffs(), other.getBuffs()))
+		{
+			return false;
+		}
+
+		for (const auto& parameter : entity.getParamValues())
+		{
+			if (entity.getMaxParameterAt(parameter.first) != other.getMaxParameterAt(parameter.first)
+				|| entity.getMinParameterAt(parameter.first) != other.getMinParameterAt(parameter.first))
+				return false;
+		}
+
+		const auto& actions = entity.getAttachedActions();
+		const auto& otherActions = other.getAttachedActions();
+		if (!std::equal(actions.begin(), actions.end(), otherActions.begin(), otherActions.end(), [](const ActionInfo& a, const ActionInfo& b)
+			{
+				return a.actionTypeID == b.actionTypeID && a.lastExecutedTick == b.lastExecutedTick;
+			}))
+		{
+			return false;
+		}
+
+		const auto& continuousActions = entity.getContinuousActions();
+		const auto& otherContinuousActions = other.getContinuousActions();
+		if (!std::equal(continuousActions.begin(), continuousActions.end(), otherContinuousActions.begin(), otherContinuousActions.end(), [](const Action& a, const Action& b)
+			{
+				return a.getActionTypeID() == b.getActionTypeID() && a.getContinuousActionID() == b.getContinuousActionID() && a.getElapsedTicks() == b.getElapsedTicks();
+			}))
+		{
+			return false;
+		}
+
+		const auto& inventory = entity.getInventory();
+		const auto& otherInventory = other.getInventory();
+		if (!std::equal(inventory.begin(), inventory.end(), otherInventory.begin(), otherInventory.end(), isSameEntity))
+			return false;
+
+		const auto slots = entity.getSlots();
+		const auto otherSlots = other.getSlots();
+		return std::equal(slots.begin(), slots.end(), otherSlots.begin(), otherSlots.end(), [](const auto& a, const auto& b)
+		{
+			return a.second == b.second && isSameEntity(a.first, b.first);
+		});
+	}
+
+	ActionSpaceCache& ActionSpaceCaches::getThreadCache()
+	{
+		std::lock_guard<std::mutex> lock(mutex);
+		auto& cache = caches[std::this_thread::get_id()];
+		if (!cache)
+			cache = std::make_unique<ActionSpaceCache>();
+		return *cache;
+	}
+
+	void ActionSpaceCaches::clear()
+	{
+		std::lock_guard<std::mutex> lock(mutex);
+		caches.clear();
+	}
+}
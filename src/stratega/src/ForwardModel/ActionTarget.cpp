@@ -122,7 +122,7 @@ namespace SGA
 		}
 		else if(targetType == EntityReference)
 		{
-			return getEntity(const_cast<GameState&>(state))->getPosition();
+			return getEntityConst(state).getPosition();
 		}
 		else
 		{
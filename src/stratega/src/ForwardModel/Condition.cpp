@@ -209,7 +209,7 @@ namespace  SGA
 	bool IsWalkable::isFullfiled(const GameState& state, const std::vector<ActionTarget>& targets) const
 	{
 		auto pos = targetPosition.getPosition(state, targets);
-		Tile t = state.getTileAtConst({ static_cast<int>(pos.x), static_cast<int>(pos.y) });
+		const auto& t = state.getTileAtConst({ static_cast<int>(pos.x), static_cast<int>(pos.y) });
 		return t.isWalkable()/* && state.getEntityAtConst(pos) == nullptr*/;
 	}
 
@@ -244,7 +244,7 @@ namespace  SGA
 		else if (gridLevel.getType() == FunctionParameter::Type::EntityTypeReference ||
 			gridLevel.getType() == FunctionParameter::Type::ArgumentReference)
 		{
-			auto type = gridLevel.getEntityType(state, targets);
+			const auto& type = gridLevel.getEntityType(state, targets);
 
 			return state.getEntitiesAtConst(pos, type.getID()).size() != 0;
 		}
@@ -284,7 +284,7 @@ namespace  SGA
 		else if (gridLevel.getType() == FunctionParameter::Type::EntityTypeReference ||
 			gridLevel.getType() == FunctionParameter::Type::ArgumentReference)
 		{
-			auto type = gridLevel.getEntityType(state, targets);
+			const auto& type = gridLevel.getEntityType(state, targets);
 
 			return state.getEntitiesAtConst(pos, type.getGrid()).size() == 0;
 		}
@@ -304,7 +304,7 @@ namespace  SGA
 		auto pos = targetPosition.getPosition(state, targets);
 		const TileType& tileType = targetTile.getTileType(state, targets);
 		//Check if target tile is same as the tile
-		Tile t = state.getTileAtConst({ static_cast<int>(pos.x), static_cast<int>(pos.y) });
+		const auto& t = state.getTileAtConst({ static_cast<int>(pos.x), static_cast<int>(pos.y) });
 		return t.getTileTypeID()==tileType.getID();
 	}
 
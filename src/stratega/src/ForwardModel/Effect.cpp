@@ -170,15 +170,15 @@ namespace SGA
 	
 	void EnqueueAction::execute(GameState& state, const ForwardModel& /*fm*/, const std::vector<ActionTarget>& targets) const
 	{
-		auto action = actionType.getActionType(state, targets);
+		const auto& action = actionType.getActionType(state, targets);
 		if (source.isPlayerReference(targets))
 		{
-			auto player = source.getPlayer(state, targets);
+			const auto& player = source.getPlayer(state, targets);
 			state.getActionQueues().addActionToPlayerQueue(ActionQueuePack::ActionSourceType::Player, player.getID(),player.getID(), action.getID());
 		}
 		else if (source.isEntityReference(targets))
 		{
-			auto entity = source.getEntity(state, targets);
+			const auto& entity = source.getEntity(state, targets);
 			state.getActionQueues().addActionToPlayerQueue(ActionQueuePack::ActionSourceType::Entity, entity.getOwnerID(), entity.getID(), action.getID());
 		}		
 	}
@@ -356,7 +356,7 @@ namespace SGA
 		pushDir = pushDir.normalized();
 		auto wallPositionCheck = target.getPosition() + pushDir;
 
-		const auto& tile = state.getTileAt(static_cast<int>(wallPositionCheck.x), static_cast<int>(wallPositionCheck.y));
+		const auto& tile = state.getTileAtConst(static_cast<int>(wallPositionCheck.x), static_cast<int>(wallPositionCheck.y));
 
 		if (!tile.isWalkable())
 		{
@@ -468,7 +468,7 @@ namespace SGA
 		auto newTargetPos = target.getPosition() + pushDir;
 		if (state.isWalkable(Vector2i{ static_cast<int>(newTargetPos.x), static_cast<int>(newTargetPos.y) }) && state.isOccupied(Vector2i{ static_cast<int>(newTargetPos.x), static_cast<int>(newTargetPos.y) }))
 		{
-			target.setPosition({ std::floor(newTargetPos.x), std::floor(newTargetPos.y) });
+			state.moveEntity(target, { std::floor(newTargetPos.x), std::floor(newTargetPos.y) });
 		}
 	}
 	
@@ -494,7 +494,7 @@ namespace SGA
 		auto* hittedEntity = state.getEntityAt(newTargetPos);
 		if (state.isInBounds(newTargetPos) && state.isWalkable(Vector2i{ static_cast<int>(newTargetPos.x), static_cast<int>(newTargetPos.y) }))
 		{
-			target.setPosition({ std::floor(newTargetPos.x), std::floor(newTargetPos.y) });
+			state.moveEntity(target, { std::floor(newTargetPos.x), std::floor(newTargetPos.y) });
 		}
 
 		//Deals damage
@@ -597,7 +597,7 @@ namespace SGA
 			auto* hittedEntity = state.getEntityAt(newTargetPos);
 			if (state.isInBounds(newTargetPos) && state.isWalkable(Vector2i{ static_cast<int>(newTargetPos.x), static_cast<int>(newTargetPos.y) }))
 			{
-				pushedEntity->setPosition({ std::floor(newTargetPos.x), std::floor(newTargetPos.y) });
+				state.moveEntity(*pushedEntity, { std::floor(newTargetPos.x), std::floor(newTargetPos.y) });
 			}
 
 			if (hittedEntity)
@@ -717,7 +717,7 @@ namespace SGA
 		
 		if (fm.getGameType() == GameType::TBS)
 		{
-			entity.setPosition( { std::floor(targetPosition.x), std::floor(targetPosition.y) } );
+			state.moveEntity(entity, { std::floor(targetPosition.x), std::floor(targetPosition.y) });
 		}
 		else if(fm.getGameType() == GameType::RTS )
 		{
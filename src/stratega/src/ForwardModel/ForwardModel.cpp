@@ -1,4 +1,5 @@
 #include <Stratega/ForwardModel/ForwardModel.h>
+#include <Stratega/Utils/ParallelFor.h>
 #pragma warning(disable: 5045)
 namespace SGA
 {
@@ -14,6 +15,18 @@ namespace SGA
 		return actionBucket;
 	}
 
+	std::vector<GameState> ForwardModel::advanceGameStates(const GameState& state, const std::vector<Action>& actions, int numThreads) const
+	{
+		// Each thread copies the states it advances, so the copies are spread over the threads too
+		std::vector<GameState> states(actions.size());
+		parallelFor(actions.size(), numThreads, [&](size_t i)
+		{
+			states[i] = state;
+			advanceGameState(states[i], actions[i]);
+		});
+		return states;
+	}
+
 	std::vector <Action> ForwardModel::generateUnitActions(const GameState& state, Entity e, int playerID, bool generateEnd) const
 	{
 		return actionSpace->generateUnitActions(state, e, playerID, generateEnd);
@@ -25,7 +38,12 @@ namespace SGA
 		{
 			actionBucket = actionSpace->generateQueueActions(state, playerID);
 		}
-		else		
+		else if (actionCacheEnabled)
+		{
+			// One cache per thread, so several threads can generate actions with the same forward model
+			actionBucket = actionCaches.getThreadCache().generateActions(actionSpace, state, playerID);
+		}
+		else
 			actionBucket = actionSpace->generateActions(state, playerID);
 	}
 	
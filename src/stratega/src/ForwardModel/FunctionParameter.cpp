@@ -2,6 +2,7 @@
 #include <Stratega/ForwardModel/ExpressionStruct.h>
 #include <Stratega/Representation/GameState.h>
 #include <boost/random.hpp>
+#include <algorithm>
 #include <Stratega/Utils/cparse/shunting-yard.h>
 
 #include <Stratega/Utils/cparse/shunting-yard.h>
@@ -108,7 +109,9 @@ namespace SGA
 	}
 	FunctionParameter::~FunctionParameter()
 	{
-
+		// The union does not know which member it holds
+		if (parameterType == Type::Expression)
+			data.expression.~ExpressionStruct();
 	}
 
 	void ExpressionStruct::addParameter(FunctionParameter parameter, std::string newVariable)
@@ -121,7 +124,65 @@ namespace SGA
 		expression = string;
 	}
 
-	std::string ExpressionStruct::getExpression(const GameState& state, const std::vector<ActionTarget>& actionTargets)
+	void ExpressionStruct::compile()
+	{
+		compiledExpression.reset();
+		compiledVariables.clear();
+
+		// Rename the longest variables first, so no variable is renamed inside a longer one
+		std::vector<std::pair<std::string, std::shared_ptr<FunctionParameter>>> variables(variable.begin(), variable.end());
+		std::sort(variables.begin(), variables.end(), [](const auto& a, const auto& b) { return a.first.size() > b.first.size(); });
+
+		std::string compiled = expression;
+		for (const auto& var : variables)
+		{
+			// getExpression only replaces these variables, the interpreter keeps the other ones as text
+			if (var.second->getType() != FunctionParameter::Type::Constant && var.second->getType() != FunctionParameter::Type::ParameterReference)
+			{
+				compiledVariables.clear();
+				return;
+			}
+
+			auto name = "__variable" + std::to_string(compiledVariables.size());
+			for (auto position = compiled.find(var.first); position != std::string::npos; position = compiled.find(var.first, position + name.size()))
+			{
+				compiled.replace(position, var.first.size(), name);
+			}
+			compiledVariables.emplace_back(name, var.second);
+		}
+
+		try
+		{
+			compiledExpression = std::make_shared<const cparse::calculator>(compiled.c_str());
+		}
+		catch (const std::exception&)
+		{
+			compiledVariables.clear();
+		}
+	}
+
+	double ExpressionStruct::evaluate(const GameState& state, const std::vector<ActionTarget>& actionTargets) const
+	{
+		if (!compiledExpression)
+			return interpret(state, actionTargets);
+
+		cparse::TokenMap variables;
+		for (const auto& var : compiledVariables)
+		{
+			variables[var.first] = var.second->getConstant(state, actionTargets);
+		}
+		return compiledExpression->eval(variables).asDouble();
+	}
+
+	double ExpressionStruct::interpret(const GameState& state, const std::vector<ActionTarget>& actionTargets) const
+	{
+		std::string expres = getExpression(state, actionTargets);
+		double value = cparse::calculator::calculate(expres.c_str()).asDouble();
+		//std::cout << "Calculate expression: " << expres << " -> " << value << std::endl;
+		return value;
+	}
+
+	std::string ExpressionStruct::getExpression(const GameState& state, const std::vector<ActionTarget>& actionTargets) const
 	{
 		std::string ex = expression;
 		for (auto& var : variable)
@@ -290,14 +351,7 @@ namespace SGA
 		switch (parameterType)
 		{
 		case Type::Constant: return data.constValue;
-		case Type::Expression:
-		{
-			ExpressionStruct test = data.expression;
-			std::string expres = test.getExpression(state, actionTargets);				
-			double value = cparse::calculator::calculate(expres.c_str()).asDouble();
-			//std::cout << "Calculate expression: " << expres << " -> " << value << std::endl;
-			return value;
-		}			
+		case Type::Expression: return data.expression.evaluate(state, actionTargets);
 		case Type::DiceAnotation: 
 		{
 			DiceAnotation test = data.diceAnotation;
@@ -322,6 +376,13 @@ namespace SGA
 		}
 	}
 
+	double FunctionParameter::interpretConstant(const GameState& state, const std::vector<ActionTarget>& actionTargets) const
+	{
+		if (parameterType == Type::Expression)
+			return data.expression.interpret(state, actionTargets);
+		return getConstant(state, actionTargets);
+	}
+
 	double FunctionParameter::getTime(const GameState& state, const std::vector<ActionTarget>& actionTargets) const
 	{
 		if (parameterType == Type::TimeReference)
@@ -359,7 +420,8 @@ namespace SGA
 			}
 			else if (actionTargets[data.parameterData.argumentIndex].getType() == ActionTarget::TileReference)
 			{
-				auto& tile = getTile(state, actionTargets);
+				// Only reads the tile, the const overload keeps a shared board shared
+				const auto& tile = getTile(static_cast<const GameState&>(state), actionTargets);
 
 				const auto& tileType = tile.getTileType();
 				const auto& param = tileType.getParameter(data.parameterData.parameterID);
@@ -531,6 +593,32 @@ namespace SGA
 
 	double FunctionParameter::getParameterValue(const GameState& state, const std::vector<ActionTarget>& actionTargets) const
 	{
+		// Read tiles and entities through the const overloads, the mutable ones would give the state its own copy of a shared board
+		// and invalidate its spatial index on every condition
+		if (parameterType == Type::ParameterReference)
+		{
+			const auto targetType = actionTargets[data.parameterData.argumentIndex].getType();
+			if (targetType == ActionTarget::TileReference)
+			{
+				const auto& param = getParameter(const_cast<GameState&>(state), actionTargets);
+				const auto& values = getTile(state, actionTargets).getParamValues();
+				auto it = values.find(param.getIndex());
+				return it == values.end() ? 0 : it->second;
+			}
+			else if (targetType == ActionTarget::EntityReference || targetType == ActionTarget::Object)
+			{
+				const auto& entity = getEntity(state, actionTargets);
+				const auto& values = entity.getParamValues();
+				auto it = values.find(entity.getEntityType().getParameter(data.parameterData.parameterID).getIndex());
+				return it == values.end() ? 0 : it->second;
+			}
+		}
+		else if (parameterType == Type::EntityPlayerParameterReference)
+		{
+			const auto& param = state.getGameInfo()->getPlayerParameterTypes().at(data.parameterData.parameterID);
+			return getPlayer(state, actionTargets).getRawParameterAt(param.getIndex());
+		}
+
 		return getRawParameterValue(const_cast<GameState&>(state), actionTargets);
 		/*if(parameterType == Type::ParameterReference)
 		{
@@ -752,7 +840,23 @@ namespace SGA
 
 	const Entity& FunctionParameter::getEntity(const GameState& state, const std::vector<ActionTarget>& actionTargets) const
 	{
-		return getEntity(const_cast<GameState&>(state), const_cast<std::vector<ActionTarget>&>(actionTargets));
+		switch (parameterType)
+		{
+		case Type::EntityPlayerReference:
+		case Type::ArgumentReference:
+		{
+			auto entityID = actionTargets[data.argumentIndex].getEntityID();
+			return *state.getEntityConst(entityID);
+		}
+		case Type::ParameterReference:
+		case Type::EntityPlayerParameterReference:
+		{
+			auto entityID = actionTargets[data.parameterData.argumentIndex].getEntityID();
+			return *state.getEntityConst(entityID);
+		}
+		default:
+			throw std::runtime_error("Parameter type " + std::to_string(int(parameterType)) + " not recognised in function parameter.");
+		}
 	}
 
 	Player& FunctionParameter::getPlayer(GameState& state, const std::vector<ActionTarget>& actionTargets) const
@@ -805,7 +909,29 @@ namespace SGA
 
 	const Player& FunctionParameter::getPlayer(const GameState& state, const std::vector<ActionTarget>& actionTargets) const
 	{
-		return getPlayer(const_cast<GameState&>(state), const_cast<std::vector<ActionTarget>&>(actionTargets));
+		switch (parameterType)
+		{
+		case Type::ParameterReference:
+		{
+			return actionTargets[data.parameterData.argumentIndex].getPlayerConst(state);
+		}
+		case Type::EntityPlayerParameterReference:
+		case Type::EntityPlayerReference:
+		{
+			const auto& entity = getEntity(state, actionTargets);
+			return *state.getPlayer(entity.getOwnerID());
+		}
+		case Type::ArgumentReference:
+		{
+			return actionTargets[data.argumentIndex].getPlayerConst(state);
+		}
+		case Type::Constant:
+		{
+			return *state.getPlayer(static_cast<int>(data.constValue));
+		}
+		default:
+			throw std::runtime_error("Parameter type " + std::to_string(int(parameterType)) + " not recognised in function parameter.");
+		}
 	}
 
 	const EntityType& FunctionParameter::getEntityType(const GameState& state, const std::vector<ActionTarget>& actionTargets) const
@@ -31,13 +31,7 @@ namespace SGA
 		executeOnAdvanceEffects(state);
 
 		//Remove flagged entities
-		auto& entities = state.getEntities();
-		auto it = entities.begin();
-		while (it != entities.end())
-		{
-			if (it->flagged())  it = entities.erase(it);
-			else 				it++;
-		}
+		state.removeFlaggedEntities();
 
 		resolveEntityCollisions(state);
 		resolveEnvironmentCollisions(state);
@@ -66,35 +60,49 @@ namespace SGA
 				// Did we reach the end of the path?
 				if (entity.getPath().m_nstraightPath >= entity.getPath().currentPathIndex)
 				{
-						entity.setPosition(targetPos);
+						state.moveEntity(entity, targetPos);
 						entity.setPath(Path());
 				}
 			}
 			else
 			{
-				entity.setPosition(entity.getPosition() + (movementDir / movementDir.magnitude()) * movementSpeed);
+				state.moveEntity(entity, entity.getPosition() + (movementDir / movementDir.magnitude()) * movementSpeed);
 			}
 		}
 	}
 
 	void RTSForwardModel::resolveEntityCollisions(GameState& state) const
 	{
-		for (auto& unit : state.getEntities())
+		auto& entities = state.getEntities();
+		if (entities.size() < 2)
+			return;
+
+		//Only affects enviroment collision if the entity can move
+		int moveActionID = state.getGameInfo()->getActionTypeID("Move");
+
+		double maxCollisionRadius = 0;
+		for (const auto& unit : entities)
 		{
+			maxCollisionRadius = std::max(maxCollisionRadius, unit.getCollisionRadius());
+		}
+
+		for (size_t i = 0; i < entities.size(); i++)
+		{
+			auto& unit = entities[i];
+			if (!unit.getEntityType().canExecuteAction(moveActionID))
+				continue;
+
+			// Broad phase, the spatial index follows the units moved before this one and returns them in the order of the entity list
+			// The margin keeps the units at exactly the collision distance despite the rounding of the query bounds
+			const auto maxDistance = unit.getCollisionRadius() + maxCollisionRadius;
 			Vector2f pushDir;
-			for (auto& otherUnit : state.getEntities())
+			for (auto otherIndex : state.getEntityIndicesAround(unit.getPosition(), maxDistance + maxDistance * 1e-9 + 1e-9))
 			{
+				const auto& otherUnit = entities[otherIndex];
 				// Units cant collide with themselves, also idle units do not push busy units
 				if (unit.getID() == otherUnit.getID() /*|| (unit.executingAction.type != RTSActionType::None && otherUnit.executingAction.type == RTSActionType::None)*/)
 					continue;
 
-				const auto& entityType = unit.getEntityType();
-
-				//Only affects enviroment collision if the entity can move
-				int moveActionID = state.getGameInfo()->getActionTypeID("Move");
-				if (!entityType.canExecuteAction(moveActionID))
-					continue;
-
 				auto dir = otherUnit.getPosition() - unit.getPosition();
 				if (dir.magnitude() <= unit.getCollisionRadius() + otherUnit.getCollisionRadius())
 				{
@@ -106,7 +114,7 @@ namespace SGA
 				}
 			}
 
-			unit.setPosition(unit.getPosition() - pushDir * deltaTime);
+			state.moveEntity(unit, unit.getPosition() - pushDir * deltaTime);
 		}
 	}
 
@@ -114,19 +122,22 @@ namespace SGA
 	{
 		static float RECT_SIZE = 1;
 
+		auto& entities = state.getEntities();
+		if (entities.empty())
+			return;
+
+		//Only affects enviroment collision if the entity can move
+		int moveActionID = state.getGameInfo()->getActionTypeID("Move");
+
 		// Collision
-		for (auto& unit : state.getEntities())
+		for (auto& unit : entities)
 		{
 			int startCheckPositionX = static_cast<int>(std::floor(unit.x() - unit.getCollisionRadius() - static_cast<double>(RECT_SIZE)));
 			int endCheckPositionX = static_cast<int>(std::ceil(unit.x() + unit.getCollisionRadius() + static_cast<double>(RECT_SIZE)));
 			int startCheckPositionY = static_cast<int>(std::floor(unit.y() - unit.getCollisionRadius() - static_cast<double>(RECT_SIZE)));
 			int endCheckPositionY = static_cast<int>(std::ceil(unit.y() + unit.getCollisionRadius() + static_cast<double>(RECT_SIZE)));
 
-			const auto& entityType = unit.getEntityType();
-			
-			//Only affects enviroment collision if the entity can move
-			int moveActionID = state.getGameInfo()->getActionTypeID("Move");
-			if (!entityType.canExecuteAction(moveActionID))
+			if (!unit.getEntityType().canExecuteAction(moveActionID))
 				continue;
 			
 			Vector2f pushDir;
@@ -156,7 +167,7 @@ namespace SGA
 				}
 			}
 
-			unit.setPosition(unit.getPosition() + pushDir);
+			state.moveEntity(unit, unit.getPosition() + pushDir);
 		}
 	}
 
@@ -520,12 +531,9 @@ namespace SGA
 		dtPolyRef startRef;
 		dtPolyRef endRef;
 
-		//Polys found in search
-		dtPolyRef m_polys[MAX_POLYS];
-		int m_npolys;
-
 		//Find nearest poly
 		std::shared_ptr<Navigation> nav = state.getRTSNavigation();
+		std::lock_guard<std::mutex> lock(nav->m_navQueryMutex);
 		nav->m_navQuery->findNearestPoly(startPosV3, nav->m_polyPickExt, &nav->m_filter, &startRef, startPosV3);
 		nav->m_navQuery->findNearestPoly(endPosV3, nav->m_polyPickExt, &nav->m_filter, &endRef, endPosV3);
 
@@ -533,16 +541,17 @@ namespace SGA
 
 		if (startRef && endRef)
 		{
-			nav->m_navQuery->findPath(startRef, endRef, startPosV3, endPosV3, &nav->m_filter, m_polys, &m_npolys, MAX_POLYS);
+			//Polys found in search
+			auto polys = nav->m_pathCache.findCorridor(*nav, startRef, endRef, startPosV3, endPosV3, pathCacheSize, flowFieldThreshold);
 			path.m_nstraightPath = 0;
-			if (m_npolys)
+			if (!polys.empty())
 			{
 				// In case of partial path, make sure the end point is clamped to the last polygon.			
 
-				if (m_polys[m_npolys - 1] != endRef)
-					nav->m_navQuery->closestPointOnPoly(m_polys[m_npolys - 1], endPosV3, endPosV3, 0);
+				if (polys.back() != endRef)
+					nav->m_navQuery->closestPointOnPoly(polys.back(), endPosV3, endPosV3, 0);
 
-				nav->m_navQuery->findStraightPath(startPosV3, endPosV3, m_polys, m_npolys,
+				nav->m_navQuery->findStraightPath(startPosV3, endPosV3, polys.data(), static_cast<int>(polys.size()),
 					path.m_straightPath, path.m_straightPathFlags,
 					path.m_straightPathPolys, &path.m_nstraightPath, MAX_POLYS, path.m_straightPathOptions);
 			}
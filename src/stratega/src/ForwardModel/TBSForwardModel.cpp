@@ -58,13 +58,7 @@ namespace SGA
 		executeOnAdvanceEffects(state);
 
 		//Remove flagged entities
-		auto& entities = state.getEntities();
-		auto it = entities.begin();
-		while (it != entities.end())
-		{
-			if (it->flagged())  it = entities.erase(it);
-			else 				it++;
-		}
+		state.removeFlaggedEntities();
 
 		//Check game is finished
 		state.setGameOver(checkGameIsFinished(state));
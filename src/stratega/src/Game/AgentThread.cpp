@@ -36,6 +36,9 @@ namespace SGA
 		state(nullptr),
 		forwardModel(nullptr),
 		gameConfig(nullptr),
+		timeBudgetMs(0),
+		hasDecision(false),
+		stopping(false),
 		computing(false),
 		joined(true),
 		resultCache()
@@ -44,45 +47,75 @@ namespace SGA
 
 	AgentThread::~AgentThread()
 	{
-		if (computing)
+		{
+			std::lock_guard<std::mutex> lock(mutex);
+			stopping = true;
+		}
+		decisionStarted.notify_one();
+
+		// The thread finishes the decision it is computing before it stops
+		if (thread.joinable())
 		{
 			thread.join();
 		}
 	}
 
-	void AgentThread::startComputing(Agent& newAgent, const GameState& newState, const ForwardModel& newForwardModel, const GameConfig& newGameConfig, long timeBudgetMs)
+	void AgentThread::startComputing(Agent& newAgent, const GameState& newState, const ForwardModel& newForwardModel, const GameConfig& newGameConfig, long newTimeBudgetMs)
 	{
-		// ToDo actually reuse the thread instead of starting a new one everytime
 		assert(!computing);
 		assert(joined);
-		computing = true;
-		joined = false;
+		{
+			std::lock_guard<std::mutex> lock(mutex);
+			computing = true;
+			joined = false;
 
-		// Setup computation
-		this->agent = &newAgent;
-		this->state = &newState;
-		this->forwardModel = &newForwardModel;
-		this->gameConfig = &newGameConfig;
-		resultCache = AgentResults{};
-		
+			// Setup computation
+			this->agent = &newAgent;
+			this->state = &newState;
+			this->forwardModel = &newForwardModel;
+			this->gameConfig = &newGameConfig;
+			this->timeBudgetMs = newTimeBudgetMs;
+			resultCache = AgentResults{};
+			hasDecision = true;
+		}
 
-		// Start thread to compute
-		thread = std::thread(&AgentThread::runAgentThread, this, timeBudgetMs);
+		// Start the thread for the first decision, later ones are handed to the waiting thread
+		if (!thread.joinable())
+		{
+			thread = std::thread(&AgentThread::runAgentThread, this);
+		}
+		else
+		{
+			decisionStarted.notify_one();
+		}
 	}
 
 	AgentResults AgentThread::join()
 	{
 		assert(!joined);
-		thread.join();
+		std::unique_lock<std::mutex> lock(mutex);
+		decisionFinished.wait(lock, [this]() { return !computing; });
 		joined = true;
 		return resultCache;
 	}
 
-	void AgentThread::runAgentThread(long timeBudgetMs)
+	void AgentThread::runAgentThread()
 	{
-		resultCache = runAgent(*this->agent, *this->state, *this->forwardModel, *this->gameConfig, timeBudgetMs);
-		computing = false;
-	}
+		std::unique_lock<std::mutex> lock(mutex);
+		while (true)
+		{
+			decisionStarted.wait(lock, [this]() { return hasDecision || stopping; });
+			if (!hasDecision)
+				return;
 
-	
-}
\ No newline at end of file
+			hasDecision = false;
+			lock.unlock();
+			auto results = runAgent(*this->agent, *this->state, *this->forwardModel, *this->gameConfig, this->timeBudgetMs);
+			lock.lock();
+
+			resultCache = std::move(results);
+			computing = false;
+			decisionFinished.notify_all();
+		}
+	}
+}
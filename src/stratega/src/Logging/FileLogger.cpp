@@ -1,21 +1,34 @@
 #include <Stratega/Logging/FileLogger.h>
 #include <iostream>
+#include <regex>
+#include <stdexcept>
 #include <yaml-cpp/emitter.h>
 
 namespace SGA
 {
-	FileLogger::FileLogger(const std::string& filePath)
-		: outputStream(filePath), loggedScalars(YAML::NodeType::Map)
+	FileLogger::FileLogger(const std::string& filePath, Format newFormat)
+		: outputStream(filePath), format(newFormat), loggedScalars(YAML::NodeType::Map)
 	{
 		// Note that we keep the file open the whole time the logger object exists
 		// Even though we only write to it in the destructor, we do this to later change to an more memory efficient implementation.
 	}
 
+	FileLogger::FileLogger()
+		: outputStream(), format(Format::Yaml), loggedScalars(YAML::NodeType::Map)
+	{
+	}
+
 	FileLogger::~FileLogger()
 	{
 		try
 		{
-			if (loggedScalars.size() == 0)
+			if (format == Format::JsonLines)
+			{
+				writeBufferedValues();
+				return;
+			}
+
+			if (loggedScalars.size() == 0 || !outputStream.is_open())
 				return;
 			
 			YAML::Emitter emitter;
@@ -29,6 +42,18 @@ namespace SGA
 
 	void FileLogger::flush()
 	{
+		// In-memory loggers keep their values until they are merged
+		if (!outputStream.is_open())
+			return;
+
+		if (format == Format::JsonLines)
+		{
+			writeBufferedValues();
+			outputStream.flush();
+			flushCount++;
+			return;
+		}
+
 		YAML::Emitter emitter;
 		emitter << loggedScalars;
 		outputStream << emitter.c_str();
@@ -37,4 +62,223 @@ namespace SGA
 
 		loggedScalars = YAML::Node(YAML::NodeType::Map);
 	}
+
+	void FileLogger::merge(const YAML::Node& values)
+	{
+		if (format == Format::JsonLines)
+		{
+			bufferNode("", values);
+			return;
+		}
+
+		mergeNodes(loggedScalars, values);
+	}
+
+	void FileLogger::bufferValue(const std::string& key, const YAML::Node& value, bool isSequence)
+	{
+		auto it = bufferedKeys.find(key);
+		if (it == bufferedKeys.end())
+		{
+			it = bufferedKeys.emplace(key, bufferedValues.size()).first;
+			bufferedValues.push_back({ key, isSequence, YAML::Node(YAML::NodeType::Sequence) });
+		}
+		else if (bufferedValues[it->second].isSequence != isSequence)
+		{
+			// Like the Yaml format, a value of a different kind overwrites the previous ones
+			auto& entry = bufferedValues[it->second];
+			bufferedValueCount -= entry.isSequence ? entry.value.size() : 1;
+			entry.isSequence = isSequence;
+			entry.value = YAML::Node(YAML::NodeType::Sequence);
+		}
+
+		auto& entry = bufferedValues[it->second];
+		if (isSequence)
+		{
+			entry.value.push_back(value);
+			bufferedValueCount++;
+		}
+		else
+		{
+			// Single values are kept as a sequence with one element, written as the element itself
+			if (entry.value.size() == 0)
+				bufferedValueCount++;
+			entry.value = YAML::Node(YAML::NodeType::Sequence);
+			entry.value.push_back(value);
+		}
+
+		if (bufferedValueCount >= maxBufferedValues)
+			writeBufferedValues();
+	}
+
+	void FileLogger::bufferNode(const std::string& key, const YAML::Node& values)
+	{
+		if (values.IsMap())
+		{
+			for (const auto& entry : values)
+			{
+				const auto childKey = entry.first.as<std::string>();
+				bufferNode(key.empty() ? childKey : key + "/" + childKey, entry.second);
+			}
+		}
+		else if (values.IsSequence())
+		{
+			for (const auto& value : values)
+			{
+				bufferValue(key, value, true);
+			}
+		}
+		else if (values.IsScalar())
+		{
+			bufferValue(key, values, false);
+		}
+	}
+
+	void FileLogger::writeBufferedValues()
+	{
+		if (bufferedValues.empty() || !outputStream.is_open())
+			return;
+
+		outputStream << "{\"flush\":" << flushCount << ",\"values\":{";
+		for (size_t i = 0; i < bufferedValues.size(); i++)
+		{
+			if (i > 0)
+				outputStream << ',';
+			const auto& entry = bufferedValues[i];
+			writeJsonString(outputStream, entry.key);
+			outputStream << ':';
+			writeJson(outputStream, entry.isSequence ? entry.value : entry.value[0]);
+		}
+		outputStream << "}}\n";
+
+		bufferedValues.clear();
+		bufferedKeys.clear();
+		bufferedValueCount = 0;
+	}
+
+	void FileLogger::writeJson(std::ostream& stream, const YAML::Node& node)
+	{
+		if (node.IsSequence())
+		{
+			stream << '[';
+			for (size_t i = 0; i < node.size(); i++)
+			{
+				if (i > 0)
+					stream << ',';
+				writeJson(stream, node[i]);
+			}
+			stream << ']';
+		}
+		else if (node.IsMap())
+		{
+			stream << '{';
+			bool first = true;
+			for (const auto& entry : node)
+			{
+				if (!first)
+					stream << ',';
+				first = false;
+				writeJsonString(stream, entry.first.as<std::string>());
+				stream << ':';
+				writeJson(stream, entry.second);
+			}
+			stream << '}';
+		}
+		else if (node.IsScalar())
+		{
+			// Values are stored as text, the ones that are valid JSON numbers are written as numbers
+			static const std::regex number(R"(-?(0|[1-9][0-9]*)(\.[0-9]+)?([eE][+-]?[0-9]+)?)");
+			const auto& text = node.Scalar();
+			if (std::regex_match(text, number))
+				stream << text;
+			else
+				writeJsonString(stream, text);
+		}
+		else
+		{
+			stream << "null";
+		}
+	}
+
+	void FileLogger::writeJsonString(std::ostream& stream, const std::string& string)
+	{
+		static const char* hexDigits = "0123456789abcdef";
+		stream << '"';
+		for (const auto c : string)
+		{
+			switch (c)
+			{
+				case '"': stream << "\\\""; break;
+				case '\\': stream << "\\\\"; break;
+				case '\n': stream << "\\n"; break;
+				case '\r': stream << "\\r"; break;
+				case '\t': stream << "\\t"; break;
+				default:
+					if (static_cast<unsigned char>(c) < 0x20)
+						stream << "\\u00" << hexDigits[(c >> 4) & 0xF] << hexDigits[c & 0xF];
+					else
+						stream << c;
+			}
+		}
+		stream << '"';
+	}
+
+	void FileLogger::convertJsonLinesToYaml(const std::string& jsonLinesPath, const std::string& yamlPath)
+	{
+		std::ifstream input(jsonLinesPath);
+		if (!input.is_open())
+			throw std::runtime_error("Could not open the log " + jsonLinesPath);
+
+		FileLogger output(yamlPath);
+		bool hasFlush = false;
+		size_t currentFlush = 0;
+		std::string line;
+		while (std::getline(input, line))
+		{
+			if (line.empty())
+				continue;
+
+			const auto entry = YAML::Load(line);
+			const auto lineFlush = entry["flush"].as<size_t>();
+			if (hasFlush && lineFlush != currentFlush)
+				output.flush();
+			hasFlush = true;
+			currentFlush = lineFlush;
+
+			for (const auto& value : entry["values"])
+			{
+				const auto key = value.first.as<std::string>();
+				if (value.second.IsSequence())
+				{
+					// An empty sequence is never written, each line appends at least one value
+					for (const auto& element : value.second)
+					{
+						output.logValue(key, element.as<std::string>());
+					}
+				}
+				else
+				{
+					output.logSingleValue(key, value.second.as<std::string>());
+				}
+			}
+		}
+
+		if (hasFlush)
+			output.flush();
+	}
+
+	void FileLogger::mergeNodes(YAML::Node target, const YAML::Node& source)
+	{
+		for (const auto& entry : source)
+		{
+			const auto key = entry.first.as<std::string>();
+			if (entry.second.IsMap() && target[key] && target[key].IsMap())
+			{
+				mergeNodes(target[key], entry.second);
+			}
+			else
+			{
+				target[key] = entry.second;
+			}
+		}
+	}
 }
\ No newline at end of file
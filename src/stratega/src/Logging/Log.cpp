@@ -4,7 +4,8 @@
 namespace SGA
 {
 	std::unique_ptr<SGA::FileLogger> defaultLogger;
-	std::vector<SGA::LoggingScope*> loggingScopes;
+	thread_local std::vector<SGA::LoggingScope*> loggingScopes;
+	thread_local SGA::FileLogger* threadLogger = nullptr;
 	std::mutex loggingMutex;
 
 	SGA::FileLogger& getDefaultLogger()
@@ -20,6 +21,14 @@ namespace SGA
 		defaultLogger = std::move(logger);
 	}
 
+	SGA::FileLogger& getThreadLogger()
+	{
+		if (threadLogger != nullptr)
+			return *threadLogger;
+
+		return getDefaultLogger();
+	}
+
 	std::string getLoggingScopeKey(const std::string& lastKey)
 	{
 		std::string key;
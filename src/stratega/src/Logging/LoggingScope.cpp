@@ -13,4 +13,15 @@ namespace SGA
 	{
 		SGA::loggingScopes.pop_back();
 	}
+
+	ThreadLoggerScope::ThreadLoggerScope(FileLogger& logger)
+		: previousLogger(SGA::threadLogger)
+	{
+		SGA::threadLogger = &logger;
+	}
+
+	ThreadLoggerScope::~ThreadLoggerScope()
+	{
+		SGA::threadLogger = previousLogger;
+	}
 }
\ No newline at end of file
@@ -28,11 +28,13 @@ namespace SGA
 
 		// Set parameter values
 		lineOfSightRange = type->getLoSRange();
+		auto& maxValues = maxParameters.getMutable();
+		auto& minValues = minParameters.getMutable();
 		for (const auto& idParamPair : type->getParameters())
 		{
 			parameters[idParamPair.second.getIndex()]=idParamPair.second.getDefaultValue();
-			maxParameters[idParamPair.second.getIndex()]=idParamPair.second.getMaxValue();
-			minParameters[idParamPair.second.getIndex()]=idParamPair.second.getMinValue();
+			maxValues[idParamPair.second.getIndex()]=idParamPair.second.getMaxValue();
+			minValues[idParamPair.second.getIndex()]=idParamPair.second.getMinValue();
 		}		
 	}
 
@@ -153,6 +155,7 @@ namespace SGA
 
 	void Entity::recomputeStats()
 	{
+		auto& maxValues = maxParameters.getMutable();
 		//Remove buffs applied but keep value clamped to min and max
 		for (size_t i = 0; i < parameters.size(); i++)
 		{
@@ -161,7 +164,7 @@ namespace SGA
 			double minParameter = param.getMinValue();
 
 			//Update the max value
-			maxParameters[static_cast<int>(i)] = maxParameter;
+			maxValues[static_cast<int>(i)] = maxParameter;
 
 			//Keep parameter inside max and min
 			if (parameters[static_cast<int>(i)] > maxParameter)
@@ -198,7 +201,7 @@ namespace SGA
 			//Write new value with the different of the max parameters
 			parameters[static_cast<int>(i)] += maxParameter - previousMaxParameter;
 			//Update the max value
-			maxParameters[static_cast<int>(i)] = maxParameter;
+			maxValues[static_cast<int>(i)] = maxParameter;
 		}
 	}
 	int Entity::getInventorySize() const
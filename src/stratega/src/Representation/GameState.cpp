@@ -37,7 +37,7 @@ namespace SGA
 		tickLimit(-1),
 		gameType(GameType::TBS),
 		fogOfWarTile(nullptr, 0, 0),
-		board(0, 0, fogOfWarTile),
+		board(Grid2D<Tile>(0, 0, fogOfWarTile)),
 		fogOfWarId(-1),
 		currentPlayer(0),
 		fogOfWarApplied(false)
@@ -194,6 +194,7 @@ namespace SGA
 		}
 
 		entities.emplace_back(std::move(instance));
+		spatialIndex.add(entities.size() - 1, position);
 
 		return instance.getID();
 	}
@@ -203,29 +204,67 @@ namespace SGA
 		instance.setOwnerID(playerID);
 		instance.setPosition(position);
 		entities.emplace_back(std::move(instance));
+		spatialIndex.add(entities.size() - 1, position);
 		nextEntityID++;
 
 		return instance.getID();
 	}
 
+	void GameState::removeFlaggedEntities()
+	{
+		auto it = entities.begin();
+		while (it != entities.end())
+		{
+			if (it->flagged())  it = entities.erase(it);
+			else 				it++;
+		}
+		spatialIndex.invalidate();
+	}
+
+	void GameState::moveEntity(Entity& entity, const Vector2f& position)
+	{
+		entity.setPosition(position);
+
+		// Objects in inventories are not part of the entity list and not indexed
+		if (!entities.empty() && &entity >= entities.data() && &entity < entities.data() + entities.size())
+			spatialIndex.move(static_cast<size_t>(&entity - entities.data()), position);
+	}
+
+	const SpatialIndex& GameState::getSpatialIndex() const
+	{
+		if (!spatialIndex.isValid(entities.size()))
+			spatialIndex.build(entities, getBoardWidth(), getBoardHeight());
+
+		return spatialIndex;
+	}
+
+	std::vector<size_t> GameState::getEntityIndicesAround(const Vector2f& pos, double maxDistance) const
+	{
+		return getSpatialIndex().candidatesAround(pos, std::max(0.0, maxDistance));
+	}
+
 	Entity* GameState::getEntityAround(Vector2f pos, float maxDistance)
 	{
-		for (auto& entity : entities)
+		Entity* found = nullptr;
+		for (auto i : getSpatialIndex().candidatesAround(pos, std::max(0.0f, maxDistance)))
 		{
-			if (entity.getPosition() == pos)
-				return &entity;
-			else if (maxDistance > 0.0 && (entity.getPosition().distance(pos) <= maxDistance))
-				return &entity;
+			auto& entity = entities[i];
+			if (entity.getPosition() == pos || (maxDistance > 0.0 && (entity.getPosition().distance(pos) <= maxDistance)))
+			{
+				found = &entity;
+				break;
+			}
 		}
 
-		return nullptr;
+		return found;
 	}
 
 	std::vector<Entity*> GameState::getEntitiesAround(Vector2f pos, float maxDistance)
 	{
 		std::vector<Entity*> newEntities;
-		for (auto& entity : entities)
+		for (auto i : getSpatialIndex().candidatesAround(pos, std::max(0.0f, maxDistance)))
 		{
+			auto& entity = entities[i];
 			if (entity.getPosition() == pos)
 				newEntities.emplace_back(&entity);
 			else if (maxDistance > 0.0 && (entity.getPosition().distance(pos) <= maxDistance))
@@ -237,8 +276,9 @@ namespace SGA
 	std::vector<const Entity*> GameState::getEntitiesAroundConst(Vector2f pos, float maxDistance) const
 	{
 		std::vector<const Entity*> newEntities;
-		for (const Entity& entity : entities)
+		for (auto i : getSpatialIndex().candidatesAround(pos, std::max(0.0f, maxDistance)))
 		{
+			const auto& entity = entities[i];
 			if (entity.getPosition() == pos)
 				newEntities.emplace_back(&entity);
 			else if (maxDistance > 0.0 && (entity.getPosition().distance(pos) <= maxDistance))
@@ -250,8 +290,9 @@ namespace SGA
 	std::vector<Entity*> GameState::getEntitiesAround(Vector2f pos, int gridLevel, float maxDistance)
 	{
 		std::vector<Entity*> newEntities;
-		for (auto& entity : entities)
+		for (auto i : getSpatialIndex().candidatesAround(pos, std::max(0.0f, maxDistance)))
 		{
+			auto& entity = entities[i];
 			if(entity.getEntityType().getGrid()==gridLevel)
 				if (entity.getPosition() == pos)
 					newEntities.emplace_back(&entity);
@@ -264,8 +305,9 @@ namespace SGA
 	std::vector<const Entity*> GameState::getEntitiesAroundConst(Vector2f pos, int gridLevel, float maxDistance) const
 	{
 		std::vector<const Entity*> newEntities;
-		for (const Entity& entity : entities)
+		for (auto i : getSpatialIndex().candidatesAround(pos, std::max(0.0f, maxDistance)))
 		{
+			const auto& entity = entities[i];
 			if (entity.getEntityType().getGrid() == gridLevel)
 				if (entity.getPosition() == pos)
 					newEntities.emplace_back(&entity);
@@ -277,8 +319,9 @@ namespace SGA
 
 	const Entity* GameState::getEntityAroundConst(const Vector2f& pos, float maxDistance) const
 	{
-		for (auto& entity : entities)
+		for (auto i : getSpatialIndex().candidatesAround(pos, std::max(0.0f, maxDistance)))
 		{
+			const auto& entity = entities[i];
 			if (entity.getPosition() == pos)
 				return &entity;
 			else if (maxDistance > 0.0 && (entity.getPosition().distance(pos) <= maxDistance))
@@ -432,16 +475,16 @@ namespace SGA
 
 	void GameState::applyFogOfWar(int playerID)
 	{
-		Grid2D<bool> visibilityMap(board.getWidth(), board.getHeight());
+		Grid2D<bool> visibilityMap(board->getWidth(), board->getHeight());
 		for (auto entity : entities)
 		{
 			if (entity.getOwnerID() == playerID)
 			{
 				// Compute maximum sized rectangle around entity
 				auto leftX = std::max<int>(0, static_cast<int>(entity.x() - entity.getLineOfSightRange()));
-				auto rightX = std::min<int>(static_cast<int>(board.getWidth() - 1), static_cast<int>(entity.x() + entity.getLineOfSightRange()));
+				auto rightX = std::min<int>(static_cast<int>(board->getWidth() - 1), static_cast<int>(entity.x() + entity.getLineOfSightRange()));
 				auto leftY = std::max<int>(0, static_cast<int>(entity.y() - entity.getLineOfSightRange()));
-				auto rightY = std::min<int>(static_cast<int>(board.getHeight() - 1), static_cast<int>(entity.y() + entity.getLineOfSightRange()));
+				auto rightY = std::min<int>(static_cast<int>(board->getHeight() - 1), static_cast<int>(entity.y() + entity.getLineOfSightRange()));
 
 				// Helper method for shadowcasting
 				auto rayCallback = [&](const Vector2i& pos) -> bool
@@ -452,7 +495,7 @@ namespace SGA
 					}
 
 					visibilityMap[pos] = true;
-					return board[pos].blocksSight();
+					return (*board)[pos].blocksSight();
 				};
 
 				// Shadowcasting
@@ -476,7 +519,7 @@ namespace SGA
 		auto it = entities.begin();
 		while (it != entities.end())
 		{
-			if (!board.isInBounds(static_cast<int>(it->x()), static_cast<int>(it->y())) ||
+			if (!board->isInBounds(static_cast<int>(it->x()), static_cast<int>(it->y())) ||
 				!visibilityMap.get(static_cast<int>(it->x()), static_cast<int>(it->y())))
 			{
 				it = entities.erase(it);
@@ -486,15 +529,17 @@ namespace SGA
 				++it;
 			}
 		}
+		spatialIndex.invalidate();
 
 		// Hide tiles that are not visible
-		for (int y = 0; y < static_cast<int>(board.getHeight()); y++)
+		auto& tiles = board.getMutable();
+		for (int y = 0; y < static_cast<int>(tiles.getHeight()); y++)
 		{
-			for (int x = 0; x < static_cast<int>(board.getWidth()); x++)
+			for (int x = 0; x < static_cast<int>(tiles.getWidth()); x++)
 			{
 				if (!visibilityMap.get(x, y))
 				{
-					auto& tile = board.get(x, y);
+					auto& tile = tiles.get(x, y);
 					tile = fogOfWarTile;
 					tile.setPosition(x, y);
 				}
@@ -563,8 +608,9 @@ namespace SGA
 	std::vector<const Entity*> GameState::getEntitiesAtConst(Vector2f pos) const
 	{
 		std::vector<const Entity*> newEntities;
-		for (const auto& entity : entities)
+		for (auto i : getSpatialIndex().candidatesAt(pos))
 		{
+			const auto& entity = entities[i];
 			if (static_cast<int>(pos.x) == static_cast<int>(entity.x()) && static_cast<int>(pos.y) == static_cast<int>(entity.y()))
 			{
 				newEntities.emplace_back(&entity);
@@ -575,8 +621,9 @@ namespace SGA
 
 	const Entity* GameState::getEntityAtConst(const Vector2f& pos) const
 	{
-		for (const auto& entity : entities)
+		for (auto i : getSpatialIndex().candidatesAt(pos))
 		{
+			const auto& entity = entities[i];
 			if (static_cast<int>(pos.x) == static_cast<int>(entity.x()) && static_cast<int>(pos.y) == static_cast<int>(entity.y()))
 			{
 				return &entity;
@@ -588,22 +635,26 @@ namespace SGA
 
 	Entity* GameState::getEntityAt(const Vector2f& pos)
 	{
-		for (auto& entity : entities)
+		Entity* found = nullptr;
+		for (auto i : getSpatialIndex().candidatesAt(pos))
 		{
+			auto& entity = entities[i];
 			if (static_cast<int>(pos.x) == static_cast<int>(entity.x()) && static_cast<int>(pos.y) == static_cast<int>(entity.y()))
 			{
-				return &entity;
+				found = &entity;
+				break;
 			}
 		}
 
-		return nullptr;
+		return found;
 	}
 
 	std::vector<const Entity*> GameState::getEntitiesAtConst(Vector2f pos, int gridLevel) const
 	{
 		std::vector<const Entity*> newEntities;
-		for (const auto& entity : entities)
+		for (auto i : getSpatialIndex().candidatesAt(pos))
 		{
+			const auto& entity = entities[i];
 			if(entity.getEntityType().getGrid()==gridLevel)
 				if (static_cast<int>(pos.x) == static_cast<int>(entity.x()) && static_cast<int>(pos.y) == static_cast<int>(entity.y()))
 				{
@@ -616,8 +667,9 @@ namespace SGA
 	std::vector<Entity*> GameState::getEntitiesAt(Vector2f pos, int gridLevel)
 	{
 		std::vector<Entity*> newEntities;
-		for (auto& entity : entities)
+		for (auto i : getSpatialIndex().candidatesAt(pos))
 		{
+			auto& entity = entities[i];
 			if (entity.getEntityType().getGrid() == gridLevel)
 				if (static_cast<int>(pos.x) == static_cast<int>(entity.x()) && static_cast<int>(pos.y) == static_cast<int>(entity.y()))
 				{
@@ -655,7 +707,7 @@ namespace SGA
 	bool GameState::isResearched(int playerID, int technologyID) const
 	{
 		//Search if the technology is found in the list of researchedtechnologies
-		const auto& researchedPairList = researchedTechnologies.find(playerID);
+		const auto& researchedPairList = researchedTechnologies->find(playerID);
 
 		for (auto& element : researchedPairList->second)
 		{
@@ -668,7 +720,7 @@ namespace SGA
 	void GameState::researchTechnology(int playerID, int technologyID)
 	{
 		//Get researched technologies of player
-		const auto& researchedPairList = researchedTechnologies.find(playerID);
+		auto researchedPairList = researchedTechnologies.getMutable().find(playerID);
 
 		//Find technology index and add it to the researched list			
 		researchedPairList->second.emplace_back(technologyID);
@@ -676,16 +728,17 @@ namespace SGA
 
 	void GameState::initResearchTechs()
 	{
+		auto& technologies = researchedTechnologies.getMutable();
 		for (int i = 0; i < static_cast<int>(players.size()); ++i)
-			researchedTechnologies[i] = {};
+			technologies[i] = {};
 	}
 
 
 	/* BOARD */
 
-	bool GameState::isWalkable(const Vector2i& position)
+	bool GameState::isWalkable(const Vector2i& position) const
 	{
-		Tile& targetTile = board.get(position.x, position.y);
+		const Tile& targetTile = board->get(position.x, position.y);
 		//Entity* targetUnit = getEntityAround(Vector2f(position));
 
 		return /*targetUnit == nullptr &&*/ targetTile.isWalkable();
@@ -704,12 +757,12 @@ namespace SGA
 
 	bool GameState::isInBounds(const Vector2i& pos) const
 	{
-		return pos.x >= 0 && pos.x < static_cast<int>(board.getWidth()) && pos.y >= 0 && pos.y < static_cast<int>(board.getHeight());
+		return pos.x >= 0 && pos.x < static_cast<int>(board->getWidth()) && pos.y >= 0 && pos.y < static_cast<int>(board->getHeight());
 	}
 
 	bool GameState::isInBounds(const Vector2f& pos) const
 	{
-		return pos.x >= 0 && pos.x < static_cast<double>(board.getWidth()) && pos.y >= 0 && pos.y < static_cast<double>(board.getHeight());
+		return pos.x >= 0 && pos.x < static_cast<double>(board->getWidth()) && pos.y >= 0 && pos.y < static_cast<double>(board->getHeight());
 	}
 
 	void GameState::initBoard(int boardWidth, std::vector<Tile>& tiles)
@@ -721,7 +774,7 @@ namespace SGA
 	const Tile& GameState::getTileAtConst(const Vector2i& pos) const
 	{
 		if (isInBounds(pos))
-			return board[pos];
+			return (*board)[pos];
 		throw std::runtime_error("Access to board out of bounds: " + std::to_string(pos.x) + "," + std::to_string(pos.y));
 	}
 
@@ -733,7 +786,7 @@ namespace SGA
 	Tile& GameState::getTileAt(const Vector2i& pos)
 	{
 		if (isInBounds(pos))
-			return board[pos];
+			return board.getMutable()[pos];
 		throw std::runtime_error("Access to board out of bounds: " + std::to_string(pos.x) + "," + std::to_string(pos.y));
 	}
 
@@ -764,12 +817,12 @@ namespace SGA
 		std::string map;
 		std::cout << "---------[Board]---------" << std::endl;
 		//Add tiles
-		for (size_t y = 0; y < board.getHeight(); ++y)
+		for (size_t y = 0; y < board->getHeight(); ++y)
 		{
-			for (size_t x = 0; x < board.getWidth(); ++x)
+			for (size_t x = 0; x < board->getWidth(); ++x)
 			{
 				//Get tile type
-				map += gameInfo->getTileType(board.get(static_cast<int>(x), static_cast<int>(y)).getTileTypeID()).getSymbol();
+				map += gameInfo->getTileType(board->get(static_cast<int>(x), static_cast<int>(y)).getTileTypeID()).getSymbol();
 				map += "  ";
 			}
 			map += "\n";
@@ -781,7 +834,7 @@ namespace SGA
 			auto& pos = entity.getPosition();
 			const char symbol = gameInfo->getEntityType(entity.getEntityTypeID()).getSymbol();
 			const char ownerID = std::to_string(entity.getOwnerID())[0];
-			const int entityMapIndex = static_cast<int>((pos.y * static_cast<double>(board.getWidth()) + pos.x) * 3 + pos.y);
+			const int entityMapIndex = static_cast<int>((pos.y * static_cast<double>(board->getWidth()) + pos.x) * 3 + pos.y);
 
 			map[entityMapIndex] = symbol;
 
@@ -0,0 +1,190 @@
+#include <Stratega/Representation/PathCache.h>
+#include <Stratega/Representation/Navigation.h>
+#include "DetourNavMeshQuery.h"
+
+#include <cmath>
+#include <functional>
+#include <queue>
+
+namespace SGA
+{
+	size_t PathCache::CellPairHash::operator()(const CellPair& key) const
+	{
+		std::hash<Vector2i> hash;
+		return hash(key.start) * 31 + hash(key.goal);
+	}
+
+	std::vector<dtPolyRef> PathCache::findCorridor(Navigation& navigation, dtPolyRef startRef, dtPolyRef endRef, const float* startPos, const float* endPos, size_t capacity, int flowFieldThreshold)
+	{
+		std::vector<dtPolyRef> corridor;
+		if (flowFieldThreshold > 0)
+		{
+			if (followFlowField(startRef, endRef, corridor))
+			{
+				hits++;
+				return corridor;
+			}
+
+			const auto goal = cellOf(endPos);
+			if (++goalQueries[goal] >= flowFieldThreshold)
+			{
+				goalQueries.erase(goal);
+				if (flowFields.size() >= MAX_FLOW_FIELDS)
+					flowFields.pop_front();
+				flowFields.emplace_back(buildFlowField(navigation, endRef));
+
+				if (followFlowField(startRef, endRef, corridor))
+				{
+					misses++;
+					return corridor;
+				}
+			}
+		}
+
+		const CellPair key{ cellOf(startPos), cellOf(endPos) };
+		if (capacity > 0)
+		{
+			auto it = corridorByCells.find(key);
+			// A cell can overlap several polygons, the corridor is only reused between the same ones
+			if (it != corridorByCells.end() && it->second->startRef == startRef && it->second->endRef == endRef)
+			{
+				corridors.splice(corridors.begin(), corridors, it->second);
+				hits++;
+				return it->second->polys;
+			}
+		}
+
+		misses++;
+		corridor = searchCorridor(navigation, startRef, endRef, startPos, endPos);
+		if (capacity > 0 && !corridor.empty())
+			insert(key, startRef, endRef, corridor, capacity);
+
+		return corridor;
+	}
+
+	void PathCache::clear()
+	{
+		corridors.clear();
+		corridorByCells.clear();
+		goalQueries.clear();
+		flowFields.clear();
+	}
+
+	Vector2i PathCache::cellOf(const float* pos)
+	{
+		// Navmesh positions store the board position in x and z
+		return { static_cast<int>(std::floor(pos[0])), static_cast<int>(std::floor(pos[2])) };
+	}
+
+	std::vector<dtPolyRef> PathCache::searchCorridor(Navigation& navigation, dtPolyRef startRef, dtPolyRef endRef, const float* startPos, const float* endPos)
+	{
+		dtPolyRef polys[MAX_POLYS];
+		int polyCount = 0;
+		navigation.m_navQuery->findPath(startRef, endRef, startPos, endPos, &navigation.m_filter, polys, &polyCount, MAX_POLYS);
+		return std::vector<dtPolyRef>(polys, polys + polyCount);
+	}
+
+	PathCache::FlowField PathCache::buildFlowField(const Navigation& navigation, dtPolyRef goalRef)
+	{
+		FlowField flowField;
+		flowField.goalRef = goalRef;
+
+		const auto& navMesh = *navigation.m_navMesh;
+		auto center = [&](dtPolyRef ref, float* result)
+		{
+			const dtMeshTile* tile = nullptr;
+			const dtPoly* poly = nullptr;
+			navMesh.getTileAndPolyByRef(ref, &tile, &poly);
+			dtCalcPolyCenter(result, poly->verts, static_cast<int>(poly->vertCount), tile->verts);
+		};
+
+		// Dijkstra from the goal over the polygon graph, the distance between polygons is the distance between their centers
+		using Node = std::pair<float, dtPolyRef>;
+		std::priority_queue<Node, std::vector<Node>, std::greater<Node>> open;
+		std::unordered_map<dtPolyRef, float> costs;
+		costs[goalRef] = 0;
+		open.emplace(0.f, goalRef);
+		while (!open.empty())
+		{
+			const auto current = open.top();
+			open.pop();
+			if (current.first > costs[current.second])
+				continue;
+
+			const dtMeshTile* tile = nullptr;
+			const dtPoly* poly = nullptr;
+			navMesh.getTileAndPolyByRef(current.second, &tile, &poly);
+			float currentCenter[3];
+			center(current.second, currentCenter);
+
+			for (unsigned int i = poly->firstLink; i != DT_NULL_LINK; i = tile->links[i].next)
+			{
+				const auto neighbourRef = tile->links[i].ref;
+				if (!neighbourRef)
+					continue;
+
+				const dtMeshTile* neighbourTile = nullptr;
+				const dtPoly* neighbourPoly = nullptr;
+				navMesh.getTileAndPolyByRef(neighbourRef, &neighbourTile, &neighbourPoly);
+				if (!navigation.m_filter.passFilter(neighbourRef, neighbourTile, neighbourPoly))
+					continue;
+
+				float neighbourCenter[3];
+				center(neighbourRef, neighbourCenter);
+				const auto cost = current.first + dtVdist(currentCenter, neighbourCenter) * navigation.m_filter.getAreaCost(neighbourPoly->getArea());
+				auto it = costs.find(neighbourRef);
+				if (it == costs.end() || cost < it->second)
+				{
+					costs[neighbourRef] = cost;
+					flowField.next[neighbourRef] = current.second;
+					open.emplace(cost, neighbourRef);
+				}
+			}
+		}
+
+		return flowField;
+	}
+
+	bool PathCache::followFlowField(dtPolyRef startRef, dtPolyRef endRef, std::vector<dtPolyRef>& corridor) const
+	{
+		for (const auto& flowField : flowFields)
+		{
+			if (flowField.goalRef != endRef)
+				continue;
+
+			corridor.clear();
+			auto ref = startRef;
+			corridor.emplace_back(ref);
+			// Corridors are as long as the ones of the navigation query, longer ones end before the goal
+			while (ref != endRef && corridor.size() < static_cast<size_t>(MAX_POLYS))
+			{
+				auto it = flowField.next.find(ref);
+				if (it == flowField.next.end())
+					return false;
+
+				ref = it->second;
+				corridor.emplace_back(ref);
+			}
+			return true;
+		}
+		return false;
+	}
+
+	void PathCache::insert(const CellPair& key, dtPolyRef startRef, dtPolyRef endRef, std::vector<dtPolyRef> polys, size_t capacity)
+	{
+		auto it = corridorByCells.find(key);
+		if (it != corridorByCells.end())
+		{
+			corridors.erase(it->second);
+			corridorByCells.erase(it);
+		}
+
+		corridors.push_front({ key, startRef, endRef, std::move(polys) });
+		corridorByCells.emplace(key, corridors.begin());
+		while (corridors.size() > capacity)
+		{
+			corridorByCells.erase(corridors.back().key);
+			corridors.pop_back();
+		}
+	}
+}
@@ -0,0 +1,164 @@
+#include <Stratega/Representation/SpatialIndex.h>
+#include <Stratega/Representation/Entity.h>
+
+#include <algorithm>
+
+namespace SGA
+{
+	void SpatialIndex::build(const std::vector<Entity>& entities, int boardWidth, int boardHeight)
+	{
+		// Copies still use the shared buckets, the unshared ones are refilled in place
+		if (buckets.isShared())
+			buckets = CopyOnWrite<Buckets>(Buckets());
+
+		auto& data = buckets.getMutable();
+		data.width = boardWidth;
+		data.height = boardHeight;
+		data.firstOfCell.assign(static_cast<size_t>(data.outsideCell()) + 1, NONE);
+		data.next.clear();
+		data.previous.clear();
+		data.cellOfEntity.clear();
+		data.next.reserve(entities.size());
+		data.previous.reserve(entities.size());
+		data.cellOfEntity.reserve(entities.size());
+
+		valid = true;
+		for (size_t i = 0; i < entities.size(); i++)
+		{
+			add(i, entities[i].getPosition());
+		}
+	}
+
+	void SpatialIndex::add(size_t entityIndex, const Vector2f& position)
+	{
+		if (!valid || entityIndex != buckets->cellOfEntity.size())
+		{
+			valid = false;
+			return;
+		}
+
+		const auto cell = cellOf(position);
+		auto& data = buckets.getMutable();
+		data.next.emplace_back(NONE);
+		data.previous.emplace_back(NONE);
+		data.cellOfEntity.emplace_back(cell);
+		data.link(entityIndex, cell);
+	}
+
+	void SpatialIndex::move(size_t entityIndex, const Vector2f& position)
+	{
+		if (!valid || entityIndex >= buckets->cellOfEntity.size())
+			return;
+
+		const auto cell = cellOf(position);
+		if (cell == buckets->cellOfEntity[entityIndex])
+			return;
+
+		auto& data = buckets.getMutable();
+		data.unlink(entityIndex);
+		data.cellOfEntity[entityIndex] = cell;
+		data.link(entityIndex, cell);
+	}
+
+	std::vector<size_t> SpatialIndex::candidatesAt(const Vector2f& pos) const
+	{
+		// Same truncation as the position comparison of the queries, also for positions in (-1, 0)
+		std::vector<size_t> candidates;
+		const auto& data = *buckets;
+		const auto x = static_cast<int>(pos.x);
+		const auto y = static_cast<int>(pos.y);
+		if (x >= 0 && y >= 0 && x < data.width && y < data.height)
+			data.appendCell(y * data.width + x, candidates);
+		data.appendCell(data.outsideCell(), candidates);
+		std::sort(candidates.begin(), candidates.end());
+		return candidates;
+	}
+
+	std::vector<size_t> SpatialIndex::candidatesAround(const Vector2f& pos, double maxDistance) const
+	{
+		// The integer part is monotonic, so every position within the square lies in the cells between its corners
+		std::vector<size_t> candidates;
+		const auto& data = *buckets;
+		const auto left = pos.x - maxDistance;
+		const auto top = pos.y - maxDistance;
+		const auto right = pos.x + maxDistance;
+		const auto bottom = pos.y + maxDistance;
+		if (right >= 0 && bottom >= 0 && left < data.width && top < data.height)
+		{
+			const auto minX = left < 0 ? 0 : static_cast<int>(left);
+			const auto minY = top < 0 ? 0 : static_cast<int>(top);
+			const auto maxX = static_cast<int>(std::min(static_cast<double>(data.width - 1), right));
+			const auto maxY = static_cast<int>(std::min(static_cast<double>(data.height - 1), bottom));
+			collect(minX, minY, maxX, maxY, candidates);
+		}
+		data.appendCell(data.outsideCell(), candidates);
+		std::sort(candidates.begin(), candidates.end());
+		return candidates;
+	}
+
+	int SpatialIndex::cellOf(const Vector2f& pos) const
+	{
+		const auto& data = *buckets;
+		const auto x = static_cast<int>(pos.x);
+		const auto y = static_cast<int>(pos.y);
+		// Positions in (-1, 0) truncate to 0, keep them outside like every other position left of the board
+		if (pos.x < 0 || pos.y < 0 || x >= data.width || y >= data.height)
+			return data.outsideCell();
+
+		return y * data.width + x;
+	}
+
+	void SpatialIndex::collect(int minX, int minY, int maxX, int maxY, std::vector<size_t>& candidates) const
+	{
+		// A large square touches more cells than there are entities, scanning all entities is cheaper then
+		const auto& data = *buckets;
+		const auto area = static_cast<size_t>(maxX - minX + 1) * static_cast<size_t>(maxY - minY + 1);
+		if (area > data.cellOfEntity.size())
+		{
+			for (size_t i = 0; i < data.cellOfEntity.size(); i++)
+			{
+				if (data.cellOfEntity[i] != data.outsideCell())
+					candidates.emplace_back(i);
+			}
+			return;
+		}
+
+		for (int y = minY; y <= maxY; y++)
+		{
+			for (int x = minX; x <= maxX; x++)
+			{
+				data.appendCell(y * data.width + x, candidates);
+			}
+		}
+	}
+
+	void SpatialIndex::Buckets::link(size_t entityIndex, int cell)
+	{
+		const auto first = firstOfCell[static_cast<size_t>(cell)];
+		next[entityIndex] = first;
+		previous[entityIndex] = NONE;
+		if (first != NONE)
+			previous[static_cast<size_t>(first)] = static_cast<int>(entityIndex);
+		firstOfCell[static_cast<size_t>(cell)] = static_cast<int>(entityIndex);
+	}
+
+	void SpatialIndex::Buckets::unlink(size_t entityIndex)
+	{
+		const auto before = previous[entityIndex];
+		const auto after = next[entityIndex];
+		if (before == NONE)
+			firstOfCell[static_cast<size_t>(cellOfEntity[entityIndex])] = after;
+		else
+			next[static_cast<size_t>(before)] = after;
+		if (after != NONE)
+			previous[static_cast<size_t>(after)] = before;
+	}
+
+	void SpatialIndex::Buckets::appendCell(int cell, std::vector<size_t>& candidates) const
+	{
+		for (auto i = firstOfCell[static_cast<size_t>(cell)]; i != NONE; i = next[static_cast<size_t>(i)])
+		{
+			candidates.emplace_back(static_cast<size_t>(i));
+		}
+	}
+}
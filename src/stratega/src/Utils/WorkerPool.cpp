@@ -0,0 +1,109 @@
+#include <Stratega/Utils/WorkerPool.h>
+
+namespace SGA
+{
+	WorkerPool::WorkerPool(int numThreads)
+	{
+		for (int i = 1; i < numThreads; i++)
+		{
+			workers.emplace_back(&WorkerPool::runWorker, this);
+		}
+	}
+
+	WorkerPool::~WorkerPool()
+	{
+		{
+			std::lock_guard<std::mutex> lock(mutex);
+			stopping = true;
+		}
+		loopStarted.notify_all();
+		for (auto& worker : workers)
+		{
+			worker.join();
+		}
+	}
+
+	void WorkerPool::parallelFor(size_t newCount, const std::function<void(size_t)>& newBody)
+	{
+		if (workers.empty() || newCount <= 1)
+		{
+			for (size_t i = 0; i < newCount; i++)
+			{
+				newBody(i);
+			}
+			return;
+		}
+
+		{
+			std::lock_guard<std::mutex> lock(mutex);
+			body = &newBody;
+			count = newCount;
+			next = 0;
+			busyWorkers = workers.size();
+			error = nullptr;
+			loopIndex++;
+		}
+		loopStarted.notify_all();
+
+		work();
+
+		std::exception_ptr loopError;
+		{
+			std::unique_lock<std::mutex> lock(mutex);
+			loopFinished.wait(lock, [&]() { return busyWorkers == 0; });
+			body = nullptr;
+			loopError = error;
+		}
+
+		if (loopError)
+			std::rethrow_exception(loopError);
+	}
+
+	void WorkerPool::runWorker()
+	{
+		size_t lastLoopIndex = 0;
+		while (true)
+		{
+			{
+				std::unique_lock<std::mutex> lock(mutex);
+				loopStarted.wait(lock, [&]() { return stopping || loopIndex != lastLoopIndex; });
+				if (stopping)
+					return;
+				lastLoopIndex = loopIndex;
+			}
+
+			work();
+
+			std::lock_guard<std::mutex> lock(mutex);
+			// The loop only returns after every worker took part, so no worker misses a loop
+			if (--busyWorkers == 0)
+				loopFinished.notify_one();
+		}
+	}
+
+	void WorkerPool::work()
+	{
+		while (true)
+		{
+			size_t i;
+			{
+				std::lock_guard<std::mutex> lock(mutex);
+				if (next >= count)
+					return;
+				i = next++;
+			}
+
+			try
+			{
+				(*body)(i);
+			}
+			catch (...)
+			{
+				std::lock_guard<std::mutex> lock(mutex);
+				if (!error)
+					error = std::current_exception();
+				next = count;
+			}
+		}
+	}
+}
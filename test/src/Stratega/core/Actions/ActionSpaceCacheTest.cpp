@@ -0,0 +1,110 @@
+#include "gtest/gtest.h"
+#include "Stratega/Configuration/GameConfigParser.h"
+#include <Stratega/ForwardModel/ActionSpaceCache.h>
+#include <Stratega/ForwardModel/ForwardModel.h>
+#include <random>
+#include <thread>
+
+namespace SGA
+{
+    static void expectSameActions(const std::vector<Action>& expected, const std::vector<Action>& actual)
+    {
+        ASSERT_EQ(expected.size(), actual.size());
+        for (size_t i = 0; i < expected.size(); i++)
+        {
+            ASSERT_EQ(expected[i].getActionTypeID(), actual[i].getActionTypeID());
+            ASSERT_EQ(expected[i].getOwnerID(), actual[i].getOwnerID());
+            ASSERT_EQ(expected[i].getActionFlag(), actual[i].getActionFlag());
+            ASSERT_EQ(expected[i].getTargets().size(), actual[i].getTargets().size());
+            for (size_t j = 0; j < expected[i].getTargets().size(); j++)
+            {
+                auto target = expected[i].getTargets()[j];
+                const auto& other = actual[i].getTargets()[j];
+                ASSERT_EQ(target.getType(), other.getType());
+                if (target.getType() == ActionTarget::Position || target.getType() == ActionTarget::TileReference)
+                    ASSERT_EQ(target.getPosition(), other.getPosition());
+                else
+                    ASSERT_FALSE(target != other);
+            }
+        }
+    }
+
+    TEST(ActionSpaceCacheTest, generatesTheSameActions)
+    {
+        auto gameConfig = loadConfigFromYAML("resources/gameConfigurations/TBS/Original/KillTheKing.yaml");
+        auto forwardModel = gameConfig->forwardModel->clone();
+        auto cachedForwardModel = gameConfig->forwardModel->clone();
+        cachedForwardModel->setActionCacheEnabled(true);
+
+        for (unsigned int seed = 0; seed < 5; seed++)
+        {
+            auto state = gameConfig->generateGameState();
+            std::mt19937 rng(seed);
+            for (int step = 0; step < 300 && !state->isGameOver(); step++)
+            {
+                const auto playerID = state->getCurrentTBSPlayer();
+                auto actions = forwardModel->generateActions(*state, playerID);
+                expectSameActions(actions, cachedForwardModel->generateActions(*state, playerID));
+
+                // Jump to a fork and back, like a search does
+                if (rng() % 3 == 0)
+                {
+                    GameState fork(*state);
+                    forwardModel->advanceGameState(fork, actions[rng() % actions.size()]);
+                    if (!fork.isGameOver())
+                    {
+                        const auto forkPlayerID = fork.getCurrentTBSPlayer();
+                        expectSameActions(forwardModel->generateActions(fork, forkPlayerID), cachedForwardModel->generateActions(fork, forkPlayerID));
+                    }
+                }
+
+                forwardModel->advanceGameState(*state, actions[rng() % actions.size()]);
+            }
+        }
+    }
+
+    TEST(ActionSpaceCacheTest, reusesActionsOfUnchangedStates)
+    {
+        auto gameConfig = loadConfigFromYAML("resources/gameConfigurations/TBS/Original/KillTheKing.yaml");
+        auto state = gameConfig->generateGameState();
+        auto actionSpace = gameConfig->forwardModel->getActionSpace();
+        const auto playerID = state->getCurrentTBSPlayer();
+
+        ActionSpaceCache cache;
+        auto actions = cache.generateActions(actionSpace, *state, playerID);
+        ASSERT_EQ(cache.getHits(), 0);
+        ASSERT_GT(cache.getMisses(), 0);
+
+        const auto misses = cache.getMisses();
+        expectSameActions(actions, cache.generateActions(actionSpace, GameState(*state), playerID));
+        ASSERT_EQ(cache.getMisses(), misses);
+        ASSERT_EQ(cache.getHits(), misses);
+
+        cache.clear();
+        expectSameActions(actions, cache.generateActions(actionSpace, *state, playerID));
+        ASSERT_EQ(cache.getMisses(), 2 * misses);
+    }
+
+    TEST(ActionSpaceCacheTest, keepsOneCachePerThread)
+    {
+        auto gameConfig = loadConfigFromYAML("resources/gameConfigurations/TBS/Original/KillTheKing.yaml");
+        auto state = gameConfig->generateGameState();
+        auto actionSpace = gameConfig->forwardModel->getActionSpace();
+
+        ActionSpaceCaches caches;
+        auto& cache = caches.getThreadCache();
+        ASSERT_EQ(&caches.getThreadCache(), &cache);
+        cache.generateActions(actionSpace, *state, state->getCurrentTBSPlayer());
+
+        const ActionSpaceCache* otherThreadCache = nullptr;
+        std::thread thread([&]() { otherThreadCache = &caches.getThreadCache(); });
+        thread.join();
+        ASSERT_NE(otherThreadCache, &cache);
+        ASSERT_EQ(otherThreadCache->getMisses(), 0);
+
+        // Copies of a forward model do not share its caches
+        ActionSpaceCaches copy(caches);
+        ASSERT_NE(&copy.getThreadCache(), &cache);
+        ASSERT_EQ(copy.getThreadCache().getMisses(), 0);
+    }
+}
@@ -0,0 +1,52 @@
+#include "gtest/gtest.h"
+#include "Stratega/Configuration/GameConfigParser.h"
+#include <Stratega/Agent/StateAbstraction/StateFactory.h>
+
+#include <unordered_map>
+
+namespace SGA
+{
+    static AbstractState createState(std::vector<double> positions, std::vector<double> health)
+    {
+        AbstractState state;
+        state.addAttribute("EntityPositions", positions);
+        state.addAttribute("Health", health);
+        return state;
+    }
+
+    TEST(AbstractStateTest, equalStatesHaveEqualHashes)
+    {
+        const auto state = createState({ 1, 2, 3, 4 }, { 10, 0 });
+        const auto sameState = createState({ 1, 2, 3, 4 }, { 10, -0.0 });
+        ASSERT_TRUE(state == sameState);
+        ASSERT_EQ(state.getHash(), sameState.getHash());
+
+        ASSERT_TRUE(state != createState({ 1, 2, 3, 4 }, { 10, 1 }));
+        // The same values split differently between the attributes
+        ASSERT_TRUE(state != createState({ 1, 2, 3 }, { 4, 10, 0 }));
+    }
+
+    TEST(AbstractStateTest, findsStatesInHashMaps)
+    {
+        std::unordered_map<AbstractState, int> clusters;
+        clusters.emplace(createState({ 1, 2 }, { 10 }), 0);
+        clusters.emplace(createState({ 2, 1 }, { 10 }), 1);
+
+        ASSERT_EQ(clusters.size(), 2u);
+        ASSERT_EQ(clusters.at(createState({ 2, 1 }, { 10 })), 1);
+        ASSERT_EQ(clusters.count(createState({ 2, 1 }, { 5 })), 0u);
+    }
+
+    TEST(AbstractStateTest, stateFactoryDescribesTheSameStateEqually)
+    {
+        auto gameConfig = loadConfigFromYAML("resources/gameConfigurations/TBS/Original/KillTheKing.yaml");
+        auto state = gameConfig->generateGameState();
+        StateFactory factory(*state);
+
+        auto copy = *state;
+        ASSERT_TRUE(factory.createAbstractState(*state) == factory.createAbstractState(copy));
+
+        gameConfig->forwardModel->advanceGameState(copy, Action::createEndAction(copy.getCurrentTBSPlayer()));
+        ASSERT_FALSE(factory.createAbstractState(*state) == factory.createAbstractState(copy));
+    }
+}
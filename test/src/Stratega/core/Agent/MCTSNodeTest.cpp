@@ -0,0 +1,140 @@
+#include "gtest/gtest.h"
+#include "Stratega/Configuration/GameConfigParser.h"
+#include <Stratega/Agent/MCTSAgent/MCTSNode.h>
+#include <Stratega/Agent/ActionScripts/RandomActionScript.h>
+#include <Stratega/Agent/Heuristic/AimToKingHeuristic.h>
+
+namespace SGA
+{
+    static MCTSParameters iterationParameters(GameState& state, int iterations)
+    {
+        MCTSParameters params;
+        params.PLAYER_ID = 0;
+        params.budgetType = Budget::ITERATIONS;
+        params.maxIterations = iterations;
+        params.heuristic = std::make_unique<AimToKingHeuristic>(state);
+        params.opponentModel = std::make_shared<RandomActionScript>();
+        params.resetCounters(Timer());
+        return params;
+    }
+
+    static int firstChildWithoutEndTick(MCTSNode& root, const ForwardModel& forwardModel)
+    {
+        const auto actionSpace = root.getActionSpace(forwardModel, 0);
+        for (size_t i = 0; i < root.children.size(); i++)
+        {
+            if (actionSpace[i].getActionFlag() != ActionFlag::EndTickAction)
+                return static_cast<int>(i);
+        }
+        return -1;
+    }
+
+    TEST(MCTSNodeTest, reRootKeepsTheSubtreeOfTheObservedState)
+    {
+        auto gameConfig = loadConfigFromYAML("resources/gameConfigurations/TBS/Original/KillTheKing.yaml");
+        auto state = gameConfig->generateGameState();
+        auto& forwardModel = *gameConfig->forwardModel;
+        auto params = iterationParameters(*state, 300);
+        boost::mt19937 randomGenerator(0);
+
+        auto root = std::make_unique<MCTSNode>(forwardModel, *state, 0);
+        root->searchMCTS(forwardModel, params, randomGenerator);
+        const auto actionIndex = firstChildWithoutEndTick(*root, forwardModel);
+        ASSERT_NE(actionIndex, -1);
+        const auto childVisits = root->children[static_cast<size_t>(actionIndex)]->getVisitCount();
+        ASSERT_GT(childVisits, 0);
+
+        auto observedState = *state;
+        forwardModel.advanceGameState(observedState, root->getActionSpace(forwardModel, 0).at(static_cast<size_t>(actionIndex)));
+        auto newRoot = MCTSNode::reRoot(std::move(root), actionIndex, observedState, forwardModel, params);
+        ASSERT_NE(newRoot, nullptr);
+        ASSERT_EQ(newRoot->getVisitCount(), childVisits);
+        ASSERT_EQ(newRoot->parentNode, nullptr);
+        ASSERT_EQ(newRoot->nodeDepth, 0);
+    }
+
+    TEST(MCTSNodeTest, reRootStartsAgainIfTheStateDiffers)
+    {
+        auto gameConfig = loadConfigFromYAML("resources/gameConfigurations/TBS/Original/KillTheKing.yaml");
+        auto state = gameConfig->generateGameState();
+        auto& forwardModel = *gameConfig->forwardModel;
+        auto params = iterationParameters(*state, 300);
+        boost::mt19937 randomGenerator(0);
+
+        auto root = std::make_unique<MCTSNode>(forwardModel, *state, 0);
+        root->searchMCTS(forwardModel, params, randomGenerator);
+        const auto actionIndex = firstChildWithoutEndTick(*root, forwardModel);
+        ASSERT_NE(actionIndex, -1);
+
+        auto observedState = *state;
+        forwardModel.advanceGameState(observedState, root->getActionSpace(forwardModel, 0).at(static_cast<size_t>(actionIndex)));
+        observedState.getEntities().front().getParamValues().begin()->second += 1;
+        ASSERT_EQ(MCTSNode::reRoot(std::move(root), actionIndex, observedState, forwardModel, params), nullptr);
+    }
+
+    TEST(MCTSNodeTest, droppedStatesAreComputedAgain)
+    {
+        auto gameConfig = loadConfigFromYAML("resources/gameConfigurations/TBS/Original/KillTheKing.yaml");
+        auto state = gameConfig->generateGameState();
+        auto& forwardModel = *gameConfig->forwardModel;
+        auto params = iterationParameters(*state, 300);
+        params.storeNodeStates = false;
+
+        boost::mt19937 randomGenerator(0);
+
+        MCTSNode root(forwardModel, *state, 0);
+        root.searchMCTS(forwardModel, params, randomGenerator);
+        ASSERT_FALSE(root.children.empty());
+
+        const auto actionSpace = root.getActionSpace(forwardModel, 0);
+        for (size_t i = 0; i < root.children.size(); i++)
+        {
+            if (actionSpace[i].getActionFlag() == ActionFlag::EndTickAction)
+                continue;
+
+            auto expected = *state;
+            forwardModel.advanceGameState(expected, actionSpace[i]);
+            ASSERT_TRUE(MCTSNode::isSameState(root.children[i]->copyGameState(forwardModel, params), expected));
+            for (const auto& grandChild : root.children[i]->children)
+            {
+                ASSERT_EQ(grandChild->parentNode, root.children[i].get());
+                ASSERT_EQ(grandChild->nodeDepth, 2);
+            }
+        }
+    }
+
+    TEST(MCTSNodeTest, actionsAreOnlyReplayableIfTheOpponentsFinished)
+    {
+        auto gameConfig = loadConfigFromYAML("resources/gameConfigurations/TBS/Original/KillTheKing.yaml");
+        auto state = gameConfig->generateGameState();
+        auto& forwardModel = *gameConfig->forwardModel;
+        auto params = iterationParameters(*state, 1);
+        params.currentIterations = params.maxIterations;
+        ASSERT_TRUE(params.isBudgetOver());
+
+        MCTSNode root(forwardModel, *state, 0);
+        const auto actionSpace = root.getActionSpace(forwardModel, 0);
+        for (auto action : actionSpace)
+        {
+            auto copy = *state;
+            const auto replayable = root.applyActionToGameState(forwardModel, copy, action, params, 0);
+            // Ending the turn leaves the opponent to move, which the budget does not allow
+            ASSERT_EQ(replayable, action.getActionFlag() != ActionFlag::EndTickAction);
+        }
+    }
+
+    TEST(MCTSNodeTest, actionSpacesAreComparedActionByAction)
+    {
+        auto gameConfig = loadConfigFromYAML("resources/gameConfigurations/TBS/Original/KillTheKing.yaml");
+        auto state = gameConfig->generateGameState();
+        auto& forwardModel = *gameConfig->forwardModel;
+
+        const auto actionSpace = forwardModel.generateActions(*state, 0);
+        ASSERT_GT(actionSpace.size(), 1u);
+        ASSERT_TRUE(MCTSNode::isSameActionSpace(actionSpace, forwardModel.generateActions(*state, 0)));
+
+        auto reordered = actionSpace;
+        std::swap(reordered.front(), reordered.back());
+        ASSERT_FALSE(MCTSNode::isSameActionSpace(actionSpace, reordered));
+    }
+}
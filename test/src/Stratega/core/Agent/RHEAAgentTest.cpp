@@ -0,0 +1,72 @@
+#include "gtest/gtest.h"
+#include "Stratega/Configuration/GameConfigParser.h"
+#include <Stratega/Agent/RHEAAgent/RHEAAgent.h>
+
+#include <sstream>
+
+namespace SGA
+{
+    // Actions point to the action types of their game, so they are compared by their description once the game is destroyed
+    static std::string describe(const Action& action)
+    {
+        std::stringstream description;
+        description << action.getActionTypeID();
+        for (const auto& target : action.getTargets())
+        {
+            description << " " << target.getTypeString() << ":";
+            if (target.getType() == ActionTarget::Position || target.getType() == ActionTarget::TileReference)
+                description << target.getPosition().x << "," << target.getPosition().y;
+            else
+                description << target.getEntityID();
+        }
+        return description.str();
+    }
+
+    // Plays a few turns of the first player, the opponent ends its turns, and returns the chosen actions
+    static std::vector<std::string> playTurns(int numThreads, unsigned int seed)
+    {
+        auto gameConfig = loadConfigFromYAML("resources/gameConfigurations/TBS/Original/KillTheKing.yaml");
+        auto state = gameConfig->generateGameState();
+        auto& forwardModel = *gameConfig->forwardModel;
+
+        RHEAParameters params;
+        params.budgetType = Budget::FMCALLS;
+        params.maxFMCalls = 2000;
+        params.popSize = 6;
+        params.individualLength = 5;
+        params.mutateBestN = 2;
+        params.numThreads = numThreads;
+        RHEAAgent agent("RHEAAgent", std::move(params));
+        agent.setPlayerID(0);
+        agent.setSeed(seed);
+        agent.init(*state, forwardModel, Timer());
+
+        std::vector<std::string> actions;
+        while (actions.size() < 8 && !state->isGameOver())
+        {
+            if (state->getCurrentTBSPlayer() == 0)
+            {
+                auto assignment = agent.computeAction(*state, forwardModel, Timer());
+                const auto& playerActions = assignment.getPlayerActions();
+                actions.emplace_back(describe(playerActions.empty() ? assignment.getEntityActions().begin()->second : playerActions.begin()->second));
+                forwardModel.advanceGameState(*state, assignment);
+            }
+            else
+            {
+                forwardModel.advanceGameState(*state, Action::createEndAction(state->getCurrentTBSPlayer()));
+            }
+        }
+        return actions;
+    }
+
+    TEST(RHEAAgentTest, threadsDoNotChangeTheChosenActions)
+    {
+        const auto sequentialActions = playTurns(1, 42);
+        ASSERT_FALSE(sequentialActions.empty());
+        for (int numThreads : { 2, 4 })
+        {
+            const auto parallelActions = playTurns(numThreads, 42);
+            ASSERT_EQ(parallelActions, sequentialActions);
+        }
+    }
+}
@@ -0,0 +1,71 @@
+#include "gtest/gtest.h"
+#include "Stratega/Configuration/GameConfigParser.h"
+#include <Stratega/Game/AgentThread.h>
+#include <stdexcept>
+
+namespace SGA
+{
+    class ThreadRecordingAgent : public Agent
+    {
+    public:
+        ThreadRecordingAgent()
+            : Agent("ThreadRecordingAgent")
+        {
+        }
+
+        ActionAssignment computeAction(GameState state, const ForwardModel& /*forwardModel*/, Timer /*timer*/) override
+        {
+            threads.emplace_back(std::this_thread::get_id());
+            if (shouldThrow)
+                throw std::runtime_error("Agent failed");
+            return ActionAssignment::fromSingleAction(Action::createEndAction(state.getCurrentTBSPlayer()));
+        }
+
+        std::vector<std::thread::id> threads;
+        bool shouldThrow = false;
+    };
+
+    TEST(AgentThreadTest, reusesTheThreadForEveryDecision)
+    {
+        auto gameConfig = loadConfigFromYAML("resources/gameConfigurations/TBS/Original/KillTheKing.yaml");
+        auto state = gameConfig->generateGameState();
+        ThreadRecordingAgent agent;
+        agent.setPlayerID(0);
+
+        AgentThread agentThread;
+        for (int i = 0; i < 10; i++)
+        {
+            agentThread.startComputing(agent, *state, *gameConfig->forwardModel, *gameConfig, 40);
+            auto results = agentThread.join();
+            ASSERT_FALSE(results.error);
+            ASSERT_EQ(results.actions.getAssignmentCount(), 1);
+            ASSERT_FALSE(agentThread.isComputing());
+            ASSERT_TRUE(agentThread.isJoined());
+        }
+
+        ASSERT_EQ(agent.threads.size(), 10);
+        ASSERT_NE(agent.threads.front(), std::this_thread::get_id());
+        for (const auto& thread : agent.threads)
+        {
+            ASSERT_EQ(thread, agent.threads.front());
+        }
+    }
+
+    TEST(AgentThreadTest, returnsTheErrorsOfTheAgent)
+    {
+        auto gameConfig = loadConfigFromYAML("resources/gameConfigurations/TBS/Original/KillTheKing.yaml");
+        auto state = gameConfig->generateGameState();
+        ThreadRecordingAgent agent;
+        agent.setPlayerID(0);
+
+        AgentThread agentThread;
+        agent.shouldThrow = true;
+        agentThread.startComputing(agent, *state, *gameConfig->forwardModel, *gameConfig, 40);
+        ASSERT_TRUE(agentThread.join().error);
+
+        // The thread keeps running after an error
+        agent.shouldThrow = false;
+        agentThread.startComputing(agent, *state, *gameConfig->forwardModel, *gameConfig, 40);
+        ASSERT_FALSE(agentThread.join().error);
+    }
+}
@@ -0,0 +1,74 @@
+#include "gtest/gtest.h"
+#include "Stratega/Configuration/GameConfigParser.h"
+#include "Stratega/Arena/Arena.h"
+#include <Stratega/Logging/Log.h>
+
+#include <cstdio>
+#include <fstream>
+#include <map>
+#include <mutex>
+#include <sstream>
+#include <utility>
+
+namespace SGA
+{
+    // Records the outcome of every battle, keyed by its logging scope, which is the same in sequential and parallel runs
+    class ResultArena : public Arena
+    {
+    public:
+        using Arena::Arena;
+
+        void onGameFinished(const GameState& finalState, const ForwardModel& forwardModel) override
+        {
+            Arena::onGameFinished(finalState, forwardModel);
+            std::lock_guard<std::mutex> resultGuard(resultMutex);
+            results[getLoggingScopeKey("Result")] = { finalState.getWinnerID(), finalState.getCurrentTick() };
+        }
+
+        std::map<std::string, std::pair<int, int>> results;
+
+    private:
+        std::mutex resultMutex;
+    };
+
+    static std::string readFile(const std::string& path)
+    {
+        std::ifstream file(path);
+        std::stringstream content;
+        content << file.rdbuf();
+        return content.str();
+    }
+
+    // Runs the games with the given number of workers and returns their results and the log they wrote
+    static std::pair<std::map<std::string, std::pair<int, int>>, std::string> runArena(int workers)
+    {
+        auto gameConfig = loadConfigFromYAML("resources/gameConfigurations/TBS/Original/KillTheKing.yaml");
+        gameConfig->tickLimit = 20;
+        gameConfig->agentParams = { { "OSLAAgent", YAML::Node() }, { "RandomAgent", YAML::Node() } };
+        const std::string logPath = "arenaParallelTest" + std::to_string(workers) + ".yaml";
+        setDefaultLogger(std::make_unique<FileLogger>(logPath));
+
+        ResultArena arena(*gameConfig);
+        arena.runGames(2, 7, 3, 1, workers);
+
+        // Replacing the logger closes the log file
+        setDefaultLogger(std::make_unique<FileLogger>());
+        auto log = readFile(logPath);
+        std::remove(logPath.c_str());
+        return { arena.results, log };
+    }
+
+    TEST(ArenaParallelTest, workersDoNotChangeTheResults)
+    {
+        const auto [sequentialResults, sequentialLog] = runArena(1);
+        // Three games with both agent orders
+        ASSERT_EQ(sequentialResults.size(), 6u);
+        ASSERT_FALSE(sequentialLog.empty());
+        for (int workers : { 2, 4 })
+        {
+            const auto [results, log] = runArena(workers);
+            ASSERT_EQ(results, sequentialResults);
+            ASSERT_EQ(log, sequentialLog);
+        }
+    }
+}
@@ -0,0 +1,41 @@
+#include "gtest/gtest.h"
+#include "Stratega/Configuration/GameConfigParser.h"
+#include <Stratega/Configuration/FunctionParser.h>
+
+namespace SGA
+{
+    TEST(ExpressionTest, compiledExpressionsMatchInterpreter)
+    {
+        auto gameConfig = loadConfigFromYAML("resources/gameConfigurations/TBS/Original/KillTheKing.yaml");
+        auto state = gameConfig->generateGameState();
+        auto context = ParseContext::fromGameConfig(*gameConfig);
+        context.targetIDs.emplace("Source", 0);
+        FunctionParser parser;
+
+        const std::vector<std::string> functionCalls = {
+            "ModifyResource(Source.Health, Source.Health*2-1)",
+            "ModifyResource(Source.Health, (Source.Health+Source.MovementPoints)/4)",
+            "ModifyResource(Source.Health, Source.MovementPoints*Source.MovementPoints-0.5)"
+        };
+
+        for (const auto& functionCall : functionCalls)
+        {
+            auto function = parser.parseAbstractFunction(functionCall, context);
+            ASSERT_TRUE(function.has_value());
+            const auto& expression = function->parameters.at(1);
+            ASSERT_EQ(expression.getType(), FunctionParameter::Type::Expression);
+
+            for (const auto& entity : state->getEntities())
+            {
+                std::vector<ActionTarget> targets = { ActionTarget::createEntityActionTarget(entity.getID()) };
+                ASSERT_NEAR(expression.getConstant(*state, targets), expression.interpretConstant(*state, targets), 1e-6);
+            }
+        }
+
+        const auto& entity = state->getEntities().front();
+        const auto health = entity.getParamValues().at(entity.getEntityType().getParameterByName("Health").getIndex());
+        std::vector<ActionTarget> targets = { ActionTarget::createEntityActionTarget(entity.getID()) };
+        auto function = parser.parseAbstractFunction(functionCalls.front(), context);
+        ASSERT_DOUBLE_EQ(function->parameters.at(1).getConstant(*state, targets), health * 2 - 1);
+    }
+}
@@ -196,7 +196,7 @@ namespace SGA
 
         auto* entity0 = gameState->getEntity(0);
 
-        entity0->setPosition(newPosition);
+        gameState->moveEntity(*entity0, newPosition);
         
         ASSERT_TRUE(gameState->getEntityAtConst(position) == nullptr);
         ASSERT_TRUE(gameState->getEntityAtConst(newPosition) != nullptr);
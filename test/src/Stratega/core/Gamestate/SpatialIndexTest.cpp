@@ -0,0 +1,260 @@
+#include <Stratega/core/TestUtils/utils.hpp>
+#include "gtest/gtest.h"
+#include <Stratega/Representation/GameState.h>
+#include <Stratega/ForwardModel/TBSForwardModel.h>
+#include <Stratega/ForwardModel/RTSForwardModel.h>
+#include <Stratega/Configuration/GameConfigParser.h>
+#include <algorithm>
+#include <random>
+
+namespace SGA
+{
+    namespace
+    {
+        std::shared_ptr<GameState> createBoardState(int width, int height, const TileType& tileType)
+        {
+            auto gameState = std::make_shared<GameState>();
+            std::vector<Tile> tiles;
+            for (int y = 0; y < height; y++)
+            {
+                for (int x = 0; x < width; x++)
+                {
+                    tiles.emplace_back(&tileType, x, y);
+                }
+            }
+            gameState->initBoard(width, tiles);
+            return gameState;
+        }
+
+        // Entities found by a linear scan, in the order of the entity list
+        std::vector<int> entitiesAroundByScan(const GameState& state, const Vector2f& pos, float maxDistance)
+        {
+            std::vector<int> ids;
+            for (const auto& entity : state.getEntities())
+            {
+                if (entity.getPosition() == pos || (maxDistance > 0.0 && entity.getPosition().distance(pos) <= maxDistance))
+                    ids.emplace_back(entity.getID());
+            }
+            return ids;
+        }
+
+        // Collision resolution of the RTS forward model that tests every pair of entities
+        void resolveEntityCollisionsByScan(GameState& state, double deltaTime)
+        {
+            for (auto& unit : state.getEntities())
+            {
+                Vector2f pushDir;
+                for (auto& otherUnit : state.getEntities())
+                {
+                    if (unit.getID() == otherUnit.getID() || !unit.getEntityType().canExecuteAction(state.getGameInfo()->getActionTypeID("Move")))
+                        continue;
+
+                    auto dir = otherUnit.getPosition() - unit.getPosition();
+                    if (dir.magnitude() <= unit.getCollisionRadius() + otherUnit.getCollisionRadius())
+                    {
+                        auto penetrationDepth = unit.getCollisionRadius() + otherUnit.getCollisionRadius() - dir.magnitude();
+                        pushDir = pushDir + dir.normalized() * 2 / (1 + penetrationDepth);
+                        pushDir = pushDir / 4;
+                    }
+                }
+                state.moveEntity(unit, unit.getPosition() - pushDir * deltaTime);
+            }
+        }
+
+        std::vector<int> ids(const std::vector<const Entity*>& entities)
+        {
+            std::vector<int> result;
+            for (const auto* entity : entities)
+                result.emplace_back(entity->getID());
+            return result;
+        }
+    }
+
+    TEST(SpatialIndexTest, queriesMatchLinearScan)
+    {
+        TileType tileType;
+        EntityType entityType;
+        TBSForwardModel fm;
+        auto gameState = createBoardState(20, 20, tileType);
+
+        std::mt19937 rng(1);
+        std::uniform_real_distribution<double> positionDist(-2.0, 22.0);
+        for (int i = 0; i < 200; i++)
+        {
+            fm.spawnEntity(*gameState, entityType, -1, { positionDist(rng), positionDist(rng) });
+        }
+
+        const auto& constState = *gameState;
+        for (int i = 0; i < 100; i++)
+        {
+            Vector2f pos(positionDist(rng), positionDist(rng));
+            for (float maxDistance : { 0.0f, 0.5f, 2.0f, 6.0f, 30.0f })
+            {
+                ASSERT_EQ(ids(constState.getEntitiesAroundConst(pos, maxDistance)), entitiesAroundByScan(constState, pos, maxDistance));
+            }
+        }
+
+        // Positions at the integer part of an entity find it
+        for (const auto& entity : constState.getEntities())
+        {
+            auto found = ids(constState.getEntitiesAtConst(entity.getPosition()));
+            ASSERT_NE(std::find(found.begin(), found.end(), entity.getID()), found.end());
+        }
+    }
+
+    TEST(SpatialIndexTest, moveEntityUpdatesQueries)
+    {
+        TileType tileType;
+        EntityType entityType;
+        TBSForwardModel fm;
+        auto gameState = createBoardState(10, 10, tileType);
+        auto position = Vector2f{ 2, 3 };
+        auto newPosition = Vector2f{ 7, 8 };
+
+        fm.spawnEntity(*gameState, entityType, -1, position);
+        ASSERT_TRUE(gameState->getEntityAtConst(position) != nullptr);
+
+        gameState->moveEntity(gameState->getEntities()[0], newPosition);
+        ASSERT_TRUE(gameState->getEntityAtConst(position) == nullptr);
+        ASSERT_TRUE(gameState->getEntityAtConst(newPosition) != nullptr);
+
+        // Leaving and entering the board
+        gameState->moveEntity(gameState->getEntities()[0], { -3, 4 });
+        ASSERT_TRUE(gameState->getEntityAtConst(newPosition) == nullptr);
+        ASSERT_TRUE(gameState->getEntityAroundConst({ -3, 4 }, 0) != nullptr);
+        gameState->moveEntity(gameState->getEntities()[0], position);
+        ASSERT_TRUE(gameState->getEntityAtConst(position) != nullptr);
+    }
+
+    TEST(SpatialIndexTest, removingEntitiesUpdatesQueries)
+    {
+        TileType tileType;
+        EntityType entityType;
+        TBSForwardModel fm;
+        auto gameState = createBoardState(10, 10, tileType);
+        auto position = Vector2f{ 2, 3 };
+        auto otherPosition = Vector2f{ 7, 8 };
+
+        fm.spawnEntity(*gameState, entityType, -1, position);
+        fm.spawnEntity(*gameState, entityType, -1, otherPosition);
+        ASSERT_TRUE(gameState->getEntityAt(position) != nullptr);
+
+        // Lookups do not change the entities, removing one shifts the others in the list
+        gameState->getEntityAt(position)->flagRemove();
+        gameState->removeFlaggedEntities();
+        ASSERT_EQ(gameState->getEntities().size(), 1u);
+        ASSERT_TRUE(gameState->getEntityAtConst(position) == nullptr);
+        ASSERT_EQ(gameState->getEntityAtConst(otherPosition), &gameState->getEntities()[0]);
+    }
+
+    TEST(SpatialIndexTest, copiesKeepTheirOwnIndex)
+    {
+        TileType tileType;
+        EntityType entityType;
+        TBSForwardModel fm;
+        auto gameState = createBoardState(10, 10, tileType);
+        auto position = Vector2f{ 1, 1 };
+        auto newPosition = Vector2f{ 5, 5 };
+
+        fm.spawnEntity(*gameState, entityType, -1, position);
+        ASSERT_TRUE(gameState->getEntityAtConst(position) != nullptr);
+
+        GameState copy(*gameState);
+        copy.moveEntity(copy.getEntities()[0], newPosition);
+
+        ASSERT_TRUE(gameState->getEntityAtConst(position) != nullptr);
+        ASSERT_TRUE(gameState->getEntityAtConst(newPosition) == nullptr);
+        ASSERT_TRUE(copy.getEntityAtConst(position) == nullptr);
+        ASSERT_TRUE(copy.getEntityAtConst(newPosition) != nullptr);
+    }
+
+    TEST(SpatialIndexTest, copiesShareTheBucketsUntilMoved)
+    {
+        TileType tileType;
+        EntityType entityType;
+        TBSForwardModel fm;
+        auto gameState = createBoardState(10, 10, tileType);
+        fm.spawnEntity(*gameState, entityType, -1, { 1, 1 });
+        fm.spawnEntity(*gameState, entityType, -1, { 1, 1 });
+        const auto& entities = gameState->getEntities();
+
+        SpatialIndex index;
+        index.build(entities, 10, 10);
+        SpatialIndex copy(index);
+        ASSERT_TRUE(copy.isValid(entities.size()));
+        ASSERT_TRUE(copy.sharesBucketsWith(index));
+
+        copy.move(0, { 5, 5 });
+        ASSERT_FALSE(copy.sharesBucketsWith(index));
+        ASSERT_EQ(index.candidatesAt({ 1, 1 }), (std::vector<size_t>{ 0, 1 }));
+        ASSERT_EQ(copy.candidatesAt({ 1, 1 }), std::vector<size_t>{ 1 });
+        ASSERT_EQ(copy.candidatesAt({ 5, 5 }), std::vector<size_t>{ 0 });
+
+        // Moving back and forth keeps the other entities of the cell
+        copy.move(1, { 5, 5 });
+        copy.move(0, { 1, 1 });
+        ASSERT_EQ(copy.candidatesAt({ 1, 1 }), std::vector<size_t>{ 0 });
+        ASSERT_EQ(copy.candidatesAt({ 5, 5 }), std::vector<size_t>{ 1 });
+    }
+
+    TEST(SpatialIndexTest, entityIndicesAroundIncludeCloseEntities)
+    {
+        TileType tileType;
+        EntityType entityType;
+        TBSForwardModel fm;
+        auto gameState = createBoardState(20, 20, tileType);
+
+        std::mt19937 rng(2);
+        std::uniform_real_distribution<double> positionDist(-2.0, 22.0);
+        for (int i = 0; i < 200; i++)
+        {
+            fm.spawnEntity(*gameState, entityType, -1, { positionDist(rng), positionDist(rng) });
+        }
+
+        const auto& entities = gameState->getEntities();
+        for (int i = 0; i < 100; i++)
+        {
+            Vector2f pos(positionDist(rng), positionDist(rng));
+            for (double maxDistance : { 0.0, 0.7, 3.0, 30.0 })
+            {
+                auto indices = gameState->getEntityIndicesAround(pos, maxDistance);
+                ASSERT_TRUE(std::is_sorted(indices.begin(), indices.end()));
+                for (size_t j = 0; j < entities.size(); j++)
+                {
+                    if (entities[j].getPosition().distance(pos) <= maxDistance)
+                        ASSERT_TRUE(std::binary_search(indices.begin(), indices.end(), j));
+                }
+            }
+        }
+    }
+
+    TEST(SpatialIndexTest, entityCollisionsMatchPairwiseResolution)
+    {
+        auto gameConfig = loadConfigFromYAML("resources/gameConfigurations/TBS/Original/KillTheKing.yaml");
+        auto state = gameConfig->generateGameState();
+        RTSForwardModel fm;
+
+        std::mt19937 rng(3);
+        std::uniform_real_distribution<double> xDist(0, state->getBoardWidth());
+        std::uniform_real_distribution<double> yDist(0, state->getBoardHeight());
+        const auto& entityTypes = state->getGameInfo()->getEntityTypes();
+        for (int i = 0; i < 300; i++)
+        {
+            auto entityType = entityTypes.begin();
+            std::advance(entityType, static_cast<long>(rng() % entityTypes.size()));
+            state->addEntity(entityType->second, i % 2, { xDist(rng), yDist(rng) });
+        }
+
+        GameState expected(*state);
+        for (int tick = 0; tick < 10; tick++)
+        {
+            fm.resolveEntityCollisions(*state);
+            resolveEntityCollisionsByScan(expected, 1. / 60.);
+        }
+
+        for (size_t i = 0; i < expected.getEntities().size(); i++)
+        {
+            ASSERT_EQ(state->getEntities()[i].getPosition(), expected.getEntities()[i].getPosition());
+        }
+    }
+}
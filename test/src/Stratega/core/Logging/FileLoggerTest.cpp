@@ -0,0 +1,128 @@
+#include "gtest/gtest.h"
+#include <Stratega/Logging/Log.h>
+#include <Stratega/Utils/ParallelFor.h>
+#include <cstdio>
+#include <fstream>
+#include <sstream>
+
+namespace SGA
+{
+    static std::string readFile(const std::string& path)
+    {
+        std::ifstream file(path);
+        std::stringstream content;
+        content << file.rdbuf();
+        return content.str();
+    }
+
+    static void logGames(FileLogger& logger)
+    {
+        ThreadLoggerScope loggerScope(logger);
+        for (int game = 0; game < 3; game++)
+        {
+            {
+                LoggingScope gameScope("Game " + std::to_string(game));
+                logSingleValue("Map", std::to_string(game));
+                logValue("PlayerAssignment", std::string("RandomAgent"));
+                logValue("PlayerAssignment", std::string("Agent \"with\": a quote"));
+                for (int turn = 0; turn < 5; turn++)
+                {
+                    logValue("ActionCount", turn * 3);
+                    logValue("Score", turn * 0.5);
+                }
+                logSingleValue("WinnerID", game % 2);
+                logSingleValue("WinnerID", -1);
+            }
+            logger.flush();
+        }
+    }
+
+    TEST(FileLoggerTest, testThreadLoggerScopeRedirectsLogs)
+    {
+        FileLogger logger;
+        {
+            ThreadLoggerScope loggerScope(logger);
+            LoggingScope scope("Game 0");
+            logValue("ActionCount", 3);
+        }
+
+        ASSERT_EQ(logger.getLoggedValues()["Game 0"]["ActionCount"][0].as<int>(), 3);
+    }
+
+    TEST(FileLoggerTest, testMergeKeepsSequentialOrder)
+    {
+        // Battles logged on different threads are merged in battle order
+        std::vector<FileLogger> battleLogs(4);
+        parallelFor(battleLogs.size(), 4, [&](size_t i)
+        {
+            ThreadLoggerScope loggerScope(battleLogs[i]);
+            LoggingScope gameScope("Game 0");
+            LoggingScope battleScope("Battle" + std::to_string(i));
+            logSingleValue("WinnerID", static_cast<int>(i));
+        });
+
+        FileLogger merged;
+        for (const auto& battleLog : battleLogs)
+        {
+            merged.merge(battleLog.getLoggedValues());
+        }
+
+        const auto& game = merged.getLoggedValues()["Game 0"];
+        ASSERT_EQ(game.size(), 4);
+        int battleID = 0;
+        for (const auto& battle : game)
+        {
+            ASSERT_EQ(battle.first.as<std::string>(), "Battle" + std::to_string(battleID));
+            ASSERT_EQ(battle.second["WinnerID"].as<int>(), battleID);
+            battleID++;
+        }
+    }
+
+    TEST(FileLoggerTest, testJsonLinesConvertToTheYamlLog)
+    {
+        {
+            FileLogger yamlLogger("fileLoggerTest.yaml");
+            logGames(yamlLogger);
+            FileLogger jsonLinesLogger("fileLoggerTest.jsonl", FileLogger::Format::JsonLines);
+            logGames(jsonLinesLogger);
+        }
+
+        FileLogger::convertJsonLinesToYaml("fileLoggerTest.jsonl", "fileLoggerTest.converted.yaml");
+        ASSERT_EQ(readFile("fileLoggerTest.converted.yaml"), readFile("fileLoggerTest.yaml"));
+
+        std::remove("fileLoggerTest.yaml");
+        std::remove("fileLoggerTest.jsonl");
+        std::remove("fileLoggerTest.converted.yaml");
+    }
+
+    TEST(FileLoggerTest, testJsonLinesWriteWhenTheBufferIsFull)
+    {
+        {
+            FileLogger yamlLogger("fileLoggerBufferTest.yaml");
+            logGames(yamlLogger);
+            FileLogger jsonLinesLogger("fileLoggerBufferTest.jsonl", FileLogger::Format::JsonLines);
+            jsonLinesLogger.setMaxBufferedValues(4);
+            logGames(jsonLinesLogger);
+        }
+
+        // Each game logs 14 values, the buffer is written three times before the flush
+        std::ifstream jsonLines("fileLoggerBufferTest.jsonl");
+        std::string line;
+        std::vector<std::string> lines;
+        while (std::getline(jsonLines, line))
+        {
+            lines.emplace_back(line);
+        }
+        jsonLines.close();
+        ASSERT_EQ(lines.size(), 12);
+        ASSERT_EQ(lines.front().rfind("{\"flush\":0,", 0), 0);
+        ASSERT_EQ(lines.back().rfind("{\"flush\":2,", 0), 0);
+
+        FileLogger::convertJsonLinesToYaml("fileLoggerBufferTest.jsonl", "fileLoggerBufferTest.converted.yaml");
+        ASSERT_EQ(readFile("fileLoggerBufferTest.converted.yaml"), readFile("fileLoggerBufferTest.yaml"));
+
+        std::remove("fileLoggerBufferTest.yaml");
+        std::remove("fileLoggerBufferTest.jsonl");
+        std::remove("fileLoggerBufferTest.converted.yaml");
+    }
+}
@@ -0,0 +1,71 @@
+#include "gtest/gtest.h"
+#include "Stratega/Configuration/GameConfigParser.h"
+#include <Stratega/ForwardModel/RTSForwardModel.h>
+
+namespace SGA
+{
+    static Vector2f endOf(const Path& path)
+    {
+        const auto last = (path.m_nstraightPath - 1) * 3;
+        return { static_cast<double>(path.m_straightPath[last]), static_cast<double>(path.m_straightPath[last + 2]) };
+    }
+
+    static std::vector<Vector2f> walkablePositions(const GameState& state)
+    {
+        std::vector<Vector2f> positions;
+        for (int y = 0; y < state.getBoardHeight(); y++)
+        {
+            for (int x = 0; x < state.getBoardWidth(); x++)
+            {
+                if (state.getTileAtConst(x, y).isWalkable())
+                    positions.emplace_back(x + 0.5, y + 0.5);
+            }
+        }
+        return positions;
+    }
+
+    TEST(PathCacheTest, cachedPathsReachTheSameEnd)
+    {
+        auto gameConfig = loadConfigFromYAML("resources/gameConfigurations/RTS/Original/BasicRTS.yaml");
+        auto state = gameConfig->generateGameState();
+        auto& forwardModel = dynamic_cast<RTSForwardModel&>(*gameConfig->forwardModel);
+        auto cachedForwardModel = forwardModel;
+        cachedForwardModel.setPathCacheSize(64);
+        cachedForwardModel.setFlowFieldThreshold(4);
+
+        const auto positions = walkablePositions(*state);
+        const auto& goal = positions.back();
+        for (size_t i = 0; i < positions.size(); i += 7)
+        {
+            for (int repeat = 0; repeat < 2; repeat++)
+            {
+                auto path = forwardModel.findPath(*state, positions[i], goal);
+                auto cachedPath = cachedForwardModel.findPath(*state, positions[i], goal);
+                ASSERT_EQ(path.isEmpty(), cachedPath.isEmpty());
+                if (!path.isEmpty())
+                    ASSERT_LT(endOf(path).distance(endOf(cachedPath)), 0.0001);
+            }
+        }
+
+        const auto& pathCache = state->getRTSNavigation()->m_pathCache;
+        ASSERT_GT(pathCache.getHits(), pathCache.getMisses());
+    }
+
+    TEST(PathCacheTest, rebuiltNavMeshStartsWithAnEmptyCache)
+    {
+        auto gameConfig = loadConfigFromYAML("resources/gameConfigurations/RTS/Original/BasicRTS.yaml");
+        auto state = gameConfig->generateGameState();
+        auto forwardModel = dynamic_cast<RTSForwardModel&>(*gameConfig->forwardModel);
+        forwardModel.setPathCacheSize(64);
+
+        const auto positions = walkablePositions(*state);
+        forwardModel.findPath(*state, positions.front(), positions.back());
+        forwardModel.findPath(*state, positions.front(), positions.back());
+        ASSERT_EQ(state->getRTSNavigation()->m_pathCache.getHits(), 1u);
+
+        forwardModel.buildNavMesh(*state, NavigationConfig{});
+        forwardModel.findPath(*state, positions.front(), positions.back());
+        ASSERT_EQ(state->getRTSNavigation()->m_pathCache.getHits(), 0u);
+        ASSERT_EQ(state->getRTSNavigation()->m_pathCache.getMisses(), 1u);
+    }
+}
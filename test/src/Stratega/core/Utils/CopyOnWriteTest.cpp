@@ -0,0 +1,69 @@
+#include <Stratega/core/TestUtils/utils.hpp>
+#include "gtest/gtest.h"
+#include <Stratega/Utils/CopyOnWrite.h>
+#include <Stratega/Representation/GameState.h>
+#include <vector>
+
+namespace SGA
+{
+    TEST(CopyOnWriteTest, copiesShareUntilWritten)
+    {
+        CopyOnWrite<std::vector<int>> original(std::vector<int>{ 1, 2, 3 });
+        auto copy = original;
+
+        ASSERT_TRUE(original.isShared());
+        ASSERT_TRUE(original.sharesWith(copy));
+        ASSERT_EQ(&original.get(), &copy.get());
+
+        copy.getMutable().push_back(4);
+
+        ASSERT_FALSE(original.isShared());
+        ASSERT_FALSE(copy.isShared());
+        ASSERT_FALSE(original.sharesWith(copy));
+        ASSERT_EQ(original->size(), 3);
+        ASSERT_EQ(copy->size(), 4);
+
+        // The only owner writes in place
+        const auto* data = &copy.get();
+        copy.getMutable().push_back(5);
+        ASSERT_EQ(&copy.get(), data);
+    }
+
+    TEST(CopyOnWriteTest, defaultValuesAreShared)
+    {
+        CopyOnWrite<std::vector<int>> first;
+        CopyOnWrite<std::vector<int>> second;
+
+        ASSERT_EQ(&first.get(), &second.get());
+
+        first.getMutable().push_back(1);
+        ASSERT_TRUE(second->empty());
+        ASSERT_TRUE(CopyOnWrite<std::vector<int>>()->empty());
+    }
+
+    TEST(CopyOnWriteTest, gameStateCopiesShareTheBoard)
+    {
+        TileType tileType;
+        std::vector<Tile> tiles;
+        for (int y = 0; y < 4; y++)
+        {
+            for (int x = 0; x < 4; x++)
+            {
+                tiles.emplace_back(&tileType, x, y);
+            }
+        }
+
+        GameState state;
+        state.initBoard(4, tiles);
+        GameState copy(state);
+
+        ASSERT_EQ(&state.getTileAtConst(1, 1), &copy.getTileAtConst(1, 1));
+
+        const auto walkable = state.getTileAtConst(1, 1).isWalkable();
+        copy.getTileAt(1, 1).setWalkable(!walkable);
+
+        ASSERT_NE(&state.getTileAtConst(1, 1), &copy.getTileAtConst(1, 1));
+        ASSERT_EQ(state.getTileAtConst(1, 1).isWalkable(), walkable);
+        ASSERT_EQ(copy.getTileAtConst(1, 1).isWalkable(), !walkable);
+    }
+}
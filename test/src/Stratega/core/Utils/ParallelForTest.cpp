@@ -0,0 +1,30 @@
+#include "gtest/gtest.h"
+#include <Stratega/Utils/ParallelFor.h>
+
+#include <stdexcept>
+
+namespace SGA
+{
+    TEST(ParallelForTest, testVisitsEveryIndexOnce)
+    {
+        for (int numThreads : { 1, 2, 4, 16 })
+        {
+            std::vector<int> visits(100, 0);
+            parallelFor(visits.size(), numThreads, [&](size_t i) { visits[i]++; });
+
+            for (const auto& count : visits)
+            {
+                ASSERT_EQ(count, 1);
+            }
+        }
+    }
+
+    TEST(ParallelForTest, testRethrowsException)
+    {
+        EXPECT_THROW(parallelFor(100, 4, [](size_t i)
+        {
+            if (i == 10)
+                throw std::runtime_error("failed");
+        }), std::runtime_error);
+    }
+}
@@ -0,0 +1,43 @@
+#include "gtest/gtest.h"
+#include <Stratega/Utils/WorkerPool.h>
+
+#include <stdexcept>
+
+namespace SGA
+{
+    TEST(WorkerPoolTest, testVisitsEveryIndexOnceInEveryLoop)
+    {
+        for (int numThreads : { 1, 2, 4, 16 })
+        {
+            WorkerPool pool(numThreads);
+            ASSERT_EQ(pool.getNumThreads(), std::max(numThreads, 1));
+            for (int loop = 0; loop < 50; loop++)
+            {
+                std::vector<int> visits(100, 0);
+                pool.parallelFor(visits.size(), [&](size_t i) { visits[i]++; });
+
+                for (const auto& count : visits)
+                {
+                    ASSERT_EQ(count, 1);
+                }
+            }
+        }
+    }
+
+    TEST(WorkerPoolTest, testRethrowsExceptionAndKeepsWorking)
+    {
+        WorkerPool pool(4);
+        EXPECT_THROW(pool.parallelFor(100, [](size_t i)
+        {
+            if (i == 10)
+                throw std::runtime_error("failed");
+        }), std::runtime_error);
+
+        std::vector<int> visits(100, 0);
+        pool.parallelFor(visits.size(), [&](size_t i) { visits[i]++; });
+        for (const auto& count : visits)
+        {
+            ASSERT_EQ(count, 1);
+        }
+    }
+}